@@ -0,0 +1,140 @@
+"""add_performance_index_pack
+
+Revision ID: a9c3e5f71d20
+Revises: f1c7a2d94b36
+Create Date: 2026-10-19 21:05:37.402918
+
+Composite indexes matching the ORM's access patterns. The tenant hook
+(app.db.hooks) adds "tenantId" = ? AND "deletedAt" IS NULL to every
+SELECT on a soft-deleted model, and list endpoints order by createdAt or
+updatedAt. Indexes on those tables are partial on "deletedAt" IS NULL, so
+they hold only live rows and serve both the filter and the ORDER BY ...
+LIMIT without a sort.
+
+The Prisma schema already indexes enrollments by ("tenantId", "status"),
+("tenantId", "userId", "status"), ("tenantId", "courseId", "status") and
+the unique ("tenantId", "userId", "courseId"), and timeline_events by
+("tenantId", "timestamp"). Indexes whose columns lead an existing index
+are left out; tests/test_query_plans.py checks the pack against the
+schema's indexes with the advisor's coverage rule.
+
+Indexes are built CONCURRENTLY so the tables stay writable during the
+migration. scripts/bench_index_pack.py measures endpoint plans with and
+without them.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c3e5f71d20"
+down_revision: Union[str, Sequence[str], None] = "f1c7a2d94b36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LIVE = 'WHERE "deletedAt" IS NULL'
+
+INDEXES = [
+    # Users list, training matrix and export ordering
+    ("ix_users_tenant_created_live", "users", f'("tenantId", "createdAt" DESC) {LIVE}'),
+    (
+        "ix_users_tenant_name_live",
+        "users",
+        f'("tenantId", "lastName", "firstName") {LIVE}',
+    ),
+    # Course lists (catalog, admin, instructor) and the grading hub join
+    (
+        "ix_courses_tenant_created_live",
+        "courses",
+        f'("tenantId", "createdAt" DESC) {LIVE}',
+    ),
+    (
+        "ix_courses_tenant_updated_live",
+        "courses",
+        f'("tenantId", "updatedAt" DESC) {LIVE}',
+    ),
+    ("ix_courses_instructor_live", "courses", f'("instructorId") {LIVE}'),
+    # Course roster and enrollment list
+    (
+        "ix_enrollments_course_created_live",
+        "enrollments",
+        f'("courseId", "createdAt" DESC) {LIVE}',
+    ),
+    (
+        "ix_enrollments_tenant_updated_live",
+        "enrollments",
+        f'("tenantId", "updatedAt" DESC) {LIVE}',
+    ),
+    (
+        "ix_groups_tenant_created_live",
+        "groups",
+        f'("tenantId", "createdAt" DESC) {LIVE}',
+    ),
+    # learning_paths has a "deletedAt" column, but LearningPath does not map
+    # it, so the tenant hook never filters on it and a partial index on
+    # LIVE would not match the list query
+    (
+        "ix_learning_paths_tenant_updated",
+        "learning_paths",
+        '("tenantId", "updatedAt" DESC)',
+    ),
+    (
+        "ix_learning_path_enrollments_path_enrolled",
+        "learning_path_enrollments",
+        '("pathId", "enrolledAt" DESC)',
+    ),
+    # Per-user and per-course timelines; these also serve FK cascades
+    (
+        "ix_timeline_events_user_timestamp",
+        "timeline_events",
+        '("userId", "timestamp" DESC)',
+    ),
+    (
+        "ix_timeline_events_course_timestamp",
+        "timeline_events",
+        '("courseId", "timestamp" DESC)',
+    ),
+    # Submission lists (admin, instructor per course, learner) and per-unit lookups
+    (
+        "ix_assignment_submissions_tenant_submitted",
+        "assignment_submissions",
+        '("tenantId", "submittedAt" DESC)',
+    ),
+    (
+        "ix_assignment_submissions_course_submitted",
+        "assignment_submissions",
+        '("courseId", "submittedAt" DESC)',
+    ),
+    (
+        "ix_assignment_submissions_user_submitted",
+        "assignment_submissions",
+        '("userId", "submittedAt" DESC)',
+    ),
+    (
+        "ix_assignment_submissions_unit",
+        "assignment_submissions",
+        '("assignmentUnitId")',
+    ),
+    (
+        "ix_notifications_tenant_created",
+        "notifications",
+        '("tenantId", "createdAt" DESC)',
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, definition in INDEXES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+                f'ON "{table}" {definition}'
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _definition in reversed(INDEXES):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
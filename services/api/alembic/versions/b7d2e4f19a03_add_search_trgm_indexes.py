@@ -0,0 +1,71 @@
+"""add_search_trgm_indexes
+
+Revision ID: b7d2e4f19a03
+Revises: e7ea8eb5b60d
+Create Date: 2026-10-19 09:12:40.118204
+
+Indexes backing app.search:
+- GIN gin_trgm_ops on the lowered search documents of users, courses and
+  groups (serves LIKE '%q%' and word_similarity ranking).
+- btree text_pattern_ops on lower(email/username/firstName/lastName) for
+  prefix autocomplete.
+
+Expressions must match app/search/text.py exactly. Indexes are built
+CONCURRENTLY so the tables stay writable during the migration.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e4f19a03"
+down_revision: Union[str, Sequence[str], None] = "e7ea8eb5b60d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+USER_DOCUMENT = (
+    """lower(coalesce("firstName", '') || ' ' || coalesce("lastName", '') """
+    """|| ' ' || coalesce(email, '') || ' ' || coalesce(username, ''))"""
+)
+COURSE_DOCUMENT = (
+    """lower(coalesce(title, '') || ' ' || coalesce(code, '') """
+    """|| ' ' || coalesce(description, ''))"""
+)
+GROUP_DOCUMENT = """lower(coalesce(name, ''))"""
+
+INDEXES = [
+    ("ix_users_search_trgm", "users", f"USING gin (({USER_DOCUMENT}) gin_trgm_ops)"),
+    (
+        "ix_courses_search_trgm",
+        "courses",
+        f"USING gin (({COURSE_DOCUMENT}) gin_trgm_ops)",
+    ),
+    (
+        "ix_groups_search_trgm",
+        "groups",
+        f"USING gin (({GROUP_DOCUMENT}) gin_trgm_ops)",
+    ),
+    ("ix_users_email_prefix", "users", "(lower(email) text_pattern_ops)"),
+    ("ix_users_username_prefix", "users", "(lower(username) text_pattern_ops)"),
+    ("ix_users_first_name_prefix", "users", '(lower("firstName") text_pattern_ops)'),
+    ("ix_users_last_name_prefix", "users", '(lower("lastName") text_pattern_ops)'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, table, definition in INDEXES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+                f'ON "{table}" {definition}'
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _definition in reversed(INDEXES):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+    # pg_trgm is left installed; other objects may depend on it
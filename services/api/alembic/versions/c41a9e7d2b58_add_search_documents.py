@@ -0,0 +1,106 @@
+"""add_search_documents
+
+Revision ID: c41a9e7d2b58
+Revises: b7d2e4f19a03
+Create Date: 2026-10-19 11:03:27.540611
+
+Per-tenant search document table behind /api/search, backfilled from
+users, courses, groups, learning_paths, branches and categories. After
+this revision the rows are maintained by the flush hooks in
+app/search/index.py.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41a9e7d2b58"
+down_revision: Union[str, Sequence[str], None] = "b7d2e4f19a03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# entity_type, table, title, subtitle, document parts, node, soft delete
+BACKFILL = [
+    (
+        "user",
+        "users",
+        """coalesce(nullif(btrim(concat_ws(' ', s."firstName", s."lastName")), ''), s.email)""",
+        "s.email",
+        's."firstName", s."lastName", s.email, s.username',
+        "s.node_id",
+        True,
+    ),
+    ("course", "courses", "s.title", "s.code", "s.title, s.code, s.description", "NULL", True),
+    ("group", "groups", "s.name", "s.description", "s.name, s.description", 's."branchId"', True),
+    (
+        "learning_path",
+        "learning_paths",
+        "s.name",
+        "s.code",
+        "s.name, s.code, s.description",
+        's."branchId"',
+        False,
+    ),
+    ("branch", "branches", "coalesce(s.title, s.name)", "s.slug", "s.name, s.slug, s.title", "s.id", True),
+    ("category", "categories", "s.name", "s.description", "s.name, s.description", "NULL", False),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        "search_documents",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("tenantId", sa.String(), nullable=False),
+        sa.Column("entityType", sa.String(), nullable=False),
+        sa.Column("entityId", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("subtitle", sa.String(), nullable=True),
+        sa.Column("document", sa.Text(), nullable=False),
+        sa.Column("nodeId", sa.String(), nullable=True),
+        sa.Column("updatedAt", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["tenantId"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenantId",
+            "entityType",
+            "entityId",
+            name="search_documents_tenant_entity_unique",
+        ),
+    )
+
+    for entity_type, table, title, subtitle, parts, node, soft_delete in BACKFILL:
+        live = 'WHERE s."deletedAt" IS NULL' if soft_delete else ""
+        op.execute(
+            f"""
+            INSERT INTO search_documents (
+                id, "tenantId", "entityType", "entityId", title, subtitle,
+                document, "nodeId", "updatedAt"
+            )
+            SELECT
+                gen_random_uuid()::text, s."tenantId", '{entity_type}', s.id,
+                {title}, {subtitle},
+                lower(btrim(regexp_replace(concat_ws(' ', {parts}), '\\s+', ' ', 'g'))),
+                {node}, now()
+            FROM {table} s
+            {live}
+            """
+        )
+
+    # Built after the backfill: one bulk build beats per-row index maintenance
+    op.execute(
+        'CREATE INDEX ix_search_documents_trgm ON search_documents '
+        "USING gin (document gin_trgm_ops)"
+    )
+    op.execute(
+        'CREATE INDEX ix_search_documents_tenant_type ON search_documents ("tenantId", "entityType")'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_search_documents_tenant_type", table_name="search_documents")
+    op.drop_index("ix_search_documents_trgm", table_name="search_documents")
+    op.drop_table("search_documents")
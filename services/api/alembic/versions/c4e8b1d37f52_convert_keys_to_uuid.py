@@ -0,0 +1,212 @@
+"""convert_keys_to_uuid
+
+Revision ID: c4e8b1d37f52
+Revises: a9c3e5f71d20
+Create Date: 2026-10-19 22:14:08.517342
+
+Converts key columns from text to the native uuid type: 16 bytes per value
+instead of 37, so primary key, foreign key and ("tenantId", id) indexes
+shrink and key comparisons are fixed-width instead of collated text.
+
+Key columns are read from the catalog: every text "id" column of a primary
+key, then, to a fixed point, every column a foreign key points from at a
+key column. That covers the composite ("tenantId", x) -> ("tenantId", id)
+foreign keys of the Prisma schema. REFERENCE_COLUMNS adds the columns the
+ORM types as UUIDKey that have no foreign key constraint.
+
+The upgrade:
+
+1. fails before any DDL when a key column holds a value that is not a
+   canonical UUID, listing the offenders;
+2. drops the foreign keys on key columns;
+3. rewrites each table once, with one ALTER COLUMN ... TYPE uuid per key
+   column, rebuilding its indexes;
+4. re-adds the foreign keys NOT VALID and validates the ones that were
+   valid before.
+
+Table rewrites hold ACCESS EXCLUSIVE locks. Stop the API and workers, run
+the migration, then start them with DB_UUID_KEYS=true (app.db.types): the
+ORM binds keys as $1::UUID only with that flag, so code and schema switch
+together. scripts/uuid_keys_audit.py checks readiness beforehand and
+measures index sizes and join timings before and after.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8b1d37f52"
+down_revision: Union[str, Sequence[str], None] = "a9c3e5f71d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keys without a foreign key constraint (some may be missing where
+# 001_add_fk_constraints skipped them)
+REFERENCE_COLUMNS = [
+    ("search_documents", "entityId"),
+    ("search_documents", "nodeId"),
+    ("group_members", "userId"),
+    ("notifications", "recipientUserId"),
+    ("scorm_data", "userId"),
+]
+
+UUID_PATTERN = (
+    "^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+TEXT_TYPES = ("text", "character varying")
+
+# Partitions are altered through their parent
+COLUMNS_SQL = """
+    SELECT c.table_name, c.column_name, c.data_type, c.column_default
+    FROM information_schema.columns c
+    JOIN pg_class t ON t.relname = c.table_name
+    JOIN pg_namespace n ON n.oid = t.relnamespace AND n.nspname = c.table_schema
+    WHERE c.table_schema = current_schema()
+      AND t.relkind IN ('r', 'p') AND NOT t.relispartition
+      AND c.table_name NOT LIKE '\\_%'
+"""
+
+PRIMARY_KEY_IDS_SQL = """
+    SELECT t.relname
+    FROM pg_constraint c
+    JOIN pg_class t ON t.oid = c.conrelid
+    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(c.conkey)
+    WHERE c.contype = 'p' AND t.relnamespace = current_schema()::regnamespace
+      AND a.attname = 'id'
+"""
+
+# Inherited constraints on partitions follow the parent's
+FOREIGN_KEYS_SQL = """
+    SELECT
+        c.conname,
+        t.relname AS table_name,
+        r.relname AS ref_table,
+        c.convalidated,
+        pg_get_constraintdef(c.oid) AS definition,
+        ARRAY(
+            SELECT a.attname::text FROM unnest(c.conkey) WITH ORDINALITY k(num, i)
+            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.num
+            ORDER BY k.i
+        ) AS columns,
+        ARRAY(
+            SELECT a.attname::text FROM unnest(c.confkey) WITH ORDINALITY k(num, i)
+            JOIN pg_attribute a ON a.attrelid = c.confrelid AND a.attnum = k.num
+            ORDER BY k.i
+        ) AS ref_columns
+    FROM pg_constraint c
+    JOIN pg_class t ON t.oid = c.conrelid
+    JOIN pg_class r ON r.oid = c.confrelid
+    WHERE c.contype = 'f' AND c.conparentid = 0
+      AND t.relnamespace = current_schema()::regnamespace
+"""
+
+
+def key_columns(conn, types: tuple[str, ...]) -> tuple[set, list, dict]:
+    """(key columns, foreign keys on them, column defaults) for columns of types."""
+    candidates = {}
+    for table, column, data_type, default in conn.execute(text(COLUMNS_SQL)):
+        if data_type in types:
+            candidates[(table, column)] = default
+    keys = {
+        (table, "id")
+        for (table,) in conn.execute(text(PRIMARY_KEY_IDS_SQL))
+        if (table, "id") in candidates
+    }
+    keys |= {ref for ref in REFERENCE_COLUMNS if ref in candidates}
+
+    foreign_keys = [row._asdict() for row in conn.execute(text(FOREIGN_KEYS_SQL))]
+    grew = True
+    while grew:
+        grew = False
+        for fk in foreign_keys:
+            for column, ref in zip(fk["columns"], fk["ref_columns"]):
+                source = (fk["table_name"], column)
+                if (
+                    (fk["ref_table"], ref) in keys
+                    and source in candidates
+                    and source not in keys
+                ):
+                    keys.add(source)
+                    grew = True
+
+    affected = [
+        fk
+        for fk in foreign_keys
+        if any((fk["table_name"], c) in keys for c in fk["columns"])
+        or any((fk["ref_table"], c) in keys for c in fk["ref_columns"])
+    ]
+    defaults = {key: candidates[key] for key in keys if candidates[key]}
+    return keys, affected, defaults
+
+
+def check_values(conn, keys: set) -> None:
+    offenders = []
+    for table, column in sorted(keys):
+        rows = conn.execute(
+            text(
+                f'SELECT "{column}" FROM "{table}" '
+                f'WHERE "{column}" !~ :pattern LIMIT 5'
+            ),
+            {"pattern": UUID_PATTERN},
+        ).scalars()
+        values = list(rows)
+        if values:
+            offenders.append(f"{table}.{column}: {values}")
+    if offenders:
+        raise RuntimeError(
+            "Key columns hold values that are not UUIDs; fix or delete these rows "
+            "before converting:\n  " + "\n  ".join(offenders)
+        )
+
+
+def convert(conn, types: tuple[str, ...], target: str) -> None:
+    keys, foreign_keys, defaults = key_columns(conn, types)
+    if target == "uuid":
+        check_values(conn, keys)
+
+    for fk in foreign_keys:
+        op.execute(
+            f'ALTER TABLE "{fk["table_name"]}" DROP CONSTRAINT "{fk["conname"]}"'
+        )
+
+    by_table: dict[str, list[str]] = {}
+    for table, column in sorted(keys):
+        by_table.setdefault(table, []).append(column)
+    for table, columns in by_table.items():
+        clauses = []
+        for column in columns:
+            if (table, column) in defaults:
+                clauses.append(f'ALTER COLUMN "{column}" DROP DEFAULT')
+            clauses.append(
+                f'ALTER COLUMN "{column}" TYPE {target} USING "{column}"::{target}'
+            )
+            if (table, column) in defaults:
+                default = defaults[(table, column)]
+                clauses.append(
+                    f'ALTER COLUMN "{column}" SET DEFAULT ({default})::{target}'
+                )
+        op.execute(f'ALTER TABLE "{table}" ' + ", ".join(clauses))
+
+    for fk in foreign_keys:
+        definition = fk["definition"].removesuffix(" NOT VALID")
+        op.execute(
+            f'ALTER TABLE "{fk["table_name"]}" ADD CONSTRAINT "{fk["conname"]}" '
+            f"{definition} NOT VALID"
+        )
+    for fk in foreign_keys:
+        if fk["convalidated"]:
+            op.execute(
+                f'ALTER TABLE "{fk["table_name"]}" '
+                f'VALIDATE CONSTRAINT "{fk["conname"]}"'
+            )
+
+
+def upgrade() -> None:
+    convert(op.get_bind(), TEXT_TYPES, "uuid")
+
+
+def downgrade() -> None:
+    convert(op.get_bind(), ("uuid",), "text")
@@ -0,0 +1,143 @@
+"""partition_auth_audit_log
+
+Revision ID: d5e8f0a13c27
+Revises: c41a9e7d2b58
+Create Date: 2026-10-19 13:41:09.274530
+
+Rebuilds auth_audit_log as a table range-partitioned by month on
+created_at, with severity and correlation_id promoted out of the metadata
+JSONB so they can be indexed. Existing rows are copied into monthly
+partitions; partitions for the next months are created ahead and later
+ones by app.audit.partitions.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e8f0a13c27"
+down_revision: Union[str, Sequence[str], None] = "c41a9e7d2b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 2
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partition(month: date) -> None:
+    end = _add_months(month, 1)
+    op.execute(
+        f'CREATE TABLE "auth_audit_log_y{month.year:04d}m{month.month:02d}" '
+        f'PARTITION OF "auth_audit_log" '
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    op.execute('ALTER TABLE "auth_audit_log" RENAME TO "auth_audit_log_legacy"')
+    op.execute(
+        'ALTER TABLE "auth_audit_log_legacy" '
+        'RENAME CONSTRAINT "auth_audit_log_pkey" TO "auth_audit_log_legacy_pkey"'
+    )
+
+    op.execute("""
+        CREATE TABLE "auth_audit_log" (
+            "id" TEXT NOT NULL,
+            "tenant_id" TEXT,
+            "event_type" TEXT NOT NULL,
+            "severity" TEXT NOT NULL DEFAULT 'LOW',
+            "user_id" TEXT,
+            "correlation_id" TEXT,
+            "ip_address" TEXT,
+            "user_agent" TEXT,
+            "metadata" JSONB NOT NULL DEFAULT '{}',
+            "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            CONSTRAINT "auth_audit_log_pkey" PRIMARY KEY ("id", "created_at")
+        ) PARTITION BY RANGE ("created_at")
+    """)
+    op.execute('CREATE TABLE "auth_audit_log_default" PARTITION OF "auth_audit_log" DEFAULT')
+
+    # Monthly partitions covering existing data through MONTHS_AHEAD.
+    # created_at is naive UTC, so month boundaries follow the UTC date.
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    oldest = conn.execute(
+        text('SELECT min("created_at") FROM "auth_audit_log_legacy"')
+    ).scalar()
+    month = oldest.date().replace(day=1) if oldest else this_month
+    while month <= _add_months(this_month, MONTHS_AHEAD):
+        _create_partition(month)
+        month = _add_months(month, 1)
+
+    op.execute("""
+        INSERT INTO "auth_audit_log" (
+            id, tenant_id, event_type, severity, user_id, correlation_id,
+            ip_address, user_agent, metadata, created_at
+        )
+        SELECT
+            id, tenant_id, event_type,
+            coalesce(metadata->>'severity', 'LOW'), user_id,
+            metadata->>'correlationId', ip_address, user_agent, metadata, created_at
+        FROM "auth_audit_log_legacy"
+    """)
+    op.execute('DROP TABLE "auth_audit_log_legacy"')
+
+    # Partitioned indexes (created on every partition, present and future).
+    # id is the keyset tiebreaker for rows sharing a timestamp.
+    op.execute(
+        'CREATE INDEX "ix_auth_audit_log_tenant_created" '
+        'ON "auth_audit_log" ("tenant_id", "created_at" DESC, "id" DESC)'
+    )
+    op.execute(
+        'CREATE INDEX "ix_auth_audit_log_tenant_event" '
+        'ON "auth_audit_log" ("tenant_id", "event_type", "created_at" DESC)'
+    )
+    op.execute(
+        'CREATE INDEX "ix_auth_audit_log_tenant_severity" '
+        'ON "auth_audit_log" ("tenant_id", "severity", "created_at" DESC)'
+    )
+    op.execute(
+        'CREATE INDEX "ix_auth_audit_log_user_created" '
+        'ON "auth_audit_log" ("user_id", "created_at" DESC)'
+    )
+    op.execute(
+        'CREATE INDEX "ix_auth_audit_log_correlation" '
+        'ON "auth_audit_log" ("correlation_id") WHERE "correlation_id" IS NOT NULL'
+    )
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE "auth_audit_log" RENAME TO "auth_audit_log_partitioned"')
+    op.execute(
+        'ALTER TABLE "auth_audit_log_partitioned" '
+        'RENAME CONSTRAINT "auth_audit_log_pkey" TO "auth_audit_log_partitioned_pkey"'
+    )
+    op.execute("""
+        CREATE TABLE "auth_audit_log" (
+            "id" TEXT NOT NULL,
+            "tenant_id" TEXT,
+            "event_type" TEXT NOT NULL,
+            "user_id" TEXT,
+            "ip_address" TEXT,
+            "user_agent" TEXT,
+            "metadata" JSONB NOT NULL DEFAULT '{}',
+            "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            CONSTRAINT "auth_audit_log_pkey" PRIMARY KEY ("id")
+        )
+    """)
+    op.execute("""
+        INSERT INTO "auth_audit_log" (
+            id, tenant_id, event_type, user_id, ip_address, user_agent, metadata, created_at
+        )
+        SELECT id, tenant_id, event_type, user_id, ip_address, user_agent, metadata, created_at
+        FROM "auth_audit_log_partitioned"
+    """)
+    # Dropping the parent drops every attached partition
+    op.execute('DROP TABLE "auth_audit_log_partitioned"')
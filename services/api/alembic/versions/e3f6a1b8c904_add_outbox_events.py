@@ -0,0 +1,64 @@
+"""add_outbox_events
+
+Revision ID: e3f6a1b8c904
+Revises: d5e8f0a13c27
+Create Date: 2026-10-19 15:12:44.803117
+
+Transactional outbox for domain events (enrollments, completions, logins,
+assignments), drained by app/events/relay.py.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f6a1b8c904"
+down_revision: Union[str, Sequence[str], None] = "d5e8f0a13c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_events",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("tenantId", sa.String(), nullable=False),
+        sa.Column("eventType", sa.String(), nullable=False),
+        sa.Column("aggregateId", sa.String(), nullable=True),
+        sa.Column("userId", sa.String(), nullable=True),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column(
+            "handledBy",
+            postgresql.ARRAY(sa.String()),
+            nullable=False,
+            server_default=sa.text("'{}'"),
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("lastError", sa.Text(), nullable=True),
+        sa.Column("createdAt", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("processedAt", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["tenantId"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # The relay only ever scans pending rows; processed ones stay out of the index
+    op.execute(
+        'CREATE INDEX "ix_outbox_events_pending" '
+        'ON "outbox_events" ("createdAt", "id") WHERE "processedAt" IS NULL'
+    )
+    op.create_index(
+        "ix_outbox_events_processed_at", "outbox_events", ["processedAt"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_events_processed_at", table_name="outbox_events")
+    op.execute('DROP INDEX IF EXISTS "ix_outbox_events_pending"')
+    op.drop_table("outbox_events")
@@ -0,0 +1,38 @@
+"""add_login_activity
+
+Revision ID: f1c7a2d94b36
+Revises: e3f6a1b8c904
+Create Date: 2026-10-19 17:40:12.511204
+
+users.lastSeenAt and per-tenant daily login counts, both written in
+batches by app/activity.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c7a2d94b36"
+down_revision: Union[str, Sequence[str], None] = "e3f6a1b8c904"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable with no default: a catalog-only change, no table rewrite
+    op.add_column("users", sa.Column("lastSeenAt", sa.DateTime(), nullable=True))
+    op.create_table(
+        "login_daily_counts",
+        sa.Column("tenantId", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("logins", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["tenantId"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenantId", "day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("login_daily_counts")
+    op.drop_column("users", "lastSeenAt")
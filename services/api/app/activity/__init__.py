@@ -0,0 +1,19 @@
+"""Write-behind login and last-seen tracking."""
+
+from app.activity.tracker import (
+    ActivityTracker,
+    get_activity_tracker,
+    start_activity_tracker,
+    stop_activity_tracker,
+    track_login,
+    track_seen,
+)
+
+__all__ = [
+    "ActivityTracker",
+    "get_activity_tracker",
+    "start_activity_tracker",
+    "stop_activity_tracker",
+    "track_login",
+    "track_seen",
+]
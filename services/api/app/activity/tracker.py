@@ -0,0 +1,300 @@
+"""
+Write-behind Activity Tracker
+
+Logins and authenticated requests update in-memory state only; a single
+background task flushes it every ACTIVITY_FLUSH_INTERVAL_SECONDS (or
+sooner once ACTIVITY_MAX_PENDING users are pending) as:
+
+- one UPDATE of users."lastLoginAt" / "lastSeenAt" for every pending
+  user, using GREATEST so concurrent API workers never move a timestamp
+  backwards;
+- one upsert adding the buffered per-tenant daily login counts to
+  login_daily_counts.
+
+This replaces a single-row UPDATE (and commit) per login on hot user rows.
+last-seen is throttled to once per ACTIVITY_SEEN_RESOLUTION_SECONDS per
+user. A failed flush is merged back and retried on the next one; on
+shutdown stop() flushes what is pending.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any
+
+from sqlalchemy import text
+
+from app.db.types import key_sql_type
+
+logger = logging.getLogger(__name__)
+
+# {key} is the key column type (app.db.types.key_sql_type)
+UPDATE_USERS_SQL = """
+    UPDATE users AS u SET
+        "lastLoginAt" = GREATEST(u."lastLoginAt", v.login_at),
+        "lastSeenAt" = GREATEST(u."lastSeenAt", v.seen_at)
+    FROM unnest(
+        CAST(:ids AS {key}[]),
+        CAST(:login_at AS timestamp[]),
+        CAST(:seen_at AS timestamp[])
+    ) AS v(id, login_at, seen_at)
+    WHERE u.id = v.id
+"""
+
+UPSERT_COUNTS_SQL = """
+    INSERT INTO login_daily_counts ("tenantId", day, logins)
+    SELECT * FROM unnest(
+        CAST(:tenant_ids AS {key}[]),
+        CAST(:days AS date[]),
+        CAST(:logins AS integer[])
+    )
+    ON CONFLICT ("tenantId", day)
+    DO UPDATE SET logins = login_daily_counts.logins + EXCLUDED.logins
+"""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class ActivityBatch:
+    """Pending state taken by one flush."""
+
+    # user id -> [lastLoginAt or None, lastSeenAt or None]
+    users: dict[str, list[datetime | None]] = field(default_factory=dict)
+    # (tenant id, UTC day) -> logins
+    logins: dict[tuple[str, date], int] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.users or self.logins)
+
+    def merge(self, other: ActivityBatch) -> None:
+        for user_id, (login_at, seen_at) in other.users.items():
+            self.touch(user_id, login_at, seen_at)
+        for key, count in other.logins.items():
+            self.logins[key] = self.logins.get(key, 0) + count
+
+    def touch(
+        self, user_id: str, login_at: datetime | None, seen_at: datetime | None
+    ) -> None:
+        entry = self.users.setdefault(user_id, [None, None])
+        if login_at is not None and (entry[0] is None or login_at > entry[0]):
+            entry[0] = login_at
+        if seen_at is not None and (entry[1] is None or seen_at > entry[1]):
+            entry[1] = seen_at
+
+    def params(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        # Sorted ids keep row lock order consistent across API workers
+        ids = sorted(self.users)
+        users = {
+            "ids": ids,
+            "login_at": [self.users[i][0] for i in ids],
+            "seen_at": [self.users[i][1] for i in ids],
+        }
+        keys = sorted(self.logins)
+        counts = {
+            "tenant_ids": [k[0] for k in keys],
+            "days": [k[1] for k in keys],
+            "logins": [self.logins[k] for k in keys],
+        }
+        return users, counts
+
+
+Sink = Callable[[ActivityBatch], Awaitable[None]]
+
+
+async def write_activity(batch: ActivityBatch) -> None:
+    """Apply a batch in one transaction: one UPDATE and one upsert."""
+    from app.db.session import engine
+
+    key = key_sql_type()
+    users, counts = batch.params()
+    async with engine.begin() as conn:
+        if users["ids"]:
+            await conn.execute(text(UPDATE_USERS_SQL.format(key=key)), users)
+        if counts["days"]:
+            await conn.execute(text(UPSERT_COUNTS_SQL.format(key=key)), counts)
+
+
+class ActivityTracker:
+    """Buffers last-login / last-seen and daily login counts for batched writes."""
+
+    def __init__(
+        self,
+        flush_interval: float = 5.0,
+        max_pending: int = 5000,
+        seen_resolution: float = 300.0,
+        sink: Sink | None = None,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.seen_resolution = seen_resolution
+        self._sink: Sink = sink or write_activity
+        self._pending = ActivityBatch()
+        # user id -> last time a lastSeenAt was buffered, for throttling
+        self._seen: dict[str, datetime] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+        self.logins = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.rows_written = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._closed
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="activity-tracker")
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending_users": len(self._pending.users),
+            "pending_counts": len(self._pending.logins),
+            "logins": self.logins,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "rows_written": self.rows_written,
+        }
+
+    # ============= Producers =============
+
+    def record_login(
+        self, user_id: str, tenant_id: str, at: datetime | None = None
+    ) -> None:
+        at = at or _utcnow()
+        self._pending.touch(user_id, at, at)
+        key = (tenant_id, at.date())
+        self._pending.logins[key] = self._pending.logins.get(key, 0) + 1
+        self._seen[user_id] = at
+        self.logins += 1
+        self._maybe_wake()
+
+    def record_seen(self, user_id: str, at: datetime | None = None) -> None:
+        at = at or _utcnow()
+        last = self._seen.get(user_id)
+        if last is not None and (at - last).total_seconds() < self.seen_resolution:
+            return
+        self._seen[user_id] = at
+        self._pending.touch(user_id, None, at)
+        self._maybe_wake()
+
+    def _maybe_wake(self) -> None:
+        if len(self._pending.users) >= self.max_pending:
+            self._wake.set()
+
+    # ============= Consumer =============
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        batch, self._pending = self._pending, ActivityBatch()
+        if not batch:
+            return
+        if len(self._seen) > self.max_pending * 20:
+            # Throttle state only needs recent users; forgetting it costs one
+            # extra write each
+            self._seen.clear()
+        try:
+            await self._sink(batch)
+            self.flushes += 1
+            self.rows_written += len(batch.users)
+        except Exception as e:
+            # Keep the batch for the next flush; timestamps and counts merge
+            self.failed_flushes += 1
+            batch.merge(self._pending)
+            self._pending = batch
+            logger.warning(
+                f"[ACTIVITY] Flush of {len(batch.users)} users failed, will retry: {e}"
+            )
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Stop the flush loop and write whatever is pending."""
+        self._closed = True
+        if self._task is not None:
+            self._wake.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[ACTIVITY] Final flush timed out; "
+                f"{len(self._pending.users)} users lost"
+            )
+
+
+_tracker: ActivityTracker | None = None
+
+
+def get_activity_tracker() -> ActivityTracker | None:
+    """The running tracker, or None outside the API process."""
+    return _tracker if _tracker is not None and _tracker.running else None
+
+
+async def start_activity_tracker() -> ActivityTracker:
+    """Start the tracker (called from the FastAPI lifespan)."""
+    global _tracker
+    if _tracker is None or not _tracker.running:
+        from app.config import get_settings
+
+        settings = get_settings()
+        _tracker = ActivityTracker(
+            flush_interval=settings.activity_flush_interval_seconds,
+            max_pending=settings.activity_max_pending,
+            seen_resolution=settings.activity_seen_resolution_seconds,
+        )
+        _tracker.start()
+    return _tracker
+
+
+async def stop_activity_tracker() -> None:
+    """Flush pending activity and stop the tracker (lifespan shutdown)."""
+    global _tracker
+    if _tracker is not None:
+        await _tracker.stop()
+        logger.info(f"[ACTIVITY] Tracker stopped: {_tracker.stats()}")
+        _tracker = None
+
+
+def track_login(user_id: str, tenant_id: str) -> bool:
+    """Buffer a login; False when no tracker runs and the caller must write it."""
+    tracker = get_activity_tracker()
+    if tracker is None:
+        return False
+    tracker.record_login(user_id, tenant_id)
+    return True
+
+
+def track_seen(user_id: str) -> None:
+    tracker = get_activity_tracker()
+    if tracker is not None:
+        tracker.record_seen(user_id)
+
+
+__all__ = [
+    "ActivityBatch",
+    "ActivityTracker",
+    "get_activity_tracker",
+    "start_activity_tracker",
+    "stop_activity_tracker",
+    "track_login",
+    "track_seen",
+    "write_activity",
+]
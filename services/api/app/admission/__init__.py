@@ -0,0 +1,19 @@
+"""Per-tenant and per-route-class admission control (see app.middleware.admission)."""
+
+from app.admission.controller import (
+    AdmissionController,
+    Gate,
+    PoolSettings,
+    Rejected,
+    classify,
+    get_admission_controller,
+)
+
+__all__ = [
+    "AdmissionController",
+    "Gate",
+    "PoolSettings",
+    "Rejected",
+    "classify",
+    "get_admission_controller",
+]
@@ -0,0 +1,260 @@
+"""
+Admission Control
+
+Bounds in-flight API work per route class and per tenant, so one tenant's
+exports or bulk enrollments cannot take every DB connection from everyone
+else's interactive requests.
+
+- Route classes: "heavy" (exports, imports, report generation, bulk
+  enrollment; HEAVY_ROUTES) and "interactive" (everything else under /api/). Each
+  class has its own global pool, so heavy work never queues ahead of
+  interactive requests.
+- Each tenant also gets a gate per class. A request takes its tenant slot
+  first and the global slot second, so requests waiting on a busy tenant
+  never hold global capacity.
+- A request that cannot be admitted within the class's queue timeout, or
+  that finds the queue already at ADMISSION_MAX_QUEUE, is rejected with a
+  503 and Retry-After.
+
+Anonymous requests (no tenant in the JWT) only use the global pools.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+RouteClass = Literal["interactive", "heavy"]
+
+# (method or None for any, path regex); matched in order
+HEAVY_ROUTES: list[tuple[Optional[str], re.Pattern[str]]] = [
+    (None, re.compile(r"^/api/reports/export/")),
+    ("POST", re.compile(r"^/api/reports/generate$")),
+    (None, re.compile(r"^/api/admin/users/export$")),
+    ("POST", re.compile(r"^/api/admin/(users|enrollments)/import$")),
+    ("POST", re.compile(r"^/api/courses/[^/]+/enrollments$")),
+]
+
+EXEMPT_PATHS = frozenset({"/api/health"})
+
+
+def classify(method: str, path: str) -> Optional[RouteClass]:
+    """Route class for a request, or None when it bypasses admission control."""
+    if not path.startswith("/api/") or path in EXEMPT_PATHS:
+        return None
+    for route_method, pattern in HEAVY_ROUTES:
+        if (route_method is None or route_method == method) and pattern.match(path):
+            return "heavy"
+    return "interactive"
+
+
+class Gate:
+    """FIFO counting semaphore that exposes its queue depth."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: deque[asyncio.Future[bool]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def full(self) -> bool:
+        return self.active >= self.limit
+
+    @property
+    def idle(self) -> bool:
+        return self.active == 0 and not self._waiters
+
+    async def acquire(self, timeout: float) -> bool:
+        """Take a slot, waiting up to timeout; False if none became free."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return True
+        if timeout <= 0:
+            return False
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+            return True
+        except asyncio.TimeoutError:
+            if waiter.done():  # handed a slot just as the timeout fired
+                return True
+            waiter.cancel()
+            self._waiters.remove(waiter)
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # handed a slot, but the request is gone
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        # Hand the slot straight to the next waiter so nobody can jump the queue
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self.active -= 1
+
+
+@dataclass
+class PoolSettings:
+    limit: int
+    tenant_limit: int
+    timeout: float
+
+
+@dataclass
+class PoolStats:
+    admitted: int = 0
+    rejected_timeout: int = 0
+    rejected_queue_full: int = 0
+    max_waiting: int = 0
+
+
+class Rejected(Exception):
+    def __init__(self, route_class: RouteClass, reason: str):
+        super().__init__(f"{route_class} admission rejected: {reason}")
+        self.route_class = route_class
+        self.reason = reason
+
+
+class AdmissionController:
+    """Per-class global pools plus per-tenant gates."""
+
+    def __init__(self, pools: dict[RouteClass, PoolSettings], max_queue: int = 200):
+        self.settings = pools
+        self.max_queue = max_queue
+        self.pools: dict[RouteClass, Gate] = {
+            name: Gate(p.limit) for name, p in pools.items()
+        }
+        self.tenant_gates: dict[tuple[str, RouteClass], Gate] = {}
+        self._stats: dict[RouteClass, PoolStats] = {name: PoolStats() for name in pools}
+
+    def _tenant_gate(self, tenant_id: str, route_class: RouteClass) -> Gate:
+        key = (tenant_id, route_class)
+        gate = self.tenant_gates.get(key)
+        if gate is None:
+            gate = self.tenant_gates[key] = Gate(
+                self.settings[route_class].tenant_limit
+            )
+        return gate
+
+    def _forget_if_idle(self, tenant_id: str, route_class: RouteClass) -> None:
+        key = (tenant_id, route_class)
+        gate = self.tenant_gates.get(key)
+        if gate is not None and gate.idle:
+            del self.tenant_gates[key]
+
+    async def acquire(self, tenant_id: Optional[str], route_class: RouteClass) -> None:
+        """Admit a request or raise Rejected; pair with release()."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings[route_class].timeout
+        stats = self._stats[route_class]
+        pool = self.pools[route_class]
+
+        tenant_gate = self._tenant_gate(tenant_id, route_class) if tenant_id else None
+        for gate in (tenant_gate, pool):
+            if gate is not None and gate.full and gate.waiting >= self.max_queue:
+                stats.rejected_queue_full += 1
+                if tenant_id:
+                    self._forget_if_idle(tenant_id, route_class)
+                raise Rejected(route_class, "queue full")
+
+        if tenant_gate is not None:
+            if not await tenant_gate.acquire(deadline - loop.time()):
+                stats.rejected_timeout += 1
+                self._forget_if_idle(tenant_id, route_class)  # type: ignore[arg-type]
+                raise Rejected(route_class, "tenant queue timeout")
+        if pool.full:
+            stats.max_waiting = max(stats.max_waiting, pool.waiting + 1)
+        try:
+            admitted = await pool.acquire(deadline - loop.time())
+        except BaseException:
+            if tenant_gate is not None:
+                tenant_gate.release()
+                self._forget_if_idle(tenant_id, route_class)  # type: ignore[arg-type]
+            raise
+        if not admitted:
+            if tenant_gate is not None:
+                tenant_gate.release()
+                self._forget_if_idle(tenant_id, route_class)  # type: ignore[arg-type]
+            stats.rejected_timeout += 1
+            raise Rejected(route_class, "queue timeout")
+        stats.admitted += 1
+
+    def release(self, tenant_id: Optional[str], route_class: RouteClass) -> None:
+        self.pools[route_class].release()
+        if tenant_id:
+            gate = self.tenant_gates.get((tenant_id, route_class))
+            if gate is not None:
+                gate.release()
+                self._forget_if_idle(tenant_id, route_class)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        result = {}
+        for name, gate in self.pools.items():
+            s = self._stats[name]
+            result[name] = {
+                "limit": gate.limit,
+                "active": gate.active,
+                "waiting": gate.waiting,
+                "max_waiting": s.max_waiting,
+                "admitted": s.admitted,
+                "rejected_timeout": s.rejected_timeout,
+                "rejected_queue_full": s.rejected_queue_full,
+                "tenants_active": sum(1 for (_, c) in self.tenant_gates if c == name),
+                "tenants_waiting": sum(
+                    g.waiting for (_, c), g in self.tenant_gates.items() if c == name
+                ),
+            }
+        return result
+
+
+_controller: AdmissionController | None = None
+
+
+def get_admission_controller() -> AdmissionController:
+    global _controller
+    if _controller is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        _controller = AdmissionController(
+            {
+                "interactive": PoolSettings(
+                    settings.admission_interactive_limit,
+                    settings.admission_tenant_interactive_limit,
+                    settings.admission_interactive_timeout_seconds,
+                ),
+                "heavy": PoolSettings(
+                    settings.admission_heavy_limit,
+                    settings.admission_tenant_heavy_limit,
+                    settings.admission_heavy_timeout_seconds,
+                ),
+            },
+            max_queue=settings.admission_max_queue,
+        )
+    return _controller
+
+
+__all__ = [
+    "AdmissionController",
+    "Gate",
+    "HEAVY_ROUTES",
+    "PoolSettings",
+    "Rejected",
+    "RouteClass",
+    "classify",
+    "get_admission_controller",
+]
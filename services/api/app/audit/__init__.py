@@ -4,13 +4,19 @@ from app.audit.logger import (
     AuditEntry,
     AuditEventType,
     AuditSeverity,
+    get_audit_writer,
     log_audit,
     log_audit_background,
+    start_audit_writer,
+    stop_audit_writer,
 )
 
 __all__ = [
     "log_audit",
     "log_audit_background",
+    "get_audit_writer",
+    "start_audit_writer",
+    "stop_audit_writer",
     "AuditEntry",
     "AuditEventType",
     "AuditSeverity",
@@ -4,7 +4,7 @@ Fail-Open Audit Logger
 Provides enterprise-grade audit logging with:
 - JSONB snapshots of before/after state
 - Severity classification
-- Non-blocking writes (fire-and-forget)
+- Non-blocking, batched writes (see app.audit.writer)
 - OpenTelemetry-compatible correlation IDs
 - Fail-open design (never crashes the main request)
 
@@ -17,13 +17,13 @@ import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 from uuid import uuid4
 
-from app.db.session import async_session_factory
-from sqlalchemy import text
+from app.audit.writer import AuditWriter, insert_audit_rows
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +173,9 @@ class AuditEntry:
     before_state: Optional[dict[str, Any]] = None  # State before change
     after_state: Optional[dict[str, Any]] = None  # State after change
     _severity: Optional[AuditSeverity] = None
+    # Captured at creation so batching does not skew event times (naive UTC,
+    # matching the TIMESTAMP(3) column)
+    created_at: datetime = field(default_factory=datetime.utcnow)
 
     @property
     def severity(self) -> AuditSeverity:
@@ -206,6 +209,57 @@ class AuditEntry:
 
         return json.dumps(data, default=str)
 
+    def to_row(self) -> dict[str, Any]:
+        """Bind parameters for an auth_audit_log INSERT."""
+        return {
+            "id": str(uuid4()),
+            "tenant_id": self.tenant_id,
+            "event_type": self.event_type.value,
+            "severity": self.severity.value,
+            "user_id": self.user_id,
+            "correlation_id": self.correlation_id,
+            "ip_address": self.ip_address,
+            "user_agent": self.user_agent,
+            "metadata": self.to_metadata_json(),
+            "created_at": self.created_at,
+        }
+
+
+# ============= Writer =============
+
+_writer: AuditWriter | None = None
+# Strong references for fallback tasks so they are not GC'd mid-flight
+_fallback_tasks: set[asyncio.Task[bool]] = set()
+
+
+def get_audit_writer() -> AuditWriter | None:
+    """The running batched writer, or None outside the API process."""
+    return _writer if _writer is not None and _writer.running else None
+
+
+async def start_audit_writer() -> AuditWriter:
+    """Start the batched writer (called from the FastAPI lifespan)."""
+    global _writer
+    if _writer is None or not _writer.running:
+        settings = get_settings()
+        _writer = AuditWriter(
+            max_queue=settings.audit_queue_size,
+            batch_size=settings.audit_batch_size,
+            flush_interval=settings.audit_flush_interval_ms / 1000,
+            enqueue_timeout=settings.audit_enqueue_timeout_ms / 1000,
+        )
+        _writer.start()
+    return _writer
+
+
+async def stop_audit_writer() -> None:
+    """Flush queued events and stop the writer (lifespan shutdown)."""
+    global _writer
+    if _writer is not None:
+        await _writer.stop()
+        logger.info(f"[AUDIT] Writer stopped: {_writer.stats()}")
+        _writer = None
+
 
 async def log_audit(entry: AuditEntry) -> bool:
     """
@@ -216,37 +270,23 @@ async def log_audit(entry: AuditEntry) -> bool:
     - Returns True on success, False on failure
     - Logs errors but doesn't propagate them
 
+    Inside the API the entry is queued for the batched writer (waiting
+    briefly for queue space) and True means it was accepted. Elsewhere
+    (workers, scripts) it is written directly.
+
     Args:
         entry: The audit entry to log
 
     Returns:
-        True if logged successfully, False otherwise
+        True if logged (or queued) successfully, False otherwise
     """
+    writer = get_audit_writer()
+    if writer is not None:
+        return await writer.enqueue(entry)
+
     try:
-        async with async_session_factory() as session:
-            await session.execute(
-                text("""
-                    INSERT INTO auth_audit_log (
-                        id, tenant_id, event_type, user_id,
-                        ip_address, user_agent, metadata, created_at
-                    ) VALUES (
-                        :id, :tenant_id, :event_type, :user_id,
-                        :ip_address, :user_agent, :metadata::jsonb, :created_at
-                    )
-                """),
-                {
-                    "id": str(uuid4()),
-                    "tenant_id": entry.tenant_id,
-                    "event_type": entry.event_type.value,
-                    "user_id": entry.user_id,
-                    "ip_address": entry.ip_address,
-                    "user_agent": entry.user_agent,
-                    "metadata": entry.to_metadata_json(),
-                    "created_at": datetime.now(timezone.utc),
-                },
-            )
-            await session.commit()
-            return True
+        await insert_audit_rows([entry.to_row()])
+        return True
 
     except Exception as e:
         # Fail-open: log error but don't crash
@@ -265,27 +305,31 @@ def log_audit_background(entry: AuditEntry) -> None:
     """
     Fire-and-forget audit logging.
 
-    Creates a background task to log the audit entry without blocking
-    the main request. This is the recommended way to log during
-    API request handling.
+    Hands the entry to the batched writer without blocking the request;
+    if the queue is full the entry is dropped and counted. Without a
+    running writer, falls back to a tracked background task.
 
     Args:
         entry: The audit entry to log
     """
+    writer = get_audit_writer()
+    if writer is not None:
+        writer.submit(entry)
+        return
+
     try:
-        # Get the current event loop and create task
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.create_task(log_audit(entry))
-        else:
-            # Fallback for non-async contexts
-            loop.run_until_complete(log_audit(entry))
+        loop = asyncio.get_running_loop()
     except RuntimeError:
-        # No event loop - try to run synchronously
+        # No event loop - run synchronously
         try:
             asyncio.run(log_audit(entry))
         except Exception as e:
             logger.warning(f"[AUDIT] Background log failed: {e}")
+        return
+
+    task = loop.create_task(log_audit(entry))
+    _fallback_tasks.add(task)
+    task.add_done_callback(_fallback_tasks.discard)
 
 
 # ============= Helper Functions =============
@@ -361,6 +405,9 @@ __all__ = [
     "AuditSeverity",
     "log_audit",
     "log_audit_background",
+    "get_audit_writer",
+    "start_audit_writer",
+    "stop_audit_writer",
     "extract_client_ip",
     "extract_user_agent",
     "create_audit_entry_from_request",
@@ -0,0 +1,211 @@
+"""
+Audit Log Partition Maintenance
+
+auth_audit_log is range-partitioned by month on created_at, one partition
+per month named auth_audit_log_yYYYYmMM plus a DEFAULT catch-all.
+
+- ensure_partitions(): creates the current month and the next few months
+  ahead of time so inserts never land in the default partition. Rows that
+  did land there (maintenance missed a month) are moved into their month's
+  new partition; Postgres refuses to create a partition whose range the
+  default partition already holds rows for.
+- retire_partitions(): detaches partitions older than the retention window
+  and either moves them to the audit_archive schema (still queryable, off
+  the hot table) or drops them.
+
+Run from the audit_maintain_partitions Celery beat task or
+scripts/audit_partitions.py.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import date
+from typing import Any, Literal
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "auth_audit_log"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+ARCHIVE_SCHEMA = "audit_archive"
+_NAME_RE = re.compile(rf"^{PARENT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def parse_partition_month(name: str) -> date | None:
+    match = _NAME_RE.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def create_partition_sql(month: date) -> str:
+    start = month_start(month)
+    end = add_months(start, 1)
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(start)}" '
+        f'PARTITION OF "{PARENT_TABLE}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def partitions_to_retire(
+    names: list[str], today: date, retention_months: int
+) -> list[str]:
+    """Monthly partitions entirely older than the retention window, oldest first."""
+    cutoff = add_months(month_start(today), -retention_months)
+    expired = [
+        (month, name)
+        for name in names
+        if (month := parse_partition_month(name)) is not None and month < cutoff
+    ]
+    return [name for _, name in sorted(expired)]
+
+
+async def list_partitions(conn: Any) -> list[str]:
+    result = await conn.execute(
+        text("""
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = :parent
+        """),
+        {"parent": PARENT_TABLE},
+    )
+    return list(result.scalars())
+
+
+async def default_partition_months(conn: Any) -> list[date]:
+    """Months that have rows in the default partition, oldest first."""
+    result = await conn.execute(
+        text(
+            f"SELECT DISTINCT date_trunc('month', created_at)::date "
+            f'FROM "{DEFAULT_PARTITION}" ORDER BY 1'
+        )
+    )
+    return list(result.scalars())
+
+
+async def move_out_of_default(conn: Any, month: date) -> None:
+    """
+    Create month's partition and move its rows out of the default partition.
+
+    The default partition is detached while the partition is created, so
+    its rows do not block the new range, then attached again.
+    """
+    start = month_start(month)
+    end = add_months(start, 1)
+    name = partition_name(start)
+    in_range = (
+        f"created_at >= '{start.isoformat()}' AND created_at < '{end.isoformat()}'"
+    )
+    await conn.execute(
+        text(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{DEFAULT_PARTITION}"')
+    )
+    await conn.execute(text(create_partition_sql(start)))
+    await conn.execute(
+        text(
+            f'INSERT INTO "{name}" SELECT * FROM "{DEFAULT_PARTITION}" WHERE {in_range}'
+        )
+    )
+    await conn.execute(text(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE {in_range}'))
+    await conn.execute(
+        text(
+            f'ALTER TABLE "{PARENT_TABLE}" '
+            f'ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT'
+        )
+    )
+    logger.warning(f"[AUDIT] Moved rows for {name} out of {DEFAULT_PARTITION}")
+
+
+async def ensure_partitions(conn: Any, today: date, ahead: int = 2) -> list[str]:
+    """
+    Create partitions for this month and `ahead` months after it, plus any
+    month whose rows are stranded in the default partition.
+    """
+    created = []
+    existing = set(await list_partitions(conn))
+    stranded = (
+        set(await default_partition_months(conn))
+        if DEFAULT_PARTITION in existing
+        else set()
+    )
+    upcoming = {add_months(month_start(today), offset) for offset in range(ahead + 1)}
+    for month in sorted(upcoming | stranded):
+        if partition_name(month) in existing:
+            continue
+        if month in stranded:
+            await move_out_of_default(conn, month)
+        else:
+            await conn.execute(text(create_partition_sql(month)))
+        created.append(partition_name(month))
+    return created
+
+
+async def retire_partitions(
+    conn: Any,
+    today: date,
+    retention_months: int,
+    mode: Literal["archive", "drop"] = "archive",
+) -> list[str]:
+    """Detach partitions past retention, then archive or drop them."""
+    retired = partitions_to_retire(await list_partitions(conn), today, retention_months)
+    if retired and mode == "archive":
+        await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{ARCHIVE_SCHEMA}"'))
+    for name in retired:
+        await conn.execute(
+            text(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"')
+        )
+        if mode == "archive":
+            await conn.execute(
+                text(f'ALTER TABLE "{name}" SET SCHEMA "{ARCHIVE_SCHEMA}"')
+            )
+        else:
+            await conn.execute(text(f'DROP TABLE "{name}"'))
+        logger.info(f"[AUDIT] Retired partition {name} ({mode})")
+    return retired
+
+
+async def maintain_partitions(
+    conn: Any,
+    today: date,
+    ahead: int,
+    retention_months: int,
+    mode: Literal["archive", "drop"],
+) -> dict[str, list[str]]:
+    created = await ensure_partitions(conn, today, ahead)
+    retired = await retire_partitions(conn, today, retention_months, mode)
+    return {"created": created, "retired": retired}
+
+
+__all__ = [
+    "ARCHIVE_SCHEMA",
+    "DEFAULT_PARTITION",
+    "PARENT_TABLE",
+    "add_months",
+    "create_partition_sql",
+    "default_partition_months",
+    "ensure_partitions",
+    "list_partitions",
+    "maintain_partitions",
+    "move_out_of_default",
+    "partition_name",
+    "partitions_to_retire",
+    "retire_partitions",
+]
@@ -0,0 +1,123 @@
+"""
+Audit Log Queries
+
+Keyset (cursor) pagination over auth_audit_log, newest first. The cursor
+is the (created_at, id) of the last row served, so each page is an index
+range scan on (tenant_id, created_at DESC, id DESC) no matter how deep the
+caller pages; OFFSET would re-read every skipped row. Bounding created_at
+also lets the planner prune monthly partitions.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Select, select, tuple_
+
+from app.db.models import AuthAuditLog
+from app.errors import BadRequestError
+
+
+@dataclass
+class AuditFilters:
+    severities: list[str] | None = None
+    event_types: list[str] | None = None
+    user_id: str | None = None
+    correlation_id: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """created_at is TIMESTAMP without time zone, stored as UTC."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return _naive_utc(datetime.fromisoformat(created_at)), row_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise BadRequestError("Invalid cursor") from e
+
+
+def build_audit_query(
+    tenant_id: str | None,
+    filters: AuditFilters,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> Select:
+    """Select one page (limit + 1 rows, to detect a next page)."""
+    query = select(AuthAuditLog).where(AuthAuditLog.tenant_id == tenant_id)
+
+    if filters.severities:
+        query = query.where(AuthAuditLog.severity.in_(filters.severities))
+    if filters.event_types:
+        query = query.where(AuthAuditLog.event_type.in_(filters.event_types))
+    if filters.user_id:
+        query = query.where(AuthAuditLog.user_id == filters.user_id)
+    if filters.correlation_id:
+        query = query.where(AuthAuditLog.correlation_id == filters.correlation_id)
+    if filters.since:
+        query = query.where(AuthAuditLog.created_at >= _naive_utc(filters.since))
+    if filters.until:
+        query = query.where(AuthAuditLog.created_at < _naive_utc(filters.until))
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(AuthAuditLog.created_at, AuthAuditLog.id)
+            < tuple_(created_at, row_id)
+        )
+
+    return query.order_by(
+        AuthAuditLog.created_at.desc(), AuthAuditLog.id.desc()
+    ).limit(limit + 1)
+
+
+def serialize_event(row: AuthAuditLog) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "eventType": row.event_type,
+        "severity": row.severity,
+        "userId": row.user_id,
+        "correlationId": row.correlation_id,
+        "ipAddress": row.ip_address,
+        "userAgent": row.user_agent,
+        "metadata": row.metadata_ or {},
+        "createdAt": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def paginate(rows: list[AuthAuditLog], limit: int) -> dict[str, Any]:
+    """Trim the probe row and build the response page."""
+    has_more = len(rows) > limit
+    page = rows[:limit]
+    next_cursor = (
+        encode_cursor(page[-1].created_at, page[-1].id) if has_more and page else None
+    )
+    return {
+        "data": [serialize_event(r) for r in page],
+        "pagination": {"limit": limit, "nextCursor": next_cursor, "hasMore": has_more},
+    }
+
+
+__all__ = [
+    "AuditFilters",
+    "build_audit_query",
+    "decode_cursor",
+    "encode_cursor",
+    "paginate",
+    "serialize_event",
+]
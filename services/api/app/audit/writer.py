@@ -0,0 +1,193 @@
+"""
+Batched Audit Writer
+
+A bounded in-process queue drained by a single writer task that inserts
+audit rows into auth_audit_log in batches (flushed by size or time), so a
+login storm costs one INSERT round-trip per batch instead of one session
+and commit per event.
+
+- Backpressure: awaiting producers wait up to AUDIT_ENQUEUE_TIMEOUT_MS for
+  queue space; fire-and-forget producers never wait. Either way an event
+  that cannot be queued is dropped and counted, never raised (fail-open).
+- Shutdown: stop() drains and flushes whatever is queued; it is called
+  from the FastAPI lifespan hook.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from app.audit.logger import AuditEntry
+
+logger = logging.getLogger(__name__)
+
+INSERT_SQL = text("""
+    INSERT INTO auth_audit_log (
+        id, tenant_id, event_type, severity, user_id, correlation_id,
+        ip_address, user_agent, metadata, created_at
+    ) VALUES (
+        :id, :tenant_id, :event_type, :severity, :user_id, :correlation_id,
+        :ip_address, :user_agent, CAST(:metadata AS jsonb), :created_at
+    )
+""")
+
+Sink = Callable[[list[dict[str, Any]]], Awaitable[None]]
+
+_STOP = object()
+
+
+async def insert_audit_rows(rows: list[dict[str, Any]]) -> None:
+    """Insert rows in one transaction (executemany, pipelined by asyncpg)."""
+    from app.db.session import engine
+
+    async with engine.begin() as conn:
+        await conn.execute(INSERT_SQL, rows)
+
+
+class AuditWriter:
+    """Single-consumer batching writer for audit entries."""
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        enqueue_timeout: float = 0.05,
+        sink: Sink | None = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self._sink: Sink = sink or insert_audit_rows
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._closed
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="audit-writer")
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    # ============= Producers =============
+
+    def submit(self, entry: AuditEntry) -> bool:
+        """Queue without waiting; drop if the queue is full."""
+        if self._closed:
+            return self._drop(entry, "writer closed")
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            return self._drop(entry, "queue full")
+        self.enqueued += 1
+        return True
+
+    async def enqueue(self, entry: AuditEntry) -> bool:
+        """Queue, waiting up to enqueue_timeout for space (backpressure)."""
+        if self._closed or not self._queue.full():
+            return self.submit(entry)
+        try:
+            await asyncio.wait_for(self._queue.put(entry), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            return self._drop(entry, "queue full")
+        self.enqueued += 1
+        return True
+
+    def _drop(self, entry: AuditEntry, reason: str) -> bool:
+        self.dropped += 1
+        # Log the first drop and then every 1000th to avoid flooding logs
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            logger.warning(
+                f"[AUDIT] Dropped event {entry.event_type.value} ({reason}); "
+                f"{self.dropped} dropped so far"
+            )
+        return False
+
+    # ============= Consumer =============
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+        # Drain anything queued behind the stop marker
+        leftover = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                leftover.append(item)
+        for i in range(0, len(leftover), self.batch_size):
+            await self._flush(leftover[i : i + self.batch_size])
+
+    async def _flush(self, batch: list[AuditEntry]) -> None:
+        try:
+            await self._sink([entry.to_row() for entry in batch])
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            # Fail-open: a failed batch is counted and logged, never retried
+            self.failed += len(batch)
+            logger.warning(f"[AUDIT] Failed to write batch of {len(batch)}: {e}")
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Stop accepting events, flush the queue and wait for the writer."""
+        self._closed = True
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.put(_STOP), timeout)
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            lost = self._queue.qsize()
+            self.dropped += lost
+            logger.warning(
+                f"[AUDIT] Writer did not drain in {timeout}s; dropped {lost}"
+            )
+
+
+__all__ = ["AuditWriter", "INSERT_SQL", "insert_audit_rows"]
@@ -6,7 +6,13 @@ from app.auth.jwt import (
     verify_token,
     verify_token_light,
 )
-from app.auth.password import hash_password, validate_password_policy, verify_password
+from app.auth.password import (
+    hash_password,
+    hash_password_async,
+    validate_password_policy,
+    verify_password,
+    verify_password_async,
+)
 
 __all__ = [
     "AuthContext",
@@ -18,6 +24,8 @@ __all__ = [
     "verify_token",
     "verify_token_light",
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
     "validate_password_policy",
 ]
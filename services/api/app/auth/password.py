@@ -3,10 +3,28 @@ Password Hashing
 
 Uses bcrypt via passlib for secure password hashing.
 Compatible with existing bcrypt hashes from the TypeScript backend.
+
+Async handlers must use hash_password_async / verify_password_async: a
+bcrypt call takes tens of milliseconds, and run inline it blocks every
+other request on the worker's event loop. The async variants run on a
+bounded thread pool (bcrypt releases the GIL, so threads hash in
+parallel) with admission control: once PASSWORD_HASH_MAX_QUEUE calls are
+waiting for a thread, further calls fail fast with a 503 instead of
+queueing without bound.
 """
 
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext  # type: ignore
 
+from app.errors import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
 # Configure passlib with bcrypt
 # The schemes list allows for future algorithm migrations
 pwd_context = CryptContext(
@@ -47,6 +65,118 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+# ============= Bounded Executor =============
+
+
+class PasswordHasher:
+    """Runs bcrypt on a fixed thread pool, rejecting work past a queue bound."""
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int = 1):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt"
+        )
+        self.in_flight = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_ms_total = 0.0
+        self.run_ms_total = 0.0
+
+    @property
+    def queued(self) -> int:
+        """Calls admitted but still waiting for a thread."""
+        return max(self.in_flight - self.workers, 0)
+
+    def stats(self) -> dict[str, float]:
+        done = self.completed or 1
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.wait_ms_total / done, 2),
+            "avg_run_ms": round(self.run_ms_total / done, 2),
+        }
+
+    async def run(self, fn, *args):
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            # Log the first rejection and then every 100th
+            if self.rejected == 1 or self.rejected % 100 == 0:
+                logger.warning(
+                    f"[AUTH] Password hasher saturated ({self.in_flight} in flight); "
+                    f"{self.rejected} rejected so far"
+                )
+            raise ServiceUnavailableError(
+                "Server is busy, please retry", retry_after=self.retry_after
+            )
+
+        submitted = time.perf_counter()
+        started: list[float] = []
+
+        def timed():
+            started.append(time.perf_counter())
+            return fn(*args)
+
+        self.in_flight += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, timed)
+        finally:
+            self.in_flight -= 1
+            if started:
+                finished = time.perf_counter()
+                self.completed += 1
+                self.wait_ms_total += (started[0] - submitted) * 1000
+                self.run_ms_total += (finished - started[0]) * 1000
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    global _hasher
+    if _hasher is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        _hasher = PasswordHasher(
+            workers=settings.password_hash_workers or os.cpu_count() or 1,
+            max_queue=settings.password_hash_max_queue,
+            retry_after=settings.password_hash_retry_after_seconds,
+        )
+    return _hasher
+
+
+def shutdown_password_hasher() -> None:
+    global _hasher
+    if _hasher is not None:
+        logger.info(f"[AUTH] Password hasher stopped: {_hasher.stats()}")
+        _hasher.shutdown()
+        _hasher = None
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on the bounded executor; ServiceUnavailableError if saturated."""
+    return await get_password_hasher().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bounded executor; ServiceUnavailableError if saturated."""
+    return await get_password_hasher().run(
+        verify_password, plain_password, hashed_password
+    )
+
+
 def validate_password_policy(password: str) -> tuple[bool, str | None]:
     """
     Validate password meets security requirements.
@@ -0,0 +1,28 @@
+"""Shared async cache: Redis pool, tags, stale-while-revalidate, coalescing."""
+
+from app.cache.backends import CacheBackend, MemoryBackend, RedisBackend
+from app.cache.core import (
+    Cache,
+    SingleFlight,
+    get_cache,
+    invalidate_tags,
+    start_cache,
+    stop_cache,
+)
+from app.cache.decorators import cached
+from app.cache.tags import DASHBOARD, tenant_tag
+
+__all__ = [
+    "Cache",
+    "CacheBackend",
+    "DASHBOARD",
+    "MemoryBackend",
+    "RedisBackend",
+    "SingleFlight",
+    "cached",
+    "get_cache",
+    "invalidate_tags",
+    "start_cache",
+    "stop_cache",
+    "tenant_tag",
+]
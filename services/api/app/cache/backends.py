@@ -0,0 +1,156 @@
+"""
+Cache Backends
+
+Byte-level storage used by app.cache.core.Cache:
+
+- RedisBackend: a shared redis.asyncio connection pool. A tag is a Redis
+  set of the keys written with it; invalidation deletes the members and
+  the set in one atomic Lua call.
+- MemoryBackend: the same operations in process memory, for tests and
+  single-process development (CACHE_REDIS_URL=memory://).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from typing import Any, Protocol
+
+# Tag sets outlive any entry added to them; refreshed on every write
+TAG_TTL_SECONDS = 24 * 3600
+
+# KEYS = tag set keys; deletes every member and the sets, returns entries deleted
+INVALIDATE_LUA = """
+local deleted = 0
+for _, tag in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', tag)
+    for i = 1, #members, 500 do
+        local last = math.min(i + 499, #members)
+        deleted = deleted + redis.call('DEL', unpack(members, i, last))
+    end
+    redis.call('DEL', tag)
+end
+return deleted
+"""
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()
+    ) -> None: ...
+
+    async def delete(self, *keys: str) -> int: ...
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int: ...
+
+    async def close(self) -> None: ...
+
+
+class RedisBackend:
+    """Redis storage over a bounded connection pool."""
+
+    def __init__(self, client: Any, prefix: str = ""):
+        self._client = client
+        self._prefix = prefix
+        self._invalidate = client.register_script(INVALIDATE_LUA)
+
+    @classmethod
+    def from_url(
+        cls, url: str, max_connections: int = 50, timeout: float = 0.1, prefix: str = ""
+    ) -> RedisBackend:
+        from redis import asyncio as aioredis
+
+        pool = aioredis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            timeout=timeout,  # Wait for a free pooled connection
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+            health_check_interval=30,
+        )
+        return cls(aioredis.Redis(connection_pool=pool), prefix)
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}tag:{tag}"
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(self._prefix + key)
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        full_key = self._prefix + key
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(full_key, value, px=max(1, int(ttl * 1000)))
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, full_key)
+                pipe.expire(tag_key, TAG_TTL_SECONDS)
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self._client.delete(*(self._prefix + k for k in keys))
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tag_keys = [self._tag_key(t) for t in tags]
+        if not tag_keys:
+            return 0
+        return int(await self._invalidate(keys=tag_keys))
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class MemoryBackend:
+    """In-process storage with the RedisBackend semantics."""
+
+    def __init__(self, max_entries: int = 10_000, clock=time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._data: dict[str, tuple[float, bytes]] = {}
+        self._tags: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._data[key]
+            return None
+        return entry[1]
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        if len(self._data) >= self.max_entries and key not in self._data:
+            now = self._clock()
+            self._data = {k: v for k, v in self._data.items() if v[0] > now}
+            if len(self._data) >= self.max_entries:
+                # Forget the oldest half (insertion order)
+                self._data = dict(list(self._data.items())[len(self._data) // 2 :])
+        self._data[key] = (self._clock() + ttl, value)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self._data.pop(k, None) is not None for k in keys)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        deleted = 0
+        for tag in tags:
+            deleted += await self.delete(*self._tags.pop(tag, ()))
+        return deleted
+
+    async def close(self) -> None:
+        self._data.clear()
+        self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+__all__ = ["CacheBackend", "INVALIDATE_LUA", "MemoryBackend", "RedisBackend"]
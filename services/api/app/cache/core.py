@@ -0,0 +1,328 @@
+"""
+Shared Async Cache
+
+Cache.get_or_set(key, compute, ttl, stale_ttl, tags) is the main entry
+point:
+
+- Entries are orjson envelopes {"f": fresh_until, "v": value} stored for
+  ttl + stale_ttl seconds. Values are anything orjson encodes (dicts,
+  lists, dataclasses, datetimes, UUIDs) plus pydantic models; pass type_
+  to get a value validated back into a type.
+- Fresh hit: returned as is.
+- Stale hit (stale-while-revalidate): the first caller recomputes and
+  stores the value; concurrent callers get the stale value at once
+  instead of waiting. The refresh runs in the caller's own request, so
+  computations may use request-scoped resources such as the DB session.
+- Miss: concurrent callers for the same key in this process share one
+  computation (SingleFlight); N API processes compute at most N times.
+- Tags: invalidate_tags() drops every entry written with any of the tags.
+
+Cache errors never fail a request: after a backend error the cache is
+bypassed (values are computed directly) for a backoff of 1 s doubling to
+30 s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from app.cache.backends import CacheBackend
+from app.metrics.registry import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+_HIT = CACHE_REQUESTS.labels("shared", "hit")
+_STALE = CACHE_REQUESTS.labels("shared", "stale")
+_MISS = CACHE_REQUESTS.labels("shared", "miss")
+
+T = TypeVar("T")
+
+
+# ============= Encoding =============
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not cacheable: {type(value).__name__}")
+
+
+def encode(value: Any, fresh_until: float) -> bytes:
+    return orjson.dumps({"f": fresh_until, "v": value}, default=_default)
+
+
+def decode(raw: bytes) -> tuple[float, Any]:
+    """(fresh_until, value)."""
+    envelope = orjson.loads(raw)
+    return envelope["f"], envelope["v"]
+
+
+_adapters: dict[Any, TypeAdapter[Any]] = {}
+
+
+def _validate(value: Any, type_: Any) -> Any:
+    if type_ is None:
+        return value
+    adapter = _adapters.get(type_)
+    if adapter is None:
+        adapter = _adapters[type_] = TypeAdapter(type_)
+    return adapter.validate_python(value)
+
+
+# ============= Request coalescing =============
+
+
+class _LeaderCancelled(Exception):
+    """The computing caller was cancelled; a follower takes over."""
+
+
+class SingleFlight:
+    """Concurrent calls for one key share a single in-flight computation."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+        self.coalesced = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        while (call := self._calls.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(call)
+            except _LeaderCancelled:
+                continue  # Compute it ourselves (or join whoever did)
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.set_exception(_LeaderCancelled())
+            call.exception()  # Mark retrieved when nobody was waiting
+            raise
+        except Exception as e:
+            call.set_exception(e)
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+# ============= Cache =============
+
+
+class Cache:
+    """Typed get/set with tags, stale-while-revalidate and coalescing."""
+
+    MIN_BACKOFF = 1.0
+    MAX_BACKOFF = 30.0
+
+    def __init__(self, backend: CacheBackend, clock=time.time):
+        self.backend = backend
+        self._clock = clock
+        self._flight = SingleFlight()
+        self._retry_at = 0.0
+        self._backoff = self.MIN_BACKOFF
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.computations = 0
+        self.errors = 0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._retry_at
+
+    def _failed(self, op: str, e: Exception) -> None:
+        self.errors += 1
+        logger.warning(
+            f"[CACHE] {op} failed, bypassing cache for {self._backoff:.0f}s: {e}"
+        )
+        self._retry_at = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, self.MAX_BACKOFF)
+
+    async def _read(self, key: str) -> tuple[float, Any] | None:
+        if not self.available:
+            return None
+        try:
+            raw = await self.backend.get(key)
+        except Exception as e:
+            self._failed("get", e)
+            return None
+        self._backoff = self.MIN_BACKOFF
+        if raw is None:
+            return None
+        try:
+            return decode(raw)
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            logger.warning(f"[CACHE] Ignoring undecodable entry {key}")
+            return None
+
+    async def get(self, key: str, type_: type[T] | Any = None) -> T | None:
+        """Cached value (fresh or stale) or None."""
+        entry = await self._read(key)
+        return _validate(entry[1], type_) if entry is not None else None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        stale_ttl: float = 0,
+        tags: Iterable[str] = (),
+    ) -> None:
+        if not self.available:
+            return
+        try:
+            raw = encode(value, self._clock() + ttl)
+        except TypeError as e:
+            logger.error(f"[CACHE] Not caching {key}: {e}")
+            return
+        try:
+            await self.backend.set(key, raw, ttl + stale_ttl, tags)
+        except Exception as e:
+            self._failed("set", e)
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self.backend.delete(*keys)
+        except Exception as e:
+            self._failed("delete", e)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Drop every entry written with any of tags; returns entries dropped."""
+        try:
+            return await self.backend.invalidate_tags(tags)
+        except Exception as e:
+            self._failed("invalidate", e)
+            return 0
+
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float = 0,
+        tags: Iterable[str] = (),
+        type_: Any = None,
+    ) -> Any:
+        """Cached value for key, computed (once per process) and stored if missing."""
+        entry = await self._read(key)
+        if entry is not None:
+            fresh_until, value = entry
+            if fresh_until > self._clock():
+                self.hits += 1
+                _HIT.inc()
+                return _validate(value, type_)
+            if key in self._flight:
+                # Someone is already refreshing it
+                self.stale_hits += 1
+                _STALE.inc()
+                return _validate(value, type_)
+
+        tags = tuple(tags)
+
+        async def compute_and_store() -> Any:
+            self.computations += 1
+            value = await compute()
+            await self.set(key, value, ttl, stale_ttl, tags)
+            return value
+
+        if entry is None:
+            self.misses += 1
+            _MISS.inc()
+        else:
+            self.stale_hits += 1
+            _STALE.inc()
+        return await self._flight.do(key, compute_and_store)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "computations": self.computations,
+            "coalesced": self._flight.coalesced,
+            "errors": self.errors,
+        }
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+_cache: Cache | None = None
+
+
+def get_cache() -> Cache | None:
+    """The shared cache, or None when it is disabled or not started."""
+    return _cache
+
+
+async def start_cache() -> Cache | None:
+    """Connect the shared cache (called from the FastAPI lifespan)."""
+    global _cache
+    if _cache is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        if not settings.cache_enabled:
+            return None
+        url = settings.cache_redis_url or settings.redis_url
+        if url.startswith("memory://"):
+            from app.cache.backends import MemoryBackend
+
+            backend: CacheBackend = MemoryBackend()
+        else:
+            from app.cache.backends import RedisBackend
+
+            backend = RedisBackend.from_url(
+                url,
+                max_connections=settings.cache_max_connections,
+                timeout=settings.cache_timeout_ms / 1000,
+                prefix=settings.cache_key_prefix,
+            )
+        _cache = Cache(backend)
+    return _cache
+
+
+async def stop_cache() -> None:
+    """Close the connection pool (lifespan shutdown)."""
+    global _cache
+    if _cache is not None:
+        logger.info(f"[CACHE] Stopped: {_cache.stats()}")
+        try:
+            await _cache.close()
+        finally:
+            _cache = None
+
+
+async def invalidate_tags(*tags: str) -> int:
+    """Invalidate tags on the shared cache; a no-op when it is not running."""
+    cache = get_cache()
+    return await cache.invalidate_tags(*tags) if cache is not None else 0
+
+
+__all__ = [
+    "Cache",
+    "SingleFlight",
+    "decode",
+    "encode",
+    "get_cache",
+    "invalidate_tags",
+    "start_cache",
+    "stop_cache",
+]
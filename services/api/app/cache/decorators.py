@@ -0,0 +1,104 @@
+"""
+Endpoint Caching Decorator
+
+    @router.get("")
+    @cached(ttl=30, stale_ttl=300, scope="tenant")
+    async def dashboard(context: RequireAuth, db: ...): ...
+
+The key is the endpoint's qualified name, the caller's scope and the
+endpoint's primitive arguments (path and query parameters); dependency
+objects such as the session or auth context are ignored.
+
+- scope="user" (default): one entry per user; bypassed for anonymous calls.
+- scope="tenant": shared by a tenant; bypassed without a tenant.
+- scope="global": shared by everyone. Only for data that is not tenant-owned.
+
+The scope comes from the tenant/user context set by TenantMiddleware.
+Without a running cache the endpoint is called directly.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from collections.abc import Callable, Iterable
+from enum import Enum
+from typing import Any, Literal
+
+import orjson
+
+from app.cache.core import get_cache
+from app.db.hooks import tenant_context, user_context
+
+Scope = Literal["user", "tenant", "global"]
+
+_PRIMITIVES = (str, int, float, bool, Enum, type(None))
+
+
+def _scope_id(scope: Scope) -> str | None:
+    tenant_id = tenant_context.get()
+    if scope == "global":
+        return "global"
+    if not tenant_id:
+        return None
+    if scope == "tenant":
+        return f"t:{tenant_id}"
+    user_id = user_context.get()
+    return f"t:{tenant_id}:u:{user_id}" if user_id else None
+
+
+def _args_digest(kwargs: dict[str, Any]) -> str:
+    params = sorted((k, v) for k, v in kwargs.items() if isinstance(v, _PRIMITIVES))
+    if not params:
+        return "-"
+    return hashlib.sha1(orjson.dumps(params)).hexdigest()[:16]
+
+
+def cached(
+    ttl: float,
+    *,
+    stale_ttl: float = 0,
+    scope: Scope = "user",
+    tags: Iterable[str] | Callable[..., Iterable[str]] = (),
+    key: Callable[..., str] | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache an async endpoint's return value.
+
+    Args:
+        ttl: Seconds the value is fresh
+        stale_ttl: Further seconds a stale value may be served while one
+            caller refreshes it
+        scope: Who shares an entry (see module docstring)
+        tags: Tags for invalidation, or a callable receiving the endpoint's
+            keyword arguments and returning them
+        key: Optional callable receiving the endpoint's keyword arguments
+            and returning the argument part of the key
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache = get_cache()
+            scope_id = _scope_id(scope)
+            if cache is None or scope_id is None:
+                return await func(*args, **kwargs)
+
+            suffix = key(**kwargs) if key is not None else _args_digest(kwargs)
+            entry_tags = tags(**kwargs) if callable(tags) else tags
+            return await cache.get_or_set(
+                f"{name}:{scope_id}:{suffix}",
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                tags=entry_tags,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["cached"]
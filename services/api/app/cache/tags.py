@@ -0,0 +1,15 @@
+"""
+Cache Tags
+
+Tag names shared by cached endpoints and the writes that invalidate them.
+"""
+
+# Tenant dashboard counts (GET /api/dashboard)
+DASHBOARD = "dashboard"
+
+
+def tenant_tag(name: str, tenant_id: str | None) -> str:
+    return f"{name}:{tenant_id}"
+
+
+__all__ = ["DASHBOARD", "tenant_tag"]
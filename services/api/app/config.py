@@ -54,6 +54,61 @@ class Settings(BaseSettings):
     access_token_minutes: int = 60
     refresh_token_days: int = 7
 
+    # Rate limiting (app.middleware.rate_limit); enable once the trusted
+    # proxies are set, or every client behind the load balancer shares its IP
+    rate_limit_enabled: bool = False
+    rate_limit_trusted_proxies: str = (
+        ""  # Comma-separated IPs/CIDRs allowed to set X-Forwarded-For
+    )
+    rate_limit_redis_url: str | None = None  # Defaults to redis_url
+    rate_limit_redis_timeout_ms: int = 50  # Then the local tier decides
+    rate_limit_local_max_keys: int = 100_000
+
+    # Admission control (app.middleware.admission); limits are per API process
+    admission_enabled: bool = True
+    admission_interactive_limit: int = 32
+    admission_heavy_limit: int = 4
+    admission_tenant_interactive_limit: int = 16
+    admission_tenant_heavy_limit: int = 2
+    admission_interactive_timeout_seconds: float = 2.0  # Queue wait before a 503
+    admission_heavy_timeout_seconds: float = 10.0
+    admission_max_queue: int = 200  # Waiters per pool before rejecting at once
+    admission_retry_after_seconds: int = 2
+
+    # Shared cache (app.cache)
+    cache_enabled: bool = True
+    cache_redis_url: str | None = (
+        None  # Defaults to redis_url; memory:// for in-process
+    )
+    cache_max_connections: int = 50  # Per API process
+    cache_timeout_ms: int = 100  # Then the value is computed without the cache
+    cache_key_prefix: str = "lms:cache:"
+
+    # Prometheus metrics (app.metrics, GET /metrics)
+    metrics_enabled: bool = True
+    metrics_token: str | None = (
+        None  # Bearer token for scrapes; required outside development
+    )
+    metrics_sample_interval_seconds: float = 5.0  # Pool/queue gauge refresh per worker
+    metrics_celery_queues: bool = True  # LLEN the broker queues on each scrape
+
+    # SQL diagnostics (app.metrics.db); Server-Timing headers outside production
+    sql_slow_query_ms: float = 250.0  # Statements slower than this are logged; 0 = off
+    sql_statement_budget: int = 50  # Statements per request before a warning; 0 = off
+
+    # Key columns are native uuid (app.db.types); set together with the migration
+    db_uuid_keys: bool = False
+
+    # Write-behind last-login / last-seen tracking (app.activity)
+    activity_flush_interval_seconds: float = 5.0
+    activity_max_pending: int = 5000  # Pending users that trigger an early flush
+    activity_seen_resolution_seconds: float = 300.0  # lastSeenAt granularity
+
+    # Password hashing executor (app.auth.password)
+    password_hash_workers: int | None = None  # bcrypt threads; defaults to CPU count
+    password_hash_max_queue: int = 64  # Waiting calls before new ones get a 503
+    password_hash_retry_after_seconds: int = 1
+
     # Environment
     env: Literal["development", "production", "test"] = "development"
     debug: bool = False
@@ -63,9 +118,65 @@ class Settings(BaseSettings):
     cookie_samesite: Literal["lax", "strict", "none"] = "lax"
     cookie_httponly: bool = True
 
+    # Outbound email (batch tasks reuse one connection per chunk)
+    mail_backend: Literal["log", "smtp"] = "log"
+    mail_from: str = "no-reply@localhost"
+    smtp_host: str | None = None
+    smtp_port: int = 587
+    smtp_username: str | None = None
+    smtp_password: str | None = None
+    smtp_use_tls: bool = True
+    # Recipients per send_email_chunk / notify_chunk task
+    bulk_chunk_size: int = 500
+
+    # Domain event outbox relay (app.events.relay)
+    outbox_relay_interval_seconds: float = 5.0
+    outbox_batch_size: int = 500
+    outbox_max_batches: int = 20  # Per relay run
+    outbox_max_attempts: int = 5  # Then the event is left for inspection
+    outbox_retention_days: int = 7  # Processed events are purged after this
+
+    # CSV imports (app.imports)
+    import_batch_size: int = 1000
+    import_enrollment_batch_size: int = 5000  # No hashing, so larger batches
+    import_hash_workers: int | None = None  # bcrypt processes; defaults to CPU count
+    import_max_errors: int = 1000  # Row errors kept on the job record
+
+    # Celery worker DB pool (one engine per worker process, see app.jobs.runtime)
+    worker_db_pool_size: int = 2
+    worker_db_max_overflow: int = 2
+
     # E2E/Test toggles
     skip_db_auth: bool = False
 
+    # File storage
+    storage_backend: Literal["local", "s3"] = "local"
+    storage_local_root: str | None = None  # Defaults to <repo>/var/uploads
+    storage_signing_secret: str | None = None  # Defaults to jwt_secret
+    storage_url_ttl_seconds: int = 3600
+    # Hand the byte transfer to the reverse proxy instead of streaming from Python
+    storage_accel_mode: Literal["none", "x-accel", "x-sendfile"] = "none"
+    storage_accel_prefix: str = "/protected-uploads/"
+    serve_static: bool = True  # Disable when nginx serves /static directly
+
+    # S3-compatible object storage (AWS S3, MinIO, ...)
+    s3_bucket: str | None = None
+    s3_endpoint_url: str | None = None
+    s3_region: str = "us-east-1"
+    s3_access_key_id: str | None = None
+    s3_secret_access_key: str | None = None
+    s3_key_prefix: str = ""
+
+    # Audit log writer (batched inserts into auth_audit_log)
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 200
+    audit_flush_interval_ms: int = 500
+    audit_enqueue_timeout_ms: int = 50  # Max wait for queue space before dropping
+    # Monthly auth_audit_log partitions
+    audit_partitions_ahead: int = 2
+    audit_retention_months: int = 12
+    audit_archive_mode: Literal["archive", "drop"] = "archive"
+
     @property
     def is_production(self) -> bool:
         return self.env == "production"
@@ -6,13 +6,14 @@ but maps to the actual table names in PostgreSQL.
 """
 
 import enum  # noqa: E402
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import uuid4
 
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
@@ -23,8 +24,11 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from app.db.types import UUIDKey
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
@@ -131,7 +135,7 @@ class Tenant(Base):
     __tablename__ = "tenants"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     domain: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -154,7 +158,7 @@ class UserType(Base):
     __tablename__ = "user_types"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     permissions: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -171,10 +175,13 @@ class Branch(Base):
     __tablename__ = "branches"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     slug: Mapped[str] = mapped_column(String, nullable=False)
@@ -208,10 +215,10 @@ class Branch(Base):
         "defaultCourseImageUrl", String
     )
     default_group_id: Mapped[str | None] = mapped_column(
-        "defaultGroupId", String, ForeignKey("groups.id")
+        "defaultGroupId", UUIDKey, ForeignKey("groups.id")
     )
     default_user_type_id: Mapped[str | None] = mapped_column(
-        "defaultUserTypeId", String, ForeignKey("user_types.id")
+        "defaultUserTypeId", UUIDKey, ForeignKey("user_types.id")
     )
     disallow_main_domain_login: Mapped[bool] = mapped_column(
         "disallowMainDomainLogin", Boolean, default=False
@@ -271,10 +278,13 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     username: Mapped[str] = mapped_column(String, nullable=False)
     email: Mapped[str] = mapped_column(String, nullable=False)
@@ -284,7 +294,7 @@ class User(Base):
     timezone: Mapped[str] = mapped_column(String, default="UTC")
     language: Mapped[str] = mapped_column(String, default="en")
     user_type_id: Mapped[str | None] = mapped_column(
-        "userTypeId", String, ForeignKey("user_types.id")
+        "userTypeId", UUIDKey, ForeignKey("user_types.id")
     )
     password_hash: Mapped[str | None] = mapped_column("passwordHash", String)
     avatar: Mapped[str | None] = mapped_column(String)
@@ -305,7 +315,9 @@ class User(Base):
     )
     is_active: Mapped[bool] = mapped_column("is_active", Boolean, default=True)
     is_verified: Mapped[bool] = mapped_column("is_verified", Boolean, default=False)
+    # Written behind by app.activity, so both can lag by a flush interval
     last_login_at: Mapped[datetime | None] = mapped_column("lastLoginAt", DateTime)
+    last_seen_at: Mapped[datetime | None] = mapped_column("lastSeenAt", DateTime)
     failed_login_attempts: Mapped[int] = mapped_column(
         "failedLoginAttempts", Integer, default=0
     )
@@ -318,7 +330,7 @@ class User(Base):
     )
     rbac_overrides: Mapped[dict | None] = mapped_column("rbac_overrides", JSONB)
     node_id: Mapped[str | None] = mapped_column(
-        "node_id", String, ForeignKey("branches.id", ondelete="SET NULL")
+        "node_id", UUIDKey, ForeignKey("branches.id", ondelete="SET NULL")
     )
     token_version: Mapped[int] = mapped_column("token_version", Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(
@@ -430,13 +442,16 @@ class UserRole(Base):
     __tablename__ = "user_roles"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     role_key: Mapped[RoleKey] = mapped_column(
         "roleKey", Enum(RoleKey, native_enum=False), nullable=False
@@ -462,7 +477,7 @@ class AuthRole(Base):
     __tablename__ = "auth_role"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -483,7 +498,7 @@ class AuthPermission(Base):
     __tablename__ = "auth_permission"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     full_permission: Mapped[str] = mapped_column(
@@ -505,13 +520,13 @@ class AuthRolePermission(Base):
 
     role_id: Mapped[str] = mapped_column(
         "roleId",
-        String,
+        UUIDKey,
         ForeignKey("auth_role.id", ondelete="CASCADE"),
         primary_key=True,
     )
     permission_id: Mapped[str] = mapped_column(
         "permissionId",
-        String,
+        UUIDKey,
         ForeignKey("auth_permission.id", ondelete="CASCADE"),
         primary_key=True,
     )
@@ -533,10 +548,13 @@ class Course(Base):
     __tablename__ = "courses"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     code: Mapped[str] = mapped_column(String, nullable=False)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -550,10 +568,10 @@ class Course(Base):
     )
     is_active: Mapped[bool] = mapped_column("isActive", Boolean, default=False)
     category_id: Mapped[str | None] = mapped_column(
-        "categoryId", String, ForeignKey("categories.id", ondelete="SET NULL")
+        "categoryId", UUIDKey, ForeignKey("categories.id", ondelete="SET NULL")
     )
     instructor_id: Mapped[str | None] = mapped_column(
-        "instructorId", String, ForeignKey("users.id", ondelete="SET NULL")
+        "instructorId", UUIDKey, ForeignKey("users.id", ondelete="SET NULL")
     )
     thumbnail_url: Mapped[str | None] = mapped_column("thumbnail_url", String)
     price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2))
@@ -638,11 +656,14 @@ class CourseVersion(Base):
     __tablename__ = "course_versions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
-    tenant_id: Mapped[str] = mapped_column("tenantId", String, nullable=False)
+    tenant_id: Mapped[str] = mapped_column("tenantId", UUIDKey, nullable=False)
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     version_number: Mapped[int] = mapped_column(
         "versionNumber", Integer, nullable=False
@@ -664,11 +685,14 @@ class CourseFile(Base):
     __tablename__ = "course_files"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
-    tenant_id: Mapped[str] = mapped_column("tenantId", String, nullable=False)
+    tenant_id: Mapped[str] = mapped_column("tenantId", UUIDKey, nullable=False)
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     url: Mapped[str] = mapped_column(String, nullable=False)
@@ -690,16 +714,22 @@ class Enrollment(Base):
     __tablename__ = "enrollments"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     status: Mapped[EnrollmentStatus] = mapped_column(
         Enum(EnrollmentStatus, native_enum=False), default=EnrollmentStatus.NOT_STARTED
@@ -737,19 +767,22 @@ class TimelineEvent(Base):
     __tablename__ = "timeline_events"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str | None] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
     )
     course_id: Mapped[str | None] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE")
+        "courseId", UUIDKey, ForeignKey("courses.id", ondelete="CASCADE")
     )
     branch_id: Mapped[str | None] = mapped_column(
-        "branchId", String, ForeignKey("branches.id", ondelete="CASCADE")
+        "branchId", UUIDKey, ForeignKey("branches.id", ondelete="CASCADE")
     )
     event_type: Mapped[str] = mapped_column("eventType", String, nullable=False)
     data: Mapped[dict | None] = mapped_column("details", JSONB)
@@ -772,14 +805,17 @@ class EnrollmentRequest(Base):
     __tablename__ = "enrollment_requests"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
-    tenant_id: Mapped[str] = mapped_column("tenantId", String, nullable=False)
+    tenant_id: Mapped[str] = mapped_column("tenantId", UUIDKey, nullable=False)
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     status: Mapped[str] = mapped_column(String, default="pending")
     created_at: Mapped[datetime] = mapped_column(
@@ -801,18 +837,18 @@ class CourseInstructor(Base):
     __tablename__ = "course_instructors"
 
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, nullable=False, primary_key=True
+        "tenantId", UUIDKey, nullable=False, primary_key=True
     )
     course_id: Mapped[str] = mapped_column(
         "courseId",
-        String,
+        UUIDKey,
         ForeignKey("courses.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     user_id: Mapped[str] = mapped_column(
         "userId",
-        String,
+        UUIDKey,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
@@ -827,11 +863,14 @@ class Prerequisite(Base):
     __tablename__ = "prerequisites"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
-    tenant_id: Mapped[str] = mapped_column("tenantId", String, nullable=False)
+    tenant_id: Mapped[str] = mapped_column("tenantId", UUIDKey, nullable=False)
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     path_index: Mapped[int] = mapped_column("pathIndex", Integer, nullable=False)
     required_course_id: Mapped[str] = mapped_column(
@@ -857,13 +896,19 @@ class CourseSection(Base):
     __tablename__ = "course_sections"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
     order_index: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -886,16 +931,22 @@ class CourseUnit(Base):
     __tablename__ = "course_units"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     section_id: Mapped[str | None] = mapped_column(
-        "sectionId", String, ForeignKey("course_sections.id", ondelete="SET NULL")
+        "sectionId", UUIDKey, ForeignKey("course_sections.id", ondelete="SET NULL")
     )
     type: Mapped[UnitType] = mapped_column(
         Enum(UnitType, name="UnitType"), nullable=False
@@ -940,17 +991,23 @@ class UnitAsset(Base):
     __tablename__ = "unit_assets"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     unit_id: Mapped[str] = mapped_column(
         "unitId",
-        String,
+        UUIDKey,
         ForeignKey("course_units.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -978,10 +1035,13 @@ class LearningPath(Base):
     __tablename__ = "learning_paths"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     code: Mapped[str | None] = mapped_column(String)
@@ -990,10 +1050,10 @@ class LearningPath(Base):
     is_active: Mapped[bool] = mapped_column("isActive", Boolean, default=False)
     is_sequential: Mapped[bool] = mapped_column("isSequential", Boolean, default=False)
     branch_id: Mapped[str | None] = mapped_column(
-        "branchId", String, ForeignKey("branches.id", ondelete="SET NULL")
+        "branchId", UUIDKey, ForeignKey("branches.id", ondelete="SET NULL")
     )
     instructor_id: Mapped[str | None] = mapped_column(
-        "instructorId", String, ForeignKey("users.id", ondelete="SET NULL")
+        "instructorId", UUIDKey, ForeignKey("users.id", ondelete="SET NULL")
     )
     created_at: Mapped[datetime] = mapped_column(
         "createdAt", DateTime, default=datetime.utcnow
@@ -1029,14 +1089,17 @@ class LearningPathSection(Base):
     __tablename__ = "learning_path_sections"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     path_id: Mapped[str] = mapped_column(
         "pathId",
-        String,
+        UUIDKey,
         ForeignKey("learning_paths.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -1062,19 +1125,25 @@ class LearningPathCourse(Base):
     __tablename__ = "learning_path_courses"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     path_id: Mapped[str] = mapped_column(
         "pathId",
-        String,
+        UUIDKey,
         ForeignKey("learning_paths.id", ondelete="CASCADE"),
         nullable=False,
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     order: Mapped[int] = mapped_column(Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(
@@ -1087,7 +1156,7 @@ class LearningPathCourse(Base):
     )
     section_id: Mapped[str | None] = mapped_column(
         "sectionId",
-        String,
+        UUIDKey,
         ForeignKey("learning_path_sections.id", ondelete="SET NULL"),
     )
 
@@ -1113,17 +1182,20 @@ class LearningPathEnrollment(Base):
     __tablename__ = "learning_path_enrollments"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     path_id: Mapped[str] = mapped_column(
         "pathId",
-        String,
+        UUIDKey,
         ForeignKey("learning_paths.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -1156,10 +1228,13 @@ class Skill(Base):
     __tablename__ = "skills"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -1196,16 +1271,19 @@ class UserSkill(Base):
     __tablename__ = "user_skills"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     skill_id: Mapped[str] = mapped_column(
-        "skillId", String, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
+        "skillId", UUIDKey, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
     )
     level: Mapped[SkillLevel] = mapped_column(
         Enum(SkillLevel, native_enum=False), default=SkillLevel.BEGINNER
@@ -1233,10 +1311,13 @@ class JobRole(Base):
     __tablename__ = "job_roles"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -1262,16 +1343,22 @@ class RoleSkill(Base):
     __tablename__ = "role_skills"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     role_id: Mapped[str] = mapped_column(
-        "roleId", String, ForeignKey("job_roles.id", ondelete="CASCADE"), nullable=False
+        "roleId",
+        UUIDKey,
+        ForeignKey("job_roles.id", ondelete="CASCADE"),
+        nullable=False,
     )
     skill_id: Mapped[str] = mapped_column(
-        "skillId", String, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
+        "skillId", UUIDKey, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
     )
     required_level: Mapped[SkillLevel] = mapped_column(
         "requiredLevel",
@@ -1295,19 +1382,25 @@ class SkillRecommendation(Base):
     __tablename__ = "skill_recommendations"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     from_user_id: Mapped[str] = mapped_column(
-        "fromUserId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "fromUserId",
+        UUIDKey,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
     )
     to_user_id: Mapped[str] = mapped_column(
-        "toUserId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "toUserId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     skill_id: Mapped[str] = mapped_column(
-        "skillId", String, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
+        "skillId", UUIDKey, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
     )
     note: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
@@ -1332,13 +1425,16 @@ class SkillResource(Base):
     __tablename__ = "skill_resources"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     skill_id: Mapped[str] = mapped_column(
-        "skillId", String, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
+        "skillId", UUIDKey, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
     url: Mapped[str] = mapped_column(String, nullable=False)
@@ -1356,13 +1452,16 @@ class SkillQuestion(Base):
     __tablename__ = "skill_questions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     skill_id: Mapped[str] = mapped_column(
-        "skillId", String, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
+        "skillId", UUIDKey, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
     )
     question: Mapped[str] = mapped_column(Text, nullable=False)
     options: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -1382,16 +1481,22 @@ class CourseSkill(Base):
     __tablename__ = "course_skills"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     skill_id: Mapped[str] = mapped_column(
-        "skillId", String, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
+        "skillId", UUIDKey, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
     )
     weight: Mapped[int] = mapped_column(Integer, default=1)
 
@@ -1413,19 +1518,22 @@ class LearningPathSkill(Base):
     __tablename__ = "learning_path_skills"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     learning_path_id: Mapped[str] = mapped_column(
         "learningPathId",
-        String,
+        UUIDKey,
         ForeignKey("learning_paths.id", ondelete="CASCADE"),
         nullable=False,
     )
     skill_id: Mapped[str] = mapped_column(
-        "skillId", String, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
+        "skillId", UUIDKey, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False
     )
     weight: Mapped[int] = mapped_column(Integer, default=1)
 
@@ -1450,18 +1558,21 @@ class Group(Base):
     __tablename__ = "groups"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(String(500))
     branch_id: Mapped[str | None] = mapped_column(
-        "branchId", String, ForeignKey("branches.id", ondelete="SET NULL")
+        "branchId", UUIDKey, ForeignKey("branches.id", ondelete="SET NULL")
     )
     instructor_id: Mapped[str | None] = mapped_column(
-        "instructorId", String, ForeignKey("users.id", ondelete="SET NULL")
+        "instructorId", UUIDKey, ForeignKey("users.id", ondelete="SET NULL")
     )
     created_at: Mapped[datetime] = mapped_column(
         "createdAt", DateTime, default=datetime.utcnow
@@ -1495,16 +1606,19 @@ class GroupMember(Base):
     __tablename__ = "group_members"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     group_id: Mapped[str] = mapped_column(
-        "groupId", String, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False
+        "groupId", UUIDKey, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     added_at: Mapped[datetime] = mapped_column(
         "addedAt", DateTime, default=datetime.utcnow
@@ -1523,16 +1637,22 @@ class GroupCourse(Base):
     __tablename__ = "group_courses"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     group_id: Mapped[str] = mapped_column(
-        "groupId", String, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False
+        "groupId", UUIDKey, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     added_at: Mapped[datetime] = mapped_column(
         "addedAt", DateTime, default=datetime.utcnow
@@ -1553,13 +1673,16 @@ class Category(Base):
     __tablename__ = "categories"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     parent_id: Mapped[str | None] = mapped_column(
-        "parentId", String, ForeignKey("categories.id", ondelete="SET NULL")
+        "parentId", UUIDKey, ForeignKey("categories.id", ondelete="SET NULL")
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     # slug: Mapped[str] = mapped_column(String, nullable=False) # Column missing in DB
@@ -1590,19 +1713,22 @@ class Assignment(Base):
     __tablename__ = "assignments"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
     course_id: Mapped[str | None] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="SET NULL")
+        "courseId", UUIDKey, ForeignKey("courses.id", ondelete="SET NULL")
     )
     due_at: Mapped[datetime | None] = mapped_column("dueAt", DateTime)
     created_by: Mapped[str] = mapped_column(
-        "createdBy", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "createdBy", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
         "createdAt", DateTime, default=datetime.utcnow
@@ -1623,26 +1749,32 @@ class AssignmentSubmission(Base):
     __tablename__ = "assignment_submissions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     assignment_unit_id: Mapped[str | None] = mapped_column(
-        "assignmentUnitId", String, ForeignKey("course_units.id", ondelete="CASCADE")
+        "assignmentUnitId", UUIDKey, ForeignKey("course_units.id", ondelete="CASCADE")
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     submission_type: Mapped[str] = mapped_column(
         "submissionType", String, nullable=False, default="text"
     )
     content: Mapped[str | None] = mapped_column(Text)
     file_id: Mapped[str | None] = mapped_column(
-        "fileId", String, ForeignKey("files.id", ondelete="SET NULL")
+        "fileId", UUIDKey, ForeignKey("files.id", ondelete="SET NULL")
     )
     status: Mapped[str] = mapped_column(String, nullable=False)
     score: Mapped[int | None] = mapped_column(Integer)
@@ -1653,7 +1785,7 @@ class AssignmentSubmission(Base):
     )
     graded_at: Mapped[datetime | None] = mapped_column("gradedAt", DateTime)
     graded_by: Mapped[str | None] = mapped_column(
-        "gradedBy", String, ForeignKey("users.id", ondelete="SET NULL")
+        "gradedBy", UUIDKey, ForeignKey("users.id", ondelete="SET NULL")
     )
 
     # Relationships
@@ -1674,19 +1806,25 @@ class LearnerCourseState(Base):
     __tablename__ = "learner_course_state"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     last_unit_id: Mapped[str | None] = mapped_column(
-        "lastUnitId", String, ForeignKey("course_units.id", ondelete="SET NULL")
+        "lastUnitId", UUIDKey, ForeignKey("course_units.id", ondelete="SET NULL")
     )
     last_accessed_at: Mapped[datetime] = mapped_column(
         "lastAccessedAt", DateTime, default=datetime.utcnow
@@ -1718,10 +1856,13 @@ class CourseRatingSetting(Base):
     __tablename__ = "course_rating_settings"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     enabled: Mapped[bool] = mapped_column(Boolean, default=False)
 
@@ -1733,16 +1874,22 @@ class CourseRating(Base):
     __tablename__ = "course_ratings"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -1771,14 +1918,17 @@ class Test(Base):
     __tablename__ = "tests"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     unit_id: Mapped[str] = mapped_column(
         "unitId",
-        String,
+        UUIDKey,
         ForeignKey("course_units.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -1808,13 +1958,16 @@ class Question(Base):
     __tablename__ = "questions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     test_id: Mapped[str | None] = mapped_column(
-        "testId", String, ForeignKey("tests.id")
+        "testId", UUIDKey, ForeignKey("tests.id")
     )
     question_pool_id: Mapped[str | None] = mapped_column("questionPoolId", String)
     type: Mapped[str] = mapped_column(String, nullable=False)
@@ -1846,14 +1999,17 @@ class QuestionPool(Base):
     __tablename__ = "question_pools"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     course_id: Mapped[str | None] = mapped_column(
-        "courseId", String, ForeignKey("courses.id")
+        "courseId", UUIDKey, ForeignKey("courses.id")
     )
     min_questions: Mapped[int] = mapped_column("minQuestions", Integer, default=2)
     created_at: Mapped[datetime] = mapped_column(
@@ -1873,14 +2029,17 @@ class FreeTextKeyword(Base):
     __tablename__ = "free_text_keywords"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     question_id: Mapped[str] = mapped_column(
         "questionId",
-        String,
+        UUIDKey,
         ForeignKey("questions.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -1903,19 +2062,25 @@ class TestAttempt(Base):
     __tablename__ = "test_attempts"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     test_id: Mapped[str] = mapped_column(
-        "testId", String, ForeignKey("tests.id", ondelete="CASCADE"), nullable=False
+        "testId", UUIDKey, ForeignKey("tests.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     course_id: Mapped[str] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+        "courseId",
+        UUIDKey,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
     )
     started_at: Mapped[datetime] = mapped_column(
         "startedAt", DateTime, default=datetime.utcnow
@@ -1941,10 +2106,13 @@ class CalendarEvent(Base):
     __tablename__ = "calendar_events"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -1953,7 +2121,7 @@ class CalendarEvent(Base):
     type: Mapped[str] = mapped_column(String, nullable=False)
     instructor_id: Mapped[str] = mapped_column(
         "instructorId",
-        String,
+        UUIDKey,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -1977,10 +2145,13 @@ class Conference(Base):
     __tablename__ = "conferences"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -1990,7 +2161,7 @@ class Conference(Base):
     meeting_url: Mapped[str | None] = mapped_column("meetingUrl", String)
     instructor_id: Mapped[str] = mapped_column(
         "instructorId",
-        String,
+        UUIDKey,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2020,10 +2191,13 @@ class Notification(Base):
     __tablename__ = "notifications"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     event_key: Mapped[str] = mapped_column("eventKey", String, nullable=False)
@@ -2033,7 +2207,7 @@ class Notification(Base):
     message_body: Mapped[str] = mapped_column("messageBody", Text, nullable=False)
     recipient_type: Mapped[str] = mapped_column("recipientType", String, nullable=False)
     recipient_user_id: Mapped[str | None] = mapped_column(
-        "recipientUserId", String, ForeignKey("users.id", ondelete="SET NULL")
+        "recipientUserId", UUIDKey, ForeignKey("users.id", ondelete="SET NULL")
     )
     filter_branches: Mapped[list[str] | None] = mapped_column(
         "filterBranches", ARRAY(String), default=[]
@@ -2069,14 +2243,17 @@ class NotificationHistory(Base):
     __tablename__ = "notification_history"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     notification_id: Mapped[str] = mapped_column(
         "notificationId",
-        String,
+        UUIDKey,
         ForeignKey("notifications.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2101,10 +2278,13 @@ class Automation(Base):
     __tablename__ = "automations"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     trigger: Mapped[str] = mapped_column("type", String, nullable=False)
@@ -2133,14 +2313,17 @@ class AutomationLog(Base):
     __tablename__ = "automation_logs"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     automation_id: Mapped[str] = mapped_column(
         "automationId",
-        String,
+        UUIDKey,
         ForeignKey("automations.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2167,13 +2350,13 @@ class Report(Base):
     __tablename__ = "reports"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     type: Mapped[str] = mapped_column(String, nullable=False)
     ruleset: Mapped[dict] = mapped_column(JSONB, nullable=False)
     created_by: Mapped[str] = mapped_column(
-        "createdBy", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "createdBy", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
         "createdAt", DateTime, default=datetime.utcnow
@@ -2190,7 +2373,7 @@ class CertificateTemplate(Base):
     __tablename__ = "certificate_templates"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     html_body: Mapped[str] = mapped_column("htmlBody", Text, nullable=False)
@@ -2213,20 +2396,20 @@ class CertificateIssue(Base):
     __tablename__ = "certificate_issues"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     course_id: Mapped[str | None] = mapped_column(
-        "courseId", String, ForeignKey("courses.id", ondelete="SET NULL")
+        "courseId", UUIDKey, ForeignKey("courses.id", ondelete="SET NULL")
     )
     path_id: Mapped[str | None] = mapped_column(
-        "pathId", String, ForeignKey("learning_paths.id", ondelete="SET NULL")
+        "pathId", UUIDKey, ForeignKey("learning_paths.id", ondelete="SET NULL")
     )
     template_id: Mapped[str] = mapped_column(
         "templateId",
-        String,
+        UUIDKey,
         ForeignKey("certificate_templates.id", ondelete="RESTRICT"),
         nullable=False,
     )
@@ -2250,10 +2433,13 @@ class Badge(Base):
     __tablename__ = "badges"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -2273,10 +2459,13 @@ class Level(Base):
     __tablename__ = "levels"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     level_number: Mapped[int] = mapped_column("levelNumber", Integer, nullable=False)
     points_required: Mapped[int] = mapped_column(
@@ -2298,10 +2487,13 @@ class Reward(Base):
     __tablename__ = "rewards"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     type: Mapped[str] = mapped_column(String, nullable=False)
@@ -2319,13 +2511,16 @@ class GamificationSettings(Base):
     __tablename__ = "gamification_settings"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     branch_id: Mapped[str | None] = mapped_column(
-        "branchId", String, ForeignKey("branches.id", ondelete="SET NULL")
+        "branchId", UUIDKey, ForeignKey("branches.id", ondelete="SET NULL")
     )
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     points_enabled: Mapped[bool] = mapped_column("pointsEnabled", Boolean, default=True)
@@ -2355,13 +2550,16 @@ class PointsLedger(Base):
     __tablename__ = "points_ledger"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     points: Mapped[int] = mapped_column(Integer, nullable=False)
     reason: Mapped[str] = mapped_column(String, nullable=False)
@@ -2380,13 +2578,16 @@ class PasswordResetToken(Base):
     __tablename__ = "password_reset_tokens"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     token: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     expires_at: Mapped[datetime] = mapped_column("expiresAt", DateTime, nullable=False)
@@ -2410,10 +2611,13 @@ class Discussion(Base):
     __tablename__ = "discussions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     topic: Mapped[str] = mapped_column(String, nullable=False)
     body: Mapped[str] = mapped_column(Text, nullable=False)
@@ -2445,14 +2649,17 @@ class DiscussionComment(Base):
     __tablename__ = "discussion_comments"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     discussion_id: Mapped[str] = mapped_column(
         "discussionId",
-        String,
+        UUIDKey,
         ForeignKey("discussions.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2475,10 +2682,13 @@ class DiscussionModerationSettings(Base):
     __tablename__ = "discussion_moderation_settings"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     edit_window_hours: Mapped[int] = mapped_column(
         "editWindowHours", Integer, default=2
@@ -2505,10 +2715,13 @@ class MessageThread(Base):
     __tablename__ = "message_threads"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     subject: Mapped[str] = mapped_column(String, nullable=False)
     created_by: Mapped[str] = mapped_column("createdBy", String, nullable=False)
@@ -2537,14 +2750,17 @@ class Message(Base):
     __tablename__ = "messages"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     thread_id: Mapped[str] = mapped_column(
         "threadId",
-        String,
+        UUIDKey,
         ForeignKey("message_threads.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2568,14 +2784,17 @@ class MessageRecipient(Base):
     __tablename__ = "message_recipients"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     thread_id: Mapped[str] = mapped_column(
         "threadId",
-        String,
+        UUIDKey,
         ForeignKey("message_threads.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2599,10 +2818,13 @@ class MessagingPermissions(Base):
     __tablename__ = "messaging_permissions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_type_id: Mapped[str] = mapped_column("userTypeId", String, nullable=False)
     can_message_admins: Mapped[bool] = mapped_column(
@@ -2627,7 +2849,7 @@ class TalentLibraryCourse(Base):
     __tablename__ = "talent_library_courses"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     external_id: Mapped[str] = mapped_column(
         "externalId", String, unique=True, nullable=False
@@ -2649,20 +2871,23 @@ class AcquiredLibraryCourse(Base):
     __tablename__ = "acquired_library_courses"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     library_course_id: Mapped[str] = mapped_column(
         "libraryCourseId",
-        String,
+        UUIDKey,
         ForeignKey("talent_library_courses.id", ondelete="CASCADE"),
         nullable=False,
     )
     local_course_id: Mapped[str] = mapped_column(
         "localCourseId",
-        String,
+        UUIDKey,
         ForeignKey("courses.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2695,14 +2920,17 @@ class EnrollmentExtension(Base):
     __tablename__ = "enrollment_extensions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     enrollment_id: Mapped[str] = mapped_column(
         "enrollmentId",
-        String,
+        UUIDKey,
         ForeignKey("enrollments.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2730,11 +2958,11 @@ class PortalFeatureFlags(Base):
     __tablename__ = "portal_feature_flags"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
         "tenantId",
-        String,
+        UUIDKey,
         ForeignKey("tenants.id", ondelete="CASCADE"),
         unique=True,
         nullable=False,
@@ -2768,17 +2996,20 @@ class SCORMData(Base):
     __tablename__ = "scorm_data"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     user_id: Mapped[str] = mapped_column(
-        "userId", String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        "userId", UUIDKey, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     unit_id: Mapped[str] = mapped_column(
         "unitId",
-        String,
+        UUIDKey,
         ForeignKey("course_units.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2810,14 +3041,17 @@ class ILTSession(Base):
     __tablename__ = "ilt_sessions"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     ilt_unit_id: Mapped[str] = mapped_column(
         "iltUnitId",
-        String,
+        UUIDKey,
         ForeignKey("course_units.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2845,14 +3079,17 @@ class ILTAttendance(Base):
     __tablename__ = "ilt_attendance"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     session_id: Mapped[str] = mapped_column(
         "sessionId",
-        String,
+        UUIDKey,
         ForeignKey("ilt_sessions.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2877,10 +3114,13 @@ class File(Base):
     __tablename__ = "files"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     filename: Mapped[str] = mapped_column(String, nullable=False)
     filepath: Mapped[str | None] = mapped_column(String)
@@ -2912,13 +3152,16 @@ class FileVisibility(Base):
     __tablename__ = "file_visibility"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     file_id: Mapped[str] = mapped_column(
-        "fileId", String, ForeignKey("files.id", ondelete="CASCADE"), nullable=False
+        "fileId", UUIDKey, ForeignKey("files.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[str] = mapped_column("userId", String, nullable=False)
     can_view: Mapped[bool] = mapped_column("canView", Boolean, default=True)
@@ -2936,14 +3179,17 @@ class ConferenceParticipant(Base):
     __tablename__ = "conference_participants"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     tenant_id: Mapped[str] = mapped_column(
-        "tenantId", String, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
     )
     conference_id: Mapped[str] = mapped_column(
         "conferenceId",
-        String,
+        UUIDKey,
         ForeignKey("conferences.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -2971,7 +3217,7 @@ class LRSStatement(Base):
     __tablename__ = "lrs_statements"
 
     id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid4())
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
     )
     actor: Mapped[dict] = mapped_column(JSONB, nullable=False)
     verb: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -2984,3 +3230,148 @@ class LRSStatement(Base):
     version: Mapped[str] = mapped_column(String, default="1.0.3")
 
 
+
+
+# ============= Search Models =============
+
+
+class SearchDocument(Base):
+    """Denormalized per-tenant search row, kept in sync by app.search.index."""
+
+    __tablename__ = "search_documents"
+
+    id: Mapped[str] = mapped_column(
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
+    )
+    tenant_id: Mapped[str] = mapped_column(
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    entity_type: Mapped[str] = mapped_column("entityType", String, nullable=False)
+    entity_id: Mapped[str] = mapped_column("entityId", UUIDKey, nullable=False)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    subtitle: Mapped[str | None] = mapped_column(String)
+    document: Mapped[str] = mapped_column(Text, nullable=False)
+    node_id: Mapped[str | None] = mapped_column("nodeId", UUIDKey)
+    updated_at: Mapped[datetime] = mapped_column(
+        "updatedAt", DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenantId",
+            "entityType",
+            "entityId",
+            name="search_documents_tenant_entity_unique",
+        ),
+    )
+
+
+# ============= Audit Models =============
+
+
+class AuthAuditLog(Base):
+    """Audit trail, partitioned by month on created_at (see app.audit.partitions)."""
+
+    __tablename__ = "auth_audit_log"
+
+    id: Mapped[str] = mapped_column(
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        "created_at", DateTime, primary_key=True, default=datetime.utcnow
+    )
+    tenant_id: Mapped[str | None] = mapped_column("tenant_id", String)
+    event_type: Mapped[str] = mapped_column("event_type", String, nullable=False)
+    severity: Mapped[str] = mapped_column("severity", String, default="LOW")
+    user_id: Mapped[str | None] = mapped_column("user_id", String)
+    correlation_id: Mapped[str | None] = mapped_column("correlation_id", String)
+    ip_address: Mapped[str | None] = mapped_column("ip_address", String)
+    user_agent: Mapped[str | None] = mapped_column("user_agent", String)
+    metadata_: Mapped[dict] = mapped_column("metadata", JSONB, default=dict)
+
+
+# ============= Outbox Models =============
+
+
+class OutboxEvent(Base):
+    """Domain event written in the producing transaction; app.events.relay drains it."""
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[str] = mapped_column(
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
+    )
+    tenant_id: Mapped[str] = mapped_column(
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_type: Mapped[str] = mapped_column("eventType", String, nullable=False)
+    aggregate_id: Mapped[str | None] = mapped_column("aggregateId", String)
+    user_id: Mapped[str | None] = mapped_column("userId", String)
+    payload: Mapped[dict] = mapped_column(JSONB, default=dict)
+    # Consumers that already handled the event; a retry skips them
+    handled_by: Mapped[list[str]] = mapped_column(
+        "handledBy", ARRAY(String), default=list
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[str | None] = mapped_column("lastError", Text)
+    created_at: Mapped[datetime] = mapped_column(
+        "createdAt", DateTime, default=datetime.utcnow
+    )
+    processed_at: Mapped[datetime | None] = mapped_column("processedAt", DateTime)
+
+
+# ============= Import Models =============
+
+
+class ImportJob(Base):
+    """Bulk CSV import run; progress is updated per batch by app.imports."""
+
+    __tablename__ = "import_jobs"
+
+    id: Mapped[str] = mapped_column(
+        UUIDKey, primary_key=True, default=lambda: str(uuid4())
+    )
+    tenant_id: Mapped[str] = mapped_column(
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    type: Mapped[str] = mapped_column(String, nullable=False)
+    filename: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    total_rows: Mapped[int] = mapped_column("totalRows", Integer, nullable=False)
+    success_rows: Mapped[int] = mapped_column("successRows", Integer, default=0)
+    error_rows: Mapped[int] = mapped_column("errorRows", Integer, default=0)
+    errors: Mapped[list[dict] | None] = mapped_column(JSONB)
+    uploaded_by: Mapped[str] = mapped_column(
+        "uploadedBy", PG_UUID(as_uuid=False), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        "createdAt", DateTime, default=datetime.utcnow
+    )
+    completed_at: Mapped[datetime | None] = mapped_column("completedAt", DateTime)
+
+
+# ============= Activity Models =============
+
+
+class LoginDailyCount(Base):
+    """Logins per tenant per UTC day, incremented by app.activity flushes."""
+
+    __tablename__ = "login_daily_counts"
+
+    tenant_id: Mapped[str] = mapped_column(
+        "tenantId",
+        UUIDKey,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    logins: Mapped[int] = mapped_column(Integer, default=0)
@@ -11,6 +11,12 @@ from app.config import get_settings
 
 # Import hooks to register event listeners
 from app.db.hooks import init_hooks, tenant_context
+
+# Import outbox to register its domain event listener
+from app.events import outbox as _outbox  # noqa: F401
+
+# Import search index to register its document sync listeners
+from app.search import index as _search_index  # noqa: F401
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
@@ -57,9 +63,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 @asynccontextmanager
-async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
-    """Context manager for database sessions outside of FastAPI."""
-    async with async_session_factory() as session:
+async def get_db_context(
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Context manager for database sessions outside of FastAPI.
+
+    Celery tasks pass the worker runtime's factory (app.jobs.runtime) so
+    they use the worker engine instead of the web app's pool.
+    """
+    async with (session_factory or async_session_factory)() as session:
         tenant_id = tenant_context.get()
         if tenant_id:
             await session.execute(
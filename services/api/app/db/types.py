@@ -0,0 +1,82 @@
+"""
+Column Types
+
+UUIDKey is the type of every primary key "id" column and of the foreign
+keys that reference one. Keys are strings in Python either way; the SQL
+type follows DB_UUID_KEYS:
+
+- off (default): text/varchar columns, as created by the Prisma schema;
+- on: native Postgres uuid columns, after the
+  alembic/versions/c4e8b1d37f52_convert_keys_to_uuid.py migration.
+
+The flag has to match the schema: asyncpg binds with explicit casts, so
+"id" = $1::VARCHAR fails against a uuid column and "id" = $1::UUID
+against a text one. Raw SQL that casts keys uses key_sql_type().
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from app.config import get_settings
+
+# No generated key is nil, so a malformed id binds as a value that matches nothing
+NIL_KEY = "00000000-0000-0000-0000-000000000000"
+
+
+def uuid_keys_enabled() -> bool:
+    """Whether key columns are native uuid (DB_UUID_KEYS)."""
+    return get_settings().db_uuid_keys
+
+
+def key_sql_type() -> str:
+    """SQL type name of key columns, for CASTs in raw SQL."""
+    return "uuid" if uuid_keys_enabled() else "text"
+
+
+class UUIDKey(TypeDecorator):
+    """
+    String key stored as text or, with DB_UUID_KEYS, as native uuid.
+
+    Accepts str or uuid.UUID and always returns str. Against uuid columns a
+    string that is not a UUID binds as NIL_KEY, so looking up a malformed
+    id finds nothing (a 404) instead of failing in the driver.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, native: bool | None = None):
+        # None follows DB_UUID_KEYS; tests pin it
+        super().__init__()
+        self.native = native
+
+    def _native(self, dialect: Dialect) -> bool:
+        if dialect.name != "postgresql":
+            return False
+        return uuid_keys_enabled() if self.native is None else self.native
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if self._native(dialect):
+            return dialect.type_descriptor(PG_UUID(as_uuid=False))
+        return dialect.type_descriptor(String())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        if not self._native(dialect):
+            return str(value)
+        try:
+            return str(value if isinstance(value, UUID) else UUID(str(value)))
+        except ValueError:
+            return NIL_KEY
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        return None if value is None else str(value)
+
+
+__all__ = ["NIL_KEY", "UUIDKey", "key_sql_type", "uuid_keys_enabled"]
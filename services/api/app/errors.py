@@ -24,11 +24,13 @@ class AppError(Exception):
         error_code: str = "INTERNAL_ERROR",
         status_code: int = 500,
         reason: str | None = None,
+        headers: dict[str, str] | None = None,
     ):
         self.message = message
         self.error_code = error_code
         self.status_code = status_code
         self.reason = reason
+        self.headers = headers
         super().__init__(message)
 
 
@@ -101,12 +103,41 @@ class BadRequestError(AppError):
         )
 
 
+class ServiceUnavailableError(AppError):
+    """Temporarily overloaded; the client should retry after retry_after seconds."""
+
+    def __init__(
+        self, message: str = "Service temporarily unavailable", retry_after: int = 1
+    ):
+        super().__init__(
+            message=message,
+            error_code="SERVICE_UNAVAILABLE",
+            status_code=503,
+            headers={"Retry-After": str(retry_after)},
+        )
+        self.retry_after = retry_after
+
+
+class TooManyRequestsError(AppError):
+    """Rate limited; the client should retry after retry_after seconds."""
+
+    def __init__(self, message: str = "Too many requests", retry_after: int = 1):
+        super().__init__(
+            message=message,
+            error_code="TOO_MANY_REQUESTS",
+            status_code=429,
+            headers={"Retry-After": str(retry_after)},
+        )
+        self.retry_after = retry_after
+
+
 def _error_response(
     status_code: int,
     error_code: str,
     message: str,
     reason: str | None = None,
     details: Any = None,
+    headers: dict[str, str] | None = None,
 ) -> JSONResponse:
     """Create standardized JSON error response."""
     content: dict[str, Any] = {
@@ -118,7 +149,7 @@ def _error_response(
     if details:
         content["details"] = details
 
-    return JSONResponse(status_code=status_code, content=content)
+    return JSONResponse(status_code=status_code, content=content, headers=headers)
 
 
 async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
@@ -128,6 +159,7 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
         error_code=exc.error_code,
         message=exc.message,
         reason=exc.reason,
+        headers=exc.headers,
     )
 
 
@@ -143,6 +175,7 @@ async def http_exception_handler(
         405: "METHOD_NOT_ALLOWED",
         429: "TOO_MANY_REQUESTS",
         500: "INTERNAL_ERROR",
+        503: "SERVICE_UNAVAILABLE",
     }
 
     error_code = error_codes.get(exc.status_code, "ERROR")
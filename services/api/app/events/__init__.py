@@ -0,0 +1,8 @@
+"""Domain event outbox package."""
+
+from app.events.outbox import DomainEventType, emit
+
+__all__ = [
+    "DomainEventType",
+    "emit",
+]
@@ -0,0 +1,165 @@
+"""
+Outbox Consumers
+
+Each consumer receives a batch of outbox events of the types it
+subscribes to and handles them in one go: a bulk INSERT, or a single
+Celery task for the whole batch. Handlers run inside the relay's
+transaction, so rows they write commit together with the events being
+marked as handled.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import (
+    Automation,
+    GamificationSettings,
+    OutboxEvent,
+    PointsLedger,
+    TimelineEvent,
+)
+from app.events.outbox import DomainEventType
+
+Handler = Callable[[AsyncSession, list[OutboxEvent]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Consumer:
+    name: str
+    event_types: frozenset[str]
+    handle: Handler
+
+
+def serialize_event(e: OutboxEvent) -> dict[str, Any]:
+    """JSON-safe event for Celery task arguments."""
+    return {
+        "id": e.id,
+        "tenant_id": e.tenant_id,
+        "event_type": e.event_type,
+        "aggregate_id": e.aggregate_id,
+        "user_id": e.user_id,
+        "payload": e.payload or {},
+    }
+
+
+async def handle_timeline(db: AsyncSession, events: list[OutboxEvent]) -> None:
+    rows = [
+        {
+            "id": e.id,  # timeline row shares the outbox event id
+            "tenant_id": e.tenant_id,
+            "user_id": e.user_id,
+            "course_id": (e.payload or {}).get("courseId"),
+            "branch_id": (e.payload or {}).get("branchId"),
+            "event_type": e.event_type,
+            "data": e.payload or {},
+            "created_at": e.created_at,
+        }
+        for e in events
+    ]
+    await db.execute(insert(TimelineEvent), rows)
+
+
+async def handle_gamification(db: AsyncSession, events: list[OutboxEvent]) -> None:
+    """Award the tenant's points-per-login for each login."""
+    tenant_ids = {e.tenant_id for e in events}
+    result = await db.execute(
+        select(
+            GamificationSettings.tenant_id, GamificationSettings.points_per_login
+        ).where(
+            GamificationSettings.tenant_id.in_(tenant_ids),
+            GamificationSettings.branch_id.is_(None),
+            GamificationSettings.enabled.is_(True),
+            GamificationSettings.points_enabled.is_(True),
+        )
+    )
+    points = dict(result.all())
+    rows = [
+        {
+            "tenant_id": e.tenant_id,
+            "user_id": e.user_id,
+            "points": points[e.tenant_id],
+            "reason": "LOGIN",
+            "created_at": e.created_at,
+        }
+        for e in events
+        if e.user_id and points.get(e.tenant_id)
+    ]
+    if rows:
+        await db.execute(insert(PointsLedger), rows)
+
+
+async def handle_certificates(db: AsyncSession, events: list[OutboxEvent]) -> None:
+    from app.jobs.tasks import certificate_check_eligibility_batch
+
+    certificate_check_eligibility_batch.delay([serialize_event(e) for e in events])
+
+
+async def handle_automations(db: AsyncSession, events: list[OutboxEvent]) -> None:
+    """Queue one evaluation task per automation whose trigger matches."""
+    from app.jobs.tasks import automation_evaluate_batch
+
+    keys = {(e.tenant_id, e.event_type) for e in events}
+    result = await db.execute(
+        select(Automation.id, Automation.tenant_id, Automation.trigger).where(
+            tuple_(Automation.tenant_id, Automation.trigger).in_(keys),
+            Automation.active.is_(True),
+        )
+    )
+    for automation_id, tenant_id, trigger in result.all():
+        user_ids = sorted(
+            {
+                e.user_id
+                for e in events
+                if e.user_id and e.tenant_id == tenant_id and e.event_type == trigger
+            }
+        )
+        if user_ids:
+            automation_evaluate_batch.delay(automation_id, tenant_id, user_ids)
+
+
+CONSUMERS: list[Consumer] = [
+    Consumer(
+        "timeline",
+        frozenset(
+            {
+                DomainEventType.ENROLLMENT_CREATED.value,
+                DomainEventType.COURSE_COMPLETED.value,
+                DomainEventType.ASSIGNMENT_CREATED.value,
+            }
+        ),
+        handle_timeline,
+    ),
+    Consumer(
+        "gamification",
+        frozenset({DomainEventType.USER_LOGGED_IN.value}),
+        handle_gamification,
+    ),
+    Consumer(
+        "certificates",
+        frozenset({DomainEventType.COURSE_COMPLETED.value}),
+        handle_certificates,
+    ),
+    Consumer(
+        "automations",
+        frozenset(t.value for t in DomainEventType),
+        handle_automations,
+    ),
+]
+
+
+def consumers_for(event_type: str) -> list[Consumer]:
+    return [c for c in CONSUMERS if event_type in c.event_types]
+
+
+__all__ = [
+    "CONSUMERS",
+    "Consumer",
+    "consumers_for",
+    "serialize_event",
+]
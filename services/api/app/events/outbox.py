@@ -0,0 +1,142 @@
+"""
+Domain Event Outbox
+
+Domain events are written to outbox_events in the same transaction as the
+change that caused them, so an event exists if and only if the change
+committed. app.events.relay drains the table in batches and hands grouped
+events to the consumers in app.events.consumers.
+
+Events come from two places:
+- emit(session, ...): explicit, for changes with no natural row to watch
+  (a login, an assignment being published).
+- an after_flush listener that derives ENROLLMENT_CREATED and
+  COURSE_COMPLETED from Enrollment rows, however a route creates or
+  updates them.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import event, insert, inspect
+from sqlalchemy.orm import Session
+
+from app.db.models import Enrollment, EnrollmentStatus, OutboxEvent
+
+
+class DomainEventType(str, Enum):
+    ENROLLMENT_CREATED = "ENROLLMENT_CREATED"
+    COURSE_COMPLETED = "COURSE_COMPLETED"
+    USER_LOGGED_IN = "USER_LOGGED_IN"
+    ASSIGNMENT_CREATED = "ASSIGNMENT_CREATED"
+
+
+def event_row(
+    event_type: DomainEventType | str,
+    tenant_id: str,
+    aggregate_id: str | None = None,
+    user_id: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    return {
+        "id": str(uuid4()),
+        "tenant_id": tenant_id,
+        "event_type": getattr(event_type, "value", event_type),
+        "aggregate_id": aggregate_id,
+        "user_id": user_id,
+        "payload": payload or {},
+        "handled_by": [],
+        "attempts": 0,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def emit(
+    session: Any,
+    event_type: DomainEventType | str,
+    tenant_id: str,
+    aggregate_id: str | None = None,
+    user_id: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> OutboxEvent:
+    """Add a domain event to the session; it commits with the caller's change."""
+    outbox_event = OutboxEvent(
+        **event_row(event_type, tenant_id, aggregate_id, user_id, payload)
+    )
+    session.add(outbox_event)
+    return outbox_event
+
+
+def _completed_now(enrollment: Enrollment) -> bool:
+    history = inspect(enrollment).attrs.status.history
+    return bool(history.added) and history.added[0] == EnrollmentStatus.COMPLETED
+
+
+def _enrollment_payload(enrollment: Enrollment) -> dict[str, Any]:
+    return {"enrollmentId": enrollment.id, "courseId": enrollment.course_id}
+
+
+def collect_events(session: Session) -> list[dict[str, Any]]:
+    """Outbox rows for Enrollment inserts and transitions to COMPLETED."""
+    rows = []
+    for obj in session.new:
+        if isinstance(obj, Enrollment) and obj.tenant_id:
+            rows.append(
+                event_row(
+                    DomainEventType.ENROLLMENT_CREATED,
+                    obj.tenant_id,
+                    obj.id,
+                    obj.user_id,
+                    _enrollment_payload(obj),
+                )
+            )
+            if obj.status == EnrollmentStatus.COMPLETED:
+                rows.append(
+                    event_row(
+                        DomainEventType.COURSE_COMPLETED,
+                        obj.tenant_id,
+                        obj.id,
+                        obj.user_id,
+                        _enrollment_payload(obj),
+                    )
+                )
+    for obj in session.dirty:
+        if isinstance(obj, Enrollment) and obj.tenant_id and _completed_now(obj):
+            rows.append(
+                event_row(
+                    DomainEventType.COURSE_COMPLETED,
+                    obj.tenant_id,
+                    obj.id,
+                    obj.user_id,
+                    _enrollment_payload(obj),
+                )
+            )
+    return rows
+
+
+def column_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Attribute keys -> column names, for Core inserts ("tenant_id" -> "tenantId")."""
+    columns = OutboxEvent.__mapper__.columns
+    return {columns[key].key: value for key, value in row.items()}
+
+
+@event.listens_for(Session, "after_flush")
+def _write_enrollment_events(session: Session, flush_context) -> None:
+    # The flush is in progress, so write on its connection rather than session.add
+    rows = collect_events(session)
+    if rows:
+        session.connection().execute(
+            insert(OutboxEvent.__table__), [column_row(r) for r in rows]
+        )
+
+
+__all__ = [
+    "DomainEventType",
+    "collect_events",
+    "column_row",
+    "emit",
+    "event_row",
+]
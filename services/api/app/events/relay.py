@@ -0,0 +1,134 @@
+"""
+Outbox Relay
+
+Drains outbox_events in creation order, batch_size rows at a time, and
+hands each consumer its subset of the batch in a single call. A burst of
+10k enrollments therefore becomes a few dozen consumer runs rather than
+tens of thousands of tasks.
+
+Delivery is at-least-once with per-consumer bookkeeping:
+- rows are claimed with FOR UPDATE SKIP LOCKED, so concurrent relays never
+  share a batch;
+- each consumer runs in a SAVEPOINT; on success its name is appended to
+  handled_by, so a retry only re-runs the consumers that failed;
+- consumer writes, handled_by and processedAt commit in one transaction.
+Events whose consumers keep failing stop being picked up after
+max_attempts and stay in the table with lastError for inspection.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Select, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.models import OutboxEvent
+from app.events.consumers import CONSUMERS, Consumer
+
+logger = logging.getLogger(__name__)
+
+
+def claim_batch_query(batch_size: int, max_attempts: int) -> Select:
+    return (
+        select(OutboxEvent)
+        .where(
+            OutboxEvent.processed_at.is_(None),
+            OutboxEvent.attempts < max_attempts,
+        )
+        .order_by(OutboxEvent.created_at, OutboxEvent.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+
+async def dispatch(
+    db: AsyncSession,
+    events: list[OutboxEvent],
+    consumers: list[Consumer] = CONSUMERS,
+) -> set[str]:
+    """Run every consumer over its share of the batch; returns ids of failed events."""
+    failed: set[str] = set()
+    for consumer in consumers:
+        pending = [
+            e
+            for e in events
+            if e.event_type in consumer.event_types
+            and consumer.name not in (e.handled_by or [])
+        ]
+        if not pending:
+            continue
+        try:
+            async with db.begin_nested():
+                await consumer.handle(db, pending)
+        except Exception as exc:
+            logger.exception(
+                f"[OUTBOX] Consumer {consumer.name} failed on {len(pending)} events"
+            )
+            for e in pending:
+                failed.add(e.id)
+                e.last_error = f"{consumer.name}: {exc}"
+            continue
+        for e in pending:
+            e.handled_by = [*(e.handled_by or []), consumer.name]
+
+    now = datetime.utcnow()
+    for e in events:
+        if e.id in failed:
+            e.attempts = (e.attempts or 0) + 1
+        else:
+            e.processed_at = now
+    return failed
+
+
+async def relay_batch(
+    db: AsyncSession, batch_size: int, max_attempts: int
+) -> dict[str, int]:
+    events = list(
+        (await db.execute(claim_batch_query(batch_size, max_attempts))).scalars()
+    )
+    failed = await dispatch(db, events) if events else set()
+    return {"events": len(events), "failed": len(failed)}
+
+
+async def drain(
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int,
+    max_batches: int,
+    max_attempts: int,
+) -> dict[str, Any]:
+    """Relay up to max_batches batches, one transaction each."""
+    from app.db.session import get_db_context
+
+    totals = {"batches": 0, "events": 0, "failed": 0}
+    for _ in range(max_batches):
+        async with get_db_context(session_factory) as db:
+            stats = await relay_batch(db, batch_size, max_attempts)
+        if not stats["events"]:
+            break
+        totals["batches"] += 1
+        totals["events"] += stats["events"]
+        totals["failed"] += stats["failed"]
+        if stats["events"] < batch_size:
+            break
+    return totals
+
+
+async def purge_processed(db: AsyncSession, retention_days: int) -> int:
+    """Delete events processed more than retention_days ago."""
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    result = await db.execute(
+        delete(OutboxEvent).where(OutboxEvent.processed_at < cutoff)
+    )
+    return result.rowcount or 0
+
+
+__all__ = [
+    "claim_batch_query",
+    "dispatch",
+    "drain",
+    "purge_processed",
+    "relay_batch",
+]
@@ -0,0 +1,14 @@
+"""Bulk CSV import package."""
+
+from app.imports.common import ImportSummary, RowError, create_job, serialize_job
+from app.imports.enrollments import run_enrollment_import
+from app.imports.users import run_user_import
+
+__all__ = [
+    "ImportSummary",
+    "RowError",
+    "create_job",
+    "run_enrollment_import",
+    "run_user_import",
+    "serialize_job",
+]
@@ -0,0 +1,232 @@
+"""
+CSV Import Plumbing
+
+Shared by the user and enrollment importers:
+
+- iter_batches(): streams a CSV file and yields fixed-size batches of
+  (row_number, row) with normalized header names, so a 100k-row file is
+  never held in memory at once.
+- copy_records(): bulk-loads a batch into a temp staging table with
+  COPY (asyncpg copy_records_to_table) on the session's connection, so
+  the merge INSERT ... SELECT runs in the same transaction.
+- start_job() / record_batch() / finish_job(): keep the import_jobs row
+  current after every batch so clients can poll progress.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import ImportJob
+
+_HEADER_RE = re.compile(r"[^a-z0-9]")
+
+
+def normalize_header(name: str) -> str:
+    """'First Name', 'first_name', 'FIRSTNAME' -> 'firstname'."""
+    return _HEADER_RE.sub("", name.strip().lower())
+
+
+@dataclass
+class RowError:
+    row: int
+    error: str
+    value: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"row": self.row, "error": self.error, "value": self.value}
+
+
+@dataclass
+class ImportSummary:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "errors": [e.to_dict() for e in self.errors],
+        }
+
+
+@asynccontextmanager
+async def open_import_file(file_ref: str, tenant_id: str) -> AsyncIterator[Path]:
+    """
+    Resolve an upload key to a readable file.
+
+    file_ref comes from the client, so it is only ever looked up in storage
+    under the tenant's prefix (tenant_key); trusted callers with a local
+    file pass its path to run_*_import directly.
+    """
+    from app.storage import get_storage, tenant_key
+
+    async with get_storage().local_copy(tenant_key(tenant_id, file_ref)) as local:
+        yield local
+
+
+def count_rows(path: Path) -> int:
+    """Data rows in a CSV file (a cheap pass; quoted newlines are respected)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+
+def iter_batches(
+    path: Path, batch_size: int
+) -> Iterator[list[tuple[int, dict[str, str]]]]:
+    """
+    Yield batches of (row_number, {normalized_header: value}).
+
+    Row numbers are 1-based data rows (the header is row 0), matching what
+    users see in a spreadsheet minus the header line.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        keys = [normalize_header(h) for h in header]
+        batch: list[tuple[int, dict[str, str]]] = []
+        for number, values in enumerate(reader, start=1):
+            if not any(v.strip() for v in values):
+                continue
+            batch.append(
+                (number, {k: v.strip() for k, v in zip(keys, values) if k})
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+async def copy_records(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: list[tuple[Any, ...]],
+) -> None:
+    """COPY records into table on the session's current connection."""
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table, records=records, columns=list(columns)
+    )
+
+
+async def create_job(
+    session: AsyncSession,
+    tenant_id: str,
+    job_type: str,
+    filename: str,
+    uploaded_by: str,
+) -> ImportJob:
+    job = ImportJob(
+        tenant_id=tenant_id,
+        type=job_type,
+        filename=filename,
+        status="PENDING",
+        total_rows=0,
+        success_rows=0,
+        error_rows=0,
+        uploaded_by=uploaded_by,
+    )
+    session.add(job)
+    await session.flush()
+    return job
+
+
+def serialize_job(job: ImportJob) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "type": job.type,
+        "filename": job.filename,
+        "status": job.status,
+        "totalRows": job.total_rows,
+        "successRows": job.success_rows,
+        "errorRows": job.error_rows,
+        "errors": job.errors or [],
+        "createdAt": job.created_at.isoformat() if job.created_at else None,
+        "completedAt": job.completed_at.isoformat() if job.completed_at else None,
+    }
+
+
+async def start_job(session: AsyncSession, job_id: str, total_rows: int) -> None:
+    await session.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id)
+        .values(status="PROCESSING", total_rows=total_rows)
+    )
+
+
+async def record_batch(
+    session: AsyncSession,
+    job_id: str,
+    succeeded: int,
+    errors: list[RowError],
+    max_errors: int,
+) -> None:
+    """Add one batch's counts to the job row (same transaction as the batch)."""
+    job = await session.get(ImportJob, job_id)
+    if job is None:
+        return
+    job.success_rows = (job.success_rows or 0) + succeeded
+    job.error_rows = (job.error_rows or 0) + len(errors)
+    kept = list(job.errors or [])
+    if len(kept) < max_errors:
+        kept.extend(e.to_dict() for e in errors[: max_errors - len(kept)])
+        job.errors = kept
+
+
+async def finish_job(session: AsyncSession, job_id: str, summary: ImportSummary) -> str:
+    if summary.failed and not summary.succeeded:
+        status = "FAILED"
+    elif summary.failed:
+        status = "PARTIAL"
+    else:
+        status = "COMPLETED"
+    await session.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id)
+        .values(status=status, completed_at=datetime.utcnow())
+    )
+    return status
+
+
+async def fail_job(session: AsyncSession, job_id: str, message: str) -> None:
+    job = await session.get(ImportJob, job_id)
+    if job is None:
+        return
+    job.status = "FAILED"
+    job.completed_at = datetime.utcnow()
+    job.errors = [*(job.errors or []), {"row": None, "error": message, "value": None}]
+
+
+__all__ = [
+    "ImportSummary",
+    "RowError",
+    "copy_records",
+    "count_rows",
+    "create_job",
+    "fail_job",
+    "finish_job",
+    "iter_batches",
+    "normalize_header",
+    "open_import_file",
+    "record_batch",
+    "serialize_job",
+    "start_job",
+]
@@ -0,0 +1,327 @@
+"""
+CSV Enrollment Import
+
+Columns: user (email or username), course (code), optional due date
+(stored as the enrollment's expiresAt). Per batch of
+IMPORT_ENROLLMENT_BATCH_SIZE rows:
+
+1. validate in Python (required fields, due date format);
+2. resolve identifiers with two set queries: users by email/username and
+   courses by code (course ids are cached across batches, since a file
+   usually names few courses). A user/course pair repeated within the
+   batch is an error, as one upsert cannot touch the same row twice;
+3. COPY the resolved rows into a temp staging table and upsert them into
+   enrollments with one INSERT ... SELECT ... ON CONFLICT DO UPDATE, which
+   refreshes the due date and restores soft-deleted enrollments;
+4. write ENROLLMENT_CREATED outbox events for the newly inserted rows (the
+   after_flush listener only sees ORM inserts);
+5. add the batch's counts to the import job, in the same transaction.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.db.models import OutboxEvent
+from app.db.types import key_sql_type
+from app.events.outbox import DomainEventType, column_row, event_row
+from app.imports.common import (
+    ImportSummary,
+    RowError,
+    copy_records,
+    count_rows,
+    finish_job,
+    iter_batches,
+    record_batch,
+    start_job,
+)
+
+logger = logging.getLogger(__name__)
+
+# normalized CSV header -> field
+HEADER_ALIASES = {
+    "user": "user",
+    "email": "user",
+    "useremail": "user",
+    "username": "user",
+    "login": "user",
+    "course": "course",
+    "coursecode": "course",
+    "code": "course",
+    "duedate": "due_date",
+    "due": "due_date",
+    "expiresat": "due_date",
+    "expirydate": "due_date",
+}
+
+STAGE_TABLE = "import_enrollments_stage"
+STAGE_COLUMNS = ("row_number", "id", "user_id", "course_id", "expires_at")
+
+# {key} is the key column type (app.db.types.key_sql_type); ids are returned as text
+CREATE_STAGE_SQL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} (
+        row_number integer,
+        id {{key}},
+        user_id {{key}},
+        course_id {{key}},
+        expires_at timestamp(3)
+    ) ON COMMIT DELETE ROWS
+"""
+
+# xmax = 0 only for rows this statement inserted (not updated)
+UPSERT_SQL = f"""
+    INSERT INTO enrollments (
+        id, "tenantId", "userId", "courseId", "expiresAt", "updatedAt"
+    )
+    SELECT id, CAST(:tenant_id AS {{key}}), user_id, course_id, expires_at, now()
+    FROM {STAGE_TABLE}
+    ORDER BY row_number
+    ON CONFLICT ("tenantId", "userId", "courseId") DO UPDATE SET
+        "expiresAt" = COALESCE(EXCLUDED."expiresAt", enrollments."expiresAt"),
+        "deletedAt" = NULL,
+        "updatedAt" = now()
+    RETURNING id::text, "userId"::text, "courseId"::text, (xmax = 0) AS inserted
+"""
+
+USERS_SQL = """
+    SELECT id::text, email, username FROM users
+    WHERE "tenantId" = :tenant_id
+      AND "deletedAt" IS NULL
+      AND (email = ANY(:emails) OR username = ANY(:usernames))
+"""
+
+COURSES_SQL = """
+    SELECT id::text, code FROM courses
+    WHERE "tenantId" = :tenant_id
+      AND "deletedAt" IS NULL
+      AND code = ANY(:codes)
+"""
+
+
+@dataclass
+class EnrollmentRow:
+    row: int
+    user: str
+    course: str
+    due_date: datetime | None
+    user_id: str = ""
+    course_id: str = ""
+
+    def record(self) -> tuple[Any, ...]:
+        return (self.row, str(uuid4()), self.user_id, self.course_id, self.due_date)
+
+
+# ============= Validation =============
+
+
+def parse_due_date(value: str) -> datetime:
+    """ISO date or datetime; timezone-aware values are converted to naive UTC."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def validate_batch(
+    batch: list[tuple[int, dict[str, str]]],
+) -> tuple[list[EnrollmentRow], list[RowError]]:
+    rows: list[EnrollmentRow] = []
+    errors: list[RowError] = []
+    for number, raw in batch:
+        f: dict[str, str] = {}
+        for key, value in raw.items():
+            field_name = HEADER_ALIASES.get(key)
+            if field_name and value and field_name not in f:
+                f[field_name] = value
+        user = f.get("user", "")
+        if "@" in user:
+            user = user.lower()
+        course = f.get("course", "")
+        if not user or not course:
+            errors.append(
+                RowError(number, "User and course are required", user or None)
+            )
+            continue
+        due_date = None
+        if f.get("due_date"):
+            try:
+                due_date = parse_due_date(f["due_date"])
+            except ValueError:
+                errors.append(RowError(number, "Invalid due date", f["due_date"]))
+                continue
+        rows.append(EnrollmentRow(number, user, course, due_date))
+    return rows, errors
+
+
+# ============= Resolution =============
+
+
+async def resolve_users(
+    session: AsyncSession, tenant_id: str, identifiers: set[str]
+) -> dict[str, str]:
+    """email/username -> user id, in one query."""
+    if not identifiers:
+        return {}
+    emails = [i for i in identifiers if "@" in i]
+    usernames = [i for i in identifiers if "@" not in i]
+    result = await session.execute(
+        text(USERS_SQL),
+        {"tenant_id": tenant_id, "emails": emails, "usernames": usernames},
+    )
+    resolved: dict[str, str] = {}
+    for user_id, email, username in result:
+        if email in identifiers:
+            resolved[email] = user_id
+        if username in identifiers:
+            resolved[username] = user_id
+    return resolved
+
+
+async def resolve_courses(
+    session: AsyncSession, tenant_id: str, codes: set[str], cache: dict[str, str]
+) -> dict[str, str]:
+    """course code -> course id; only codes missing from cache are queried."""
+    missing = [c for c in codes if c not in cache]
+    if missing:
+        result = await session.execute(
+            text(COURSES_SQL), {"tenant_id": tenant_id, "codes": missing}
+        )
+        cache.update({code: course_id for course_id, code in result})
+    return cache
+
+
+async def resolve_rows(
+    session: AsyncSession,
+    tenant_id: str,
+    rows: list[EnrollmentRow],
+    course_cache: dict[str, str],
+) -> tuple[list[EnrollmentRow], list[RowError]]:
+    users = await resolve_users(session, tenant_id, {r.user for r in rows})
+    courses = await resolve_courses(
+        session, tenant_id, {r.course for r in rows}, course_cache
+    )
+    kept: list[EnrollmentRow] = []
+    errors: list[RowError] = []
+    # Compare resolved ids: an email and a username can name the same user
+    pairs: set[tuple[str, str]] = set()
+    for r in rows:
+        if r.user not in users:
+            errors.append(RowError(r.row, "User not found", r.user))
+        elif r.course not in courses:
+            errors.append(RowError(r.row, "Course not found", r.course))
+        elif (users[r.user], courses[r.course]) in pairs:
+            errors.append(RowError(r.row, "Duplicate enrollment in batch", r.user))
+        else:
+            r.user_id, r.course_id = users[r.user], courses[r.course]
+            pairs.add((r.user_id, r.course_id))
+            kept.append(r)
+    return kept, errors
+
+
+# ============= Upsert =============
+
+
+async def upsert_enrollments(
+    session: AsyncSession, tenant_id: str, rows: list[EnrollmentRow]
+) -> tuple[int, int]:
+    """COPY rows into staging and upsert them; returns (inserted, updated)."""
+    key = key_sql_type()
+    await session.execute(text(CREATE_STAGE_SQL.format(key=key)))
+    await copy_records(session, STAGE_TABLE, STAGE_COLUMNS, [r.record() for r in rows])
+    result = await session.execute(
+        text(UPSERT_SQL.format(key=key)), {"tenant_id": tenant_id}
+    )
+
+    events = []
+    updated = 0
+    for enrollment_id, user_id, course_id, inserted in result:
+        if not inserted:
+            updated += 1
+            continue
+        events.append(
+            column_row(
+                event_row(
+                    DomainEventType.ENROLLMENT_CREATED,
+                    tenant_id,
+                    enrollment_id,
+                    user_id,
+                    {"enrollmentId": enrollment_id, "courseId": course_id},
+                )
+            )
+        )
+    if events:
+        await session.execute(insert(OutboxEvent.__table__), events)
+    return len(events), updated
+
+
+async def import_batch(
+    session: AsyncSession,
+    tenant_id: str,
+    rows: list[EnrollmentRow],
+    course_cache: dict[str, str],
+) -> tuple[int, list[RowError]]:
+    rows, errors = await resolve_rows(session, tenant_id, rows, course_cache)
+    if not rows:
+        return 0, errors
+    inserted, updated = await upsert_enrollments(session, tenant_id, rows)
+    return inserted + updated, errors
+
+
+async def run_enrollment_import(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_id: str,
+    path: Path,
+    tenant_id: str,
+    options: dict[str, Any] | None = None,
+) -> ImportSummary:
+    """Import an enrollments CSV into tenant_id, one transaction per batch."""
+    from app.db.session import get_db_context
+
+    settings = get_settings()
+
+    summary = ImportSummary()
+    async with get_db_context(session_factory) as db:
+        await start_job(db, job_id, count_rows(path))
+
+    course_cache: dict[str, str] = {}
+    for batch in iter_batches(path, settings.import_enrollment_batch_size):
+        rows, errors = validate_batch(batch)
+        async with get_db_context(session_factory) as db:
+            upserted, batch_errors = await import_batch(
+                db, tenant_id, rows, course_cache
+            )
+            errors.extend(batch_errors)
+            errors.sort(key=lambda e: e.row)
+            await record_batch(db, job_id, upserted, errors, settings.import_max_errors)
+
+        summary.total += len(batch)
+        summary.succeeded += upserted
+        summary.failed += len(errors)
+        room = settings.import_max_errors - len(summary.errors)
+        summary.errors.extend(errors[: max(room, 0)])
+        logger.info(
+            f"[IMPORT] Job {job_id}: {summary.succeeded}/{summary.total} enrolled"
+        )
+
+    async with get_db_context(session_factory) as db:
+        await finish_job(db, job_id, summary)
+    return summary
+
+
+__all__ = [
+    "EnrollmentRow",
+    "import_batch",
+    "resolve_rows",
+    "run_enrollment_import",
+    "upsert_enrollments",
+    "validate_batch",
+]
@@ -0,0 +1,409 @@
+"""
+CSV User Import
+
+Per batch of IMPORT_BATCH_SIZE rows:
+
+1. validate in Python (required fields, email shape, role, password
+   policy, duplicates within the file);
+2. one set query for email/username collisions with existing users,
+   soft-deleted ones included since the unique constraints cover them;
+3. bcrypt the supplied passwords in a process pool (~60 ms each at 10
+   rounds, so this is the dominant cost); rows without a password are
+   created with no hash and must use password reset;
+4. COPY the batch into a temp staging table and merge it into users with
+   one INSERT ... SELECT ... ON CONFLICT DO NOTHING, then index the new
+   rows for search;
+5. add the batch's counts to the import job, in the same transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.password import hash_password, validate_password_policy
+from app.config import get_settings
+from app.db.models import RoleKey
+from app.db.types import key_sql_type
+from app.imports.common import (
+    ImportSummary,
+    RowError,
+    copy_records,
+    count_rows,
+    finish_job,
+    iter_batches,
+    record_batch,
+    start_job,
+)
+from app.search.index import SPECS_BY_TYPE, upsert_sql
+
+logger = logging.getLogger(__name__)
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# normalized CSV header -> field
+HEADER_ALIASES = {
+    "email": "email",
+    "emailaddress": "email",
+    "mail": "email",
+    "username": "username",
+    "login": "username",
+    "firstname": "first_name",
+    "first": "first_name",
+    "givenname": "first_name",
+    "lastname": "last_name",
+    "last": "last_name",
+    "surname": "last_name",
+    "familyname": "last_name",
+    "password": "password",
+    "role": "role",
+    "timezone": "timezone",
+    "language": "language",
+}
+
+STAGE_TABLE = "import_users_stage"
+STAGE_COLUMNS = (
+    "row_number",
+    "id",
+    "email",
+    "username",
+    "first_name",
+    "last_name",
+    "password_hash",
+    "role",
+    "timezone",
+    "language",
+)
+
+# {key} is the key column type (app.db.types.key_sql_type); ids are returned as text
+CREATE_STAGE_SQL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} (
+        row_number integer,
+        id {{key}},
+        email text,
+        username text,
+        first_name text,
+        last_name text,
+        password_hash text,
+        role text,
+        timezone text,
+        language text
+    ) ON COMMIT DELETE ROWS
+"""
+
+MERGE_SQL = f"""
+    INSERT INTO users (
+        id, "tenantId", username, email, "firstName", "lastName", "passwordHash",
+        role, "activeRole", status, is_active, is_verified, "failedLoginAttempts",
+        "excludeFromEmails", token_version, timezone, language, node_id,
+        "createdAt", "updatedAt"
+    )
+    SELECT
+        id, CAST(:tenant_id AS {{key}}), username, email, first_name, last_name,
+        password_hash, CAST(role AS "RoleKey"), CAST(role AS "RoleKey"),
+        'ACTIVE', true, false, 0, false, 0, timezone, language,
+        CAST(:node_id AS {{key}}), now(), now()
+    FROM {STAGE_TABLE}
+    ORDER BY row_number
+    ON CONFLICT DO NOTHING
+    RETURNING id::text
+"""
+
+COLLISIONS_SQL = """
+    SELECT email, username FROM users
+    WHERE "tenantId" = :tenant_id
+      AND (email = ANY(:emails) OR username = ANY(:usernames))
+"""
+
+
+@dataclass
+class UserRow:
+    row: int
+    email: str
+    username: str
+    first_name: str
+    last_name: str
+    password: str | None
+    role: str
+    timezone: str
+    language: str
+    id: str = ""
+    password_hash: str | None = None
+
+    def record(self) -> tuple[Any, ...]:
+        return (
+            self.row,
+            self.id,
+            self.email,
+            self.username,
+            self.first_name,
+            self.last_name,
+            self.password_hash,
+            self.role,
+            self.timezone,
+            self.language,
+        )
+
+
+# ============= Validation =============
+
+
+def map_fields(raw: dict[str, str]) -> dict[str, str]:
+    fields: dict[str, str] = {}
+    for key, value in raw.items():
+        field_name = HEADER_ALIASES.get(key)
+        if field_name and value and field_name not in fields:
+            fields[field_name] = value
+    return fields
+
+
+def validate_batch(
+    batch: list[tuple[int, dict[str, str]]],
+    seen_emails: set[str],
+    seen_usernames: set[str],
+    default_role: str = "LEARNER",
+) -> tuple[list[UserRow], list[RowError]]:
+    """
+    Validate rows; seen_* carry across batches to catch in-file duplicates.
+    """
+    rows: list[UserRow] = []
+    errors: list[RowError] = []
+    for number, raw in batch:
+        f = map_fields(raw)
+        email = f.get("email", "").lower()
+        if not email or not _EMAIL_RE.match(email):
+            errors.append(RowError(number, "Invalid email", email or None))
+            continue
+        if not f.get("first_name") or not f.get("last_name"):
+            errors.append(RowError(number, "First and last name are required", email))
+            continue
+        username = f.get("username") or email.split("@")[0].replace(".", "_")
+        role = f.get("role", default_role).upper()
+        if role not in RoleKey.__members__:
+            errors.append(RowError(number, f"Unknown role {role}", email))
+            continue
+        password = f.get("password")
+        if password:
+            ok, message = validate_password_policy(password)
+            if not ok:
+                errors.append(RowError(number, message or "Invalid password", email))
+                continue
+        if email in seen_emails:
+            errors.append(RowError(number, "Duplicate email in file", email))
+            continue
+        if username in seen_usernames:
+            errors.append(RowError(number, "Duplicate username in file", username))
+            continue
+        seen_emails.add(email)
+        seen_usernames.add(username)
+        rows.append(
+            UserRow(
+                row=number,
+                email=email,
+                username=username,
+                first_name=f["first_name"],
+                last_name=f["last_name"],
+                password=password,
+                role=role,
+                timezone=f.get("timezone", "UTC"),
+                language=f.get("language", "en"),
+            )
+        )
+    return rows, errors
+
+
+async def find_collisions(
+    session: AsyncSession, tenant_id: str, rows: list[UserRow]
+) -> tuple[list[UserRow], list[RowError]]:
+    """Drop rows whose email or username already exists, in one query."""
+    if not rows:
+        return rows, []
+    result = await session.execute(
+        text(COLLISIONS_SQL),
+        {
+            "tenant_id": tenant_id,
+            "emails": [r.email for r in rows],
+            "usernames": [r.username for r in rows],
+        },
+    )
+    taken_emails: set[str] = set()
+    taken_usernames: set[str] = set()
+    for email, username in result:
+        taken_emails.add(email)
+        taken_usernames.add(username)
+
+    kept: list[UserRow] = []
+    errors: list[RowError] = []
+    for r in rows:
+        if r.email in taken_emails:
+            errors.append(RowError(r.row, "Email already exists", r.email))
+        elif r.username in taken_usernames:
+            errors.append(RowError(r.row, "Username already exists", r.username))
+        else:
+            kept.append(r)
+    return kept, errors
+
+
+# ============= Password Hashing =============
+
+
+_hash_pool: Executor | None = None
+
+
+def _hash_chunk(passwords: list[str]) -> list[str]:
+    return [hash_password(p) for p in passwords]
+
+
+def get_hash_pool() -> Executor:
+    global _hash_pool
+    if _hash_pool is None:
+        workers = get_settings().import_hash_workers or os.cpu_count() or 1
+        _hash_pool = ProcessPoolExecutor(max_workers=workers)
+    return _hash_pool
+
+
+def _fallback_to_threads() -> Executor:
+    # Daemonic Celery children may not fork; bcrypt releases the GIL, so
+    # threads still hash in parallel
+    global _hash_pool
+    workers = get_settings().import_hash_workers or os.cpu_count() or 1
+    logger.warning("[IMPORT] Process pool unavailable, hashing on threads")
+    _hash_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+    return _hash_pool
+
+
+async def hash_passwords(passwords: list[str], chunk_size: int = 16) -> list[str]:
+    """bcrypt passwords in parallel, chunked to amortize IPC."""
+    if not passwords:
+        return []
+    loop = asyncio.get_running_loop()
+    chunks = [
+        passwords[i : i + chunk_size] for i in range(0, len(passwords), chunk_size)
+    ]
+    pool = get_hash_pool()
+    try:
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _hash_chunk, c) for c in chunks)
+        )
+    except (AssertionError, BrokenProcessPool, OSError):
+        pool = _fallback_to_threads()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _hash_chunk, c) for c in chunks)
+        )
+    return [h for chunk in results for h in chunk]
+
+
+# ============= Merge =============
+
+
+async def merge_users(
+    session: AsyncSession, tenant_id: str, rows: list[UserRow], node_id: str | None
+) -> set[str]:
+    """COPY rows into staging and merge them into users; returns inserted ids."""
+    key = key_sql_type()
+    await session.execute(text(CREATE_STAGE_SQL.format(key=key)))
+    await copy_records(session, STAGE_TABLE, STAGE_COLUMNS, [r.record() for r in rows])
+    result = await session.execute(
+        text(MERGE_SQL.format(key=key)), {"tenant_id": tenant_id, "node_id": node_id}
+    )
+    inserted = set(result.scalars())
+    if inserted:
+        # Core insert: the ORM flush hook that maintains search documents never ran
+        await session.execute(
+            text(upsert_sql(SPECS_BY_TYPE["user"], "s.id = ANY(:ids)")),
+            {"ids": list(inserted)},
+        )
+    return inserted
+
+
+async def import_batch(
+    session: AsyncSession,
+    tenant_id: str,
+    rows: list[UserRow],
+    node_id: str | None,
+) -> tuple[int, list[RowError]]:
+    rows, errors = await find_collisions(session, tenant_id, rows)
+    if not rows:
+        return 0, errors
+
+    with_password = [r for r in rows if r.password]
+    passwords = [r.password for r in with_password]
+    hashes = await hash_passwords(passwords)  # type: ignore[arg-type]
+    for r, h in zip(with_password, hashes):
+        r.password_hash = h
+    for r in rows:
+        r.id = str(uuid4())
+
+    inserted = await merge_users(session, tenant_id, rows, node_id)
+    # Lost a race with a concurrent insert of the same email/username
+    errors.extend(
+        RowError(r.row, "Email or username already exists", r.email)
+        for r in rows
+        if r.id not in inserted
+    )
+    return len(inserted), errors
+
+
+async def run_user_import(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_id: str,
+    path: Path,
+    tenant_id: str,
+    options: dict[str, Any] | None = None,
+) -> ImportSummary:
+    """Import a users CSV into tenant_id, one transaction per batch."""
+    from app.db.session import get_db_context
+
+    settings = get_settings()
+    options = options or {}
+    default_role = str(options.get("defaultRole", "LEARNER")).upper()
+    node_id = options.get("nodeId")
+
+    summary = ImportSummary()
+    async with get_db_context(session_factory) as db:
+        await start_job(db, job_id, count_rows(path))
+
+    seen_emails: set[str] = set()
+    seen_usernames: set[str] = set()
+    for batch in iter_batches(path, settings.import_batch_size):
+        rows, errors = validate_batch(batch, seen_emails, seen_usernames, default_role)
+        async with get_db_context(session_factory) as db:
+            inserted, batch_errors = await import_batch(db, tenant_id, rows, node_id)
+            errors.extend(batch_errors)
+            errors.sort(key=lambda e: e.row)
+            await record_batch(db, job_id, inserted, errors, settings.import_max_errors)
+
+        summary.total += len(batch)
+        summary.succeeded += inserted
+        summary.failed += len(errors)
+        room = settings.import_max_errors - len(summary.errors)
+        summary.errors.extend(errors[: max(room, 0)])
+        logger.info(
+            f"[IMPORT] Job {job_id}: {summary.succeeded}/{summary.total} imported"
+        )
+
+    async with get_db_context(session_factory) as db:
+        await finish_job(db, job_id, summary)
+    return summary
+
+
+__all__ = [
+    "UserRow",
+    "find_collisions",
+    "hash_passwords",
+    "import_batch",
+    "merge_users",
+    "run_user_import",
+    "validate_batch",
+]
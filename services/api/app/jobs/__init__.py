@@ -56,6 +56,21 @@ celery_app.conf.update(
     },
     # Default queue
     task_default_queue="default",
+    # Periodic tasks (celery beat)
+    beat_schedule={
+        "audit-maintain-partitions": {
+            "task": "app.jobs.tasks.audit_maintain_partitions",
+            "schedule": 24 * 60 * 60,  # daily
+        },
+        "outbox-relay": {
+            "task": "app.jobs.tasks.outbox_relay",
+            "schedule": settings.outbox_relay_interval_seconds,
+        },
+        "outbox-purge": {
+            "task": "app.jobs.tasks.outbox_purge",
+            "schedule": 24 * 60 * 60,  # daily
+        },
+    },
     # Task time limits
     task_soft_time_limit=300,  # 5 minutes soft limit
     task_time_limit=600,  # 10 minutes hard limit
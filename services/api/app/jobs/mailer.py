@@ -0,0 +1,113 @@
+"""
+Outbound Mail Connections
+
+Batch email tasks open one connection per chunk of recipients and send
+every message in the chunk over it, instead of one connection per email.
+The transport is chosen by the MAIL_BACKEND setting:
+
+- log: no delivery, messages are logged (development default)
+- smtp: a single SMTP session (STARTTLS/login once) per chunk
+
+send() raises RecipientRejected when the server refuses one address;
+the caller records that recipient as failed and carries on. Any other
+exception means the connection itself is unusable and the chunk should
+be retried.
+"""
+
+from __future__ import annotations
+
+import logging
+import smtplib
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from email.message import EmailMessage
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class RecipientRejected(Exception):
+    """The server refused a single recipient; retrying will not help."""
+
+
+class MailConnection(ABC):
+    @abstractmethod
+    def send(self, to: str, subject: str, body: str) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+
+class LogMailConnection(MailConnection):
+    def send(self, to: str, subject: str, body: str) -> None:
+        logger.info(f"[EMAIL] {to}: {subject}")
+
+
+class SmtpMailConnection(MailConnection):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = True,
+        timeout: float = 30,
+    ):
+        self.sender = sender
+        self.smtp = smtplib.SMTP(host, port, timeout=timeout)
+        if use_tls:
+            self.smtp.starttls()
+        if username:
+            self.smtp.login(username, password or "")
+
+    def send(self, to: str, subject: str, body: str) -> None:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = to
+        message["Subject"] = subject
+        message.set_content(body)
+        try:
+            self.smtp.send_message(message)
+        except smtplib.SMTPRecipientsRefused as e:
+            raise RecipientRejected(str(e.recipients.get(to, e))) from e
+
+    def close(self) -> None:
+        try:
+            self.smtp.quit()
+        except smtplib.SMTPException:
+            self.smtp.close()
+
+
+@contextmanager
+def open_mail_connection() -> Iterator[MailConnection]:
+    """Open one outbound connection for a batch of messages."""
+    settings = get_settings()
+    if settings.mail_backend == "smtp":
+        if not settings.smtp_host:
+            raise RuntimeError("SMTP_HOST must be set when MAIL_BACKEND=smtp")
+        connection: MailConnection = SmtpMailConnection(
+            host=settings.smtp_host,
+            port=settings.smtp_port,
+            sender=settings.mail_from,
+            username=settings.smtp_username,
+            password=settings.smtp_password,
+            use_tls=settings.smtp_use_tls,
+        )
+    else:
+        connection = LogMailConnection()
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+__all__ = [
+    "LogMailConnection",
+    "MailConnection",
+    "RecipientRejected",
+    "SmtpMailConnection",
+    "open_mail_connection",
+]
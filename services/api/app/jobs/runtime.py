@@ -0,0 +1,124 @@
+"""
+Celery Worker Async Runtime
+
+Each worker process gets one long-lived event loop and its own async
+engine/pool, created in worker_process_init (after the prefork fork), so
+tasks reuse warm connections instead of paying for loop setup and
+connection churn per task, and no asyncpg pool is shared across processes.
+
+Tasks call run_async(coro) to execute their async body on the process
+loop, and open sessions with task_db(), which uses the worker engine.
+Outside a prefork child (solo/threads pools, eager mode, scripts) the
+runtime is created lazily on first use, one per thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Coroutine
+from contextlib import AbstractAsyncContextManager
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown  # type: ignore
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerRuntime:
+    """Event loop + async engine owned by one worker process (or thread)."""
+
+    def __init__(self, pool_size: int, max_overflow: int):
+        settings = get_settings()
+        self.loop = asyncio.new_event_loop()
+        self.engine: AsyncEngine = create_async_engine(
+            settings.async_database_url,
+            echo=settings.debug,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+        )
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return self.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        try:
+            self.loop.run_until_complete(self.engine.dispose())
+        finally:
+            self.loop.close()
+
+
+_local = threading.local()
+
+
+def current_runtime() -> WorkerRuntime:
+    runtime: WorkerRuntime | None = getattr(_local, "runtime", None)
+    if runtime is None:
+        settings = get_settings()
+        runtime = WorkerRuntime(
+            pool_size=settings.worker_db_pool_size,
+            max_overflow=settings.worker_db_max_overflow,
+        )
+        _local.runtime = runtime
+    return runtime
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run an async task body on this worker's persistent loop."""
+    return current_runtime().run(coro)
+
+
+def task_db() -> AbstractAsyncContextManager[AsyncSession]:
+    """Session context bound to the worker engine (see get_db_context)."""
+    from app.db.session import get_db_context
+
+    return get_db_context(current_runtime().session_factory)
+
+
+def shutdown_runtime() -> None:
+    runtime: WorkerRuntime | None = getattr(_local, "runtime", None)
+    if runtime is not None:
+        _local.runtime = None
+        runtime.close()
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs: Any) -> None:
+    # Connections inherited from the parent must not be reused after fork
+    from app.db.session import engine
+
+    engine.sync_engine.dispose(close=False)
+    current_runtime()
+    logger.info("[WORKER] Async runtime initialized")
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**kwargs: Any) -> None:
+    shutdown_runtime()
+
+
+__all__ = [
+    "WorkerRuntime",
+    "current_runtime",
+    "run_async",
+    "shutdown_runtime",
+    "task_db",
+]
@@ -19,27 +19,31 @@ Tasks are grouped by:
 - Automation: Rule-based automation execution
 """
 
-import asyncio
+from datetime import datetime
 from typing import Any, Dict, List, Optional
-
-from app.db.models import NotificationHistory, PointsLedger, TimelineEvent
-from app.db.session import get_db_context
+from uuid import uuid4
+
+from app.config import get_settings
+
+from app.db.models import (
+    CertificateIssue,
+    Enrollment,
+    EnrollmentStatus,
+    Notification,
+    NotificationHistory,
+    PointsLedger,
+    TimelineEvent,
+    User,
+)
+from app.jobs.mailer import RecipientRejected, open_mail_connection
+from app.jobs.runtime import current_runtime, run_async, task_db
 from celery import shared_task  # type: ignore
 from celery.utils.log import get_task_logger  # type: ignore
+from sqlalchemy import insert, select, tuple_
 
 logger = get_task_logger(__name__)
 
 
-def run_async(coro):
-    """Run an async coroutine in a synchronous context."""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
-
-
 # ============= Email Tasks =============
 
 
@@ -112,6 +116,10 @@ def send_email(
         raise self.retry(exc=exc)
 
 
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 @shared_task(
     name="app.jobs.tasks.send_bulk_email",
     queue="email",
@@ -124,28 +132,183 @@ def send_bulk_email(
     template_data: Dict[str, Any],
     tenant_id: str,
 ):
-    """Send bulk email to multiple recipients."""
-    logger.info(f"[EMAIL] Sending bulk email to {len(recipients)} recipients")
-
-    results = []
-    for recipient in recipients:
-        # Queue individual emails for better retry handling
-        result = send_email.delay(
-            email_type="notification",
-            to=recipient,
+    """Send bulk email, one send_email_chunk task per BULK_CHUNK_SIZE recipients."""
+    chunks = _chunks(recipients, get_settings().bulk_chunk_size)
+    logger.info(
+        f"[EMAIL] Sending bulk email to {len(recipients)} recipients "
+        f"in {len(chunks)} chunks"
+    )
+
+    task_ids = []
+    for chunk in chunks:
+        result = send_email_chunk.delay(
+            recipients=chunk,
             subject=subject,
             tenant_id=tenant_id,
             template_data=template_data,
             template_id=template_id,
         )
-        results.append({"to": recipient, "task_id": result.id})
+        task_ids.append(result.id)
+
+    return {"queued": len(recipients), "chunks": len(task_ids), "task_ids": task_ids}
 
-    return {"queued": len(results), "results": results}
+
+@shared_task(
+    bind=True,
+    name="app.jobs.tasks.send_email_chunk",
+    queue="email",
+    max_retries=3,
+    default_retry_delay=10,
+)
+def send_email_chunk(
+    self,
+    recipients: List[str],
+    subject: str,
+    tenant_id: str,
+    template_data: Optional[Dict[str, Any]] = None,
+    template_id: Optional[str] = None,
+    email_type: str = "notification",
+    sent: int = 0,
+    failed: Optional[List[Dict[str, str]]] = None,
+):
+    """
+    Send one email to each recipient over a single mail connection.
+
+    A rejected address is recorded in `failed` and skipped. If the
+    connection breaks, the chunk is retried with only the recipients not
+    yet sent to; `sent` and `failed` carry over between attempts. Once
+    retries run out, the unsent recipients are marked failed.
+    """
+    failed = list(failed or [])
+    body = (template_data or {}).get("body", "")
+    logger.info(
+        f"[EMAIL] Sending {email_type} chunk of {len(recipients)} "
+        f"(attempt {self.request.retries + 1})"
+    )
+
+    done = 0
+    try:
+        with open_mail_connection() as mail:
+            for to in recipients:
+                try:
+                    mail.send(to, subject, body)
+                    sent += 1
+                except RecipientRejected as e:
+                    failed.append({"to": to, "error": str(e)})
+                done += 1
+    except Exception as exc:
+        remaining = recipients[done:]
+        if self.request.retries < self.max_retries:
+            logger.warning(
+                f"[EMAIL] Chunk interrupted, retrying {len(remaining)} recipients"
+            )
+            raise self.retry(
+                exc=exc,
+                countdown=self.default_retry_delay * 2**self.request.retries,
+                kwargs={
+                    "recipients": remaining,
+                    "subject": subject,
+                    "tenant_id": tenant_id,
+                    "template_data": template_data,
+                    "template_id": template_id,
+                    "email_type": email_type,
+                    "sent": sent,
+                    "failed": failed,
+                },
+            )
+        logger.exception(f"[EMAIL] Giving up on {len(remaining)} recipients")
+        failed.extend({"to": to, "error": str(exc)} for to in remaining)
+
+    if failed:
+        logger.warning(f"[EMAIL] {len(failed)} recipients failed in chunk")
+    return {
+        "success": not failed,
+        "sent": sent,
+        "failed": failed,
+        "tenant_id": tenant_id,
+    }
 
 
 # ============= Notification Tasks =============
 
 
+async def _record_notifications(
+    db: Any, notifications: List[Dict[str, Any]]
+) -> tuple[List[Optional[str]], List[Dict[str, Any]]]:
+    """
+    Insert NotificationHistory rows for notify_user-style payloads.
+
+    Definitions and recipient emails are resolved with one query each and
+    all rows go in with a single INSERT. Returns the history id per
+    payload (None when skipped) and the skipped recipients with a reason.
+    """
+    lookup_keys = {
+        (n["tenant_id"], n["notification_type"])
+        for n in notifications
+        if not n.get("notification_id")
+    }
+    definitions: Dict[tuple[str, str], str] = {}
+    if lookup_keys:
+        result = await db.execute(
+            select(Notification.tenant_id, Notification.event_key, Notification.id)
+            .where(
+                tuple_(Notification.tenant_id, Notification.event_key).in_(lookup_keys),
+                Notification.is_active.is_(True),
+            )
+            .order_by(Notification.created_at)
+        )
+        for tenant_id, event_key, definition_id in result:
+            definitions.setdefault((tenant_id, event_key), definition_id)
+
+    recipient_ids = {n["recipient_id"] for n in notifications}
+    emails = dict(
+        (
+            await db.execute(
+                select(User.id, User.email).where(User.id.in_(recipient_ids))
+            )
+        ).all()
+    )
+
+    ids: List[Optional[str]] = []
+    rows: List[Dict[str, Any]] = []
+    failed: List[Dict[str, Any]] = []
+    now = datetime.utcnow()
+    for n in notifications:
+        definition_id = n.get("notification_id") or definitions.get(
+            (n["tenant_id"], n["notification_type"])
+        )
+        email = emails.get(n["recipient_id"])
+        if definition_id is None or email is None:
+            reason = "no notification definition" if email else "unknown recipient"
+            failed.append({"recipient_id": n["recipient_id"], "error": reason})
+            ids.append(None)
+            continue
+        history_id = str(uuid4())
+        rows.append(
+            {
+                "id": history_id,
+                "tenant_id": n["tenant_id"],
+                "notification_id": definition_id,
+                "recipient_email": email,
+                "recipient_user_id": n["recipient_id"],
+                "event_key": n["notification_type"],
+                "status": "SENT",
+                "sent_at": now,
+                "context_json": {
+                    "title": n["title"],
+                    "body": n["body"],
+                    "link": n.get("link"),
+                    **(n.get("metadata") or {}),
+                },
+            }
+        )
+        ids.append(history_id)
+
+    if rows:
+        await db.execute(insert(NotificationHistory), rows)
+    return ids, failed
+
+
 @shared_task(
     bind=True,
     name="app.jobs.tasks.notify_user",
@@ -162,31 +325,32 @@ def notify_user(
     body: str,
     link: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
+    notification_id: Optional[str] = None,
 ):
     """
     Create an in-app notification for a user.
+
+    History rows belong to a notification definition; when notification_id
+    is not given, the tenant's active definition for notification_type
+    (its event key) is used. Without one there is nothing to record.
     """
     logger.info(f"[NOTIFICATION] {notification_type} to {recipient_id}: {title}")
+    payload = {
+        "notification_type": notification_type,
+        "recipient_id": recipient_id,
+        "tenant_id": tenant_id,
+        "title": title,
+        "body": body,
+        "link": link,
+        "metadata": metadata,
+        "notification_id": notification_id,
+    }
 
     async def _impl():
-        async with get_db_context() as db:
-            # Create notification history record
-            history = NotificationHistory(
-                user_id=recipient_id,
-                tenant_id=tenant_id,
-                channel=notification_type.upper(),
-                status="SENT",
-                metadata={
-                    "title": title,
-                    "body": body,
-                    "link": link,
-                    **(metadata or {}),
-                },
-            )
-            db.add(history)
+        async with task_db() as db:
+            ids, _ = await _record_notifications(db, [payload])
             # If type is push, we would also call external service here
-            await db.commit()
-            return history.id
+            return ids[0]
 
     try:
         history_id = run_async(_impl())
@@ -209,12 +373,46 @@ def notify_user(
     queue="notification",
 )
 def notify_batch(notifications: List[Dict[str, Any]]):
-    """Send batch notifications."""
-    results = []
-    for notif in notifications:
-        result = notify_user.delay(**notif)
-        results.append(result.id)
-    return {"queued": len(results)}
+    """Send batch notifications, one notify_chunk task per BULK_CHUNK_SIZE payloads."""
+    task_ids = [
+        notify_chunk.delay(chunk).id
+        for chunk in _chunks(notifications, get_settings().bulk_chunk_size)
+    ]
+    return {"queued": len(notifications), "chunks": len(task_ids), "task_ids": task_ids}
+
+
+@shared_task(
+    bind=True,
+    name="app.jobs.tasks.notify_chunk",
+    queue="notification",
+    max_retries=3,
+    default_retry_delay=3,
+    retry_backoff=True,
+)
+def notify_chunk(self, notifications: List[Dict[str, Any]]):
+    """
+    Record a chunk of notify_user payloads in one transaction.
+
+    Recipients that cannot be notified (unknown user, no definition for
+    the event key) are reported in `failed`; a database error rolls the
+    whole chunk back and retries it.
+    """
+    logger.info(f"[NOTIFICATION] Recording chunk of {len(notifications)}")
+
+    async def _impl():
+        async with task_db() as db:
+            return await _record_notifications(db, notifications)
+
+    try:
+        ids, failed = run_async(_impl())
+    except Exception as exc:
+        logger.exception(f"[NOTIFICATION] Chunk of {len(notifications)} failed")
+        raise self.retry(exc=exc)
+
+    if failed:
+        logger.warning(f"[NOTIFICATION] {len(failed)} recipients skipped in chunk")
+    recorded = sum(1 for i in ids if i)
+    return {"success": not failed, "recorded": recorded, "failed": failed}
 
 
 # ============= Certificate Tasks =============
@@ -235,22 +433,21 @@ def certificate_check_eligibility(
     """
     Check if user is eligible for a certificate.
 
-    If eligible, queues PDF generation.
+    Eligible means a completed enrollment in the course with no certificate
+    issued for it yet (see _eligible_for_certificate).
     """
     logger.info(
         f"[CERTIFICATE] Checking eligibility for user={user_id} course={course_id}"
     )
 
-    try:
-        # TODO: Query enrollment status and completion
-        # TODO: Check certificate template exists for course
-
-        is_eligible = False  # Placeholder
+    async def _impl():
+        async with task_db() as db:
+            return await _eligible_for_certificate(
+                db, {(tenant_id, user_id, course_id)}
+            )
 
-        if is_eligible:
-            logger.info(f"[CERTIFICATE] User {user_id} eligible for certificate")
-            # Queue PDF generation
-            # certificate_generate_pdf.delay(...)
+    try:
+        is_eligible = bool(run_async(_impl()))
 
         return {
             "eligible": is_eligible,
@@ -263,6 +460,73 @@ def certificate_check_eligibility(
         raise self.retry(exc=exc)
 
 
+async def _eligible_for_certificate(
+    db: Any, keys: set[tuple[str, str, str]]
+) -> set[tuple[str, str, str]]:
+    """
+    The (tenant_id, user_id, course_id) keys eligible for a certificate.
+
+    A key is eligible when its enrollment is completed, not deleted, and
+    no certificate has been issued for that user and course. All keys are
+    resolved with one query.
+    """
+    if not keys:
+        return set()
+    issued = select(CertificateIssue.id).where(
+        CertificateIssue.user_id == Enrollment.user_id,
+        CertificateIssue.course_id == Enrollment.course_id,
+    )
+    result = await db.execute(
+        select(Enrollment.tenant_id, Enrollment.user_id, Enrollment.course_id).where(
+            tuple_(Enrollment.tenant_id, Enrollment.user_id, Enrollment.course_id).in_(
+                keys
+            ),
+            Enrollment.status == EnrollmentStatus.COMPLETED,
+            Enrollment.deleted_at.is_(None),
+            ~issued.exists(),
+        )
+    )
+    return {tuple(row) for row in result.all()}
+
+
+@shared_task(
+    bind=True,
+    name="app.jobs.tasks.certificate_check_eligibility_batch",
+    queue="certificate",
+    max_retries=3,
+)
+def certificate_check_eligibility_batch(self, events: List[Dict[str, Any]]):
+    """
+    Check eligibility for a batch of COURSE_COMPLETED outbox events.
+
+    Queued once per relay batch by app.events.consumers.
+    """
+    keys = {
+        (e["tenant_id"], e["user_id"], e["payload"].get("courseId"))
+        for e in events
+        if e.get("user_id") and e["payload"].get("courseId")
+    }
+
+    async def _impl():
+        async with task_db() as db:
+            return await _eligible_for_certificate(db, keys)
+
+    try:
+        found = run_async(_impl())
+        eligible = [
+            e["id"]
+            for e in events
+            if (e["tenant_id"], e.get("user_id"), e["payload"].get("courseId")) in found
+        ]
+        if eligible:
+            logger.info(f"[CERTIFICATE] {len(eligible)} completions eligible")
+        return {"checked": len(events), "eligible": eligible}
+
+    except Exception as exc:
+        logger.exception("[CERTIFICATE] Batch eligibility check failed")
+        raise self.retry(exc=exc)
+
+
 @shared_task(
     bind=True,
     name="app.jobs.tasks.certificate_generate_pdf",
@@ -324,37 +588,47 @@ def import_users(
 
     Args:
         import_job_id: ID of the ImportJob record
-        file_path: Path to uploaded CSV file
+        file_path: Upload storage key of the CSV file, scoped to tenant_id
         tenant_id: Tenant ID
         user_id: User who initiated import
-        options: Import options (skip_existing, update_existing, etc.)
+        options: Import options (defaultRole, nodeId)
     """
+    from app.db.hooks import TenantContextManager
+    from app.imports.common import fail_job, open_import_file
+    from app.imports.users import run_user_import
+
     logger.info(f"[IMPORT] Processing user import job={import_job_id}")
 
-    options = options or {}
-    success_count = 0
-    failure_count = 0
-    errors: list[str] = []
+    async def _impl():
+        with TenantContextManager(tenant_id=tenant_id):
+            try:
+                async with open_import_file(file_path, tenant_id) as path:
+                    return await run_user_import(
+                        current_runtime().session_factory,
+                        import_job_id,
+                        path,
+                        tenant_id,
+                        options,
+                    )
+            except Exception as exc:
+                async with task_db() as db:
+                    await fail_job(db, import_job_id, str(exc))
+                raise
 
     try:
-        # TODO: Update job status to PROCESSING
-        # TODO: Read and parse CSV file
-        # TODO: Validate each row
-        # TODO: Insert/update users
-        # TODO: Update job status to COMPLETED/PARTIAL/FAILED
+        summary = run_async(_impl())
 
         return {
             "success": True,
             "import_job_id": import_job_id,
-            "processed": success_count + failure_count,
-            "success_count": success_count,
-            "failure_count": failure_count,
-            "errors": errors,
+            "processed": summary.total,
+            "success_count": summary.succeeded,
+            "failure_count": summary.failed,
+            "errors": [e.to_dict() for e in summary.errors[:100]],
         }
 
     except Exception:
         logger.exception(f"[IMPORT] Import job {import_job_id} failed")
-        # TODO: Update job status to FAILED
         raise
 
 
@@ -371,12 +645,53 @@ def import_enrollments(
     user_id: str,
     options: Optional[Dict[str, Any]] = None,
 ):
-    """Process bulk enrollment import from CSV."""
+    """
+    Process bulk enrollment import from CSV.
+
+    Args:
+        import_job_id: ID of the ImportJob record
+        file_path: Upload storage key of the CSV file, scoped to tenant_id
+        tenant_id: Tenant ID
+        user_id: User who initiated import
+        options: Import options (currently unused)
+    """
+    from app.db.hooks import TenantContextManager
+    from app.imports.common import fail_job, open_import_file
+    from app.imports.enrollments import run_enrollment_import
+
     logger.info(f"[IMPORT] Processing enrollment import job={import_job_id}")
 
-    # TODO: Similar to import_users
+    async def _impl():
+        with TenantContextManager(tenant_id=tenant_id):
+            try:
+                async with open_import_file(file_path, tenant_id) as path:
+                    return await run_enrollment_import(
+                        current_runtime().session_factory,
+                        import_job_id,
+                        path,
+                        tenant_id,
+                        options,
+                    )
+            except Exception as exc:
+                async with task_db() as db:
+                    await fail_job(db, import_job_id, str(exc))
+                raise
 
-    return {"success": True, "import_job_id": import_job_id}
+    try:
+        summary = run_async(_impl())
+
+        return {
+            "success": True,
+            "import_job_id": import_job_id,
+            "processed": summary.total,
+            "success_count": summary.succeeded,
+            "failure_count": summary.failed,
+            "errors": [e.to_dict() for e in summary.errors[:100]],
+        }
+
+    except Exception:
+        logger.exception(f"[IMPORT] Import job {import_job_id} failed")
+        raise
 
 
 @shared_task(
@@ -391,20 +706,36 @@ def users_import(
 ) -> Dict[str, Any]:
     """
     Compatibility wrapper for Next.js 'users import' job.
-    Creates a logical import job and delegates to import_users.
+    Creates the import job record and delegates to import_users.
+
+    import_jobs."uploadedBy" is a non-null uuid, so calls without a
+    requester are rejected before any job row is written.
     """
+    from app.imports.common import create_job
+
+    if not tenant_id or not requester_id:
+        logger.warning(
+            f"[IMPORT] Skipping users_import file_id={file_id} - "
+            "missing tenant_id or requester_id"
+        )
+        return {"queued": False, "reason": "Missing tenant_id or requester_id"}
+
     logger.info(
         f"[IMPORT] users_import file_id={file_id} tenant={tenant_id} requester={requester_id}"
     )
-    import_job_id = f"imp-{file_id}"
-    # In a real system, file_id would be resolved to a storage path
-    file_path = f"/tmp/uploads/{file_id}.csv"
+
+    async def _impl():
+        async with task_db() as db:
+            job = await create_job(db, tenant_id, "users", file_id, requester_id)
+            return job.id
+
+    import_job_id = run_async(_impl())
     # Fire the heavy task
     result = import_users.delay(
         import_job_id=import_job_id,
-        file_path=file_path,
+        file_path=file_id,
         tenant_id=tenant_id,
-        user_id=requester_id or "",
+        user_id=requester_id,
         options=options or {},
     )
     return {"queued": True, "taskId": result.id, "importJobId": import_job_id}
@@ -431,7 +762,7 @@ def gamification_award_points(
     logger.info(f"[GAMIFICATION] Awarding {points} points to {user_id} for {action}")
 
     async def _impl():
-        async with get_db_context() as db:
+        async with task_db() as db:
             ledger = PointsLedger(user_id=user_id, points=points, reason=action)
             db.add(ledger)
             await db.commit()
@@ -522,14 +853,14 @@ def timeline_add_event(
     logger.info(f"[TIMELINE] Adding {event_type} for {user_id}")
 
     async def _impl():
-        async with get_db_context() as db:
+        async with task_db() as db:
             event = TimelineEvent(
                 user_id=user_id,
                 tenant_id=tenant_id,
                 event_type=event_type,
                 course_id=course_id,
                 branch_id=details.get("branchId") if details else None,
-                details={**(details or {}), "enrollmentId": enrollment_id},
+                data={**(details or {}), "enrollmentId": enrollment_id},
             )
             db.add(event)
             await db.commit()
@@ -642,30 +973,73 @@ def automation_evaluate(
 
     Checks if conditions are met and queues execution if so.
     """
+    try:
+        should_execute = _evaluate_automation(automation_id, tenant_id, user_id)
+
+        return {
+            "success": True,
+            "automation_id": automation_id,
+            "executed": should_execute,
+        }
+
+    except Exception as exc:
+        logger.exception("[AUTOMATION] Evaluation failed")
+        raise self.retry(exc=exc)
+
+
+def _evaluate_automation(
+    automation_id: str, tenant_id: str, user_id: Optional[str]
+) -> bool:
     logger.info(f"[AUTOMATION] Evaluating automation={automation_id}")
 
-    try:
-        # TODO: Load automation definition
-        # TODO: Check trigger conditions
-        # TODO: If conditions met, queue execution
+    # TODO: Load automation definition
+    # TODO: Check trigger conditions
+    # TODO: If conditions met, queue execution
 
-        should_execute = False  # Placeholder
+    should_execute = False  # Placeholder
 
-        if should_execute:
-            automation_execute.delay(
-                automation_id=automation_id,
-                tenant_id=tenant_id,
-                user_id=user_id,
-            )
+    if should_execute:
+        automation_execute.delay(
+            automation_id=automation_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+        )
+
+    return should_execute
+
+
+@shared_task(
+    bind=True,
+    name="app.jobs.tasks.automation_evaluate_batch",
+    queue="automation",
+    max_retries=2,
+)
+def automation_evaluate_batch(
+    self,
+    automation_id: str,
+    tenant_id: str,
+    user_ids: List[str],
+):
+    """
+    Evaluate one automation for every user in a batch of triggering events.
 
+    Queued once per automation per relay batch by app.events.consumers.
+    """
+    try:
+        executed = [
+            user_id
+            for user_id in user_ids
+            if _evaluate_automation(automation_id, tenant_id, user_id)
+        ]
         return {
             "success": True,
             "automation_id": automation_id,
-            "executed": should_execute,
+            "evaluated": len(user_ids),
+            "executed": executed,
         }
 
     except Exception as exc:
-        logger.exception("[AUTOMATION] Evaluation failed")
+        logger.exception("[AUTOMATION] Batch evaluation failed")
         raise self.retry(exc=exc)
 
 
@@ -703,3 +1077,102 @@ def automation_execute(
     except Exception as exc:
         logger.exception("[AUTOMATION] Execution failed")
         raise self.retry(exc=exc)
+
+
+# ============= Audit Tasks =============
+
+
+@shared_task(
+    name="app.jobs.tasks.audit_maintain_partitions",
+    max_retries=0,
+)
+def audit_maintain_partitions():
+    """
+    Create upcoming auth_audit_log partitions and retire expired ones.
+
+    Scheduled daily via celery beat; safe to run repeatedly.
+    """
+    from datetime import timezone
+
+    from app.audit.partitions import maintain_partitions
+
+    settings = get_settings()
+
+    async def _impl():
+        async with current_runtime().engine.begin() as conn:
+            return await maintain_partitions(
+                conn,
+                datetime.now(timezone.utc).date(),
+                ahead=settings.audit_partitions_ahead,
+                retention_months=settings.audit_retention_months,
+                mode=settings.audit_archive_mode,
+            )
+
+    try:
+        result = run_async(_impl())
+        logger.info(f"[AUDIT] Partition maintenance: {result}")
+        return {"success": True, **result}
+
+    except Exception:
+        logger.exception("[AUDIT] Partition maintenance failed")
+        raise
+
+
+# ============= Outbox Tasks =============
+
+
+@shared_task(
+    name="app.jobs.tasks.outbox_relay",
+    max_retries=0,
+)
+def outbox_relay():
+    """
+    Drain pending domain events from outbox_events to their consumers.
+
+    Scheduled every OUTBOX_RELAY_INTERVAL_SECONDS via celery beat; runs
+    may overlap safely because batches are claimed with SKIP LOCKED.
+    """
+    from app.events.relay import drain
+
+    settings = get_settings()
+
+    try:
+        result = run_async(
+            drain(
+                current_runtime().session_factory,
+                batch_size=settings.outbox_batch_size,
+                max_batches=settings.outbox_max_batches,
+                max_attempts=settings.outbox_max_attempts,
+            )
+        )
+        if result["events"]:
+            logger.info(f"[OUTBOX] Relayed {result}")
+        return {"success": True, **result}
+
+    except Exception:
+        logger.exception("[OUTBOX] Relay failed")
+        raise
+
+
+@shared_task(
+    name="app.jobs.tasks.outbox_purge",
+    max_retries=0,
+)
+def outbox_purge():
+    """Delete processed outbox events older than OUTBOX_RETENTION_DAYS."""
+    from app.events.relay import purge_processed
+
+    settings = get_settings()
+
+    async def _impl():
+        async with task_db() as db:
+            return await purge_processed(db, settings.outbox_retention_days)
+
+    try:
+        deleted = run_async(_impl())
+        logger.info(f"[OUTBOX] Purged {deleted} processed events")
+        return {"success": True, "deleted": deleted}
+
+    except Exception:
+        logger.exception("[OUTBOX] Purge failed")
+        raise
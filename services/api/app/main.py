@@ -4,14 +4,27 @@ FastAPI Application Entry Point
 Main application setup with routers, middleware, and exception handlers.
 """
 
+import hmac
 import os
 from contextlib import asynccontextmanager
 from typing import Any
 
+from app.activity import start_activity_tracker, stop_activity_tracker
+from app.audit import start_audit_writer, stop_audit_writer
+from app.auth.password import shutdown_password_hasher
+from app.cache import start_cache, stop_cache
 from app.config import get_settings
 from app.db.session import close_db, engine, init_db
-from app.errors import register_exception_handlers
-from fastapi import FastAPI, Request
+from app.errors import AuthError, register_exception_handlers
+from app.metrics import (
+    MetricsMiddleware,
+    instrument_engine,
+    render_metrics,
+    start_metrics,
+    stop_metrics,
+)
+from app.serialization import ORJSONResponse
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
@@ -23,16 +36,21 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown events."""
     # Startup
-    # Trigger reload
     await init_db()
-    print("DEBUG: Listing all registered routes:")
-    from fastapi.routing import APIRoute
-
-    for route in app.routes:
-        if isinstance(route, APIRoute):
-            print(f"DEBUG_ROUTE: {route.path} {route.methods}")
+    await start_audit_writer()
+    await start_activity_tracker()
+    await start_cache()
+    if settings.metrics_enabled:
+        await start_metrics()
     yield
     # Shutdown
+    # Flush queued audit events before the engine is disposed
+    await stop_audit_writer()
+    await stop_activity_tracker()
+    shutdown_password_hasher()
+    await stop_cache()
+    if settings.metrics_enabled:
+        await stop_metrics()
     await close_db()
 
 
@@ -42,29 +60,45 @@ app = FastAPI(
     description="Learning Management System API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     # Disable automatic docs in production
     docs_url="/api/docs" if not settings.is_production else None,
     redoc_url="/api/redoc" if not settings.is_production else None,
     openapi_url="/api/openapi.json" if not settings.is_production else None,
 )
 
-# Mount static files (for large media)
-static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
-if not os.path.exists(static_dir):
-    os.makedirs(static_dir, exist_ok=True)
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+# Mount static files (dev convenience; in production nginx serves /static
+# directly and SERVE_STATIC=false keeps API workers out of the byte path)
+if settings.serve_static:
+    static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
+    if not os.path.exists(static_dir):
+        os.makedirs(static_dir, exist_ok=True)
+    app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 # Register exception handlers for JSON-only responses
 register_exception_handlers(app)
 
 # ============= Middleware Stack =============
 # Order matters: outermost middleware runs first
-# Request flow: CORS -> RateLimit -> CSRF -> Tenant -> Route Handler
-# Response flow: Route Handler -> Tenant -> CSRF -> RateLimit -> CORS
+# Request flow: Metrics -> CORS -> CSRF -> Tenant -> RateLimit -> Admission -> Handler
+# Response flow: Handler -> Admission -> RateLimit -> Tenant -> CSRF -> CORS -> Metrics
+# RateLimit sits inside Tenant so per-user/per-tenant rules see the JWT identity;
+# Admission is innermost so rate-limited requests never take a slot;
+# Metrics is outermost so latency includes every middleware and 429/503s are counted
 
+from app.middleware.admission import AdmissionMiddleware  # noqa: E402
 from app.middleware.csrf import CSRFMiddleware  # noqa: E402
+from app.middleware.rate_limit import RateLimitMiddleware  # noqa: E402
 from app.middleware.tenant import TenantMiddleware  # noqa: E402
 
+# Admission control (per-tenant interactive/heavy concurrency pools)
+if settings.admission_enabled:
+    app.add_middleware(AdmissionMiddleware)
+
+# Rate limiting (GCRA: local tier, then Redis)
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
 # Tenant middleware (extracts tenant/user context from JWT)
 app.add_middleware(TenantMiddleware)
 
@@ -83,24 +117,20 @@ app.add_middleware(
         "Accept-Ranges",
         "Content-Length",
         "X-Correlation-ID",
+        "Server-Timing",
     ],
 )
 
 
-@app.middleware("http")
-async def diagnostic_logging_middleware(request: Request, call_next):
-    if request.url.path.startswith("/api/submissions"):
-        print(f"DIAGNOSTIC: Request {request.method} {request.url.path}")
-    try:
-        response = await call_next(request)
-        if request.url.path.startswith("/api/submissions"):
-            print(f"DIAGNOSTIC: Response status {response.status_code}")
-        return response
-    except Exception as e:
-        print(f"DIAGNOSTIC: Exception in middleware: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise e
+# Prometheus metrics (per-route latency/count, per-request SQL statistics,
+# statement budget and Server-Timing); the slow-query log works without them
+instrument_engine(engine, slow_query_ms=settings.sql_slow_query_ms or None)
+if settings.metrics_enabled:
+    app.add_middleware(
+        MetricsMiddleware,
+        statement_budget=settings.sql_statement_budget or None,
+        server_timing=not settings.is_production,
+    )
 
 
 # Health check endpoint
@@ -114,6 +144,23 @@ async def health_check() -> dict[str, Any]:
     }
 
 
+# Prometheus scrape endpoint (aggregates all workers in multiprocess mode)
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics(request: Request) -> Response:
+        """Prometheus exposition format; needs METRICS_TOKEN outside development."""
+        if not settings.metrics_token:
+            if settings.env != "development":
+                raise AuthError("METRICS_TOKEN is required outside development", 403)
+        elif not hmac.compare_digest(
+            request.headers.get("authorization", ""), f"Bearer {settings.metrics_token}"
+        ):
+            raise AuthError("Invalid metrics token")
+        body, content_type = await render_metrics()
+        return Response(content=body, media_type=content_type)
+
+
 # API health check (matches /api/* pattern)
 @app.get("/api/health")
 async def api_health_check() -> dict[str, Any]:
@@ -171,6 +218,7 @@ from app.routes import (  # noqa: E402
     me,
     notifications,
     reports,
+    search,
     skills,
     submissions,
     super_instructor,
@@ -222,6 +270,7 @@ app.include_router(catalog.router, prefix="/api/catalog", tags=["catalog"])
 app.include_router(files.router, prefix="/api/files", tags=["files"])
 app.include_router(uploads.router, prefix="/api/upload", tags=["uploads"])
 app.include_router(submissions.router, prefix="/api/submissions", tags=["submissions"])
+app.include_router(search.router, prefix="/api/search", tags=["search"])
 
 
 # Catch-all for unknown /api/* routes - returns JSON 404
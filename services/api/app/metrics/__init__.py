@@ -0,0 +1,58 @@
+"""Prometheus metrics: per-route HTTP and SQL statistics, pools, caches and queues."""
+
+from app.metrics.db import (
+    CapturedStatement,
+    QueryStats,
+    capture_statements,
+    instrument_engine,
+    query_stats_context,
+)
+from app.metrics.middleware import MetricsMiddleware, route_template
+from app.metrics.registry import (
+    ADMISSION_REQUESTS,
+    CACHE_REQUESTS,
+    CELERY_QUEUE_LENGTH,
+    DB_POOL_CONNECTIONS,
+    HTTP_IN_FLIGHT,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+    PASSWORD_HASH_JOBS,
+    REQUEST_DB_BUDGET_EXCEEDED,
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_SECONDS,
+    SLOW_QUERIES,
+    WRITE_BEHIND_PENDING,
+)
+from app.metrics.sampler import (
+    render_metrics,
+    sample_components,
+    start_metrics,
+    stop_metrics,
+)
+
+__all__ = [
+    "ADMISSION_REQUESTS",
+    "CACHE_REQUESTS",
+    "CELERY_QUEUE_LENGTH",
+    "CapturedStatement",
+    "DB_POOL_CONNECTIONS",
+    "HTTP_IN_FLIGHT",
+    "HTTP_LATENCY",
+    "HTTP_REQUESTS",
+    "MetricsMiddleware",
+    "PASSWORD_HASH_JOBS",
+    "QueryStats",
+    "REQUEST_DB_BUDGET_EXCEEDED",
+    "REQUEST_DB_QUERIES",
+    "REQUEST_DB_SECONDS",
+    "SLOW_QUERIES",
+    "WRITE_BEHIND_PENDING",
+    "capture_statements",
+    "instrument_engine",
+    "query_stats_context",
+    "render_metrics",
+    "route_template",
+    "sample_components",
+    "start_metrics",
+    "stop_metrics",
+]
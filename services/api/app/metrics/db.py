@@ -0,0 +1,145 @@
+"""
+Per-request SQL Statistics and Slow-query Log
+
+instrument_engine() adds cursor-execute listeners that add each
+statement's count and duration to the QueryStats of the current request
+(a context variable set by MetricsMiddleware). Statements outside a
+request (startup, background writers) are not counted.
+
+Any statement slower than SQL_SLOW_QUERY_MS is logged with the request's
+correlation id (X-Correlation-ID), tenant and route template, so a slow
+query in the logs can be traced back to the request that ran it.
+Parameters are never logged.
+
+capture_statements() collects the statements (with parameters) run inside
+a block, for tools that re-run them under EXPLAIN (tests/query_plans.py).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.hooks import tenant_context
+from app.metrics.registry import SLOW_QUERIES
+from app.middleware.tenant import correlation_id_context
+
+logger = logging.getLogger(__name__)
+
+_START_KEY = "lms_query_start"
+_MAX_LOGGED_STATEMENT = 1000
+
+# Set by instrument_engine(); infinite means slow-query logging is off
+_slow_query_seconds = math.inf
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    # The request's ASGI scope, to label slow queries with the route template
+    scope: dict[str, Any] | None = field(default=None, repr=False)
+
+
+query_stats_context: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats_context", default=None
+)
+
+
+@dataclass
+class CapturedStatement:
+    statement: str
+    parameters: Any
+    executemany: bool
+    seconds: float
+
+
+_capture_context: ContextVar[list[CapturedStatement] | None] = ContextVar(
+    "statement_capture_context", default=None
+)
+
+
+@contextmanager
+def capture_statements() -> Iterator[list[CapturedStatement]]:
+    """Collect every statement executed in this context (and tasks it starts)."""
+    captured: list[CapturedStatement] = []
+    token = _capture_context.set(captured)
+    try:
+        yield captured
+    finally:
+        _capture_context.reset(token)
+
+
+def _log_slow_query(statement: str, elapsed: float, stats: QueryStats | None) -> None:
+    from app.metrics.middleware import route_template
+
+    route = route_template(stats.scope) if stats and stats.scope else "-"
+    SLOW_QUERIES.labels(route).inc()
+    logger.warning(
+        f"[SQL] Slow query {elapsed * 1000:.1f}ms "
+        f"correlation_id={correlation_id_context.get() or '-'} "
+        f"tenant={tenant_context.get() or '-'} route={route}: "
+        f"{' '.join(statement.split())[:_MAX_LOGGED_STATEMENT]}"
+    )
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = query_stats_context.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+    if elapsed >= _slow_query_seconds:
+        _log_slow_query(statement, elapsed, stats)
+    captured = _capture_context.get()
+    if captured is not None:
+        captured.append(CapturedStatement(statement, parameters, executemany, elapsed))
+
+
+def _handle_error(exception_context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_START_KEY):
+        conn.info[_START_KEY].pop()
+
+
+def instrument_engine(engine: AsyncEngine, slow_query_ms: float | None = None) -> None:
+    """Attach the SQL listeners (idempotent); slow_query_ms=None disables the log."""
+    global _slow_query_seconds
+    _slow_query_seconds = math.inf if slow_query_ms is None else slow_query_ms / 1000
+
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+__all__ = [
+    "CapturedStatement",
+    "QueryStats",
+    "capture_statements",
+    "instrument_engine",
+    "query_stats_context",
+]
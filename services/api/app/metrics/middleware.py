@@ -0,0 +1,118 @@
+"""
+Metrics Middleware
+
+Outermost ASGI middleware: counts and times every HTTP request under its
+route template (e.g. /api/courses/{course_id}, taken from the route the
+router matched, so label cardinality stays bounded) and records the SQL
+statements the request executed. Requests that match no route are
+labelled "unmatched".
+
+Requests that execute more than statement_budget SQL statements (an N+1
+query is the usual cause) are logged with their correlation id, tenant
+and route, and counted in lms_http_request_db_budget_exceeded_total. With
+server_timing on (non-production), responses carry a Server-Timing header
+with the SQL statement count and time, shown by browser dev tools.
+"""
+
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics.db import QueryStats, query_stats_context
+from app.metrics.registry import (
+    HTTP_IN_FLIGHT,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+    REQUEST_DB_BUDGET_EXCEEDED,
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Scrapes and probes would dominate the latency histograms
+EXCLUDED_PATHS = frozenset({"/metrics", "/health"})
+
+
+def route_template(scope: Scope) -> str:
+    # FastAPI resolves included routers lazily: scope["route"] is the route as
+    # declared on its APIRouter (no prefix); the effective route context
+    # carries the full path
+    effective = scope.get("fastapi", {}).get("effective_route_context")
+    for route in (effective, scope.get("route")):
+        path = getattr(route, "path_format", None)
+        if path:
+            return path
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """Request count, latency, in-flight and per-request SQL metrics."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        statement_budget: int | None = None,
+        server_timing: bool = False,
+    ):
+        self.app = app
+        self.statement_budget = statement_budget
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        correlation_id = ""
+        stats = QueryStats(scope=scope)
+        token = query_stats_context.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, correlation_id
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                correlation_id = headers.get("x-correlation-id", "")
+                if self.server_timing:
+                    db_ms = stats.seconds * 1000
+                    app_ms = (time.perf_counter() - start) * 1000
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={db_ms:.1f};desc="{stats.count} queries", '
+                        f"app;dur={app_ms:.1f}",
+                    )
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            query_stats_context.reset(token)
+            route = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route, str(status)).inc()
+            HTTP_LATENCY.labels(method, route).observe(elapsed)
+            REQUEST_DB_QUERIES.labels(route).observe(stats.count)
+            REQUEST_DB_SECONDS.labels(route).observe(stats.seconds)
+            if (
+                self.statement_budget is not None
+                and stats.count > self.statement_budget
+            ):
+                REQUEST_DB_BUDGET_EXCEEDED.labels(route).inc()
+                tenant_id = scope.get("state", {}).get("tenant_id")
+                logger.warning(
+                    f"[SQL] Statement budget exceeded: {stats.count} statements "
+                    f"(budget {self.statement_budget}, {stats.seconds * 1000:.1f}ms) "
+                    f"correlation_id={correlation_id or '-'} tenant={tenant_id or '-'} "
+                    f"route={method} {route}"
+                )
+
+
+__all__ = ["MetricsMiddleware", "route_template"]
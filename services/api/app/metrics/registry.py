@@ -0,0 +1,116 @@
+"""
+Metric Definitions
+
+All metrics live in prometheus_client's default registry. With
+PROMETHEUS_MULTIPROC_DIR set (it must be set before the process starts and
+emptied on each deploy), every uvicorn worker writes its values to
+memory-mapped files in that directory and /metrics aggregates all
+workers; gauges declare how per-worker values combine.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+# ============= HTTP =============
+
+HTTP_REQUESTS = Counter(
+    "lms_http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "lms_http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_IN_FLIGHT = Gauge(
+    "lms_http_requests_in_flight",
+    "HTTP requests currently being served.",
+    multiprocess_mode="livesum",
+)
+
+# ============= Database =============
+
+REQUEST_DB_QUERIES = Histogram(
+    "lms_http_request_db_queries",
+    "SQL statements executed per HTTP request.",
+    ["route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "lms_http_request_db_seconds",
+    "Time spent executing SQL per HTTP request.",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_DB_BUDGET_EXCEEDED = Counter(
+    "lms_http_request_db_budget_exceeded_total",
+    "Requests that executed more SQL statements than SQL_STATEMENT_BUDGET.",
+    ["route"],
+)
+SLOW_QUERIES = Counter(
+    "lms_db_slow_queries_total",
+    "SQL statements slower than SQL_SLOW_QUERY_MS, by route template.",
+    ["route"],
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "lms_db_pool_connections",
+    "Connection pool state: pool size, checked out, idle and overflow connections.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+
+# ============= Caches =============
+
+CACHE_REQUESTS = Counter(
+    "lms_cache_requests_total",
+    "Cache lookups by cache and result (hit, stale, miss).",
+    ["cache", "result"],
+)
+
+# ============= Background work =============
+
+CELERY_QUEUE_LENGTH = Gauge(
+    "lms_celery_queue_length",
+    "Messages waiting in each Celery queue (sampled at scrape time).",
+    ["queue"],
+    multiprocess_mode="mostrecent",
+)
+ADMISSION_REQUESTS = Gauge(
+    "lms_admission_requests",
+    "Requests admitted (active) or queued (waiting) per admission pool.",
+    ["pool", "state"],
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_JOBS = Gauge(
+    "lms_password_hash_jobs",
+    "bcrypt jobs running (in_flight) or queued on the password executor.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+WRITE_BEHIND_PENDING = Gauge(
+    "lms_write_behind_pending",
+    "Items buffered by the audit writer and activity tracker awaiting a flush.",
+    ["writer"],
+    multiprocess_mode="livesum",
+)
+
+
+__all__ = [
+    "ADMISSION_REQUESTS",
+    "CACHE_REQUESTS",
+    "CELERY_QUEUE_LENGTH",
+    "DB_POOL_CONNECTIONS",
+    "HTTP_IN_FLIGHT",
+    "HTTP_LATENCY",
+    "HTTP_REQUESTS",
+    "PASSWORD_HASH_JOBS",
+    "REQUEST_DB_BUDGET_EXCEEDED",
+    "REQUEST_DB_QUERIES",
+    "REQUEST_DB_SECONDS",
+    "SLOW_QUERIES",
+    "WRITE_BEHIND_PENDING",
+]
@@ -0,0 +1,175 @@
+"""
+Metrics Sampler and Exposition
+
+Gauges for in-process components (connection pool, admission pools,
+password executor, write-behind buffers) are copied from their stats()
+every METRICS_SAMPLE_INTERVAL_SECONDS by one background task per worker,
+so the multiprocess files stay current in every worker rather than only
+in the one that serves the scrape. Celery queue lengths are read from the
+broker (one pipelined LLEN per queue) when /metrics is scraped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+
+from app.metrics.registry import (
+    ADMISSION_REQUESTS,
+    CELERY_QUEUE_LENGTH,
+    DB_POOL_CONNECTIONS,
+    PASSWORD_HASH_JOBS,
+    WRITE_BEHIND_PENDING,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def sample_components() -> None:
+    """Copy component stats into gauges (cheap; no I/O)."""
+    from app.activity import get_activity_tracker
+    from app.admission import get_admission_controller
+    from app.audit import get_audit_writer
+    from app.auth.password import get_password_hasher
+    from app.db.session import engine
+
+    pool = engine.sync_engine.pool
+    if hasattr(pool, "checkedout"):
+        DB_POOL_CONNECTIONS.labels("size").set(pool.size())
+        DB_POOL_CONNECTIONS.labels("checked_out").set(pool.checkedout())
+        DB_POOL_CONNECTIONS.labels("idle").set(pool.checkedin())
+        DB_POOL_CONNECTIONS.labels("overflow").set(max(pool.overflow(), 0))
+
+    for name, stats in get_admission_controller().stats().items():
+        ADMISSION_REQUESTS.labels(name, "active").set(stats["active"])
+        ADMISSION_REQUESTS.labels(name, "waiting").set(
+            stats["waiting"] + stats["tenants_waiting"]
+        )
+
+    hasher = get_password_hasher().stats()
+    PASSWORD_HASH_JOBS.labels("in_flight").set(hasher["in_flight"])
+    PASSWORD_HASH_JOBS.labels("queued").set(hasher["queued"])
+
+    writer = get_audit_writer()
+    WRITE_BEHIND_PENDING.labels("audit").set(writer.stats()["queued"] if writer else 0)
+    tracker = get_activity_tracker()
+    WRITE_BEHIND_PENDING.labels("activity").set(
+        tracker.stats()["pending_users"] if tracker else 0
+    )
+
+
+async def sample_celery_queues(client) -> None:
+    """LLEN every Celery queue on the Redis broker."""
+    from app.jobs import QUEUE_NAMES
+
+    queues = ["default", *QUEUE_NAMES.values()]
+    async with client.pipeline(transaction=False) as pipe:
+        for queue in queues:
+            pipe.llen(queue)
+        lengths = await pipe.execute()
+    for queue, length in zip(queues, lengths):
+        CELERY_QUEUE_LENGTH.labels(queue).set(length)
+
+
+class MetricsSampler:
+    """Background task refreshing component gauges."""
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="metrics-sampler")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                sample_components()
+            except Exception as e:
+                logger.warning(f"[METRICS] Sampling failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_sampler: MetricsSampler | None = None
+_broker = None
+
+
+async def start_metrics() -> None:
+    """Start this worker's sampler (called from the FastAPI lifespan)."""
+    global _sampler
+    if _sampler is None:
+        from app.config import get_settings
+
+        _sampler = MetricsSampler(get_settings().metrics_sample_interval_seconds)
+        _sampler.start()
+
+
+async def stop_metrics() -> None:
+    """Stop the sampler and retire this worker's multiprocess files (on shutdown)."""
+    global _sampler, _broker
+    if _sampler is not None:
+        await _sampler.stop()
+        _sampler = None
+    if _broker is not None:
+        await _broker.aclose()
+        _broker = None
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid())
+
+
+async def render_metrics() -> tuple[bytes, str]:
+    """Exposition body and content type, aggregated across workers if multiprocess."""
+    global _broker
+    from app.config import get_settings
+
+    settings = get_settings()
+    if settings.metrics_celery_queues:
+        try:
+            if _broker is None:
+                from redis import asyncio as aioredis
+
+                _broker = aioredis.from_url(
+                    settings.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+                )
+            await sample_celery_queues(_broker)
+        except Exception as e:
+            logger.warning(f"[METRICS] Celery queue sampling failed: {e}")
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+__all__ = [
+    "MetricsSampler",
+    "render_metrics",
+    "sample_celery_queues",
+    "sample_components",
+    "start_metrics",
+    "stop_metrics",
+]
@@ -0,0 +1,88 @@
+"""
+Admission Control Middleware
+
+Admits each /api/ request into its route class's pool (interactive or
+heavy) and its tenant's share of that pool before the handler runs, and
+frees the slot when the response has been sent. Requests that cannot be
+admitted within the queue timeout get a 503 with Retry-After.
+
+A plain ASGI middleware installed inside TenantMiddleware, so the tenant
+is taken from tenant_context (set from the JWT).
+"""
+
+import logging
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.admission.controller import (
+    AdmissionController,
+    Rejected,
+    classify,
+    get_admission_controller,
+)
+from app.db.hooks import tenant_context
+from app.errors import ServiceUnavailableError, _error_response
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionMiddleware:
+    """Bounded concurrency per route class and per tenant."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: Optional[AdmissionController] = None,
+        retry_after: Optional[int] = None,
+    ):
+        self.app = app
+        if retry_after is None:
+            from app.config import get_settings
+
+            retry_after = get_settings().admission_retry_after_seconds
+        self.controller = controller or get_admission_controller()
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        tenant_id = tenant_context.get() or (scope.get("state") or {}).get("tenant_id")
+        try:
+            await self.controller.acquire(tenant_id, route_class)
+        except Rejected as e:
+            logger.warning(
+                f"[Admission] Rejected {scope['method']} {scope['path']} "
+                f"(tenant={tenant_id}, {e.reason})",
+                extra={
+                    "tenant_id": tenant_id,
+                    "route_class": route_class,
+                    "reason": e.reason,
+                },
+            )
+            error = ServiceUnavailableError(
+                "Server is busy. Please retry shortly.", retry_after=self.retry_after
+            )
+            response = _error_response(
+                error.status_code,
+                error.error_code,
+                error.message,
+                headers=error.headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(tenant_id, route_class)
+
+
+__all__ = ["AdmissionMiddleware"]
@@ -1,204 +1,228 @@
 """
-Redis-Backed Rate Limiting Middleware
+Rate Limiting Middleware
 
-Implements sliding window rate limiting with support for:
+Applies the rules in app.ratelimit.rules with support for:
 - Per-tenant limits (prevent noisy neighbor in multi-tenant)
 - Per-IP limits (anonymous/unauthenticated protection)
 - Per-user limits (authenticated user protection)
 
-Uses Redis sorted sets for efficient sliding window implementation.
-Designed to fail-open: if Redis is unavailable, requests are allowed through.
+Decisions come from app.ratelimit.engine: a local in-process tier first,
+then one atomic Lua call to Redis. While Redis is unreachable the local
+tier decides on its own, and Redis is retried with backoff.
+
+A plain ASGI middleware (no BaseHTTPMiddleware), installed inside
+TenantMiddleware so the user and tenant ids are already in the request
+state.
+
+The client IP is the socket peer unless the peer is one of
+RATE_LIMIT_TRUSTED_PROXIES; then X-Forwarded-For is read from the right,
+skipping trusted hops, so clients cannot pick their own rate-limit key.
+Limits keyed by an account in the request body (LOGIN_ACCOUNT_LIMIT) are
+checked by the route through check_account_limit().
 """
 
+import ipaddress
 import logging
 import time
-from dataclasses import dataclass
-from typing import Dict, Literal, Optional
+from functools import lru_cache
+from typing import Optional, Sequence
 
-from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.ratelimit.engine import (
+    LocalLimiter,
+    RateLimiter,
+    RateLimitResult,
+    RedisLimiter,
+    retry_after_header,
+)
+from app.errors import TooManyRequestsError
+from app.ratelimit.rules import DEFAULT_LIMITS, PrefixMatcher, RateLimitConfig
 
 logger = logging.getLogger(__name__)
 
+Networks = Sequence[ipaddress.IPv4Network | ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(value: str) -> Networks:
+    """Networks from a comma-separated list of IPs and CIDRs."""
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    ]
+
+
+def _trusted(address: str, proxies: Networks) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in proxies)
+
+
+def _client_ip(scope: Scope, proxies: Networks = ()) -> str:
+    """The socket peer, or behind trusted proxies the nearest untrusted hop."""
+    client = scope.get("client")
+    peer = client[0] if client else "unknown"
+    if not _trusted(peer, proxies):
+        return peer
+    forwarded = Headers(scope=scope).get("x-forwarded-for")
+    hops = [hop.strip() for hop in (forwarded or "").split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _trusted(hop, proxies):
+            return hop
+    return hops[0] if hops else peer
+
+
+def _identifier(scope: Scope, config: RateLimitConfig, proxies: Networks = ()) -> str:
+    """Identifier for the rule's scope; anonymous requests fall back to the IP."""
+    state = scope.get("state") or {}
+    if config.scope == "user" and state.get("user_id"):
+        return f"user:{state['user_id']}"
+    if config.scope == "tenant" and state.get("tenant_id"):
+        return f"tenant:{state['tenant_id']}"
+    return f"ip:{_client_ip(scope, proxies)}"
+
+
+def _limit_headers(result: RateLimitResult) -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(int(time.time() + result.reset_after)),
+    }
+
+
+def build_rate_limiter(
+    redis_url: Optional[str], local_max_keys: int, timeout: float
+) -> RateLimiter:
+    redis_limiter = None
+    if redis_url:
+        from redis import asyncio as aioredis
+
+        client = aioredis.from_url(
+            redis_url,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+            health_check_interval=30,
+        )
+        redis_limiter = RedisLimiter(client)
+    return RateLimiter(LocalLimiter(max_keys=local_max_keys), redis_limiter)
 
-@dataclass
-class RateLimitConfig:
-    """Configuration for a rate limit rule."""
-
-    requests: int  # Max requests allowed
-    window_seconds: int  # Time window in seconds
-    scope: Literal["ip", "user", "tenant"]  # What to rate limit by
 
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    """The process-wide limiter shared by the middleware and route-level checks."""
+    from app.config import get_settings
 
-# Default rate limits by endpoint pattern
-# More specific patterns should come first
-DEFAULT_LIMITS: Dict[str, RateLimitConfig] = {
-    # Auth endpoints - strict limits to prevent brute force
-    "/api/auth/login": RateLimitConfig(5, 60, "ip"),  # 5 per minute per IP
-    "/api/auth/register": RateLimitConfig(3, 300, "ip"),  # 3 per 5 min per IP
-    "/api/auth/forgot-password": RateLimitConfig(3, 300, "ip"),  # 3 per 5 min per IP
-    "/api/auth/reset-password": RateLimitConfig(5, 300, "ip"),  # 5 per 5 min per IP
-    # Import endpoints - heavy operations
-    "/api/import": RateLimitConfig(5, 60, "tenant"),  # 5 per minute per tenant
-    # Report generation - resource intensive
-    "/api/reports/generate": RateLimitConfig(10, 60, "user"),  # 10 per minute per user
-    # General API - reasonable defaults
-    "/api/": RateLimitConfig(200, 60, "tenant"),  # 200 per minute per tenant
-}
+    settings = get_settings()
+    return build_rate_limiter(
+        settings.rate_limit_redis_url or settings.redis_url,
+        settings.rate_limit_local_max_keys,
+        settings.rate_limit_redis_timeout_ms / 1000,
+    )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+async def check_account_limit(name: str, account: str, config: RateLimitConfig) -> None:
     """
-    Redis-backed sliding window rate limiter.
-
-    Uses sorted sets to implement accurate sliding window:
-    - Each request timestamp is added to a sorted set
-    - Expired timestamps (outside window) are removed
-    - Count of remaining timestamps determines if limit exceeded
-
-    Fail-open design: if Redis is unavailable, requests pass through.
+    Apply a per-account limit from a route handler, raising TooManyRequestsError
+    (429) when exceeded. A no-op while RATE_LIMIT_ENABLED is off.
     """
+    from app.config import get_settings
+
+    if not get_settings().rate_limit_enabled:
+        return
+    key = f"rl:{name}:account:{account.strip().lower()}"
+    result = await get_rate_limiter().check(key, config)
+    if not result.allowed:
+        retry_after = retry_after_header(result)
+        logger.warning(f"[RateLimit] Exceeded: {key} ({result.source})")
+        raise TooManyRequestsError(
+            f"Too many attempts. Try again in {retry_after} seconds.",
+            retry_after=int(retry_after),
+        )
+
 
-    def __init__(self, app, redis_client=None):
-        super().__init__(app)
-        self._redis = redis_client
-        self._redis_available = redis_client is not None
-
-    def set_redis(self, redis_client):
-        """Set Redis client after initialization (for late binding)."""
-        self._redis = redis_client
-        self._redis_available = redis_client is not None
-
-    def _get_limit_config(self, path: str) -> Optional[RateLimitConfig]:
-        """Get rate limit config for a path (most specific match wins)."""
-        # Check exact matches first
-        if path in DEFAULT_LIMITS:
-            return DEFAULT_LIMITS[path]
-
-        # Check prefix matches (longest match wins)
-        best_match = None
-        best_length = 0
-
-        for pattern, config in DEFAULT_LIMITS.items():
-            if path.startswith(pattern) and len(pattern) > best_length:
-                best_match = config
-                best_length = len(pattern)
-
-        return best_match
-
-    def _get_identifier(self, request: Request, config: RateLimitConfig) -> str:
-        """Build identifier based on scope."""
-        if config.scope == "ip":
-            # Get real IP (handles proxies)
-            forwarded = request.headers.get("X-Forwarded-For")
-            if forwarded:
-                return forwarded.split(",")[0].strip()
-            return request.client.host if request.client else "unknown"
-
-        elif config.scope == "user":
-            # Get user ID from request state (set by TenantMiddleware)
-            user_id = getattr(request.state, "user_id", None)
-            return user_id or "anonymous"
-
-        else:  # tenant
-            # Get tenant ID from request state
-            tenant_id = getattr(request.state, "tenant_id", None)
-            return tenant_id or "default"
-
-    def _get_key(self, request: Request, config: RateLimitConfig) -> str:
-        """Build Redis key for rate limiting."""
-        identifier = self._get_identifier(request, config)
-        path = request.url.path
-        return f"ratelimit:{config.scope}:{identifier}:{path}"
-
-    async def _check_rate_limit(
-        self, key: str, config: RateLimitConfig
-    ) -> tuple[bool, int]:
-        """
-        Check if rate limit is exceeded.
-
-        Returns:
-            (is_limited, current_count)
-        """
-        if not self._redis or not self._redis_available:
-            return False, 0  # Fail open
-
-        try:
-            now = time.time()
-            window_start = now - config.window_seconds
-
-            # Use pipeline for atomicity
-            async with self._redis.pipeline(transaction=True) as pipe:
-                # Remove expired entries
-                await pipe.zremrangebyscore(key, 0, window_start)
-                # Add current request
-                await pipe.zadd(key, {str(now): now})
-                # Count requests in window
-                await pipe.zcard(key)
-                # Set key expiration
-                await pipe.expire(key, config.window_seconds)
-
-                results = await pipe.execute()
-
-            current_count = results[2]
-            is_limited = current_count > config.requests
-
-            return is_limited, current_count
-
-        except Exception as e:
-            logger.warning(f"[RateLimit] Redis error, failing open: {e}")
-            self._redis_available = False  # Disable until next restart
-            return False, 0
-
-    async def dispatch(self, request: Request, call_next):
-        # Get rate limit config for this path
-        config = self._get_limit_config(request.url.path)
-
-        if not config:
+class RateLimitMiddleware:
+    """GCRA rate limiter: local first tier, Redis second, local fallback."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[RateLimiter] = None,
+        rules: Optional[dict[str, RateLimitConfig]] = None,
+        trusted_proxies: Optional[str] = None,
+    ):
+        self.app = app
+        if trusted_proxies is None:
+            from app.config import get_settings
+
+            trusted_proxies = get_settings().rate_limit_trusted_proxies
+        self.limiter = limiter if limiter is not None else get_rate_limiter()
+        self.matcher = PrefixMatcher(rules if rules is not None else DEFAULT_LIMITS)
+        self.proxies = parse_trusted_proxies(trusted_proxies)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        match = self.matcher.match(scope["path"])
+        if match is None:
             # No rate limit for this path
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        key = self._get_key(request, config)
-        is_limited, current_count = await self._check_rate_limit(key, config)
+        pattern, config = match
+        key = f"rl:{pattern}:{_identifier(scope, config, self.proxies)}"
+        result = await self.limiter.check(key, config)
+        headers = _limit_headers(result)
 
-        if is_limited:
+        if not result.allowed:
+            retry_after = retry_after_header(result)
             logger.warning(
-                f"[RateLimit] Exceeded: {key} ({current_count}/{config.requests})",
+                f"[RateLimit] Exceeded: {key} "
+                f"({config.requests}/{config.window_seconds}s, {result.source})",
                 extra={
                     "key": key,
-                    "count": current_count,
                     "limit": config.requests,
                     "window": config.window_seconds,
+                    "source": result.source,
                 },
             )
-
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "TOO_MANY_REQUESTS",
-                    "message": f"Rate limit exceeded. Try again in {config.window_seconds} seconds.",
-                    "retryAfter": config.window_seconds,
-                },
-                headers={
-                    "Retry-After": str(config.window_seconds),
-                    "X-RateLimit-Limit": str(config.requests),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(time.time()) + config.window_seconds),
+                    "message": (
+                        f"Rate limit exceeded. Try again in {retry_after} seconds."
+                    ),
+                    "retryAfter": int(retry_after),
                 },
+                headers={"Retry-After": retry_after, **headers},
             )
-
-        # Add rate limit headers to successful response
-        response = await call_next(request)
-
-        remaining = max(0, config.requests - current_count)
-        response.headers["X-RateLimit-Limit"] = str(config.requests)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(
-            int(time.time()) + config.window_seconds
-        )
-
-        return response
-
-
-__all__ = ["RateLimitMiddleware", "RateLimitConfig", "DEFAULT_LIMITS"]
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers to successful response
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+__all__ = [
+    "DEFAULT_LIMITS",
+    "RateLimitConfig",
+    "RateLimitMiddleware",
+    "build_rate_limiter",
+    "check_account_limit",
+    "get_rate_limiter",
+    "parse_trusted_proxies",
+]
@@ -5,12 +5,15 @@ This middleware sets context variables for every request:
 1. tenant_id - Extracted from JWT for multi-tenant isolation
 2. branch_id (node_id) - Extracted from JWT for branch-level scoping
 3. correlation_id - Generated or extracted for request tracing
+
+Authenticated requests also mark the user as seen (app.activity).
 """
 
 import logging
 import uuid
 from contextvars import ContextVar
 
+from app.activity import track_seen
 from app.auth import verify_token_light
 from app.db.hooks import branch_context, tenant_context, user_context
 from fastapi import Request
@@ -86,6 +89,9 @@ class TenantMiddleware(BaseHTTPMiddleware):
         try:
             response = await call_next(request)
 
+            if user_id and response.status_code != 401:
+                track_seen(user_id)
+
             # Add correlation ID to response headers for tracing
             response.headers["X-Correlation-ID"] = correlation_id
 
@@ -0,0 +1,25 @@
+"""Rate limiting rules and GCRA engine (see app.middleware.rate_limit)."""
+
+from app.ratelimit.engine import (
+    LocalLimiter,
+    RateLimiter,
+    RateLimitResult,
+    RedisLimiter,
+)
+from app.ratelimit.rules import (
+    DEFAULT_LIMITS,
+    LOGIN_ACCOUNT_LIMIT,
+    PrefixMatcher,
+    RateLimitConfig,
+)
+
+__all__ = [
+    "DEFAULT_LIMITS",
+    "LOGIN_ACCOUNT_LIMIT",
+    "LocalLimiter",
+    "PrefixMatcher",
+    "RateLimitConfig",
+    "RateLimitResult",
+    "RateLimiter",
+    "RedisLimiter",
+]
@@ -0,0 +1,217 @@
+"""
+Rate Limit Engine (GCRA)
+
+Limits use the generic cell rate algorithm: each key stores one number,
+the theoretical arrival time (TAT) of the next request. A request is
+allowed when it is no more than one window ahead of the TAT, which gives
+`requests` per `window_seconds` with bursts up to `requests`.
+
+Two tiers:
+- LocalLimiter: the same algorithm in process memory. Any process sees at
+  most the global number of requests for a key, so a local rejection is
+  always a correct global rejection and skips the Redis round trip (a
+  brute-force client is turned away locally). It is also the fallback
+  while Redis is unreachable, which makes limits approximate (per process)
+  during an outage.
+- RedisLimiter: one EVALSHA per decision running GCRA_LUA atomically,
+  using the Redis server clock. After an error it backs off (1 s doubling
+  to 30 s) and then reconnects on its own.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from app.ratelimit.rules import RateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = key; ARGV[1] = emission interval ms; ARGV[2] = window ms.
+# Returns {allowed, remaining, retry_after_ms, reset_after_ms}.
+GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local emission = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + emission
+local allow_at = new_tat - window
+if allow_at > now then
+    return {0, 0, allow_at - now, tat - now}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {1, math.floor((now + window - new_tat) / emission), 0, new_tat - now}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # Seconds until a request would be allowed (0 if allowed)
+    reset_after: float  # Seconds until the bucket is full again
+    source: str  # "local", "redis" or "fallback"
+
+
+def _params(config: RateLimitConfig) -> tuple[float, float]:
+    """(emission interval ms, window ms)."""
+    window = config.window_seconds * 1000.0
+    return window / config.requests, window
+
+
+def gcra(
+    tat: float | None, now: float, emission: float, window: float
+) -> tuple[bool, float, int, float, float]:
+    """One GCRA step: (allowed, new_tat, remaining, retry_after, reset_after) in ms."""
+    if tat is None or tat < now:
+        tat = now
+    new_tat = tat + emission
+    allow_at = new_tat - window
+    if allow_at > now:
+        return False, tat, 0, allow_at - now, tat - now
+    remaining = int((now + window - new_tat) // emission)
+    return True, new_tat, remaining, 0.0, new_tat - now
+
+
+class LocalLimiter:
+    """In-process GCRA; approximate across processes, exact within one."""
+
+    def __init__(self, max_keys: int = 100_000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._tats: dict[str, float] = {}
+
+    def check(self, key: str, config: RateLimitConfig) -> RateLimitResult:
+        now = self._clock() * 1000
+        emission, window = _params(config)
+        allowed, new_tat, remaining, retry, reset = gcra(
+            self._tats.get(key), now, emission, window
+        )
+        if allowed:
+            self._tats[key] = new_tat
+            if len(self._tats) > self.max_keys:
+                self._prune(now)
+        return RateLimitResult(
+            allowed, config.requests, remaining, retry / 1000, reset / 1000, "local"
+        )
+
+    def _prune(self, now: float) -> None:
+        # A TAT in the past means a full bucket, which is the same as no entry
+        self._tats = {k: v for k, v in self._tats.items() if v > now}
+        if len(self._tats) > self.max_keys:
+            # Still too many live keys: forget the oldest half (insertion order)
+            keep = list(self._tats.items())[len(self._tats) // 2 :]
+            self._tats = dict(keep)
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+class RedisLimiter:
+    """Atomic GCRA in Redis with backoff and automatic reconnection."""
+
+    MIN_BACKOFF = 1.0
+    MAX_BACKOFF = 30.0
+
+    def __init__(self, client: Any, clock=time.monotonic):
+        self._client = client
+        self._script = client.register_script(GCRA_LUA)
+        self._clock = clock
+        self._retry_at = 0.0
+        self._backoff = self.MIN_BACKOFF
+        self.errors = 0
+
+    @property
+    def available(self) -> bool:
+        return self._clock() >= self._retry_at
+
+    async def check(self, key: str, config: RateLimitConfig) -> RateLimitResult | None:
+        """Decision from Redis, or None while Redis is unavailable."""
+        if not self.available:
+            return None
+        emission, window = _params(config)
+        try:
+            allowed, remaining, retry, reset = await self._script(
+                keys=[key], args=[emission, window]
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(
+                f"[RateLimit] Redis error, using local limits "
+                f"for {self._backoff:.0f}s: {e}"
+            )
+            self._retry_at = self._clock() + self._backoff
+            self._backoff = min(self._backoff * 2, self.MAX_BACKOFF)
+            return None
+        self._backoff = self.MIN_BACKOFF
+        return RateLimitResult(
+            bool(allowed),
+            config.requests,
+            int(remaining),
+            int(retry) / 1000,
+            int(reset) / 1000,
+            "redis",
+        )
+
+
+class RateLimiter:
+    """Local pre-check, then Redis; local alone while Redis is down."""
+
+    def __init__(self, local: LocalLimiter, redis: RedisLimiter | None = None):
+        self.local = local
+        self.redis = redis
+        self.local_rejections = 0
+        self.redis_checks = 0
+        self.fallback_checks = 0
+
+    async def check(self, key: str, config: RateLimitConfig) -> RateLimitResult:
+        local = self.local.check(key, config)
+        if not local.allowed:
+            self.local_rejections += 1
+            return local
+        if self.redis is not None:
+            result = await self.redis.check(key, config)
+            if result is not None:
+                self.redis_checks += 1
+                return result
+        self.fallback_checks += 1
+        return RateLimitResult(
+            local.allowed,
+            local.limit,
+            local.remaining,
+            local.retry_after,
+            local.reset_after,
+            "fallback" if self.redis is not None else "local",
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "local_keys": len(self.local),
+            "local_rejections": self.local_rejections,
+            "redis_checks": self.redis_checks,
+            "fallback_checks": self.fallback_checks,
+            "redis_errors": self.redis.errors if self.redis is not None else 0,
+        }
+
+
+def retry_after_header(result: RateLimitResult) -> str:
+    return str(max(1, math.ceil(result.retry_after)))
+
+
+__all__ = [
+    "GCRA_LUA",
+    "LocalLimiter",
+    "RateLimitResult",
+    "RateLimiter",
+    "RedisLimiter",
+    "gcra",
+    "retry_after_header",
+]
@@ -0,0 +1,65 @@
+"""
+Rate Limit Rules
+
+DEFAULT_LIMITS maps path prefixes to limits; the longest matching prefix
+wins. PrefixMatcher compiles the table once, so matching a path costs one
+dict lookup per distinct prefix length instead of a scan of every rule.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Literal, Optional
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Configuration for a rate limit rule."""
+
+    requests: int  # Max requests allowed
+    window_seconds: int  # Time window in seconds
+    scope: Literal["ip", "user", "tenant", "account"]  # What to rate limit by
+
+
+# Default rate limits by endpoint pattern (longest prefix wins). Per-IP
+# limits are sized for schools and offices where a whole class logs in
+# from one NAT address; brute force against a single account is stopped by
+# LOGIN_ACCOUNT_LIMIT instead.
+DEFAULT_LIMITS: Dict[str, RateLimitConfig] = {
+    # Auth endpoints
+    "/api/auth/login": RateLimitConfig(120, 60, "ip"),  # 120 per minute per IP
+    "/api/auth/register": RateLimitConfig(30, 300, "ip"),  # 30 per 5 min per IP
+    "/api/auth/forgot-password": RateLimitConfig(30, 300, "ip"),  # 30 per 5 min per IP
+    "/api/auth/reset-password": RateLimitConfig(30, 300, "ip"),  # 30 per 5 min per IP
+    # Import endpoints - heavy operations
+    "/api/import": RateLimitConfig(5, 60, "tenant"),  # 5 per minute per tenant
+    # Report generation - resource intensive
+    "/api/reports/generate": RateLimitConfig(10, 60, "user"),  # 10 per minute per user
+    # General API - per user (per IP when anonymous), so one tenant's users
+    # do not share a single budget
+    "/api/": RateLimitConfig(600, 60, "user"),  # 600 per minute per user
+}
+
+# Login attempts per account (the email in the request body), checked by the
+# login route itself through app.middleware.rate_limit.check_account_limit
+LOGIN_ACCOUNT_LIMIT = RateLimitConfig(10, 300, "account")  # 10 per 5 min
+
+
+class PrefixMatcher:
+    """Longest-prefix lookup over a fixed rule table."""
+
+    def __init__(self, rules: Dict[str, RateLimitConfig]):
+        self._rules = dict(rules)
+        self._lengths = sorted({len(p) for p in rules}, reverse=True)
+
+    def match(self, path: str) -> Optional[tuple[str, RateLimitConfig]]:
+        """(pattern, config) for the longest rule prefixing path, or None."""
+        size = len(path)
+        for length in self._lengths:
+            if length <= size:
+                pattern = path[:length]
+                config = self._rules.get(pattern)
+                if config is not None:
+                    return pattern, config
+        return None
+
+
+__all__ = ["DEFAULT_LIMITS", "LOGIN_ACCOUNT_LIMIT", "PrefixMatcher", "RateLimitConfig"]
@@ -8,6 +8,7 @@ Matches the TypeScript implementation's behavior.
 from app.auth.deps import AuthContext
 from app.db.models import AuthPermission, AuthRole, AuthRolePermission, User
 from app.errors import NotFoundError, RBACError
+from app.metrics.registry import CACHE_REQUESTS
 from cachetools import TTLCache  # type: ignore
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +17,8 @@ from sqlalchemy.orm import selectinload
 # Permission cache: user_id -> set of permissions
 # TTL of 60 seconds matches TypeScript implementation
 _permission_cache: TTLCache[str, set[str]] = TTLCache(maxsize=1000, ttl=60)
+_CACHE_HIT = CACHE_REQUESTS.labels("rbac_permissions", "hit")
+_CACHE_MISS = CACHE_REQUESTS.labels("rbac_permissions", "miss")
 
 
 async def resolve_permissions(
@@ -151,8 +154,11 @@ async def get_user_permissions(
     """
     # Check cache first
     cache_key = user_id
-    if cache_key in _permission_cache:
-        return _permission_cache[cache_key]
+    cached = _permission_cache.get(cache_key)
+    if cached is not None:
+        _CACHE_HIT.inc()
+        return cached
+    _CACHE_MISS.inc()
 
     # Fetch user with roles
     print(f"DEBUG_RBAC: get_user_permissions for user_id={user_id}")
@@ -6,12 +6,15 @@ Implements administrative endpoints matching Next.js /api/admin/* contract:
 - settings (get/update)
 - security (audit, sessions)
 - users (import, export, preview-permissions, impersonate)
+- enrollments (import)
 - notifications admin helpers (partial)
 """
 
+from datetime import datetime
 from typing import Annotated, Any, Optional
 
-from app.auth import RequireAuth
+from app.audit.query import AuditFilters, build_audit_query, paginate
+from app.auth import AuthContext, RequireAuth
 from app.db.models import (
     AuthPermission,
     AuthRole,
@@ -22,6 +25,7 @@ from app.db.models import (
 )
 from app.db.session import get_db
 from app.errors import BadRequestError, NotFoundError, RBACError
+from app.search import user_search_filter
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy import delete, func, select
@@ -52,6 +56,18 @@ class UsersImportRequest(BaseModel):
     options: Optional[dict[str, Any]] = None
 
 
+def _import_file_key(context: AuthContext, file_id: str) -> str:
+    """Storage key of an uploaded import file, scoped to the caller's tenant."""
+    from app.storage import InvalidKeyError, tenant_key
+
+    if not context.tenant_id:
+        raise BadRequestError("Tenant context required")
+    try:
+        return tenant_key(context.tenant_id, file_id)
+    except InvalidKeyError:
+        raise BadRequestError("Invalid fileId")
+
+
 class UsersExportQuery(BaseModel):
     search: Optional[str] = None
     status: Optional[str] = None
@@ -179,16 +195,44 @@ async def update_settings_admin(
 async def get_audit_log(
     context: RequireAuth,
     db: Annotated[AsyncSession, Depends(get_db)],
-    page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None, description="nextCursor from the previous page"
+    ),
+    severity: Optional[str] = Query(
+        None, description="Comma-separated, e.g. HIGH,CRITICAL"
+    ),
+    eventType: Optional[str] = Query(None, description="Comma-separated event types"),
+    userId: Optional[str] = Query(None),
+    correlationId: Optional[str] = Query(None),
+    since: Optional[datetime] = Query(None, alias="from"),
+    until: Optional[datetime] = Query(None, alias="to"),
 ) -> dict[str, Any]:
+    """
+    Browse the tenant's audit log, newest first, with keyset pagination.
+    Pass pagination.nextCursor back as ?cursor= for the next page.
+    """
     if context.role != "ADMIN":
         raise RBACError("security:audit:read")
-    # Placeholder: audit events table may differ; return empty list with pagination
-    return {
-        "data": [],
-        "pagination": {"page": page, "limit": limit, "total": 0, "totalPages": 0},
-    }
+
+    def _csv(value: Optional[str]) -> Optional[list[str]]:
+        items = (
+            [v.strip().upper() for v in value.split(",") if v.strip()] if value else []
+        )
+        return items or None
+
+    filters = AuditFilters(
+        severities=_csv(severity),
+        event_types=_csv(eventType),
+        user_id=userId,
+        correlation_id=correlationId,
+        since=since,
+        until=until,
+    )
+    result = await db.execute(
+        build_audit_query(context.tenant_id, filters, cursor, limit)
+    )
+    return paginate(list(result.scalars()), limit)
 
 
 @router.get("/security/sessions")
@@ -232,12 +276,7 @@ async def export_users(
     # Simplified export: return IDs matching filters (frontend can request file later)
     query = select(User.id)
     if search:
-        query = query.where(
-            (User.first_name.ilike(f"%{search}%"))
-            | (User.last_name.ilike(f"%{search}%"))
-            | (User.email.ilike(f"%{search}%"))
-            | (User.username.ilike(f"%{search}%"))
-        )
+        query = query.where(user_search_filter(search))
     if status and status != "all":
         query = query.where(User.status == status.upper())
     result = await db.execute(query)
@@ -305,16 +344,88 @@ async def import_users(
 ) -> dict[str, Any]:
     if context.role != "ADMIN":
         raise RBACError("user:create")
-    # Enqueue Celery task (implemented in app.jobs.tasks)
-    from app.jobs.tasks import users_import
+    from app.imports import create_job
+    from app.jobs.tasks import import_users as import_users_task
 
-    task = users_import.delay(
-        tenant_id=context.tenant_id or "",
-        file_id=request.fileId,
+    file_key = _import_file_key(context, request.fileId)
+    job = await create_job(db, context.tenant_id, "users", file_key, context.user_id)
+    # The worker reads the job row, so it must be committed before enqueueing
+    await db.commit()
+    task = import_users_task.delay(
+        import_job_id=job.id,
+        file_path=file_key,
+        tenant_id=context.tenant_id,
+        user_id=context.user_id,
         options=request.options or {},
-        requester_id=context.user_id,
     )
-    return {"success": True, "taskId": task.id}
+    return {"success": True, "taskId": task.id, "importJobId": job.id}
+
+
+async def _get_import_job(
+    db: AsyncSession, tenant_id: str | None, job_id: str, job_type: str
+) -> dict[str, Any]:
+    from app.db.models import ImportJob
+    from app.imports import serialize_job
+
+    result = await db.execute(
+        select(ImportJob).where(
+            ImportJob.id == job_id,
+            ImportJob.tenant_id == tenant_id,
+            ImportJob.type == job_type,
+        )
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise NotFoundError("Import job")
+    return {"success": True, "data": serialize_job(job)}
+
+
+@router.get("/users/import/{job_id}")
+async def get_users_import(
+    job_id: str,
+    context: RequireAuth,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> dict[str, Any]:
+    if context.role != "ADMIN":
+        raise RBACError("user:create")
+    return await _get_import_job(db, context.tenant_id, job_id, "users")
+
+
+@router.post("/enrollments/import")
+async def import_enrollments(
+    request: UsersImportRequest,
+    context: RequireAuth,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> dict[str, Any]:
+    if context.role != "ADMIN":
+        raise RBACError("enrollment:create")
+    from app.imports import create_job
+    from app.jobs.tasks import import_enrollments as import_enrollments_task
+
+    file_key = _import_file_key(context, request.fileId)
+    job = await create_job(
+        db, context.tenant_id, "enrollments", file_key, context.user_id
+    )
+    await db.commit()
+    task = import_enrollments_task.delay(
+        import_job_id=job.id,
+        file_path=file_key,
+        tenant_id=context.tenant_id,
+        user_id=context.user_id,
+        options=request.options or {},
+    )
+    return {"success": True, "taskId": task.id, "importJobId": job.id}
+
+
+@router.get("/enrollments/import/{job_id}")
+async def get_enrollments_import(
+    job_id: str,
+    context: RequireAuth,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> dict[str, Any]:
+    if context.role != "ADMIN":
+        raise RBACError("enrollment:create")
+    return await _get_import_job(db, context.tenant_id, job_id, "enrollments")
 
 
 @router.post("/users/{user_id}/impersonate")
@@ -11,7 +11,7 @@ from app.auth import RequireAuth
 from app.db.models import Assignment, AssignmentSubmission, Course, Enrollment
 from app.db.session import get_db
 from app.errors import BadRequestError, ForbiddenError, NotFoundError, RBACError
-from app.jobs.tasks import timeline_add_event
+from app.events import DomainEventType, emit
 from app.rbac import can
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
@@ -197,26 +197,25 @@ async def create_assignment(
         )
 
         db.add(assignment)
-        await db.commit()
-        await db.refresh(assignment)
+        await db.flush()
 
-        # Queue timeline event
+        # Timeline event, committed atomically with the assignment
         if request.courseId and context.tenant_id:
-            try:
-                timeline_add_event.delay(
-                    user_id=context.user_id,
-                    tenant_id=context.tenant_id,
-                    event_type="ASSIGNMENT_CREATED",
-                    course_id=request.courseId,
-                    details={"assignmentId": assignment.id, "title": request.title},
-                )
-            except Exception as e:
-                # Log but don't fail the request if timeline event fails
-                import logging
-
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to add timeline event: {str(e)}")
-                pass
+            emit(
+                db,
+                DomainEventType.ASSIGNMENT_CREATED,
+                tenant_id=context.tenant_id,
+                aggregate_id=assignment.id,
+                user_id=context.user_id,
+                payload={
+                    "assignmentId": assignment.id,
+                    "courseId": request.courseId,
+                    "title": request.title,
+                },
+            )
+
+        await db.commit()
+        await db.refresh(assignment)
 
         return {
             "id": assignment.id,
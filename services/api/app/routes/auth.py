@@ -7,12 +7,13 @@ All authentication endpoints matching the TypeScript implementation.
 from datetime import datetime, timezone
 from typing import Annotated, Any
 
+from app.activity import track_login
 from app.auth import (
     RequireAuth,
     create_access_token,
-    hash_password,
+    hash_password_async,
     validate_password_policy,
-    verify_password,
+    verify_password_async,
     verify_token,
 )
 from app.config import get_settings
@@ -20,6 +21,9 @@ from app.db.hooks import TenantContextManager
 from app.db.models import Branch, PasswordResetToken, User, RoleKey, Tenant
 from app.db.session import get_db
 from app.errors import AuthError, BadRequestError, NotFoundError
+from app.events import DomainEventType, emit
+from app.middleware.rate_limit import check_account_limit
+from app.ratelimit import LOGIN_ACCOUNT_LIMIT
 from app.core.tenant import get_tenant_id
 from app.rbac import get_user_permissions
 from fastapi import APIRouter, Depends, Request, Response
@@ -109,6 +113,8 @@ async def login(
     Login with email and password.
     Sets httpOnly session cookie on success.
     """
+    await check_account_limit("login", request.email, LOGIN_ACCOUNT_LIMIT)
+
     # Find user by email
     try:
         result = await db.execute(
@@ -120,18 +126,26 @@ async def login(
             raise AuthError("Invalid email or password", status_code=401)
 
         # Verify password
-        if not verify_password(request.password, user.password_hash):
+        if not await verify_password_async(request.password, user.password_hash):
             raise AuthError("Invalid email or password", status_code=401)
 
         # Check if active
         if not user.is_active:
             raise AuthError("Account is disabled", status_code=403)
 
-        # Update last login
+        # Update last login (buffered; written in batches by app.activity)
         # Use TenantContextManager(bypass=True) to bypass tenant checks for login updates
         # This prevents errors if the request has a stale/mismatched session cookie
         with TenantContextManager(bypass=True):
-            user.last_login_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            if not track_login(user.id, user.tenant_id):
+                user.last_login_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            emit(
+                db,
+                DomainEventType.USER_LOGGED_IN,
+                tenant_id=user.tenant_id,
+                aggregate_id=user.id,
+                user_id=user.id,
+            )
             await db.commit()
 
         # Get token version
@@ -359,7 +373,7 @@ async def signup(
         raise BadRequestError("User with this email or username already exists")
 
     # Create user
-    password_hash = hash_password(request.password)
+    password_hash = await hash_password_async(request.password)
 
     user = User(
         email=email_lower,
@@ -478,7 +492,7 @@ async def reset_password(
         raise BadRequestError("User not found for reset token")
 
     # Update user password and invalidate sessions by incrementing tokenVersion
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password_async(new_password)
     user.token_version = (user.token_version or 0) + 1
 
     # Mark token used
@@ -1,11 +1,21 @@
-from typing import Annotated, Any
+from typing import Annotated, Any, TypedDict
 
 from app.auth import RequireAuth
+from app.cache import DASHBOARD, invalidate_tags, tenant_tag
 from app.core.tenant import get_tenant_id
-from app.db.models import Course, CourseStatus, Enrollment
+from app.db.models import (
+    Course,
+    CourseStatus,
+    CourseUnit,
+    Enrollment,
+    UnitStatus,
+    UnitType,
+)
 from app.db.session import get_db
 from app.errors import BadRequestError, NotFoundError, RBACError
 from app.rbac import can
+from app.search import course_search_filter
+from app.serialization import ORJSONResponse
 from fastapi import APIRouter, Depends, Query
 from pydantic import UUID4, BaseModel, Field
 from sqlalchemy import delete, func, select, update
@@ -56,6 +66,32 @@ class CourseListResponse(BaseModel):
     totalPages: int
 
 
+class UnitRow(TypedDict):
+    id: str
+    title: str
+    orderIndex: int
+    type: UnitType
+    sectionId: str | None
+    config: dict[str, Any]
+    status: UnitStatus
+
+
+# ============= Serializers =============
+
+
+def _unit_row(unit: CourseUnit) -> UnitRow:
+    """Course outline row with raw enums (encoded by orjson)."""
+    return {
+        "id": unit.id,
+        "title": unit.title,
+        "orderIndex": unit.order_index,
+        "type": unit.type,
+        "sectionId": unit.section_id,
+        "config": unit.config or {},
+        "status": unit.status,
+    }
+
+
 # ============= Endpoints =============
 
 
@@ -85,11 +121,7 @@ async def list_courses(
 
     # Apply search filter
     if search:
-        search_filter = (
-            Course.title.ilike(f"%{search}%")
-            | Course.code.ilike(f"%{search}%")
-            | Course.description.ilike(f"%{search}%")
-        )
+        search_filter = course_search_filter(search)
         query = query.where(search_filter)
         count_query = count_query.where(search_filter)
 
@@ -198,6 +230,7 @@ async def create_course(
     db.add(course)
     await db.commit()
     await db.refresh(course)
+    await invalidate_tags(tenant_tag(DASHBOARD, tenant_id))
 
     return {
         "ok": True,
@@ -248,11 +281,7 @@ async def get_catalog(
     )
 
     if search:
-        search_filter = (
-            Course.title.ilike(f"%{search}%")
-            | Course.code.ilike(f"%{search}%")
-            | Course.description.ilike(f"%{search}%")
-        )
+        search_filter = course_search_filter(search)
         query = query.where(search_filter)
         count_query = count_query.where(search_filter)
 
@@ -373,7 +402,7 @@ async def get_course(
     course_id: str,
     context: RequireAuth,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get a single course by ID.
     """
@@ -418,7 +447,7 @@ async def get_course(
                 raise NotFoundError("Course")
 
     # Load sections and units for learner navigation
-    from app.db.models import CourseSection, CourseUnit
+    from app.db.models import CourseSection
 
     sec_result = await db.execute(
         select(CourseSection).where(CourseSection.course_id == course_id)
@@ -428,53 +457,39 @@ async def get_course(
         select(CourseUnit).where(CourseUnit.course_id == course_id)
     )
     units = unit_result.scalars().all()
-    units_data = [
-        {
-            "id": u.id,
-            "title": u.title,
-            "orderIndex": u.order_index,
-            "type": u.type.value if hasattr(u.type, "value") else str(u.type),
-            "sectionId": u.section_id,
-            "config": u.config or {},
-            "status": u.status.value if hasattr(u.status, "value") else str(u.status),
-        }
-        for u in units
-    ]
-    sections_data = [
+    # Group units by section in one pass
+    units_by_section: dict[str | None, list[UnitRow]] = {}
+    for u in units:
+        units_by_section.setdefault(u.section_id, []).append(_unit_row(u))
+
+    return ORJSONResponse(
         {
-            "id": s.id,
-            "name": s.title,
-            "order": s.order_index,
-            "units": [ud for ud in units_data if ud["sectionId"] == s.id],
+            "id": course.id,
+            "code": course.code,
+            "title": course.title,
+            "description": course.description,
+            "status": course.status,
+            "isActive": course.is_active,
+            "hiddenFromCatalog": course.hidden_from_catalog,
+            "thumbnailUrl": course.thumbnail_url,
+            "categoryId": course.category_id,
+            "instructorId": course.instructor_id,
+            "createdAt": course.created_at,
+            "updatedAt": course.updated_at,
+            "sections": [
+                {
+                    "id": s.id,
+                    "name": s.title,
+                    "order": s.order_index,
+                    "units": units_by_section.get(s.id, []),
+                }
+                for s in sections
+            ],
+            "unassignedUnits": units_by_section.get(None, []),
+            "totalUnits": len(units),
+            "totalDuration": "45m",
         }
-        for s in sections
-    ]
-    unassigned_units = [ud for ud in units_data if ud["sectionId"] is None]
-    if not sections_data and not unassigned_units:
-        unassigned_units = []
-
-    return {
-        "id": course.id,
-        "code": course.code,
-        "title": course.title,
-        "description": course.description,
-        "status": (
-            course.status.value
-            if hasattr(course.status, "value")
-            else str(course.status)
-        ),
-        "isActive": course.is_active,
-        "hiddenFromCatalog": course.hidden_from_catalog,
-        "thumbnailUrl": course.thumbnail_url,
-        "categoryId": course.category_id,
-        "instructorId": course.instructor_id,
-        "createdAt": course.created_at.isoformat() if course.created_at else None,
-        "updatedAt": course.updated_at.isoformat() if course.updated_at else None,
-        "sections": sections_data,
-        "unassignedUnits": unassigned_units,
-        "totalUnits": len(units),
-        "totalDuration": "45m",
-    }
+    )
 
 
 @router.get("/{course_id}/units/{unit_id}")
@@ -461,24 +461,26 @@ async def add_course_enrollment(
     if not course_res.scalar_one_or_none():
         raise NotFoundError("Course")
 
-    for user_id in request.userIds:
-        # Check if already enrolled
-        existing = await db.execute(
-            select(Enrollment).where(
-                and_(Enrollment.course_id == course_id, Enrollment.user_id == user_id)
-            )
+    # Skip users already enrolled (one query for the whole batch)
+    user_ids = list(dict.fromkeys(request.userIds))
+    existing = await db.execute(
+        select(Enrollment.user_id).where(
+            and_(Enrollment.course_id == course_id, Enrollment.user_id.in_(user_ids))
         )
-        if existing.scalar_one_or_none():
-            continue
+    )
+    enrolled = set(existing.scalars().all())
 
-        enr = Enrollment(
+    db.add_all(
+        Enrollment(
             tenant_id=context.tenant_id,
             user_id=user_id,
             course_id=course_id,
             status=EnrollmentStatus.NOT_STARTED,
             progress=0,
         )
-        db.add(enr)
+        for user_id in user_ids
+        if user_id not in enrolled
+    )
 
     await db.commit()
     return {"success": True}
@@ -516,10 +518,11 @@ async def set_course_image(
     db: Annotated[AsyncSession, Depends(get_db)],
     file: UploadFile = File(...),
 ) -> dict:
-    from app.routes.uploads import PRIMARY_UPLOADS_DIR, SECONDARY_UPLOADS_DIR
     import uuid
     from pathlib import Path
 
+    from app.storage import get_storage, tenant_key
+
     await require_permission(db, context, "course:update")
 
     # Check course
@@ -531,24 +534,15 @@ async def set_course_image(
     # Save file
     suffix = Path(str(file.filename)).suffix or ".png"
     unique_name = f"course-{course_id}-{uuid.uuid4().hex[:8]}{suffix}"
-    
+
+    storage = get_storage()
     contents = await file.read()
-    
-    # Write to primary
-    try:
-        with open(PRIMARY_UPLOADS_DIR / unique_name, "wb") as f:
-            f.write(contents)
-    except Exception:
-        pass
-    # Also write to secondary for compatibility
-    try:
-        with open(SECONDARY_UPLOADS_DIR / unique_name, "wb") as f:
-            f.write(contents)
-    except Exception:
-        pass
+    stored = await storage.save(
+        tenant_key(course.tenant_id, unique_name), contents, file.content_type
+    )
+
+    image_url = storage.public_url(stored.key)
 
-    image_url = f"/files/{unique_name}"
-    
     # Update course
     course.thumbnail_url = image_url
     await db.commit()
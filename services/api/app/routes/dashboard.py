@@ -2,6 +2,7 @@ import json
 from typing import Annotated, Any
 
 from app.auth import RequireAuth
+from app.cache import DASHBOARD, cached, tenant_tag
 from app.db.models import Branch, Course, CourseStatus, TimelineEvent, User
 from app.db.session import get_db
 from fastapi import APIRouter, Depends
@@ -12,6 +13,12 @@ router = APIRouter()
 
 
 @router.get("")
+@cached(
+    ttl=30,
+    stale_ttl=300,
+    scope="tenant",
+    tags=lambda context, **_: [tenant_tag(DASHBOARD, context.tenant_id)],
+)
 async def dashboard_alias(
     context: RequireAuth,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -19,6 +26,7 @@ async def dashboard_alias(
     """
     GET /api/dashboard
     Returns dashboard statistics, timeline, and recent courses.
+    Cached per tenant; concurrent misses share one computation.
     """
     print(f">>> REACHED DASHBOARD ALIAS ENDPOINT for tenant {context.tenant_id} <<<")
     try:
@@ -4,14 +4,16 @@ Enrollment Routes
 CRUD endpoints for course enrollments.
 """
 
-from typing import Annotated, Any, Optional
+from datetime import datetime
+from typing import Annotated, Any, Optional, TypedDict
 
 from app.audit import AuditEntry, AuditEventType, log_audit_background
 from app.auth import RequireAuth
-from app.db.models import Course, Enrollment, EnrollmentStatus
+from app.db.models import Course, CourseStatus, Enrollment, EnrollmentStatus
 from app.db.session import get_db
 from app.errors import BadRequestError, NotFoundError, RBACError
 from app.rbac import can
+from app.serialization import ORJSONResponse
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy import and_, func, select
@@ -29,16 +31,69 @@ class CreateEnrollmentRequest(BaseModel):
     courseId: str
 
 
+class EnrollmentCourseRow(TypedDict):
+    id: str
+    code: str
+    title: str
+    description: str | None
+    thumbnailUrl: str | None
+    status: CourseStatus
+
+
+class EnrollmentRow(TypedDict):
+    id: str
+    userId: str
+    courseId: str
+    status: EnrollmentStatus
+    progress: int
+    score: float | None
+    startedAt: datetime | None
+    completedAt: datetime | None
+    createdAt: datetime | None
+    course: EnrollmentCourseRow | None
+
+
 class EnrollmentListResponse(BaseModel):
     data: list[dict[str, Any]]
     stats: dict[str, int]
     pagination: dict[str, Any]
 
 
+# ============= Serializers =============
+
+
+def _enrollment_row(enrollment: Enrollment) -> EnrollmentRow:
+    """List row with raw enums and datetimes (encoded by orjson)."""
+    course = enrollment.course
+    return {
+        "id": enrollment.id,
+        "userId": enrollment.user_id,
+        "courseId": enrollment.course_id,
+        "status": enrollment.status,
+        "progress": enrollment.progress,
+        "score": float(enrollment.score) if enrollment.score else None,
+        "startedAt": enrollment.created_at,
+        "completedAt": enrollment.completed_at,
+        "createdAt": enrollment.created_at,
+        "course": (
+            {
+                "id": course.id,
+                "code": course.code,
+                "title": course.title,
+                "description": course.description,
+                "thumbnailUrl": course.thumbnail_url,
+                "status": course.status,
+            }
+            if course
+            else None
+        ),
+    }
+
+
 # ============= Endpoints =============
 
 
-@router.get("")
+@router.get("", response_model=EnrollmentListResponse)
 async def list_enrollments(
     context: RequireAuth,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -47,7 +102,7 @@ async def list_enrollments(
     search: Optional[str] = Query(None, description="Search by course title/code"),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     GET /api/enrollments
     List enrollments with pagination and filtering.
@@ -115,61 +170,18 @@ async def list_enrollments(
         elif status_val == EnrollmentStatus.NOT_STARTED:
             stats["notStarted"] = count
 
-    # Transform for response
-    enrollments_data = []
-    for enrollment in enrollments:
-        course_data = None
-        if enrollment.course:
-            course_data = {
-                "id": enrollment.course.id,
-                "code": enrollment.course.code,
-                "title": enrollment.course.title,
-                "description": enrollment.course.description,
-                "thumbnailUrl": enrollment.course.thumbnail_url,
-                "status": (
-                    enrollment.course.status.value
-                    if hasattr(enrollment.course.status, "value")
-                    else str(enrollment.course.status)
-                ),
-            }
-
-        enrollments_data.append(
-            {
-                "id": enrollment.id,
-                "userId": enrollment.user_id,
-                "courseId": enrollment.course_id,
-                "status": (
-                    enrollment.status.value
-                    if hasattr(enrollment.status, "value")
-                    else str(enrollment.status)
-                ),
-                "progress": enrollment.progress,
-                "score": float(enrollment.score) if enrollment.score else None,
-                "startedAt": (
-                    enrollment.created_at.isoformat() if enrollment.created_at else None
-                ),
-                "completedAt": (
-                    enrollment.completed_at.isoformat()
-                    if enrollment.completed_at
-                    else None
-                ),
-                "createdAt": (
-                    enrollment.created_at.isoformat() if enrollment.created_at else None
-                ),
-                "course": course_data,
-            }
-        )
-
-    return {
-        "data": enrollments_data,
-        "stats": stats,
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total": total,
-            "totalPages": (total + limit - 1) // limit,
-        },
-    }
+    return ORJSONResponse(
+        {
+            "data": [_enrollment_row(e) for e in enrollments],
+            "stats": stats,
+            "pagination": {
+                "page": page,
+                "limit": limit,
+                "total": total,
+                "totalPages": (total + limit - 1) // limit,
+            },
+        }
+    )
 
 
 @router.post("")
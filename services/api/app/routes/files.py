@@ -1,101 +1,150 @@
-import mimetypes
-from pathlib import Path
-from typing import Annotated
+"""
+File Routes
 
-from app.auth import RequireAuth
+Download endpoints for uploaded media. The API never streams object bytes
+itself when a proxy or object store can do it:
+
+- S3 backend: 307 redirect to a presigned, expiring URL.
+- Local backend + STORAGE_ACCEL_MODE: empty response carrying
+  X-Accel-Redirect / X-Sendfile so nginx sends the file.
+- Local backend without offload: FileResponse (chunked, Range-aware).
+
+Every download needs either a valid signed link or a session. Keys scoped
+to a tenant (tenants/<tenant_id>/...) are only visible to that tenant's
+users; other tenants get a 404.
+"""
+
+from typing import Annotated, Any
+
+from app.auth import AuthContext, OptionalAuth, RequireAuth
+from app.config import get_settings
 from app.db.session import get_db
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from fastapi.responses import StreamingResponse
+from app.storage import (
+    InvalidKeyError,
+    LocalStorage,
+    get_storage,
+    key_tenant,
+    signing_secret,
+    verify_signature,
+)
+from app.storage.base import guess_content_type
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, RedirectResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
+CACHE_HEADERS = {"Cache-Control": "public, max-age=3600, must-revalidate"}
 
-def resolve_repo_root() -> Path:
-    p = Path(__file__).resolve().parent
-    for _ in range(8):
-        if (p / "public").exists() or (p / "apps" / "web" / "public").exists():
-            return p
-        p = p.parent
-    return Path(__file__).resolve().parents[5]
 
+def _content_disposition(filename: str | None) -> dict[str, str]:
+    if not filename:
+        return {}
+    safe = filename.replace('"', "")
+    return {"Content-Disposition": f'attachment; filename="{safe}"'}
 
-ROOT_DIR = resolve_repo_root()
-PRIMARY_UPLOADS_DIR = ROOT_DIR / "public" / "uploads"
-SECONDARY_UPLOADS_DIR = ROOT_DIR / "apps" / "web" / "public" / "uploads"
-TERTIARY_UPLOADS_DIR = ROOT_DIR / "services" / "api" / "public" / "uploads"
 
+def _check_tenant(file_id: str, context: AuthContext) -> None:
+    """Hide keys scoped to another tenant behind a 404."""
+    owner = key_tenant(file_id)
+    if owner is not None and owner != context.tenant_id:
+        raise HTTPException(status_code=404, detail="File not found")
 
-def find_file_path(file_id: str) -> Path | None:
-    candidates = [
-        PRIMARY_UPLOADS_DIR / file_id,
-        SECONDARY_UPLOADS_DIR / file_id,
-        TERTIARY_UPLOADS_DIR / file_id,
-    ]
-    for c in candidates:
-        if c.exists() and c.is_file():
-            return c
-    return None
+
+@router.get("/{file_id:path}/url")
+async def get_file_url(
+    file_id: str,
+    context: RequireAuth,
+    expiresIn: int | None = Query(None, ge=1, le=7 * 24 * 3600),
+    filename: str | None = Query(None),
+) -> dict[str, Any]:
+    """
+    Issue a signed, expiring direct-download URL for a file.
+
+    Clients can hand this URL to <video>/<img> tags or download managers;
+    the bytes are then served by nginx or object storage, not the API.
+    """
+    storage = get_storage()
+    ttl = expiresIn or get_settings().storage_url_ttl_seconds
+    try:
+        _check_tenant(file_id, context)
+        if not await storage.exists(file_id):
+            raise HTTPException(status_code=404, detail="File not found")
+        url = storage.signed_url(file_id, ttl, filename=filename)
+    except InvalidKeyError:
+        raise HTTPException(status_code=400, detail="Invalid file id")
+    return {"url": url, "expiresIn": ttl}
 
 
-@router.get("/{file_id}")
+@router.get("/{file_id:path}")
 async def get_file(
     file_id: str,
     request: Request,
-    response: Response,
+    context: OptionalAuth,
+    expires: int | None = Query(None),
+    signature: str | None = Query(None),
+    filename: str | None = Query(None),
 ):
-    file_path = find_file_path(file_id)
+    storage = get_storage()
+
+    # Signed URLs must carry a valid, unexpired signature; anything else
+    # needs a session in the file's tenant
+    if signature is not None or expires is not None:
+        if (
+            signature is None
+            or expires is None
+            or not verify_signature(
+                file_id, expires, signature, signing_secret(), filename
+            )
+        ):
+            raise HTTPException(status_code=403, detail="Invalid or expired link")
+    elif context is None:
+        raise HTTPException(status_code=401, detail="Authentication required")
+
+    try:
+        if signature is None:
+            _check_tenant(file_id, context)
+        if storage.redirect_downloads:
+            if not await storage.exists(file_id):
+                raise HTTPException(status_code=404, detail="File not found")
+            url = storage.signed_url(
+                file_id, get_settings().storage_url_ttl_seconds, filename=filename
+            )
+            return RedirectResponse(url, status_code=307)
+
+        assert isinstance(storage, LocalStorage)
+        file_path = storage.path_for(file_id)
+    except InvalidKeyError:
+        raise HTTPException(status_code=400, detail="Invalid file id")
+
     if not file_path:
         raise HTTPException(status_code=404, detail="File not found")
 
-    mime, _ = mimetypes.guess_type(str(file_path))
-    if not mime:
-        mime = "application/octet-stream"
-
-    # Read the file into memory (small files) or stream; for dev simplicity
-    # we stream from disk
-    data = file_path.read_bytes()
-
-    # Range support
-    range_header = request.headers.get("range")
-    headers = {
-        "Accept-Ranges": "bytes",
-        "Cache-Control": "public, max-age=3600, must-revalidate",
-    }
-    if range_header and range_header.startswith("bytes="):
-        try:
-            start_end = range_header.replace("bytes=", "").split("-")
-            start = int(start_end[0]) if start_end[0] else 0
-            end = (
-                int(start_end[1])
-                if (len(start_end) > 1 and start_end[1])
-                else len(data) - 1
-            )
-            if start > end or start < 0 or end >= len(data):
-                raise ValueError()
-        except Exception:
-            # Malformed range; serve whole file
-            return StreamingResponse(iter([data]), media_type=mime, headers=headers)
-        chunk = data[start : end + 1]
-        headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
-        return StreamingResponse(
-            iter([chunk]), status_code=206, media_type=mime, headers=headers
+    mime = guess_content_type(file_path.name)
+    headers = {**CACHE_HEADERS, **_content_disposition(filename)}
+
+    accel = storage.accel_headers(file_id, file_path)
+    if accel:
+        # nginx/Apache replace this empty body with the file contents
+        return Response(
+            status_code=200, media_type=mime, headers={**headers, **accel}
         )
 
-    return StreamingResponse(iter([data]), media_type=mime, headers=headers)
+    return FileResponse(file_path, media_type=mime, headers=headers)
 
 
-@router.delete("/{file_id}")
+@router.delete("/{file_id:path}")
 async def delete_file(
     file_id: str,
     context: RequireAuth,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict:
-    fp = find_file_path(file_id)
-    if not fp:
-        raise HTTPException(status_code=404, detail="File not found")
+    storage = get_storage()
     try:
-        fp.unlink(missing_ok=True)
-    except Exception:
-        pass
+        _check_tenant(file_id, context)
+        if not await storage.exists(file_id):
+            raise HTTPException(status_code=404, detail="File not found")
+        await storage.delete(file_id)
+    except InvalidKeyError:
+        raise HTTPException(status_code=400, detail="Invalid file id")
     return {"success": True}
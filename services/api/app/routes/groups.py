@@ -14,6 +14,7 @@ from app.db.models import Course, Group, GroupCourse, GroupMember, User
 from app.db.session import get_db
 from app.errors import BadRequestError, NotFoundError, RBACError
 from app.rbac import can
+from app.search import group_search_filter
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
@@ -90,8 +91,8 @@ async def list_groups(
 
     # Apply search filter
     if search:
-        query = query.where(Group.name.ilike(f"%{search}%"))
-        count_query = count_query.where(Group.name.ilike(f"%{search}%"))
+        query = query.where(group_search_filter(search))
+        count_query = count_query.where(group_search_filter(search))
 
     # Get total count
     count_result = await db.execute(count_query)
@@ -104,21 +105,27 @@ async def list_groups(
     result = await db.execute(query)
     groups = result.scalars().all()
 
-    # Transform for response
-    groups_data = []
-    for group in groups:
-        # Fetch counts
-        member_count = await db.scalar(
-            select(func.count())
-            .select_from(GroupMember)
-            .where(GroupMember.group_id == group.id)
+    # Member/course counts for the whole page (one grouped query each)
+    group_ids = [group.id for group in groups]
+    member_counts: dict[str, int] = {}
+    course_counts: dict[str, int] = {}
+    if group_ids:
+        member_result = await db.execute(
+            select(GroupMember.group_id, func.count())
+            .where(GroupMember.group_id.in_(group_ids))
+            .group_by(GroupMember.group_id)
         )
-        course_count = await db.scalar(
-            select(func.count())
-            .select_from(GroupCourse)
-            .where(GroupCourse.group_id == group.id)
+        member_counts = dict(member_result.tuples().all())
+        course_result = await db.execute(
+            select(GroupCourse.group_id, func.count())
+            .where(GroupCourse.group_id.in_(group_ids))
+            .group_by(GroupCourse.group_id)
         )
+        course_counts = dict(course_result.tuples().all())
 
+    # Transform for response
+    groups_data = []
+    for group in groups:
         groups_data.append(
             {
                 "id": group.id,
@@ -128,8 +135,8 @@ async def list_groups(
                 "instructorId": group.instructor_id,
                 "createdAt": group.created_at.isoformat() if group.created_at else None,
                 "updatedAt": group.updated_at.isoformat() if group.updated_at else None,
-                "memberCount": member_count or 0,
-                "courseCount": course_count or 0,
+                "memberCount": member_counts.get(group.id, 0),
+                "courseCount": course_counts.get(group.id, 0),
             }
         )
 
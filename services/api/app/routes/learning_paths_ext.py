@@ -309,34 +309,37 @@ async def add_lp_enrollment(
         else ([request.userId] if request.userId else [])
     )
 
-    for uid in uids:
-        # Check user
-        user_res = await db.execute(select(User).where(User.id == uid))
-        if not user_res.scalar_one_or_none():
-            continue
-
-        # Check if already enrolled
-        existing = await db.execute(
-            select(LearningPathEnrollment).where(
+    uids = list(dict.fromkeys(uids))
+    if uids:
+        # Existing users not yet on the path (one query each for the whole batch)
+        users_res = await db.execute(select(User.id).where(User.id.in_(uids)))
+        known = set(users_res.scalars().all())
+        existing_res = await db.execute(
+            select(LearningPathEnrollment.user_id).where(
                 and_(
                     LearningPathEnrollment.path_id == path_id,
-                    LearningPathEnrollment.user_id == uid,
+                    LearningPathEnrollment.user_id.in_(uids),
                 )
             )
         )
-        if existing.scalar_one_or_none():
-            continue
-
-        enr = LearningPathEnrollment(
-            tenant_id=context.tenant_id,
-            user_id=uid,
-            path_id=path_id,
-            status="NOT_STARTED",
-            progress=0,
+        on_path = set(existing_res.scalars().all())
+        new_uids = [uid for uid in uids if uid in known and uid not in on_path]
+    else:
+        new_uids = []
+
+    if new_uids:
+        db.add_all(
+            LearningPathEnrollment(
+                tenant_id=context.tenant_id,
+                user_id=uid,
+                path_id=path_id,
+                status="NOT_STARTED",
+                progress=0,
+            )
+            for uid in new_uids
         )
-        db.add(enr)
 
-        # Auto-enroll user in all courses in this path
+        # Auto-enroll the new users in all courses in this path
         courses_res = await db.execute(
             select(LearningPathCourse.course_id).where(
                 LearningPathCourse.path_id == path_id
@@ -346,22 +349,26 @@ async def add_lp_enrollment(
 
         from app.db.models import Enrollment, EnrollmentStatus
 
-        for cid in course_ids:
-            # Check if already enrolled in the course
+        if course_ids:
             course_enr_res = await db.execute(
-                select(Enrollment).where(
-                    (Enrollment.user_id == uid) & (Enrollment.course_id == cid)
+                select(Enrollment.user_id, Enrollment.course_id).where(
+                    Enrollment.user_id.in_(new_uids),
+                    Enrollment.course_id.in_(course_ids),
                 )
             )
-            if not course_enr_res.scalar_one_or_none():
-                new_course_enr = Enrollment(
+            enrolled = set(course_enr_res.tuples().all())
+            db.add_all(
+                Enrollment(
                     tenant_id=context.tenant_id,
                     user_id=uid,
                     course_id=cid,
                     status=EnrollmentStatus.NOT_STARTED,
                     progress=0,
                 )
-                db.add(new_course_enr)
+                for uid in new_uids
+                for cid in course_ids
+                if (uid, cid) not in enrolled
+            )
 
     await db.commit()
     return {"success": True}
@@ -4,20 +4,23 @@ Reports Routes
 Endpoints for generating and exporting reports.
 """
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 from typing import Annotated, Any, Optional
 from io import BytesIO
 
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-
 from app.auth import RequireAuth
-from app.db.models import Course, Enrollment, EnrollmentStatus, TimelineEvent, User
+from app.db.models import (
+    Course,
+    Enrollment,
+    EnrollmentStatus,
+    LoginDailyCount,
+    TimelineEvent,
+    User,
+)
 from app.db.session import get_db
 from app.errors import RBACError
-from app.jobs.tasks import report_generate
 from app.rbac import can
+from app.search import course_search_filter, user_search_filter
 from fastapi import APIRouter, Depends, Query, Body
 from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
@@ -50,6 +53,72 @@ class ExportProgressRequest(BaseModel):
 
 
 
+# ============= Helpers =============
+
+
+def activity_buckets(period: str, today: date) -> list[tuple[date, date, str]]:
+    """(start, end exclusive, label) buckets: 7 days, 4 weeks (default) or 12 months."""
+    if period == "week":
+        days = [today - timedelta(days=i) for i in range(6, -1, -1)]
+        return [(d, d + timedelta(days=1), d.strftime("%a")) for d in days]
+    if period == "year":
+        buckets = []
+        for i in range(11, -1, -1):
+            month_index = today.year * 12 + today.month - 1 - i
+            start = date(month_index // 12, month_index % 12 + 1, 1)
+            next_index = month_index + 1
+            end = date(next_index // 12, next_index % 12 + 1, 1)
+            buckets.append((start, end, start.strftime("%b")))
+        return buckets
+    first = today - timedelta(days=27)
+    return [
+        (
+            first + timedelta(days=7 * i),
+            first + timedelta(days=7 * (i + 1)),
+            (first + timedelta(days=7 * i)).strftime("%b %d"),
+        )
+        for i in range(4)
+    ]
+
+
+def bucket_counts(
+    buckets: list[tuple[date, date, str]], daily: list[tuple[date, int]]
+) -> list[int]:
+    totals = [0] * len(buckets)
+    for day, count in daily:
+        for i, (start, end, _) in enumerate(buckets):
+            if start <= day < end:
+                totals[i] += count
+                break
+    return totals
+
+
+async def _activity_series(
+    db: AsyncSession, tenant_id: str | None, period: str
+) -> tuple[list[str], list[int], list[int]]:
+    buckets = activity_buckets(period, datetime.utcnow().date())
+    since = buckets[0][0]
+    login_rows = await db.execute(
+        select(LoginDailyCount.day, LoginDailyCount.logins).where(
+            LoginDailyCount.tenant_id == tenant_id, LoginDailyCount.day >= since
+        )
+    )
+    completed_day = func.date(Enrollment.completed_at)
+    completion_rows = await db.execute(
+        select(completed_day, func.count())
+        .where(
+            Enrollment.tenant_id == tenant_id,
+            Enrollment.completed_at >= datetime.combine(since, time.min),
+        )
+        .group_by(completed_day)
+    )
+    return (
+        [label for _, _, label in buckets],
+        bucket_counts(buckets, list(login_rows.tuples())),
+        bucket_counts(buckets, list(completion_rows.tuples())),
+    )
+
+
 # ============= Endpoints =============
 
 
@@ -108,10 +177,8 @@ async def get_overview(
     lp_count = (
         await db.execute(select(func.count()).select_from(LearningPath))
     ).scalar() or 0
-    # Activity placeholder arrays
-    labels = ["Week 1", "Week 2", "Week 3", "Week 4"]
-    logins = [active_users // 4] * 4
-    completions = [completed_courses // 4] * 4
+    # Activity chart: daily login counts (app.activity) and completions, bucketed
+    labels, logins, completions = await _activity_series(db, context.tenant_id, period)
     # Enrollment distribution
     in_progress_result = await db.execute(
         select(func.count())
@@ -305,27 +372,26 @@ async def get_training_matrix(
     # Users
     user_query = select(User).order_by(User.created_at.desc())
     if search:
-        user_query = user_query.where(
-            (User.first_name.ilike(f"%{search}%"))
-            | (User.last_name.ilike(f"%{search}%"))
-            | (User.email.ilike(f"%{search}%"))
-        )
+        user_query = user_query.where(user_search_filter(search))
     users_result = await db.execute(user_query)
     users = users_result.scalars().all()
     # Courses
     course_result = await db.execute(select(Course.id, Course.title))
     course_rows = course_result.all()
     courses = [{"id": r[0], "title": r[1]} for r in course_rows]
-    # Enrollments per user
-    data_users: list[dict[str, Any]] = []
-    for u in users:
+    # Enrollments of all listed users in one query, grouped per user
+    entries_by_user: dict[str, list[dict[str, Any]]] = {u.id: [] for u in users}
+    if users:
+        user_ids = user_query.with_only_columns(User.id).order_by(None)
         enr_result = await db.execute(
             select(Enrollment, Course.title)
             .join(Course, Course.id == Enrollment.course_id, isouter=True)
-            .where(Enrollment.user_id == u.id)
+            .where(Enrollment.user_id.in_(user_ids))
         )
-        entries = []
         for enr, title in enr_result.all():
+            entries = entries_by_user.get(enr.user_id)
+            if entries is None:
+                continue
             entries.append(
                 {
                     "courseId": enr.course_id,
@@ -338,14 +404,15 @@ async def get_training_matrix(
                     ),
                 }
             )
-        data_users.append(
-            {
-                "userId": u.id,
-                "userName": f"{u.first_name} {u.last_name}",
-                "userEmail": u.email,
-                "courses": entries,
-            }
-        )
+    data_users: list[dict[str, Any]] = [
+        {
+            "userId": u.id,
+            "userName": f"{u.first_name} {u.last_name}",
+            "userEmail": u.email,
+            "courses": entries_by_user[u.id],
+        }
+        for u in users
+    ]
     return {"users": data_users, "courses": courses}
 
 
@@ -362,6 +429,9 @@ async def generate_report(
     if not await can(db, context, "reports:create"):
         raise RBACError("reports:create")
 
+    # Imported here: the Celery task modules are only needed to enqueue
+    from app.jobs.tasks import report_generate
+
     # Queue the report generation task
     task = report_generate.delay(
         report_id=request.reportType,
@@ -561,19 +631,19 @@ async def export_training_matrix(
     if request and request.search:
         search = request.search
         query = query.where(
-            (User.first_name.ilike(f"%{search}%"))
-            | (User.last_name.ilike(f"%{search}%"))
-            | (User.email.ilike(f"%{search}%"))
-            | (Course.title.ilike(f"%{search}%"))
+            user_search_filter(search) | course_search_filter(search)
         )
 
     result = await db.execute(query)
     rows = result.all()
 
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, PatternFill
+
     workbook_out = BytesIO()
     try:
         # Create Excel
-        wb = openpyxl.Workbook()
+        wb = Workbook()
         ws = wb.active
         ws.title = "Training Matrix"
 
@@ -661,9 +731,12 @@ async def export_training_progress(
         rows = result.all()
         print(f"DEBUG: Query returned {len(rows)} rows.")
 
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, PatternFill
+
         workbook_out = BytesIO()
         # Create Excel
-        wb = openpyxl.Workbook()
+        wb = Workbook()
         ws = wb.active
         ws.title = "Course Progress"
 
@@ -0,0 +1,35 @@
+"""
+Search Routes
+
+Unified cross-entity search across users, courses, groups, learning paths,
+branches and categories.
+"""
+
+from typing import Annotated, Any, Optional
+
+from app.auth import RequireAuth
+from app.db.session import get_db
+from app.search.unified import search_all
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter()
+
+
+@router.get("")
+async def unified_search(
+    context: RequireAuth,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    q: str = Query("", description="Search text"),
+    types: Optional[str] = Query(
+        None, description="Comma-separated entity types (e.g. user,course)"
+    ),
+    perType: int = Query(5, ge=1, le=50, description="Max results per type"),
+) -> dict[str, Any]:
+    """
+    GET /api/search
+    Ranked results grouped by type, with per-type match counts in facets.
+    Types the caller cannot read are omitted.
+    """
+    requested = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    return await search_all(db, context, q, types=requested, per_type=perType)
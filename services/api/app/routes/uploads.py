@@ -4,29 +4,13 @@ from typing import Annotated
 
 from app.auth import RequireAuth
 from app.db.session import get_db
+from app.storage import get_storage, tenant_key
 from fastapi import APIRouter, Depends, File, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
 
-def resolve_repo_root() -> Path:
-    p = Path(__file__).resolve().parent
-    for _ in range(10):
-        if (p / "apps" / "web").exists() and (p / "services" / "api").exists():
-            return p
-        p = p.parent
-    # Fallback: 5 levels up from routes/ -> repo root
-    return Path(__file__).resolve().parents[5]
-
-
-ROOT_DIR = resolve_repo_root()
-PRIMARY_UPLOADS_DIR = ROOT_DIR / "public" / "uploads"
-SECONDARY_UPLOADS_DIR = ROOT_DIR / "apps" / "web" / "public" / "uploads"
-PRIMARY_UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
-SECONDARY_UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
-
-
 @router.post("")
 async def upload_file(
     file: UploadFile = File(...),
@@ -36,28 +20,19 @@ async def upload_file(
     # Generate a stable unique name to avoid collisions
     suffix = Path(str(file.filename)).suffix or ""
     unique_name = f"{uuid.uuid4().hex}{suffix}"
-    target_primary = PRIMARY_UPLOADS_DIR / unique_name
-    target_secondary = SECONDARY_UPLOADS_DIR / unique_name
+    key = (
+        tenant_key(context.tenant_id, unique_name) if context.tenant_id else unique_name
+    )
 
-    # Persist file to disk for frontend to serve at /files/<unique_name>
+    storage = get_storage()
     contents = await file.read()
-    # Write to primary
-    try:
-        with open(target_primary, "wb") as f:
-            f.write(contents)
-    except Exception:
-        pass
-    # Also write to secondary for compatibility
-    try:
-        with open(target_secondary, "wb") as f:
-            f.write(contents)
-    except Exception:
-        pass
+    stored = await storage.save(key, contents, file.content_type)
 
     return {
         "file": {
-            "url": f"/files/{unique_name}",
+            "url": storage.public_url(stored.key),
             "name": unique_name,
-            "size": len(contents),
+            "key": stored.key,
+            "size": stored.size,
         }
     }
@@ -5,14 +5,17 @@ CRUD endpoints for user management with RBAC and node scoping.
 """
 
 from datetime import datetime
-from typing import Annotated, Any
+from typing import Annotated, Any, TypedDict
 
-from app.auth import RequireAuth, hash_password
+from app.auth import RequireAuth, hash_password_async
+from app.cache import DASHBOARD, invalidate_tags, tenant_tag
 from app.db.models import AuthPermission, AuthRole, RoleKey, User, UserRole, UserStatus
 from app.db.session import get_db
 from app.errors import BadRequestError, NotFoundError, RBACError
 from app.rbac import can
 from app.scope import enforce_node_filter
+from app.search import apply_user_search, rank, user_document, user_search_filter
+from app.serialization import ORJSONResponse
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy import and_, exists, func, or_, select, update
@@ -64,6 +67,21 @@ class BulkActionRequest(BaseModel):
     status: str | None = None
 
 
+class UserRow(TypedDict):
+    id: str
+    username: str | None
+    email: str
+    firstName: str
+    lastName: str
+    status: UserStatus
+    role: RoleKey
+    activeRole: RoleKey
+    roles: list[RoleKey]
+    isActive: bool
+    nodeId: str | None
+    createdAt: datetime | None
+
+
 class UserListResponse(BaseModel):
     users: list[dict[str, Any]]
     total: int
@@ -72,10 +90,31 @@ class UserListResponse(BaseModel):
     totalPages: int
 
 
+# ============= Serializers =============
+
+
+def _user_row(user: User) -> UserRow:
+    """List row with raw enums and datetimes (encoded by orjson)."""
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "firstName": user.first_name,
+        "lastName": user.last_name,
+        "status": user.status,
+        "role": user.role,
+        "activeRole": user.active_role,
+        "roles": [ur.role_key for ur in user.roles] or [user.role],
+        "isActive": user.is_active,
+        "nodeId": user.node_id,
+        "createdAt": user.created_at,
+    }
+
+
 # ============= Endpoints =============
 
 
-@router.get("")
+@router.get("", response_model=UserListResponse)
 async def list_users(
     context: RequireAuth,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -87,7 +126,7 @@ async def list_users(
     limit: int = Query(20, ge=1, le=100),
     sort_by: str = Query("created_at", description="Sort field"),
     order: str = Query("desc", description="Sort order (asc/desc)"),
-) -> UserListResponse:
+) -> ORJSONResponse:
     """
     List users with pagination and filtering.
     Respects node scoping for non-admin users.
@@ -102,12 +141,7 @@ async def list_users(
 
     # Apply search filter
     if search:
-        search_filter = (
-            User.first_name.ilike(f"%{search}%")
-            | User.last_name.ilike(f"%{search}%")
-            | User.email.ilike(f"%{search}%")
-            | User.username.ilike(f"%{search}%")
-        )
+        search_filter = user_search_filter(search)
         query = query.where(search_filter)
         count_query = count_query.where(search_filter)
 
@@ -143,7 +177,9 @@ async def list_users(
 
     # Apply sorting
     sort_column: Any = User.created_at
-    if sort_by == "firstName":
+    if sort_by == "relevance" and search:
+        sort_column = rank(user_document(), search)
+    elif sort_by == "firstName":
         sort_column = User.first_name
     elif sort_by == "lastName":
         sort_column = User.last_name
@@ -167,48 +203,14 @@ async def list_users(
     result = await db.execute(query)
     users = result.scalars().all()
 
-    # Transform for response
-    users_data = []
-    for user in users:
-        role_keys = [ur.role_key.value for ur in user.roles] if user.roles else []
-        if not role_keys:
-            role_keys = [
-                user.role.value if hasattr(user.role, "value") else str(user.role)
-            ]
-
-        users_data.append(
-            {
-                "id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "firstName": user.first_name,
-                "lastName": user.last_name,
-                "status": (
-                    user.status.value
-                    if hasattr(user.status, "value")
-                    else str(user.status)
-                ),
-                "role": (
-                    user.role.value if hasattr(user.role, "value") else str(user.role)
-                ),
-                "activeRole": (
-                    user.active_role.value
-                    if hasattr(user.active_role, "value")
-                    else str(user.active_role)
-                ),
-                "roles": role_keys,
-                "isActive": user.is_active,
-                "nodeId": user.node_id,
-                "createdAt": user.created_at.isoformat() if user.created_at else None,
-            }
-        )
-
-    return UserListResponse(
-        users=users_data,
-        total=total,
-        page=page,
-        limit=limit,
-        totalPages=(total + limit - 1) // limit,
+    return ORJSONResponse(
+        {
+            "users": [_user_row(user) for user in users],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "totalPages": (total + limit - 1) // limit,
+        }
     )
 
 
@@ -278,7 +280,7 @@ async def create_user(
 
         # Update fields with new values
         if request.password:
-            user.password_hash = hash_password(request.password)
+            user.password_hash = await hash_password_async(request.password)
         user.first_name = request.firstName
         user.last_name = request.lastName
         user.active_role = RoleKey(request.role or "LEARNER")
@@ -302,12 +304,12 @@ async def create_user(
 
     # Hash password or generate temporary
     if request.password:
-        password_hash = hash_password(request.password)
+        password_hash = await hash_password_async(request.password)
     else:
         import secrets
 
         temp_password = f"Temp{secrets.token_urlsafe(8)}!1"
-        password_hash = hash_password(temp_password)
+        password_hash = await hash_password_async(temp_password)
 
     # Security check: only ADMIN can create ADMIN users
     if request.role == "ADMIN" and context.role != "ADMIN":
@@ -399,6 +401,7 @@ async def create_user(
 
     await db.commit()
     await db.refresh(user)
+    await invalidate_tags(tenant_tag(DASHBOARD, context.tenant_id))
 
     return {
         "ok": True,
@@ -430,12 +433,8 @@ async def search_users(
     query = select(User)
 
     if q:
-        query = query.where(
-            (User.first_name.ilike(f"%{q}%"))
-            | (User.last_name.ilike(f"%{q}%"))
-            | (User.email.ilike(f"%{q}%"))
-            | (User.username.ilike(f"%{q}%"))
-        )
+        # Prefix match for 1-2 chars, ranked trigram match otherwise
+        query = apply_user_search(query, q)
 
     # Exclude users already in course (if needed)
     # This requires joining with Enrollment or checking a subquery
@@ -0,0 +1,28 @@
+# Search package
+from app.search.index import ENTITY_SPECS, collect_changes, reindex_tenant
+from app.search.text import (
+    apply_user_search,
+    contains_filter,
+    course_search_filter,
+    escape_like,
+    group_search_filter,
+    prefix_filter,
+    rank,
+    user_document,
+    user_search_filter,
+)
+
+__all__ = [
+    "ENTITY_SPECS",
+    "apply_user_search",
+    "collect_changes",
+    "contains_filter",
+    "course_search_filter",
+    "escape_like",
+    "group_search_filter",
+    "prefix_filter",
+    "rank",
+    "reindex_tenant",
+    "user_document",
+    "user_search_filter",
+]
@@ -0,0 +1,271 @@
+"""
+Search Document Index
+
+Keeps search_documents in sync with the searchable entities so the unified
+/api/search endpoint answers from one trigram-indexed table instead of
+scanning each entity table.
+
+- after_flush: re-derives documents for new/changed rows and removes them
+  for deleted or soft-deleted rows, inside the same transaction.
+- do_orm_execute: bulk ORM DELETE statements (delete(Course).where(...))
+  never reach the flush, so their documents are removed before they run.
+
+Documents are built in SQL from the flushed rows (INSERT ... SELECT), which
+avoids lazy-loading attributes inside the flush and keeps the incremental
+path identical to a full reindex.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import bindparam, delete, event, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.models import (
+    Branch,
+    Category,
+    Course,
+    Group,
+    LearningPath,
+    SearchDocument,
+    User,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EntitySpec:
+    """How one entity maps onto a search document (SQL over alias "s")."""
+
+    entity_type: str
+    model: type
+    permission: str
+    title: str
+    subtitle: str
+    parts: tuple[str, ...]
+    node: str
+    # ORM attributes feeding the document; other column changes skip reindex
+    fields: tuple[str, ...]
+
+    @property
+    def table(self) -> str:
+        return self.model.__tablename__  # type: ignore[attr-defined]
+
+    @property
+    def soft_delete(self) -> bool:
+        return hasattr(self.model, "deleted_at")
+
+
+ENTITY_SPECS: tuple[EntitySpec, ...] = (
+    EntitySpec(
+        entity_type="user",
+        model=User,
+        permission="user:read",
+        title=(
+            "coalesce(nullif(btrim("
+            """concat_ws(' ', s."firstName", s."lastName")), ''), s.email)"""
+        ),
+        subtitle="s.email",
+        parts=('s."firstName"', 's."lastName"', "s.email", "s.username"),
+        node="s.node_id",
+        fields=("first_name", "last_name", "email", "username", "node_id"),
+    ),
+    EntitySpec(
+        entity_type="course",
+        model=Course,
+        permission="course:read",
+        title="s.title",
+        subtitle="s.code",
+        parts=("s.title", "s.code", "s.description"),
+        node="NULL",
+        fields=("title", "code", "description"),
+    ),
+    EntitySpec(
+        entity_type="group",
+        model=Group,
+        permission="groups:read",
+        title="s.name",
+        subtitle="s.description",
+        parts=("s.name", "s.description"),
+        node='s."branchId"',
+        fields=("name", "description", "branch_id"),
+    ),
+    EntitySpec(
+        entity_type="learning_path",
+        model=LearningPath,
+        permission="learning_path:read",
+        title="s.name",
+        subtitle="s.code",
+        parts=("s.name", "s.code", "s.description"),
+        node='s."branchId"',
+        fields=("name", "code", "description", "branch_id"),
+    ),
+    EntitySpec(
+        entity_type="branch",
+        model=Branch,
+        permission="branches:read",
+        title="coalesce(s.title, s.name)",
+        subtitle="s.slug",
+        parts=("s.name", "s.slug", "s.title"),
+        node="s.id",
+        fields=("name", "slug", "title"),
+    ),
+    EntitySpec(
+        entity_type="category",
+        model=Category,
+        permission="categories:read",
+        title="s.name",
+        subtitle="s.description",
+        parts=("s.name", "s.description"),
+        node="NULL",
+        fields=("name", "description"),
+    ),
+)
+
+SPECS_BY_TYPE = {spec.entity_type: spec for spec in ENTITY_SPECS}
+SPECS_BY_MODEL = {spec.model: spec for spec in ENTITY_SPECS}
+
+
+# ============= SQL =============
+
+
+def _document_sql(spec: EntitySpec) -> str:
+    joined = f"concat_ws(' ', {', '.join(spec.parts)})"
+    return f"lower(btrim(regexp_replace({joined}, '\\s+', ' ', 'g')))"
+
+
+def upsert_sql(spec: EntitySpec, where: str) -> str:
+    """INSERT ... SELECT documents for rows of spec.table matching where."""
+    live = ' AND s."deletedAt" IS NULL' if spec.soft_delete else ""
+    return f"""
+        INSERT INTO search_documents (
+            id, "tenantId", "entityType", "entityId", title, subtitle,
+            document, "nodeId", "updatedAt"
+        )
+        SELECT
+            gen_random_uuid(), s."tenantId", '{spec.entity_type}', s.id,
+            {spec.title}, {spec.subtitle}, {_document_sql(spec)}, {spec.node}, now()
+        FROM {spec.table} s
+        WHERE {where}{live}
+        ON CONFLICT ("tenantId", "entityType", "entityId") DO UPDATE SET
+            title = EXCLUDED.title,
+            subtitle = EXCLUDED.subtitle,
+            document = EXCLUDED.document,
+            "nodeId" = EXCLUDED."nodeId",
+            "updatedAt" = EXCLUDED."updatedAt"
+    """
+
+
+def prune_sql(spec: EntitySpec, where: str) -> str:
+    """DELETE documents whose source row is gone or soft-deleted."""
+    live = ' AND s."deletedAt" IS NULL' if spec.soft_delete else ""
+    return f"""
+        DELETE FROM search_documents d
+        WHERE d."entityType" = '{spec.entity_type}' AND {where}
+          AND NOT EXISTS (
+              SELECT 1 FROM {spec.table} s WHERE s.id = d."entityId"{live}
+          )
+    """
+
+
+def sync_entities(conn: Connection, changes: dict[str, set[str]]) -> None:
+    """Re-derive documents for the given {entity_type: ids} on a sync connection."""
+    for entity_type, ids in changes.items():
+        spec = SPECS_BY_TYPE[entity_type]
+        params = {"ids": list(ids)}
+        ids_param = bindparam("ids", expanding=True)
+        conn.execute(
+            text(prune_sql(spec, 'd."entityId" IN :ids')).bindparams(ids_param), params
+        )
+        conn.execute(
+            text(upsert_sql(spec, "s.id IN :ids")).bindparams(ids_param), params
+        )
+
+
+async def reindex_tenant(conn: Any, tenant_id: str) -> None:
+    """Rebuild every document for a tenant (async connection)."""
+    params = {"tenant_id": tenant_id}
+    for spec in ENTITY_SPECS:
+        await conn.execute(
+            text(prune_sql(spec, 'd."tenantId" = :tenant_id')), params
+        )
+        await conn.execute(text(upsert_sql(spec, 's."tenantId" = :tenant_id')), params)
+
+
+# ============= Change Tracking =============
+
+
+def _changed(obj: Any, keys: tuple[str, ...]) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[key].history.has_changes() for key in keys if key in attrs)
+
+
+def collect_changes(session: Session) -> dict[str, set[str]]:
+    """
+    Gather {entity_type: ids} needing a reindex from the session's pending
+    state. Reads only already-loaded state (never triggers a lazy load).
+    """
+    changes: dict[str, set[str]] = {}
+
+    def add(obj: Any) -> None:
+        spec = SPECS_BY_MODEL.get(type(obj))
+        entity_id = inspect(obj).dict.get("id") if spec else None
+        if spec and entity_id:
+            changes.setdefault(spec.entity_type, set()).add(entity_id)
+
+    for obj in session.new:
+        add(obj)
+    for obj in session.deleted:
+        add(obj)
+    for obj in session.dirty:
+        spec = SPECS_BY_MODEL.get(type(obj))
+        if spec and _changed(obj, spec.fields + ("deleted_at",)):
+            add(obj)
+    return changes
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_search_documents(session: Session, flush_context) -> None:
+    changes = collect_changes(session)
+    if changes:
+        sync_entities(session.connection(), changes)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _prune_documents_for_bulk_delete(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_delete:
+        return
+    mapper = orm_execute_state.bind_mapper
+    spec = SPECS_BY_MODEL.get(mapper.class_) if mapper is not None else None
+    if spec is None:
+        return
+
+    model: Any = spec.model
+    targets = select(model.id)
+    whereclause = getattr(orm_execute_state.statement, "whereclause", None)
+    if whereclause is not None:
+        targets = targets.where(whereclause)
+
+    orm_execute_state.session.connection().execute(
+        delete(SearchDocument)
+        .where(SearchDocument.entity_type == spec.entity_type)
+        .where(SearchDocument.entity_id.in_(targets))
+    )
+
+
+__all__ = [
+    "ENTITY_SPECS",
+    "EntitySpec",
+    "SPECS_BY_MODEL",
+    "SPECS_BY_TYPE",
+    "collect_changes",
+    "prune_sql",
+    "reindex_tenant",
+    "sync_entities",
+    "upsert_sql",
+]
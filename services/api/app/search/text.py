@@ -0,0 +1,143 @@
+"""
+Indexed Text Search Helpers
+
+Builds search predicates that line up with the pg_trgm / text_pattern_ops
+indexes created by the search migration, instead of OR-ing one
+ilike('%q%') per column (which forces a sequential scan).
+
+Two strategies:
+- contains: lower(<document>) LIKE '%q%' served by a GIN gin_trgm_ops index
+  on the concatenated document, ranked with word_similarity().
+- prefix: lower(<column>) LIKE 'q%' served by btree text_pattern_ops
+  indexes. Used for 1-2 character typeahead input, where trigrams are not
+  selective.
+
+The document expressions below must stay byte-for-byte equivalent to the
+index definitions in the migration or the planner will not use them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, literal_column, or_
+
+from app.db.models import Course, Group, User
+
+# Queries shorter than this use prefix matching (trigrams need 3 chars)
+MIN_TRIGRAM_LENGTH = 3
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards using PostgreSQL's default backslash escape."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def normalize_term(term: str) -> str:
+    return " ".join(term.split()).lower()
+
+
+def search_document(*columns: Any) -> ColumnElement[str]:
+    """
+    lower(coalesce(a, '') || ' ' || coalesce(b, '') ...)
+
+    Literals are rendered inline (not as bind parameters) so the
+    expression matches the functional index definition.
+    """
+    empty = literal_column("''")
+    space = literal_column("' '")
+    expr: Any = func.coalesce(columns[0], empty)
+    for column in columns[1:]:
+        expr = expr.op("||")(space).op("||")(func.coalesce(column, empty))
+    return func.lower(expr)
+
+
+def user_document() -> ColumnElement[str]:
+    return search_document(User.first_name, User.last_name, User.email, User.username)
+
+
+def course_document() -> ColumnElement[str]:
+    return search_document(Course.title, Course.code, Course.description)
+
+
+def group_document() -> ColumnElement[str]:
+    return search_document(Group.name)
+
+
+USER_PREFIX_COLUMNS = (User.email, User.username, User.first_name, User.last_name)
+
+
+def contains_filter(document: ColumnElement[str], term: str) -> ColumnElement[bool]:
+    """Substring match served by a trigram index on document."""
+    return document.like(f"%{escape_like(normalize_term(term))}%")
+
+
+def prefix_filter(columns: tuple[Any, ...], term: str) -> ColumnElement[bool]:
+    """Prefix match served by lower(column) text_pattern_ops indexes."""
+    pattern = f"{escape_like(normalize_term(term))}%"
+    return or_(*(func.lower(c).like(pattern) for c in columns))
+
+
+def rank(document: ColumnElement[str], term: str) -> ColumnElement[float]:
+    """Relevance score in [0, 1] (pg_trgm word_similarity)."""
+    return func.word_similarity(normalize_term(term), document)
+
+
+# ============= Entity helpers =============
+
+
+def user_search_filter(term: str) -> ColumnElement[bool]:
+    """Drop-in replacement for the first/last/email/username ilike OR."""
+    return contains_filter(user_document(), term)
+
+
+def course_search_filter(term: str) -> ColumnElement[bool]:
+    """Drop-in replacement for the title/code/description ilike OR."""
+    return contains_filter(course_document(), term)
+
+
+def group_search_filter(term: str) -> ColumnElement[bool]:
+    return contains_filter(group_document(), term)
+
+
+def apply_user_search(query: Select, term: str, ranked: bool = True) -> Select:
+    """
+    Apply typeahead search to a User select.
+
+    Short input uses indexed prefix matching; longer input uses the trigram
+    index. With ranked=True results are ordered best match first.
+    """
+    term = normalize_term(term)
+    if not term:
+        return query
+    if len(term) < MIN_TRIGRAM_LENGTH:
+        query = query.where(prefix_filter(USER_PREFIX_COLUMNS, term))
+        if ranked:
+            query = query.order_by(
+                func.lower(User.first_name), func.lower(User.last_name)
+            )
+        return query
+
+    document = user_document()
+    query = query.where(contains_filter(document, term))
+    if ranked:
+        query = query.order_by(rank(document, term).desc(), User.id)
+    return query
+
+
+__all__ = [
+    "MIN_TRIGRAM_LENGTH",
+    "USER_PREFIX_COLUMNS",
+    "apply_user_search",
+    "contains_filter",
+    "course_document",
+    "course_search_filter",
+    "escape_like",
+    "group_document",
+    "group_search_filter",
+    "prefix_filter",
+    "rank",
+    "search_document",
+    "user_document",
+    "user_search_filter",
+]
@@ -0,0 +1,145 @@
+"""
+Unified Cross-Entity Search
+
+Ranked, type-faceted search over search_documents. RBAC is resolved once
+per request into the set of entity types the caller may read and applied
+in SQL, rather than checking each hit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Select, case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.deps import AuthContext
+from app.db.models import SearchDocument
+from app.rbac import get_user_permissions
+from app.search.index import ENTITY_SPECS
+from app.search.text import (
+    MIN_TRIGRAM_LENGTH,
+    contains_filter,
+    escape_like,
+    normalize_term,
+    rank,
+)
+
+
+def allowed_types(
+    permissions: set[str], requested: Iterable[str] | None = None
+) -> list[str]:
+    """Entity types readable with permissions, optionally narrowed to requested."""
+    wanted = set(requested) if requested else None
+    return [
+        spec.entity_type
+        for spec in ENTITY_SPECS
+        if spec.permission in permissions
+        and (wanted is None or spec.entity_type in wanted)
+    ]
+
+
+def build_search_query(
+    tenant_id: str | None,
+    term: str,
+    types: list[str],
+    node_id: str | None = None,
+    node_scoped: bool = False,
+    per_type: int = 5,
+) -> Select:
+    """
+    Top per_type hits for each type, best first, with per-type match totals.
+
+    Short input (< 3 chars) matches word prefixes; longer input uses the
+    trigram index and word_similarity. Titles starting with the term get a
+    boost either way.
+    """
+    term = normalize_term(term)
+    doc = SearchDocument.document
+    prefix = f"{escape_like(term)}%"
+    title_boost = case((func.lower(SearchDocument.title).like(prefix), 0.5), else_=0.0)
+
+    if len(term) < MIN_TRIGRAM_LENGTH:
+        match = or_(doc.like(prefix), doc.like(f"% {prefix}"))
+        score: Any = 0.5 + title_boost
+    else:
+        match = contains_filter(doc, term)
+        score = rank(doc, term) + title_boost
+
+    filtered = (
+        select(
+            SearchDocument.entity_type,
+            SearchDocument.entity_id,
+            SearchDocument.title,
+            SearchDocument.subtitle,
+            score.label("score"),
+            func.row_number()
+            .over(
+                partition_by=SearchDocument.entity_type,
+                order_by=(score.desc(), SearchDocument.title),
+            )
+            .label("rn"),
+            func.count()
+            .over(partition_by=SearchDocument.entity_type)
+            .label("type_total"),
+        )
+        .where(SearchDocument.tenant_id == tenant_id)
+        .where(SearchDocument.entity_type.in_(types))
+        .where(match)
+    )
+    if node_scoped:
+        # Same rule as validate_node_access: unassigned resources stay visible
+        filtered = filtered.where(
+            or_(SearchDocument.node_id.is_(None), SearchDocument.node_id == node_id)
+        )
+
+    ranked = filtered.subquery()
+    return (
+        select(ranked)
+        .where(ranked.c.rn <= per_type)
+        .order_by(ranked.c.score.desc(), ranked.c.title)
+    )
+
+
+async def search_all(
+    db: AsyncSession,
+    context: AuthContext,
+    term: str,
+    types: Iterable[str] | None = None,
+    per_type: int = 5,
+) -> dict[str, Any]:
+    """Run the unified search for the current user."""
+    permissions = await get_user_permissions(db, context.user_id, context.node_id)
+    readable = allowed_types(permissions, types)
+    facets: dict[str, int] = {t: 0 for t in readable}
+
+    if not normalize_term(term) or not readable:
+        return {"query": term, "results": [], "facets": facets}
+
+    query = build_search_query(
+        context.tenant_id,
+        term,
+        readable,
+        node_id=context.node_id,
+        node_scoped=context.role != "ADMIN",
+        per_type=per_type,
+    )
+    rows = (await db.execute(query)).mappings().all()
+
+    results = []
+    for row in rows:
+        facets[row["entity_type"]] = row["type_total"]
+        results.append(
+            {
+                "type": row["entity_type"],
+                "id": row["entity_id"],
+                "title": row["title"],
+                "subtitle": row["subtitle"],
+                "score": round(float(row["score"]), 4),
+            }
+        )
+    return {"query": term, "results": results, "facets": facets}
+
+
+__all__ = ["allowed_types", "build_search_query", "search_all"]
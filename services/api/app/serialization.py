@@ -0,0 +1,35 @@
+"""
+JSON Serialization
+
+ORJSONResponse is the application's default response class. orjson
+encodes datetimes (ISO 8601, like .isoformat()), dates, UUIDs, enums (by
+value) and dataclasses natively, so handlers can put raw ORM values in
+their payloads. Anything else falls back to FastAPI's jsonable_encoder.
+
+Hot list endpoints return ORJSONResponse directly with typed rows built
+from raw column values: that skips FastAPI's jsonable_encoder pass and
+response validation, and encodes the payload once.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any) -> bytes:
+    # jsonable_encoder only sees what orjson cannot encode (Decimal, models, sets)
+    return orjson.dumps(content, default=jsonable_encoder, option=OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+__all__ = ["ORJSONResponse", "dumps"]
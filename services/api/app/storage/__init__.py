@@ -0,0 +1,98 @@
+"""
+File Storage Package
+
+Pluggable storage for uploads and media. The active backend is chosen by
+the STORAGE_BACKEND setting:
+
+- local: files on disk; downloads offloaded to nginx via X-Accel-Redirect
+  (or X-Sendfile) when STORAGE_ACCEL_MODE is set.
+- s3: S3-compatible object storage; downloads redirect to presigned URLs.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from app.config import get_settings
+from app.storage.base import (
+    InvalidKeyError,
+    StorageBackend,
+    StoredObject,
+    key_tenant,
+    normalize_key,
+    sign_key,
+    tenant_key,
+    verify_signature,
+)
+from app.storage.local import LocalStorage
+from app.storage.s3 import S3Storage
+
+
+def resolve_repo_root() -> Path:
+    """Locate the monorepo root (the directory holding apps/web and services)."""
+    p = Path(__file__).resolve().parent
+    for _ in range(10):
+        if (p / "apps" / "web").exists() and (p / "services" / "api").exists():
+            return p
+        p = p.parent
+    # Fallback: services/api/app/storage -> repo root
+    return Path(__file__).resolve().parents[4]
+
+
+def signing_secret() -> str:
+    settings = get_settings()
+    return settings.storage_signing_secret or settings.jwt_secret
+
+
+@lru_cache
+def get_storage() -> StorageBackend:
+    """Get the configured storage backend (cached per process)."""
+    settings = get_settings()
+
+    if settings.storage_backend == "s3":
+        if not settings.s3_bucket:
+            raise RuntimeError("S3_BUCKET must be set when STORAGE_BACKEND=s3")
+        return S3Storage(
+            bucket=settings.s3_bucket,
+            endpoint_url=settings.s3_endpoint_url,
+            region=settings.s3_region,
+            access_key_id=settings.s3_access_key_id,
+            secret_access_key=settings.s3_secret_access_key,
+            key_prefix=settings.s3_key_prefix,
+        )
+
+    repo_root = resolve_repo_root()
+    root = (
+        Path(settings.storage_local_root)
+        if settings.storage_local_root
+        else repo_root / "var" / "uploads"
+    )
+    # Files written before uploads moved out of the web public/ trees
+    legacy = [
+        repo_root / "public" / "uploads",
+        repo_root / "apps" / "web" / "public" / "uploads",
+        repo_root / "services" / "api" / "public" / "uploads",
+    ]
+    return LocalStorage(
+        root=root,
+        legacy_roots=[d for d in legacy if d != root],
+        signing_secret=signing_secret(),
+        accel_mode=settings.storage_accel_mode,
+        accel_prefix=settings.storage_accel_prefix,
+    )
+
+
+__all__ = [
+    "InvalidKeyError",
+    "LocalStorage",
+    "S3Storage",
+    "StorageBackend",
+    "StoredObject",
+    "get_storage",
+    "key_tenant",
+    "normalize_key",
+    "resolve_repo_root",
+    "sign_key",
+    "signing_secret",
+    "tenant_key",
+    "verify_signature",
+]
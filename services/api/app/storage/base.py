@@ -0,0 +1,161 @@
+"""
+Storage Backend Interface
+
+Defines the contract shared by all file storage backends and the
+HMAC helpers used to sign expiring download URLs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import mimetypes
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from contextlib import AbstractAsyncContextManager
+from pathlib import Path, PurePosixPath
+
+# First segment of tenant-scoped keys: tenants/<tenant_id>/<name>
+TENANT_PREFIX = "tenants"
+
+
+class InvalidKeyError(ValueError):
+    """Raised when a storage key tries to escape the storage root."""
+
+
+@dataclass
+class StoredObject:
+    """Metadata for an object held by a storage backend."""
+
+    key: str
+    size: int
+    content_type: str
+
+
+def normalize_key(key: str) -> str:
+    """
+    Validate and normalize a storage key.
+
+    Keys are POSIX-style relative paths. Absolute paths and ".." segments
+    are rejected so a key can never resolve outside the storage root.
+    """
+    key = key.replace("\\", "/").lstrip("/")
+    parts = PurePosixPath(key).parts
+    if not parts or any(p in ("..", ".") for p in parts):
+        raise InvalidKeyError(f"Invalid storage key: {key!r}")
+    return "/".join(parts)
+
+
+def guess_content_type(key: str) -> str:
+    """Guess a MIME type from the key's extension."""
+    mime, _ = mimetypes.guess_type(key)
+    return mime or "application/octet-stream"
+
+
+def tenant_key(tenant_id: str, key: str) -> str:
+    """
+    Scope key to a tenant: "tenants/<tenant_id>/<key>".
+
+    Keys already under the tenant's prefix are returned unchanged, so a key
+    from another tenant can only ever resolve inside the caller's prefix.
+    """
+    if not tenant_id:
+        raise InvalidKeyError("A tenant is required to scope a storage key")
+    prefix = f"{TENANT_PREFIX}/{normalize_key(tenant_id)}/"
+    key = normalize_key(key)
+    return key if key.startswith(prefix) else prefix + key
+
+
+def key_tenant(key: str) -> str | None:
+    """Tenant a key is scoped to, or None for keys from before tenant scoping."""
+    parts = normalize_key(key).split("/")
+    if len(parts) > 2 and parts[0] == TENANT_PREFIX:
+        return parts[1]
+    return None
+
+
+def sign_key(key: str, expires: int, secret: str, filename: str | None = None) -> str:
+    """
+    Create an HMAC-SHA256 signature for a key, expiry timestamp and download
+    filename (so a link cannot be reused under another attachment name).
+    """
+    message = f"{key}:{expires}:{filename or ''}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def verify_signature(
+    key: str,
+    expires: int,
+    signature: str,
+    secret: str,
+    filename: str | None = None,
+    now: float | None = None,
+) -> bool:
+    """Check a download signature; expired or tampered URLs are rejected."""
+    if expires < int(now if now is not None else time.time()):
+        return False
+    expected = sign_key(key, expires, secret, filename)
+    return hmac.compare_digest(expected, signature)
+
+
+class StorageBackend(ABC):
+    """
+    Abstract file storage backend.
+
+    Backends store opaque bytes under string keys and know how to hand the
+    actual transfer off to something other than the API worker: either a
+    signed URL pointing at object storage, or a reverse-proxy header.
+    """
+
+    name: str = "base"
+
+    # True when downloads should be redirected to signed_url() instead of
+    # being served (or delegated) by the API itself.
+    redirect_downloads: bool = False
+
+    @abstractmethod
+    async def save(
+        self, key: str, data: bytes, content_type: str | None = None
+    ) -> StoredObject:
+        """Store bytes under key, overwriting any existing object."""
+
+    @abstractmethod
+    async def stat(self, key: str) -> StoredObject | None:
+        """Return object metadata, or None if the key does not exist."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete an object. Returns True if something was removed."""
+
+    @abstractmethod
+    def signed_url(self, key: str, expires_in: int, filename: str | None = None) -> str:
+        """Return a URL that grants read access to key for expires_in seconds."""
+
+    @abstractmethod
+    def local_copy(self, key: str) -> AbstractAsyncContextManager[Path]:
+        """
+        Context manager yielding a local file path holding key's bytes, for
+        consumers that need to stream a file (CSV imports). Raises
+        FileNotFoundError if the key does not exist.
+        """
+
+    def public_url(self, key: str) -> str:
+        """Stable URL stored on records (e.g. course thumbnails)."""
+        return f"/api/files/{normalize_key(key)}"
+
+    async def exists(self, key: str) -> bool:
+        return await self.stat(key) is not None
+
+
+__all__ = [
+    "InvalidKeyError",
+    "StorageBackend",
+    "StoredObject",
+    "guess_content_type",
+    "key_tenant",
+    "normalize_key",
+    "sign_key",
+    "tenant_key",
+    "verify_signature",
+]
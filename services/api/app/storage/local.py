@@ -0,0 +1,149 @@
+"""
+Local Filesystem Storage
+
+Stores uploads on disk. Downloads are either delegated to the reverse
+proxy (nginx X-Accel-Redirect / Apache-lighttpd X-Sendfile) or, when no
+proxy is configured, streamed by Starlette's FileResponse.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from urllib.parse import urlencode
+
+import aiofiles  # type: ignore
+import aiofiles.os  # type: ignore
+
+from app.storage.base import (
+    StorageBackend,
+    StoredObject,
+    guess_content_type,
+    normalize_key,
+    sign_key,
+)
+
+
+class LocalStorage(StorageBackend):
+    """
+    Filesystem-backed storage.
+
+    Args:
+        root: Directory new objects are written to. Keep it outside any
+            public/ tree the web app serves without authentication.
+        legacy_roots: Read-only directories searched when a key is missing
+            from the primary root.
+        signing_secret: Secret for signed download URLs.
+        accel_mode: "none", "x-accel" or "x-sendfile".
+        accel_prefix: Internal nginx location aliased to root.
+        url_base: Path the signed URLs point at.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        root: Path,
+        signing_secret: str,
+        legacy_roots: list[Path] | None = None,
+        accel_mode: str = "none",
+        accel_prefix: str = "/protected-uploads/",
+        url_base: str = "/api/files",
+    ):
+        self.root = root
+        self.legacy_roots = legacy_roots or []
+        self.signing_secret = signing_secret
+        self.accel_mode = accel_mode
+        self.accel_prefix = accel_prefix.rstrip("/") + "/"
+        self.url_base = url_base.rstrip("/")
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # ============= Path resolution =============
+
+    def _candidates(self, key: str) -> list[Path]:
+        key = normalize_key(key)
+        return [root / key for root in (self.root, *self.legacy_roots)]
+
+    def path_for(self, key: str) -> Path | None:
+        """Return the on-disk path for key, or None if it does not exist."""
+        for candidate in self._candidates(key):
+            if candidate.is_file():
+                return candidate
+        return None
+
+    # ============= StorageBackend =============
+
+    async def save(
+        self, key: str, data: bytes, content_type: str | None = None
+    ) -> StoredObject:
+        key = normalize_key(key)
+        target = self.root / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(target, "wb") as f:
+            await f.write(data)
+        return StoredObject(
+            key=key,
+            size=len(data),
+            content_type=content_type or guess_content_type(key),
+        )
+
+    async def stat(self, key: str) -> StoredObject | None:
+        path = self.path_for(key)
+        if not path:
+            return None
+        st = await aiofiles.os.stat(path)
+        return StoredObject(
+            key=normalize_key(key),
+            size=st.st_size,
+            content_type=guess_content_type(key),
+        )
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[Path]:
+        path = self.path_for(key)
+        if not path:
+            raise FileNotFoundError(key)
+        yield path
+
+    async def delete(self, key: str) -> bool:
+        removed = False
+        for candidate in self._candidates(key):
+            if candidate.is_file():
+                await aiofiles.os.remove(candidate)
+                removed = True
+        return removed
+
+    def signed_url(
+        self, key: str, expires_in: int, filename: str | None = None
+    ) -> str:
+        key = normalize_key(key)
+        expires = int(time.time()) + expires_in
+        params = {
+            "expires": str(expires),
+            "signature": sign_key(key, expires, self.signing_secret, filename),
+        }
+        if filename:
+            params["filename"] = filename
+        return f"{self.url_base}/{key}?{urlencode(params)}"
+
+    # ============= Proxy offload =============
+
+    def accel_headers(self, key: str, path: Path) -> dict[str, str] | None:
+        """
+        Build the header that tells the reverse proxy to send the file.
+
+        Returns None when offload is disabled, or when the file lives outside
+        the primary root (the proxy only has an alias for that directory).
+        """
+        if self.accel_mode == "x-sendfile":
+            return {"X-Sendfile": str(path.resolve())}
+        if self.accel_mode == "x-accel" and path.parent.resolve().is_relative_to(
+            self.root.resolve()
+        ):
+            return {"X-Accel-Redirect": f"{self.accel_prefix}{normalize_key(key)}"}
+        return None
+
+
+__all__ = ["LocalStorage"]
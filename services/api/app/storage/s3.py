@@ -0,0 +1,136 @@
+"""
+S3-Compatible Object Storage
+
+Works against AWS S3 and S3-compatible servers such as MinIO (set
+S3_ENDPOINT_URL). Downloads are never proxied: the API answers with a
+redirect to a presigned, expiring GET URL and the bytes flow straight
+from object storage to the client.
+
+boto3 is imported lazily so the local backend has no hard dependency on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+from app.storage.base import (
+    StorageBackend,
+    StoredObject,
+    guess_content_type,
+    normalize_key,
+)
+
+
+class S3Storage(StorageBackend):
+    """Storage backend for S3-compatible object stores."""
+
+    name = "s3"
+    redirect_downloads = True
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str | None = None,
+        region: str = "us-east-1",
+        access_key_id: str | None = None,
+        secret_access_key: str | None = None,
+        key_prefix: str = "",
+        client: Any = None,
+    ):
+        self.bucket = bucket
+        self.key_prefix = key_prefix.strip("/")
+        if client is None:
+            import boto3  # type: ignore
+            from botocore.config import Config  # type: ignore
+
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url,
+                region_name=region,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                config=Config(
+                    signature_version="s3v4",
+                    # MinIO and most self-hosted stores need path-style URLs
+                    s3={"addressing_style": "path" if endpoint_url else "auto"},
+                ),
+            )
+        self._client = client
+
+    def _object_key(self, key: str) -> str:
+        key = normalize_key(key)
+        return f"{self.key_prefix}/{key}" if self.key_prefix else key
+
+    async def save(
+        self, key: str, data: bytes, content_type: str | None = None
+    ) -> StoredObject:
+        content_type = content_type or guess_content_type(key)
+        await asyncio.to_thread(
+            self._client.put_object,
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=data,
+            ContentType=content_type,
+        )
+        return StoredObject(
+            key=normalize_key(key), size=len(data), content_type=content_type
+        )
+
+    async def stat(self, key: str) -> StoredObject | None:
+        from botocore.exceptions import ClientError  # type: ignore
+
+        try:
+            head = await asyncio.to_thread(
+                self._client.head_object, Bucket=self.bucket, Key=self._object_key(key)
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return StoredObject(
+            key=normalize_key(key),
+            size=int(head.get("ContentLength", 0)),
+            content_type=head.get("ContentType") or guess_content_type(key),
+        )
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[Path]:
+        if not await self.exists(key):
+            raise FileNotFoundError(key)
+        fd, tmp = tempfile.mkstemp(suffix=Path(key).suffix)
+        os.close(fd)
+        try:
+            await asyncio.to_thread(
+                self._client.download_file, self.bucket, self._object_key(key), tmp
+            )
+            yield Path(tmp)
+        finally:
+            os.unlink(tmp)
+
+    async def delete(self, key: str) -> bool:
+        if not await self.exists(key):
+            return False
+        await asyncio.to_thread(
+            self._client.delete_object, Bucket=self.bucket, Key=self._object_key(key)
+        )
+        return True
+
+    def signed_url(
+        self, key: str, expires_in: int, filename: str | None = None
+    ) -> str:
+        params: dict[str, Any] = {"Bucket": self.bucket, "Key": self._object_key(key)}
+        if filename:
+            params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+        # Presigning is a local HMAC computation, no network round-trip
+        return self._client.generate_presigned_url(
+            "get_object", Params=params, ExpiresIn=expires_in
+        )
+
+
+__all__ = ["S3Storage"]
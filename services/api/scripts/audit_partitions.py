@@ -0,0 +1,60 @@
+"""
+Maintain monthly auth_audit_log partitions by hand.
+
+Creates partitions ahead of time and retires (archives or drops) ones older
+than the retention window. The same work runs daily via the
+audit_maintain_partitions Celery beat task.
+
+Usage:
+    python scripts/audit_partitions.py [--retention 12] [--mode archive|drop] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.audit.partitions import (
+    list_partitions,
+    maintain_partitions,
+    partitions_to_retire,
+)
+from app.config import get_settings
+from app.db.session import engine
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ahead", type=int, default=settings.audit_partitions_ahead)
+    parser.add_argument("--retention", type=int, default=settings.audit_retention_months)
+    parser.add_argument(
+        "--mode", choices=["archive", "drop"], default=settings.audit_archive_mode
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    today = datetime.now(timezone.utc).date()
+    async with engine.begin() as conn:
+        names = await list_partitions(conn)
+        print(f"{len(names)} partitions attached")
+        if args.dry_run:
+            for name in partitions_to_retire(names, today, args.retention):
+                print(f"would {args.mode}: {name}")
+        else:
+            result = await maintain_partitions(
+                conn, today, args.ahead, args.retention, args.mode
+            )
+            print(f"created: {result['created'] or '-'}")
+            print(f"retired ({args.mode}): {result['retired'] or '-'}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
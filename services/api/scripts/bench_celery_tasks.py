@@ -0,0 +1,251 @@
+"""
+Celery task throughput: legacy run_async vs the per-worker runtime.
+
+Runs notify_user and timeline_add_event eagerly in-process (task.apply),
+which is what a worker child does per message minus the broker round trip:
+
+- legacy:  the previous run_async (asyncio.get_event_loop per task) with
+           sessions from the web app's engine
+- runtime: app.jobs.runtime (one persistent loop + worker engine/pool)
+
+Seeds a throwaway tenant, user and notification definition, then writes
+reports/CELERY_TASK_BENCHMARK.md. No run is checked in; the report exists
+only after running this against a database.
+
+Usage:
+    python scripts/bench_celery_tasks.py [--tasks 500] [--keep]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.config import get_settings
+from app.db.session import engine, get_db_context
+from app.jobs import runtime, tasks
+
+BENCH_DOMAIN = "celery-bench.local"
+EVENT_KEY = "bench.notify"
+
+
+def legacy_run_async(coro):
+    """run_async as it was before app.jobs.runtime."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+@asynccontextmanager
+async def legacy_task_db():
+    async with get_db_context() as db:
+        yield db
+
+
+async def _execute(statements: List[Tuple[str, Dict[str, Any]]]) -> None:
+    # Own engine: seeding runs on a loop the benchmarked code never sees
+    bench_engine = create_async_engine(get_settings().async_database_url)
+    try:
+        async with bench_engine.begin() as conn:
+            for sql, params in statements:
+                await conn.execute(text(sql), params)
+    finally:
+        await bench_engine.dispose()
+
+
+def seed() -> Dict[str, str]:
+    ids = {"tenant": str(uuid4()), "user": str(uuid4()), "notification": str(uuid4())}
+    asyncio.run(
+        _execute([
+            (
+                """
+                INSERT INTO tenants (id, domain, name, settings, "createdAt", "updatedAt")
+                VALUES (:id, :domain, 'Celery Bench', '{}'::jsonb, now(), now())
+                """,
+                {"id": ids["tenant"], "domain": BENCH_DOMAIN},
+            ),
+            (
+                """
+                INSERT INTO users (
+                    id, "tenantId", username, email, "firstName", "lastName",
+                    timezone, language, status, "activeRole", role, is_active,
+                    is_verified, "failedLoginAttempts", "excludeFromEmails",
+                    token_version, "createdAt", "updatedAt"
+                )
+                VALUES (
+                    :id, :tenant_id, 'bench', 'bench@celery-bench.example.com',
+                    'Bench', 'User', 'UTC', 'en', 'ACTIVE', 'LEARNER', 'LEARNER',
+                    true, true, 0, false, 0, now(), now()
+                )
+                """,
+                {"id": ids["user"], "tenant_id": ids["tenant"]},
+            ),
+            (
+                """
+                INSERT INTO notifications (
+                    id, "tenantId", name, "eventKey", "messageSubject",
+                    "messageBody", "recipientType", "isActive", "createdAt", "updatedAt"
+                )
+                VALUES (
+                    :id, :tenant_id, 'Bench', :event_key, 'Bench', 'Bench',
+                    'USER', true, now(), now()
+                )
+                """,
+                {"id": ids["notification"], "tenant_id": ids["tenant"], "event_key": EVENT_KEY},
+            ),
+        ])
+    )
+    return ids
+
+
+def cleanup(tenant_id: str) -> None:
+    params = {"t": tenant_id}
+    asyncio.run(
+        _execute([
+            ('DELETE FROM notification_history WHERE "tenantId" = :t', params),
+            ('DELETE FROM timeline_events WHERE "tenantId" = :t', params),
+            ('DELETE FROM notifications WHERE "tenantId" = :t', params),
+            ('DELETE FROM search_documents WHERE "tenantId" = :t', params),
+            ('DELETE FROM users WHERE "tenantId" = :t', params),
+            ("DELETE FROM tenants WHERE id = :t", params),
+        ])
+    )
+
+
+def find_stale_tenant() -> str | None:
+    async def _find():
+        bench_engine = create_async_engine(get_settings().async_database_url)
+        try:
+            async with bench_engine.connect() as conn:
+                return (
+                    await conn.execute(
+                        text("SELECT id FROM tenants WHERE domain = :d"), {"d": BENCH_DOMAIN}
+                    )
+                ).scalar()
+        finally:
+            await bench_engine.dispose()
+
+    return asyncio.run(_find())
+
+
+def task_calls(ids: Dict[str, str]) -> List[Tuple[str, Callable[[], Any]]]:
+    return [
+        (
+            "notify_user",
+            lambda: tasks.notify_user.apply(
+                kwargs={
+                    "notification_type": EVENT_KEY,
+                    "recipient_id": ids["user"],
+                    "tenant_id": ids["tenant"],
+                    "title": "Bench",
+                    "body": "Benchmark notification",
+                },
+                throw=True,
+            ),
+        ),
+        (
+            "timeline_add_event",
+            lambda: tasks.timeline_add_event.apply(
+                kwargs={
+                    "user_id": ids["user"],
+                    "tenant_id": ids["tenant"],
+                    "event_type": "bench",
+                },
+                throw=True,
+            ),
+        ),
+    ]
+
+
+def measure(call: Callable[[], Any], n_tasks: int) -> Tuple[float, float, float]:
+    """Returns (tasks/s, p50 ms, p95 ms)."""
+    call()  # warm up: first connection, statement cache
+    timings = []
+    started = time.perf_counter()
+    for _ in range(n_tasks):
+        t0 = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return n_tasks / elapsed, statistics.median(timings), timings[int(len(timings) * 0.95)]
+
+
+def run_benchmark(ids: Dict[str, str], n_tasks: int) -> List[Tuple[str, str, float, float, float]]:
+    results = []
+    for mode in ("legacy", "runtime"):
+        if mode == "legacy":
+            tasks.run_async, tasks.task_db = legacy_run_async, legacy_task_db
+        else:
+            tasks.run_async, tasks.task_db = runtime.run_async, runtime.task_db
+        for name, call in task_calls(ids):
+            rate, p50, p95 = measure(call, n_tasks)
+            results.append((name, mode, rate, p50, p95))
+            print(f"{name:<20} {mode:<8} {rate:>8.1f}/s  p50 {p50:6.2f} ms  p95 {p95:6.2f} ms")
+    tasks.run_async, tasks.task_db = runtime.run_async, runtime.task_db
+    return results
+
+
+def write_report(n_tasks: int, results: List[Tuple[str, str, float, float, float]]) -> str:
+    settings = get_settings()
+    out_dir = os.path.join(API_ROOT, "reports")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "CELERY_TASK_BENCHMARK.md")
+    lines: List[str] = []
+    lines.append("# Celery Task Benchmark")
+    lines.append("")
+    lines.append(f"- Tasks per case: {n_tasks:,} (sequential, eager apply, after warm-up)")
+    lines.append(
+        f"- Worker pool: pool_size={settings.worker_db_pool_size}, "
+        f"max_overflow={settings.worker_db_max_overflow}"
+    )
+    lines.append("")
+    lines.append("| Task | Mode | Tasks/s | p50 ms | p95 ms |")
+    lines.append("|------|------|---------|--------|--------|")
+    for name, mode, rate, p50, p95 in results:
+        lines.append(f"| {name} | {mode} | {rate:.1f} | {p50:.2f} | {p95:.2f} |")
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return out_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded tenant")
+    args = parser.parse_args()
+
+    stale = find_stale_tenant()
+    if stale:
+        cleanup(stale)
+
+    ids = seed()
+    try:
+        results = run_benchmark(ids, args.tasks)
+        out_path = write_report(args.tasks, results)
+        print(f"Celery task benchmark written to {out_path}")
+    finally:
+        runtime.shutdown_runtime()
+        legacy_run_async(engine.dispose())
+        if not args.keep:
+            cleanup(ids["tenant"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Before/after benchmark of the performance index pack.
+
+Drops the indexes of alembic/versions/a9c3e5f71d20_add_performance_index_pack.py,
+plans every endpoint statement with the query-plan tracker
+(tests/query_plans.py), builds the indexes, plans again and compares
+total cost, execution time and large-table Seq Scans per endpoint. Indexes
+the database did not have before the run are dropped again unless --keep
+is given.
+
+Run against a database loaded with scripts/generate_synthetic_data.py;
+on small tables the planner prefers Seq Scans either way. Writes
+reports/INDEX_PACK_BENCHMARK.md.
+
+Usage:
+    python scripts/bench_index_pack.py [--rows 20] [--keep]
+"""
+
+import argparse
+import asyncio
+import glob
+import importlib.util
+import os
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+from sqlalchemy import text
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.db.session import engine
+from tests.query_plans import StatementPlan, run
+
+
+def load_index_pack() -> list:
+    pattern = os.path.join(
+        API_ROOT, "alembic", "versions", "*_add_performance_index_pack.py"
+    )
+    path = glob.glob(pattern)[0]
+    spec = importlib.util.spec_from_file_location("index_pack", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.INDEXES
+
+
+async def existing_indexes(names: List[str]) -> set:
+    async with engine.connect() as conn:
+        res = await conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:n)"),
+            {"n": names},
+        )
+        return set(res.scalars())
+
+
+async def apply(indexes: list, create: bool) -> None:
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name, table, definition in indexes:
+            if create:
+                await conn.execute(
+                    text(
+                        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+                        f'ON "{table}" {definition}'
+                    )
+                )
+            else:
+                await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+        for table in sorted({table for _, table, _ in indexes}):
+            await conn.execute(text(f'ANALYZE "{table}"'))
+    await engine.dispose()
+
+
+def per_endpoint(plans: List[StatementPlan]) -> Dict[str, Dict[str, float]]:
+    totals: Dict[str, Dict[str, float]] = defaultdict(
+        lambda: {"cost": 0.0, "ms": 0.0, "seq_scans": 0}
+    )
+    for plan in plans:
+        if plan.error:
+            continue
+        totals[plan.endpoint]["cost"] += plan.total_cost
+        totals[plan.endpoint]["ms"] += plan.actual_ms
+        totals[plan.endpoint]["seq_scans"] += len(plan.seq_scans)
+    return totals
+
+
+def write_report(
+    indexes: list, before: List[StatementPlan], after: List[StatementPlan]
+) -> str:
+    out_dir = os.path.join(API_ROOT, "reports")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "INDEX_PACK_BENCHMARK.md")
+    a, b = per_endpoint(before), per_endpoint(after)
+    lines: List[str] = [
+        "# Index Pack Benchmark",
+        "",
+        f"- Indexes: {len(indexes)} (alembic revision a9c3e5f71d20)",
+        "- Per endpoint: summed planner cost, EXPLAIN ANALYZE execution time and",
+        "  Seq Scans on large tables over every statement the endpoint ran",
+        "",
+        "| Endpoint | Cost before | Cost after | ms before | ms after "
+        "| Seq Scans before | Seq Scans after |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for endpoint in sorted(set(a) | set(b)):
+        x = a.get(endpoint, {"cost": 0.0, "ms": 0.0, "seq_scans": 0})
+        y = b.get(endpoint, {"cost": 0.0, "ms": 0.0, "seq_scans": 0})
+        lines.append(
+            f"| `{endpoint}` | {x['cost']:.0f} | {y['cost']:.0f} | {x['ms']:.2f} "
+            f"| {y['ms']:.2f} | {x['seq_scans']} | {y['seq_scans']} |"
+        )
+    used = sorted(
+        {
+            name
+            for plan in after
+            for line in plan.shape
+            for name, _, _ in indexes
+            if line.endswith(f"using {name}")
+        }
+    )
+    lines += ["", "## Pack indexes used by the plans", ""]
+    lines += [f"- `{name}`" for name in used] or ["None."]
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return out_path
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    indexes = load_index_pack()
+    had = await existing_indexes([name for name, _, _ in indexes])
+
+    await apply(indexes, create=False)
+    before = await run(args.rows)
+    await apply(indexes, create=True)
+    after = await run(args.rows)
+    if not args.keep:
+        await apply([i for i in indexes if i[0] not in had], create=False)
+
+    out_path = write_report(indexes, before, after)
+    print(f"Index pack benchmark written to {out_path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="Leave every index built")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
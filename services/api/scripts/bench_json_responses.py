@@ -0,0 +1,193 @@
+"""
+JSON response benchmark: large list payloads through FastAPI.
+
+Serves a users list of --rows rows (the list_users row shape, built from
+in-memory user objects with enum and datetime attributes) from three
+in-process FastAPI apps and times full requests over ASGI:
+
+- before:  rows built with .isoformat() / hasattr(x, "value") and returned
+           as a dict: jsonable_encoder + stdlib json (the previous path)
+- default: the same handler with ORJSONResponse as the app default class
+           (jsonable_encoder + orjson)
+- direct:  the list_users path: raw rows from _user_row returned as an
+           ORJSONResponse (one orjson pass)
+
+No database or server is needed. Writes reports/JSON_RESPONSE_BENCHMARK.md.
+
+Usage:
+    python scripts/bench_json_responses.py [--rows 100 500 2000] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.db.models import RoleKey, UserStatus  # noqa: E402
+from app.routes.users import _user_row  # noqa: E402
+from app.serialization import ORJSONResponse  # noqa: E402
+
+MODES = ("before", "default", "direct")
+
+
+def make_users(count: int) -> List[Any]:
+    base = datetime(2024, 1, 1, 9, 30, 0, 123000)
+    return [
+        SimpleNamespace(
+            id=f"9f6c1a52-0000-4000-8000-{i:012d}",
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            first_name="First",
+            last_name=f"Last{i}",
+            status=UserStatus.ACTIVE,
+            role=RoleKey.LEARNER,
+            active_role=RoleKey.LEARNER,
+            roles=[SimpleNamespace(role_key=RoleKey.LEARNER)],
+            is_active=True,
+            node_id=None,
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_row(user: Any) -> Dict[str, Any]:
+    role_keys = [ur.role_key.value for ur in user.roles] if user.roles else []
+    if not role_keys:
+        role_keys = [user.role.value if hasattr(user.role, "value") else str(user.role)]
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "firstName": user.first_name,
+        "lastName": user.last_name,
+        "status": user.status.value if hasattr(user.status, "value") else str(user.status),
+        "role": user.role.value if hasattr(user.role, "value") else str(user.role),
+        "activeRole": (
+            user.active_role.value
+            if hasattr(user.active_role, "value")
+            else str(user.active_role)
+        ),
+        "roles": role_keys,
+        "isActive": user.is_active,
+        "nodeId": user.node_id,
+        "createdAt": user.created_at.isoformat() if user.created_at else None,
+    }
+
+
+def build_app(mode: str, users: List[Any]) -> FastAPI:
+    if mode == "before":
+        app = FastAPI()
+    else:
+        app = FastAPI(default_response_class=ORJSONResponse)
+
+    if mode == "direct":
+
+        @app.get("/api/users")
+        async def list_users_direct():
+            return ORJSONResponse({"users": [_user_row(u) for u in users], "total": len(users)})
+
+    else:
+
+        @app.get("/api/users")
+        async def list_users_legacy():
+            return {"users": [legacy_row(u) for u in users], "total": len(users)}
+
+    return app
+
+
+async def time_mode(mode: str, users: List[Any], requests: int) -> Dict[str, Any]:
+    app = build_app(mode, users)
+    transport = httpx.ASGITransport(app=app)
+    timings: List[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        body = (await client.get("/api/users")).content  # warm up
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            response = await client.get("/api/users")
+            timings.append((time.perf_counter() - t0) * 1000)
+            assert response.status_code == 200
+    timings.sort()
+    return {
+        "mode": mode,
+        "rows": len(users),
+        "bytes": len(body),
+        "p50": statistics.median(timings),
+        "p95": timings[min(int(len(timings) * 0.95), len(timings) - 1)],
+        "rps": 1000 / statistics.mean(timings),
+        "body": body,
+    }
+
+
+def write_report(args: argparse.Namespace, results: List[Dict[str, Any]]) -> str:
+    out_dir = os.path.join(API_ROOT, "reports")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "JSON_RESPONSE_BENCHMARK.md")
+    lines: List[str] = []
+    lines.append("# JSON Response Benchmark")
+    lines.append("")
+    lines.append(
+        f"- {args.requests} sequential requests per case over in-process ASGI "
+        "(routing + serialization, no network or database)"
+    )
+    lines.append("- Payload: list_users rows (enums, datetimes, role list)")
+    lines.append("")
+    lines.append("| Rows | Mode | Body bytes | p50 ms | p95 ms | Requests/s | Speedup (p50) |")
+    lines.append("|------|------|------------|--------|--------|------------|---------------|")
+    baseline = {r["rows"]: r["p50"] for r in results if r["mode"] == "before"}
+    for r in results:
+        speedup = baseline[r["rows"]] / r["p50"] if r["p50"] else 0.0
+        lines.append(
+            f"| {r['rows']:,} | {r['mode']} | {r['bytes']:,} | {r['p50']:.2f} "
+            f"| {r['p95']:.2f} | {r['rps']:.0f} | {speedup:.1f}x |"
+        )
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return out_path
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    import orjson
+
+    results = []
+    for rows in args.rows:
+        users = make_users(rows)
+        bodies = []
+        for mode in MODES:
+            result = await time_mode(mode, users, args.requests)
+            bodies.append(orjson.loads(result.pop("body")))
+            results.append(result)
+            print(
+                f"{rows:>6} rows  {mode:<8} p50 {result['p50']:7.2f} ms  "
+                f"p95 {result['p95']:7.2f} ms  {result['rps']:7.0f} req/s"
+            )
+        # Every mode must produce the same JSON document
+        assert all(b == bodies[0] for b in bodies), "response bodies differ"
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    results = asyncio.run(run(args))
+    out_path = write_report(args, results)
+    print(f"JSON response benchmark written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
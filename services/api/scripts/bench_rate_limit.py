@@ -0,0 +1,173 @@
+"""
+Rate limiter throughput: legacy sorted-set window vs the GCRA engine.
+
+Measures, per decision:
+- rule lookup: the old linear scan of DEFAULT_LIMITS vs PrefixMatcher
+- local tier: LocalLimiter (in-process GCRA)
+- Redis (when reachable): the old ZREMRANGEBYSCORE/ZADD/ZCARD/EXPIRE
+  pipeline vs one EVALSHA of GCRA_LUA, at several concurrency levels
+
+Writes reports/RATE_LIMIT_BENCHMARK.md.
+
+Usage:
+    python scripts/bench_rate_limit.py [--decisions 20000] [--keys 1000]
+        [--concurrency 1 50] [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.ratelimit import (
+    DEFAULT_LIMITS,
+    LocalLimiter,
+    PrefixMatcher,
+    RateLimitConfig,
+    RedisLimiter,
+)
+
+PATHS = [
+    "/api/auth/login",
+    "/api/courses/8f14e45f-ceea-467f-a0e6-5b3c2a1d9e10/units",
+    "/api/reports/generate",
+    "/api/users?page=2",
+    "/api/import/users",
+    "/health",
+]
+CONFIG = RateLimitConfig(1_000_000, 60, "user")  # Never limits: measures the decision cost
+
+
+def legacy_match(path: str) -> Optional[RateLimitConfig]:
+    """_get_limit_config before the engine rewrite."""
+    if path in DEFAULT_LIMITS:
+        return DEFAULT_LIMITS[path]
+    best_match = None
+    best_length = 0
+    for pattern, config in DEFAULT_LIMITS.items():
+        if path.startswith(pattern) and len(pattern) > best_length:
+            best_match = config
+            best_length = len(pattern)
+    return best_match
+
+
+async def legacy_check(redis: Any, key: str, config: RateLimitConfig) -> bool:
+    """_check_rate_limit before the engine rewrite."""
+    now = time.time()
+    async with redis.pipeline(transaction=True) as pipe:
+        await pipe.zremrangebyscore(key, 0, now - config.window_seconds)
+        await pipe.zadd(key, {str(now): now})
+        await pipe.zcard(key)
+        await pipe.expire(key, config.window_seconds)
+        results = await pipe.execute()
+    return results[2] <= config.requests
+
+
+def time_sync(fn: Callable[[int], Any], n: int) -> float:
+    started = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return n / (time.perf_counter() - started)
+
+
+async def time_async(fn: Callable[[int], Any], n: int, concurrency: int) -> float:
+    async def worker(offset: int) -> None:
+        for i in range(offset, n, concurrency):
+            await fn(i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    return n / (time.perf_counter() - started)
+
+
+async def redis_results(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from redis import asyncio as aioredis
+
+    client = aioredis.from_url(args.redis_url, socket_timeout=1, socket_connect_timeout=1)
+    try:
+        await client.ping()
+    except Exception as e:
+        print(f"Redis not reachable at {args.redis_url}: {e}; skipping Redis modes")
+        return []
+
+    gcra = RedisLimiter(client)
+    rows = []
+    try:
+        for concurrency in args.concurrency:
+            await client.flushdb()
+            legacy = await time_async(
+                lambda i: legacy_check(client, f"bench:legacy:{i % args.keys}", CONFIG),
+                args.decisions,
+                concurrency,
+            )
+            await client.flushdb()
+            engine = await time_async(
+                lambda i: gcra.check(f"bench:gcra:{i % args.keys}", CONFIG),
+                args.decisions,
+                concurrency,
+            )
+            rows.append({"mode": "Redis ZSET pipeline (legacy)", "concurrency": concurrency, "rate": legacy})
+            rows.append({"mode": "Redis GCRA Lua", "concurrency": concurrency, "rate": engine})
+            print(f"redis c={concurrency:<3} legacy {legacy:10.0f}/s  gcra {engine:10.0f}/s")
+        await client.flushdb()
+    finally:
+        await client.aclose()
+    return rows
+
+
+def write_report(args: argparse.Namespace, rows: List[Dict[str, Any]]) -> str:
+    out_dir = os.path.join(API_ROOT, "reports")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "RATE_LIMIT_BENCHMARK.md")
+    lines: List[str] = []
+    lines.append("# Rate Limit Benchmark")
+    lines.append("")
+    lines.append(f"- Decisions per case: {args.decisions:,} over {args.keys:,} keys")
+    if not any(r["mode"].startswith("Redis") for r in rows):
+        lines.append(f"- Redis modes skipped: no server at {args.redis_url}")
+    lines.append("")
+    lines.append("| Mode | Concurrency | Decisions/s |")
+    lines.append("|------|-------------|-------------|")
+    for r in rows:
+        lines.append(f"| {r['mode']} | {r['concurrency']} | {r['rate']:,.0f} |")
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return out_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=20_000)
+    parser.add_argument("--keys", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 50])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    matcher = PrefixMatcher(DEFAULT_LIMITS)
+    lookups = args.decisions * 10
+    legacy = time_sync(lambda i: legacy_match(PATHS[i % len(PATHS)]), lookups)
+    compiled = time_sync(lambda i: matcher.match(PATHS[i % len(PATHS)]), lookups)
+    rows.append({"mode": "Rule lookup: linear scan (legacy)", "concurrency": 1, "rate": legacy})
+    rows.append({"mode": "Rule lookup: PrefixMatcher", "concurrency": 1, "rate": compiled})
+    print(f"rule lookup  legacy {legacy:10.0f}/s  compiled {compiled:10.0f}/s")
+
+    local = LocalLimiter()
+    rate = time_sync(lambda i: local.check(f"bench:{i % args.keys}", CONFIG), args.decisions)
+    rows.append({"mode": "Local GCRA tier", "concurrency": 1, "rate": rate})
+    print(f"local tier   {rate:10.0f}/s")
+
+    rows.extend(asyncio.run(redis_results(args)))
+    out_path = write_report(args, rows)
+    print(f"Rate limit benchmark written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
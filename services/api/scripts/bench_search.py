@@ -0,0 +1,216 @@
+"""
+Search benchmark: legacy ilike OR vs app.search trigram/prefix helpers.
+
+Seeds a throwaway tenant with N users (default 100k) using generate_series,
+runs EXPLAIN (ANALYZE, BUFFERS) for each query shape and writes
+reports/SEARCH_BENCHMARK.md. Requires the b7d2e4f19a03 migration. No run
+is checked in; the report exists only after running this against a
+database.
+
+Usage:
+    python scripts/bench_search.py [--users 100000] [--runs 5] [--keep]
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import sys
+from typing import Any, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import select, text
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.db.models import User
+from app.db.session import engine
+from app.search import apply_user_search, user_search_filter
+from sqlalchemy.dialects.postgresql import asyncpg as pg_asyncpg
+
+BENCH_DOMAIN = "search-bench.local"
+
+FIRST_NAMES = [
+    "John", "Joanna", "Maria", "Mohammed", "Wei", "Olga", "Carlos", "Aisha",
+    "Liam", "Sofia", "Noah", "Emma", "Yuki", "Ivan", "Fatima", "Lucas",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Garcia", "Nguyen", "Kowalski", "Haddad", "Silva",
+    "Tanaka", "Petrov", "Anderson", "Okafor", "Rossi", "Schmidt", "Dubois",
+]
+
+# (label, term)
+TERMS = [
+    ("typeahead, 2 chars", "jo"),
+    ("surname", "smith"),
+    ("full name", "maria garcia"),
+    ("email fragment", "user4242"),
+    ("no match", "zzqx"),
+]
+
+
+def _sql_array(values: List[str]) -> str:
+    return "ARRAY[" + ", ".join(f"'{v}'" for v in values) + "]"
+
+
+async def seed(n_users: int) -> str:
+    tenant_id = str(uuid4())
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                INSERT INTO tenants (id, domain, name, settings, "createdAt", "updatedAt")
+                VALUES (:id, :domain, 'Search Bench', '{}'::jsonb, now(), now())
+                """
+            ),
+            {"id": tenant_id, "domain": BENCH_DOMAIN},
+        )
+        first = _sql_array(FIRST_NAMES)
+        last = _sql_array(LAST_NAMES)
+        await conn.execute(
+            text(
+                f"""
+                INSERT INTO users (
+                    id, "tenantId", username, email, "firstName", "lastName",
+                    timezone, language, status, "activeRole", role, is_active,
+                    is_verified, "failedLoginAttempts", "excludeFromEmails",
+                    token_version, "createdAt", "updatedAt"
+                )
+                SELECT
+                    gen_random_uuid()::text, :tenant_id,
+                    'user' || g, 'user' || g || '@bench.example.com',
+                    ({first})[1 + g % {len(FIRST_NAMES)}],
+                    ({last})[1 + (g / {len(FIRST_NAMES)}) % {len(LAST_NAMES)}],
+                    'UTC', 'en', 'ACTIVE', 'LEARNER', 'LEARNER', true,
+                    true, 0, false, 0, now(), now()
+                FROM generate_series(1, :n) AS g
+                """
+            ),
+            {"tenant_id": tenant_id, "n": n_users},
+        )
+        await conn.execute(text("ANALYZE users"))
+    return tenant_id
+
+
+async def cleanup(tenant_id: str) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text('DELETE FROM users WHERE "tenantId" = :t'), {"t": tenant_id})
+        await conn.execute(text("DELETE FROM tenants WHERE id = :t"), {"t": tenant_id})
+
+
+def _compile(stmt: Any) -> str:
+    return str(
+        stmt.compile(
+            dialect=pg_asyncpg.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def build_queries(tenant_id: str, term: str) -> List[Tuple[str, str]]:
+    base = (
+        select(User.id)
+        .where(User.tenant_id == tenant_id)
+        .where(User.deleted_at.is_(None))
+    )
+    legacy = base.where(
+        User.first_name.ilike(f"%{term}%")
+        | User.last_name.ilike(f"%{term}%")
+        | User.email.ilike(f"%{term}%")
+        | User.username.ilike(f"%{term}%")
+    )
+    return [
+        ("legacy ilike OR", _compile(legacy.limit(20))),
+        ("user_search_filter", _compile(base.where(user_search_filter(term)).limit(20))),
+        ("apply_user_search (ranked)", _compile(apply_user_search(base, term).limit(20))),
+    ]
+
+
+def _execution_ms(plan: List[str]) -> float:
+    for line in reversed(plan):
+        m = re.search(r"Execution Time: ([\d.]+) ms", line)
+        if m:
+            return float(m.group(1))
+    return float("nan")
+
+
+def _scan_kind(plan: List[str]) -> str:
+    joined = "\n".join(plan)
+    for name in re.findall(r"Index Scan (?:using|on) (\w+)", joined):
+        if name.startswith("ix_users_"):
+            return name
+    if "Seq Scan on users" in joined:
+        return "Seq Scan"
+    return "other"
+
+
+async def run_benchmark(tenant_id: str, runs: int) -> List[Tuple[str, str, str, float, str]]:
+    results: List[Tuple[str, str, str, float, str]] = []
+    async with engine.connect() as conn:
+        for label, term in TERMS:
+            for name, sql in build_queries(tenant_id, term):
+                timings: List[float] = []
+                plan: List[str] = []
+                for _ in range(runs):
+                    res = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+                    plan = [row[0] for row in res.fetchall()]
+                    timings.append(_execution_ms(plan))
+                results.append(
+                    (label, term, name, statistics.median(timings), _scan_kind(plan))
+                )
+                print(f"{label:<20} {name:<28} {statistics.median(timings):>9.2f} ms")
+    return results
+
+
+def write_report(n_users: int, runs: int, results: List[Tuple[str, str, str, float, str]]) -> str:
+    out_dir = os.path.join(API_ROOT, "reports")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "SEARCH_BENCHMARK.md")
+    lines: List[str] = []
+    lines.append("# Search Benchmark")
+    lines.append("")
+    lines.append(f"- Users in tenant: {n_users:,}")
+    lines.append(f"- Runs per query: {runs} (median execution time)")
+    lines.append("")
+    lines.append("| Case | Term | Query | Median ms | Scan |")
+    lines.append("|------|------|-------|-----------|------|")
+    for label, term, name, ms, scan in results:
+        lines.append(f"| {label} | `{term}` | {name} | {ms:.2f} | {scan} |")
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return out_path
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded tenant")
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        stale = (
+            await conn.execute(
+                text("SELECT id FROM tenants WHERE domain = :d"), {"d": BENCH_DOMAIN}
+            )
+        ).scalar()
+    if stale:
+        await cleanup(stale)
+
+    print(f"Seeding {args.users:,} users...")
+    tenant_id = await seed(args.users)
+    try:
+        results = await run_benchmark(tenant_id, args.runs)
+        out_path = write_report(args.users, args.runs, results)
+        print(f"Search benchmark written to {out_path}")
+    finally:
+        if not args.keep:
+            await cleanup(tenant_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
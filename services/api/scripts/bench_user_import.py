@@ -0,0 +1,232 @@
+"""
+CSV user import benchmark: streaming COPY pipeline vs per-row ORM inserts.
+
+Generates users CSVs (10k and 100k rows by default, a configurable share
+of them with passwords) and imports them into a throwaway tenant:
+
+- pipeline: app.imports.run_user_import (batched validation, one collision
+            query per batch, pooled bcrypt, COPY into staging + merge)
+- per-row:  the shape of a naive importer (SELECT for collisions, hash,
+            session.add, commit) for every row, timed on a small sample
+            and reported as rows/s
+
+Writes reports/USER_IMPORT_BENCHMARK.md. No run is checked in; the report
+exists only after running this against a database.
+
+Usage:
+    python scripts/bench_user_import.py [--rows 10000 100000] [--password-ratio 0.1]
+        [--baseline-rows 500] [--keep]
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import func, select, text
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.auth.password import hash_password
+from app.config import get_settings
+from app.db.hooks import TenantContextManager
+from app.db.models import RoleKey, User, UserStatus
+from app.db.session import async_session_factory, engine, get_db_context
+from app.imports import create_job, run_user_import
+from app.imports.common import iter_batches
+
+BENCH_DOMAIN = "import-bench.local"
+PASSWORD = "Bench-Passw0rd!"
+
+
+def generate_csv(path: Path, rows: int, password_ratio: float, prefix: str) -> None:
+    every = int(1 / password_ratio) if password_ratio > 0 else 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Email", "First Name", "Last Name", "Username", "Password", "Role"])
+        for i in range(rows):
+            password = PASSWORD if every and i % every == 0 else ""
+            writer.writerow(
+                [f"{prefix}{i}@import-bench.example.com", "Bench", f"User {i}",
+                 f"{prefix}{i}", password, "LEARNER"]
+            )
+
+
+async def seed() -> Tuple[str, str]:
+    tenant_id, admin_id = str(uuid4()), str(uuid4())
+    async with get_db_context() as db:
+        await db.execute(
+            text(
+                """
+                INSERT INTO tenants (id, domain, name, settings, "createdAt", "updatedAt")
+                VALUES (:id, :domain, 'Import Bench', '{}'::jsonb, now(), now())
+                """
+            ),
+            {"id": tenant_id, "domain": BENCH_DOMAIN},
+        )
+        await db.execute(
+            text(
+                """
+                INSERT INTO users (
+                    id, "tenantId", username, email, "firstName", "lastName",
+                    timezone, language, status, "activeRole", role, is_active,
+                    is_verified, "failedLoginAttempts", "excludeFromEmails",
+                    token_version, "createdAt", "updatedAt"
+                )
+                VALUES (
+                    :id, :tenant_id, 'bench-admin', 'admin@import-bench.example.com',
+                    'Bench', 'Admin', 'UTC', 'en', 'ACTIVE', 'ADMIN', 'ADMIN',
+                    true, true, 0, false, 0, now(), now()
+                )
+                """
+            ),
+            {"id": admin_id, "tenant_id": tenant_id},
+        )
+    return tenant_id, admin_id
+
+
+async def cleanup(tenant_id: str) -> None:
+    params = {"t": tenant_id}
+    async with get_db_context() as db:
+        for table in ("import_jobs", "search_documents", "users"):
+            await db.execute(text(f'DELETE FROM {table} WHERE "tenantId" = :t'), params)
+        await db.execute(text("DELETE FROM tenants WHERE id = :t"), params)
+
+
+async def find_stale_tenant() -> str | None:
+    async with get_db_context() as db:
+        return (
+            await db.execute(text("SELECT id FROM tenants WHERE domain = :d"), {"d": BENCH_DOMAIN})
+        ).scalar()
+
+
+async def bench_pipeline(tenant_id: str, admin_id: str, path: Path) -> Tuple[float, Dict[str, Any]]:
+    async with get_db_context() as db:
+        job = await create_job(db, tenant_id, "users", path.name, admin_id)
+        job_id = job.id
+    with TenantContextManager(tenant_id=tenant_id):
+        started = time.perf_counter()
+        summary = await run_user_import(async_session_factory, job_id, path, tenant_id)
+        elapsed = time.perf_counter() - started
+    return elapsed, summary.to_dict()
+
+
+async def bench_per_row(tenant_id: str, path: Path, limit: int) -> Tuple[float, int]:
+    """One SELECT + optional bcrypt + INSERT + COMMIT per row."""
+    imported = 0
+    started = time.perf_counter()
+    with TenantContextManager(tenant_id=tenant_id):
+        for batch in iter_batches(path, 100):
+            for _, row in batch:
+                if imported >= limit:
+                    break
+                async with get_db_context() as db:
+                    exists = await db.execute(
+                        select(func.count()).select_from(User).where(
+                            (User.email == row["email"]) | (User.username == row["username"])
+                        )
+                    )
+                    if exists.scalar():
+                        continue
+                    db.add(
+                        User(
+                            tenant_id=tenant_id,
+                            email=row["email"],
+                            username=row["username"],
+                            first_name=row["firstname"],
+                            last_name=row["lastname"],
+                            password_hash=hash_password(row["password"]) if row["password"] else None,
+                            role=RoleKey.LEARNER,
+                            active_role=RoleKey.LEARNER,
+                            status=UserStatus.ACTIVE,
+                        )
+                    )
+                imported += 1
+    return time.perf_counter() - started, imported
+
+
+def write_report(password_ratio: float, results: List[Dict[str, Any]]) -> str:
+    settings = get_settings()
+    out_dir = os.path.join(API_ROOT, "reports")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "USER_IMPORT_BENCHMARK.md")
+    lines: List[str] = []
+    lines.append("# User Import Benchmark")
+    lines.append("")
+    lines.append(f"- Rows with a password (bcrypt): {password_ratio:.0%}")
+    lines.append(
+        f"- Batch size: {settings.import_batch_size}, hash workers: "
+        f"{settings.import_hash_workers or os.cpu_count()}"
+    )
+    lines.append("")
+    lines.append("| Mode | Rows | Seconds | Rows/s | Imported | Failed |")
+    lines.append("|------|------|---------|--------|----------|--------|")
+    for r in results:
+        lines.append(
+            f"| {r['mode']} | {r['rows']:,} | {r['seconds']:.2f} | {r['rate']:.0f} "
+            f"| {r['imported']:,} | {r['failed']:,} |"
+        )
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return out_path
+
+
+async def run(args: argparse.Namespace) -> None:
+    stale = await find_stale_tenant()
+    if stale:
+        await cleanup(stale)
+
+    tenant_id, admin_id = await seed()
+    results: List[Dict[str, Any]] = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for rows in args.rows:
+                path = Path(tmp) / f"users_{rows}.csv"
+                generate_csv(path, rows, args.password_ratio, f"p{rows}-")
+                seconds, summary = await bench_pipeline(tenant_id, admin_id, path)
+                results.append({
+                    "mode": "pipeline", "rows": rows, "seconds": seconds,
+                    "rate": rows / seconds, "imported": summary["succeeded"],
+                    "failed": summary["failed"],
+                })
+                print(f"pipeline {rows:>8,} rows  {seconds:8.2f}s  {rows / seconds:8.0f} rows/s")
+
+            path = Path(tmp) / "users_baseline.csv"
+            generate_csv(path, args.baseline_rows, args.password_ratio, "b-")
+            seconds, imported = await bench_per_row(tenant_id, path, args.baseline_rows)
+            results.append({
+                "mode": "per-row ORM", "rows": args.baseline_rows, "seconds": seconds,
+                "rate": imported / seconds, "imported": imported,
+                "failed": args.baseline_rows - imported,
+            })
+            print(f"per-row  {args.baseline_rows:>8,} rows  {seconds:8.2f}s  {imported / seconds:8.0f} rows/s")
+
+        out_path = write_report(args.password_ratio, results)
+        print(f"User import benchmark written to {out_path}")
+    finally:
+        if not args.keep:
+            await cleanup(tenant_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--password-ratio", type=float, default=0.1)
+    parser.add_argument("--baseline-rows", type=int, default=500)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded tenant")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1021 @@
+"""
+Synthetic data generator for load-test and benchmark databases.
+
+Generates production-shaped data from a scale profile and bulk-loads it
+with COPY (asyncpg copy_records_to_table), one worker process per job:
+
+1. Per tenant: the tenant, branches, users, courses with sections and
+   units, and learning paths with their courses.
+2. Per tenant and user shard: enrollments, learning path memberships,
+   assignment submissions and timeline events.
+
+Distributions follow what production looks like rather than uniform
+noise: tenant sizes and branch sizes are skewed (a few large ones),
+course popularity is Zipf-like, enrollment counts per user are
+heavy-tailed, enrollment status and progress depend on enrollment age and
+timeline events cluster in recent weeks. Row ids are derived from (run,
+tenant, kind, index), so shards reference parents without querying them.
+
+Every user gets the same password (--password) so load tests can log in.
+COPY bypasses the ORM hooks that maintain search_documents; run
+scripts/reindex_search.py afterwards if search is part of the benchmark.
+Tenants are created under *.synthetic.local and removed with --drop.
+
+Usage:
+    python scripts/generate_synthetic_data.py --profile bench [--workers 8]
+    python scripts/generate_synthetic_data.py --profile production --seed 7
+    python scripts/generate_synthetic_data.py --drop
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import enum
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import JSONB
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+DOMAIN_SUFFIX = ".synthetic.local"
+DEFAULT_PASSWORD = "Synthetic123!"
+
+
+@dataclass(frozen=True)
+class ScaleProfile:
+    tenants: int
+    users_per_tenant: int  # Mean; tenant sizes are skewed around it
+    branches_per_tenant: int
+    courses_per_tenant: int
+    sections_per_course: int
+    units_per_section: int
+    paths_per_tenant: int
+    courses_per_path: int
+    enrollments_per_user: float  # Mean of a heavy-tailed distribution
+    path_memberships_per_user: float
+    submission_rate: float  # Share of started enrollments with a submission
+    events_per_user: float
+    history_days: int = 3 * 365
+    shard_users: int = 5000  # Users per phase-2 job
+
+    def estimate(self) -> dict[str, int]:
+        users = self.tenants * self.users_per_tenant
+        courses = self.tenants * self.courses_per_tenant
+        units = courses * self.sections_per_course * self.units_per_section
+        enrollments = int(users * self.enrollments_per_user)
+        return {
+            "users": users,
+            "courses": courses,
+            "course_units": units,
+            "enrollments": enrollments,
+            "learning_path_enrollments": int(users * self.path_memberships_per_user),
+            "assignment_submissions": int(enrollments * 0.8 * self.submission_rate),
+            "timeline_events": int(users * self.events_per_user),
+        }
+
+
+PROFILES = {
+    # ~60k rows: CI and laptops
+    "smoke": ScaleProfile(
+        tenants=2,
+        users_per_tenant=1000,
+        branches_per_tenant=3,
+        courses_per_tenant=50,
+        sections_per_course=3,
+        units_per_section=4,
+        paths_per_tenant=5,
+        courses_per_path=4,
+        enrollments_per_user=8,
+        path_memberships_per_user=1,
+        submission_rate=0.15,
+        events_per_user=15,
+        shard_users=1000,
+    ),
+    # ~1M rows: query plans start to look like production
+    "bench": ScaleProfile(
+        tenants=4,
+        users_per_tenant=10_000,
+        branches_per_tenant=8,
+        courses_per_tenant=200,
+        sections_per_course=4,
+        units_per_section=5,
+        paths_per_tenant=20,
+        courses_per_path=5,
+        enrollments_per_user=12,
+        path_memberships_per_user=1.5,
+        submission_rate=0.15,
+        events_per_user=15,
+    ),
+    # ~10M rows: production shape
+    "production": ScaleProfile(
+        tenants=10,
+        users_per_tenant=20_000,
+        branches_per_tenant=15,
+        courses_per_tenant=500,
+        sections_per_course=4,
+        units_per_section=5,
+        paths_per_tenant=40,
+        courses_per_path=6,
+        enrollments_per_user=20,
+        path_memberships_per_user=2,
+        submission_rate=0.15,
+        events_per_user=25,
+    ),
+}
+
+# Load order (parents first); --drop deletes in reverse
+TABLES = (
+    "tenants",
+    "branches",
+    "users",
+    "user_roles",
+    "courses",
+    "course_sections",
+    "course_units",
+    "learning_paths",
+    "learning_path_courses",
+    "enrollments",
+    "learning_path_enrollments",
+    "assignment_submissions",
+    "timeline_events",
+)
+
+FIRST_NAMES = [
+    "James",
+    "Mary",
+    "Mohammed",
+    "Fatima",
+    "Wei",
+    "Li",
+    "Carlos",
+    "Ana",
+    "Olga",
+    "Ivan",
+    "Yuki",
+    "Hiroshi",
+    "Aisha",
+    "Omar",
+    "Sofia",
+    "Lucas",
+    "Emma",
+    "Noah",
+    "Priya",
+    "Arjun",
+    "Chloe",
+    "Liam",
+    "Zara",
+    "Mateo",
+    "Nadia",
+    "Kofi",
+]
+LAST_NAMES = [
+    "Smith",
+    "Johnson",
+    "Garcia",
+    "Nguyen",
+    "Kim",
+    "Haddad",
+    "Silva",
+    "Tanaka",
+    "Petrov",
+    "Anderson",
+    "Okafor",
+    "Rossi",
+    "Schmidt",
+    "Dubois",
+    "Patel",
+    "Khan",
+    "Cohen",
+    "Novak",
+    "Jensen",
+    "Moreau",
+    "Santos",
+    "Yilmaz",
+    "Kowalski",
+    "Ali",
+]
+TOPICS = [
+    "Compliance",
+    "Safety",
+    "Onboarding",
+    "Leadership",
+    "Sales",
+    "Security",
+    "Customer Service",
+    "Data Privacy",
+    "Excel",
+    "Project Management",
+    "Communication",
+    "Wellbeing",
+    "Diversity",
+    "Finance",
+    "Product",
+    "Python",
+]
+UNIT_TYPES = (
+    ["TEXT"] * 30
+    + ["VIDEO"] * 30
+    + ["FILE"] * 10
+    + ["TEST"] * 15
+    + ["ASSIGNMENT"] * 8
+    + ["SURVEY"] * 4
+    + ["EMBED"] * 3
+)
+ROLES = ["LEARNER"] * 90 + ["INSTRUCTOR"] * 7 + ["SUPER_INSTRUCTOR"] + ["ADMIN"] * 2
+USER_STATUSES = ["ACTIVE"] * 94 + ["INACTIVE"] * 4 + ["DEACTIVATED"] * 2
+EVENT_TYPES = (
+    ["user_signin"] * 50
+    + ["course_enrolled"] * 15
+    + ["unit_completed"] * 25
+    + ["course_completed"] * 8
+    + ["learning_path_created"] * 2
+)
+
+# Id kinds (third UUID group)
+KIND = {name: i for i, name in enumerate(TABLES, start=1)}
+
+
+def make_id(run: int, tenant: int, kind: str, index: int) -> str:
+    """Deterministic UUID-shaped id; unique per (run, tenant, kind, index)."""
+    return (
+        f"{run:08x}-{tenant:04x}-4{KIND[kind]:03x}-"
+        f"8{(index >> 48) & 0xFFF:03x}-{index & 0xFFFFFFFFFFFF:012x}"
+    )
+
+
+def zipf_cum_weights(n: int, s: float = 1.0) -> list[float]:
+    """Cumulative weights for random.choices: rank k has weight 1 / k**s."""
+    return list(accumulate(1 / (k**s) for k in range(1, n + 1)))
+
+
+def skewed_sizes(total: int, parts: int, s: float = 0.6) -> list[int]:
+    """Split total into parts with a Zipf-like skew; every part gets >= 1."""
+    weights = [1 / (k**s) for k in range(1, parts + 1)]
+    scale = total / sum(weights)
+    return [max(1, round(w * scale)) for w in weights]
+
+
+def past(rng: random.Random, now: datetime, days: float, recent_bias: float = 2.0):
+    """A moment in the last `days`, denser towards now as recent_bias grows."""
+    return now - timedelta(days=days * rng.random() ** recent_bias)
+
+
+# ============= Column defaults =============
+
+
+def _table(name: str):
+    from app.db.models import Base
+
+    return Base.metadata.tables[name]
+
+
+def _db_value(column, value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(column.type, JSONB):
+        return orjson.dumps(value).decode()
+    return value
+
+
+def copy_columns(name: str, generated: tuple[str, ...]) -> tuple[list[str], tuple]:
+    """
+    COPY column list and the constant tail appended to every generated row.
+
+    NOT NULL columns the generator does not produce take the ORM default;
+    a NOT NULL column with neither is a bug in the generator (the model
+    gained a column) and fails fast, before anything is loaded.
+    """
+    table = _table(name)
+    columns = list(generated)
+    tail = []
+    for column in table.columns:
+        if column.name in generated or column.nullable:
+            continue
+        default = column.default
+        if default is None:
+            raise RuntimeError(f"{name}.{column.name} is NOT NULL without a default")
+        value = default.arg(None) if default.is_callable else default.arg
+        columns.append(column.name)
+        tail.append(_db_value(column, value))
+    return columns, tuple(tail)
+
+
+# ============= Generators =============
+
+
+@dataclass(frozen=True)
+class Job:
+    profile: ScaleProfile
+    run: int
+    seed: int
+    tenant: int
+    users: int  # Users in this tenant
+    password_hash: str
+    now: datetime
+    shard: tuple[int, int] | None = None  # User index range for phase 2
+
+    def rng(self, salt: str) -> random.Random:
+        return random.Random(f"{self.seed}:{self.tenant}:{self.shard}:{salt}")
+
+    def id(self, kind: str, index: int) -> str:
+        return make_id(self.run, self.tenant, kind, index)
+
+
+def branch_of_user(job: Job) -> list[int]:
+    """Branch index of every user in the tenant (skewed branch sizes)."""
+    sizes = skewed_sizes(job.users, job.profile.branches_per_tenant, s=0.8)
+    owners = [b for b, size in enumerate(sizes) for _ in range(size)]
+    owners += [0] * max(job.users - len(owners), 0)
+    return owners[: job.users]
+
+
+def user_created_at(job: Job, index: int) -> datetime:
+    # Index order follows sign-up order, with growth accelerating over time
+    age = 1 - (index + 1) / (job.users + 1)
+    return job.now - timedelta(days=job.profile.history_days * age**1.5)
+
+
+def gen_tenant(job: Job) -> Iterator[tuple]:
+    created = job.now - timedelta(days=job.profile.history_days)
+    domain = f"t{job.tenant}-{job.run:08x}{DOMAIN_SUFFIX}"
+    yield (
+        job.id("tenants", 0),
+        domain,
+        f"Synthetic {job.tenant}",
+        "{}",
+        created,
+        created,
+    )
+
+
+def gen_branches(job: Job) -> Iterator[tuple]:
+    created = job.now - timedelta(days=job.profile.history_days)
+    for b in range(job.profile.branches_per_tenant):
+        yield (
+            job.id("branches", b),
+            job.id("tenants", 0),
+            f"Branch {b}",
+            f"branch-{b}",
+            [],
+            True,
+            created,
+            created,
+        )
+
+
+def user_roles(job: Job) -> list[str]:
+    """Role of every user in the tenant; user 0 is the tenant admin."""
+    roles = job.rng("roles").choices(ROLES, k=job.users)
+    roles[0] = "ADMIN"
+    return roles
+
+
+def gen_users(job: Job) -> Iterator[tuple]:
+    rng = job.rng("users")
+    tenant_id = job.id("tenants", 0)
+    branches = branch_of_user(job)
+    roles = user_roles(job)
+    for i in range(job.users):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        role = roles[i]
+        created = user_created_at(job, i)
+        last_login = past(rng, job.now, (job.now - created).days + 1, recent_bias=3)
+        yield (
+            job.id("users", i),
+            tenant_id,
+            f"u{i}.t{job.tenant}",
+            f"user{i}@t{job.tenant}{DOMAIN_SUFFIX}",
+            first,
+            last,
+            rng.choice(USER_STATUSES),
+            role,
+            role,
+            job.id("branches", branches[i]),
+            job.password_hash,
+            last_login,
+            created,
+            created,
+        )
+
+
+def gen_user_roles(job: Job) -> Iterator[tuple]:
+    tenant_id = job.id("tenants", 0)
+    for i, role in enumerate(user_roles(job)):
+        yield (
+            job.id("user_roles", i),
+            tenant_id,
+            job.id("users", i),
+            role,
+            user_created_at(job, i),
+        )
+
+
+def gen_courses(job: Job) -> Iterator[tuple]:
+    rng = job.rng("courses")
+    tenant_id = job.id("tenants", 0)
+    for c in range(job.profile.courses_per_tenant):
+        created = past(rng, job.now, job.profile.history_days, recent_bias=1)
+        published = rng.random() < 0.85
+        yield (
+            job.id("courses", c),
+            tenant_id,
+            f"C{c:05d}",
+            f"{rng.choice(TOPICS)} {c}",
+            "PUBLISHED" if published else "DRAFT",
+            rng.random() < 0.1,
+            published,
+            job.id("users", 0),
+            created,
+            created,
+        )
+
+
+def gen_sections(job: Job) -> Iterator[tuple]:
+    tenant_id = job.id("tenants", 0)
+    created = job.now - timedelta(days=job.profile.history_days)
+    per_course = job.profile.sections_per_course
+    for c in range(job.profile.courses_per_tenant):
+        for s in range(per_course):
+            yield (
+                job.id("course_sections", c * per_course + s),
+                tenant_id,
+                job.id("courses", c),
+                f"Section {s + 1}",
+                s,
+                created,
+                created,
+            )
+
+
+def unit_type(job: Job, index: int) -> str:
+    return UNIT_TYPES[(index * 2654435761 + job.seed) % len(UNIT_TYPES)]
+
+
+def gen_units(job: Job) -> Iterator[tuple]:
+    tenant_id = job.id("tenants", 0)
+    created = job.now - timedelta(days=job.profile.history_days)
+    sections, units = job.profile.sections_per_course, job.profile.units_per_section
+    for c in range(job.profile.courses_per_tenant):
+        for s in range(sections):
+            section = c * sections + s
+            for u in range(units):
+                index = section * units + u
+                yield (
+                    job.id("course_units", index),
+                    tenant_id,
+                    job.id("courses", c),
+                    job.id("course_sections", section),
+                    unit_type(job, index),
+                    f"Unit {s + 1}.{u + 1}",
+                    "PUBLISHED",
+                    s * units + u,
+                    "{}",
+                    created,
+                    created,
+                )
+
+
+def gen_paths(job: Job) -> Iterator[tuple]:
+    rng = job.rng("paths")
+    tenant_id = job.id("tenants", 0)
+    for p in range(job.profile.paths_per_tenant):
+        created = past(rng, job.now, job.profile.history_days, recent_bias=1)
+        yield (
+            job.id("learning_paths", p),
+            tenant_id,
+            f"{rng.choice(TOPICS)} path {p}",
+            f"LP{p:04d}",
+            "published" if rng.random() < 0.8 else "draft",
+            True,
+            job.id("branches", p % job.profile.branches_per_tenant),
+            created,
+            created,
+        )
+
+
+def path_courses(job: Job, path: int) -> list[int]:
+    rng = random.Random(f"{job.seed}:{job.tenant}:path:{path}")
+    return rng.sample(
+        range(job.profile.courses_per_tenant), job.profile.courses_per_path
+    )
+
+
+def gen_path_courses(job: Job) -> Iterator[tuple]:
+    tenant_id = job.id("tenants", 0)
+    created = job.now - timedelta(days=job.profile.history_days)
+    for p in range(job.profile.paths_per_tenant):
+        for order, c in enumerate(path_courses(job, p)):
+            yield (
+                job.id(
+                    "learning_path_courses", p * job.profile.courses_per_path + order
+                ),
+                tenant_id,
+                job.id("learning_paths", p),
+                job.id("courses", c),
+                order,
+                created,
+            )
+
+
+def _progress(rng: random.Random, age_days: float) -> tuple[str, int]:
+    """Enrollment status and progress; older enrollments are further along."""
+    maturity = min(age_days / 120, 1.0)
+    roll = rng.random()
+    if roll < 0.55 * maturity + 0.05:
+        return "COMPLETED", 100
+    if roll < 0.57 * maturity + 0.06:
+        return rng.choice(("FAILED", "EXPIRED")), rng.randint(10, 90)
+    if roll < 0.85:
+        return "IN_PROGRESS", rng.randint(5, 95)
+    return "NOT_STARTED", 0
+
+
+def _sample_courses(rng: random.Random, cum: list[float], count: int) -> list[int]:
+    count = min(count, len(cum))
+    picked: dict[int, None] = {}
+    population = range(len(cum))
+    while len(picked) < count:
+        for c in rng.choices(population, cum_weights=cum, k=count - len(picked)):
+            picked[c] = None
+    return list(picked)
+
+
+class ShardData:
+    """Phase-2 rows of one user shard, generated in one pass over its users."""
+
+    def __init__(self, job: Job):
+        self.job = job
+        self.enrollments: list[tuple] = []
+        self.path_enrollments: list[tuple] = []
+        self.submissions: list[tuple] = []
+        self.events: list[tuple] = []
+        self._generate()
+
+    def _generate(self) -> None:
+        job, profile = self.job, self.job.profile
+        rng = job.rng("activity")
+        tenant_id = job.id("tenants", 0)
+        course_cum = zipf_cum_weights(profile.courses_per_tenant, s=1.1)
+        path_cum = zipf_cum_weights(profile.paths_per_tenant, s=0.9)
+        branches = branch_of_user(job)
+        units_per_course = profile.sections_per_course * profile.units_per_section
+        assignment_units = {
+            c: [
+                i
+                for i in range(c * units_per_course, (c + 1) * units_per_course)
+                if unit_type(job, i) == "ASSIGNMENT"
+            ]
+            for c in range(profile.courses_per_tenant)
+        }
+        start, end = job.shard or (0, job.users)
+        for u in range(start, end):
+            user_id = job.id("users", u)
+            joined = user_created_at(job, u)
+            tenure = max((job.now - joined).total_seconds() / 86400, 1)
+            count = int(rng.expovariate(1 / profile.enrollments_per_user))
+            for c in _sample_courses(rng, course_cum, count):
+                enrolled = past(rng, job.now, tenure, recent_bias=1.3)
+                status, progress = _progress(rng, (job.now - enrolled).days)
+                completed = None
+                if status == "COMPLETED":
+                    completed = enrolled + timedelta(days=rng.expovariate(1 / 14))
+                    completed = min(completed, job.now)
+                self.enrollments.append(
+                    (
+                        job.id("enrollments", u * profile.courses_per_tenant + c),
+                        tenant_id,
+                        user_id,
+                        job.id("courses", c),
+                        status,
+                        progress,
+                        rng.randint(50, 100) if completed else None,
+                        completed,
+                        enrolled,
+                        completed or enrolled,
+                    )
+                )
+                units = assignment_units[c]
+                if units and progress and rng.random() < profile.submission_rate:
+                    submitted = enrolled + (job.now - enrolled) * rng.random()
+                    graded = rng.random() < 0.7
+                    self.submissions.append(
+                        (
+                            job.id(
+                                "assignment_submissions",
+                                u * profile.courses_per_tenant + c,
+                            ),
+                            tenant_id,
+                            job.id("course_units", rng.choice(units)),
+                            user_id,
+                            job.id("courses", c),
+                            "text",
+                            "Synthetic submission",
+                            "GRADED" if graded else "SUBMITTED",
+                            rng.randint(40, 100) if graded else None,
+                            100,
+                            submitted,
+                            (
+                                submitted + timedelta(days=rng.random() * 5)
+                                if graded
+                                else None
+                            ),
+                        )
+                    )
+            memberships = int(rng.expovariate(1 / profile.path_memberships_per_user))
+            for p in _sample_courses(rng, path_cum, memberships):
+                enrolled = past(rng, job.now, tenure, recent_bias=1.3)
+                status, progress = _progress(rng, (job.now - enrolled).days)
+                completed = None
+                if status == "COMPLETED":
+                    completed = min(
+                        enrolled + timedelta(days=rng.expovariate(1 / 45)), job.now
+                    )
+                self.path_enrollments.append(
+                    (
+                        job.id(
+                            "learning_path_enrollments",
+                            u * profile.paths_per_tenant + p,
+                        ),
+                        tenant_id,
+                        user_id,
+                        job.id("learning_paths", p),
+                        status,
+                        progress,
+                        enrolled,
+                        completed,
+                        enrolled,
+                        completed or enrolled,
+                    )
+                )
+            events = min(int(rng.expovariate(1 / profile.events_per_user)), 4095)
+            branch_id = job.id("branches", branches[u])
+            for e in range(events):
+                kind = rng.choice(EVENT_TYPES)
+                course = rng.choices(
+                    range(profile.courses_per_tenant), cum_weights=course_cum
+                )[0]
+                self.events.append(
+                    (
+                        job.id("timeline_events", u * 4096 + e),
+                        tenant_id,
+                        user_id,
+                        None if kind == "user_signin" else job.id("courses", course),
+                        branch_id,
+                        kind,
+                        "{}",
+                        past(rng, job.now, min(tenure, 365), recent_bias=2.5),
+                    )
+                )
+
+
+# ============= Loading =============
+
+# Generated columns per table, in the order the generators yield them
+COLUMNS = {
+    "tenants": ("id", "domain", "name", "settings", "createdAt", "updatedAt"),
+    "branches": (
+        "id",
+        "tenantId",
+        "name",
+        "slug",
+        "allowedDomains",
+        "isActive",
+        "createdAt",
+        "updatedAt",
+    ),
+    "users": (
+        "id",
+        "tenantId",
+        "username",
+        "email",
+        "firstName",
+        "lastName",
+        "status",
+        "activeRole",
+        "role",
+        "node_id",
+        "passwordHash",
+        "lastLoginAt",
+        "createdAt",
+        "updatedAt",
+    ),
+    "user_roles": ("id", "tenantId", "userId", "roleKey", "createdAt"),
+    "courses": (
+        "id",
+        "tenantId",
+        "code",
+        "title",
+        "status",
+        "hiddenFromCatalog",
+        "isActive",
+        "instructorId",
+        "createdAt",
+        "updatedAt",
+    ),
+    "course_sections": (
+        "id",
+        "tenantId",
+        "courseId",
+        "title",
+        "order_index",
+        "createdAt",
+        "updatedAt",
+    ),
+    "course_units": (
+        "id",
+        "tenantId",
+        "courseId",
+        "sectionId",
+        "type",
+        "title",
+        "status",
+        "order_index",
+        "config",
+        "createdAt",
+        "updatedAt",
+    ),
+    "learning_paths": (
+        "id",
+        "tenantId",
+        "name",
+        "code",
+        "status",
+        "isActive",
+        "branchId",
+        "createdAt",
+        "updatedAt",
+    ),
+    "learning_path_courses": (
+        "id",
+        "tenantId",
+        "pathId",
+        "courseId",
+        "order",
+        "createdAt",
+    ),
+    "enrollments": (
+        "id",
+        "tenantId",
+        "userId",
+        "courseId",
+        "status",
+        "progress",
+        "score",
+        "completedAt",
+        "createdAt",
+        "updatedAt",
+    ),
+    "learning_path_enrollments": (
+        "id",
+        "tenantId",
+        "userId",
+        "pathId",
+        "status",
+        "progress",
+        "enrolledAt",
+        "completedAt",
+        "createdAt",
+        "updatedAt",
+    ),
+    "assignment_submissions": (
+        "id",
+        "tenantId",
+        "assignmentUnitId",
+        "userId",
+        "courseId",
+        "submissionType",
+        "content",
+        "status",
+        "score",
+        "maxScore",
+        "submittedAt",
+        "gradedAt",
+    ),
+    "timeline_events": (
+        "id",
+        "tenantId",
+        "userId",
+        "courseId",
+        "branchId",
+        "eventType",
+        "details",
+        "timestamp",
+    ),
+}
+
+TENANT_GENERATORS = {
+    "tenants": gen_tenant,
+    "branches": gen_branches,
+    "users": gen_users,
+    "user_roles": gen_user_roles,
+    "courses": gen_courses,
+    "course_sections": gen_sections,
+    "course_units": gen_units,
+    "learning_paths": gen_paths,
+    "learning_path_courses": gen_path_courses,
+}
+
+SHARD_TABLES = {
+    "enrollments": "enrollments",
+    "learning_path_enrollments": "path_enrollments",
+    "assignment_submissions": "submissions",
+    "timeline_events": "events",
+}
+
+
+def check_columns() -> dict[str, tuple[list[str], tuple]]:
+    """COPY columns and default tails for every table (raises on model drift)."""
+    return {name: copy_columns(name, COLUMNS[name]) for name in TABLES}
+
+
+async def _copy(conn, name: str, rows, plan) -> int:
+    columns, tail = plan[name]
+    count = 0
+
+    def records():
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row + tail
+
+    await conn.copy_records_to_table(name, records=records(), columns=columns)
+    return count
+
+
+async def _load(job: Job) -> dict[str, int]:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.config import get_settings
+
+    plan = check_columns()
+    engine = create_async_engine(get_settings().async_database_url, poolclass=NullPool)
+    counts: dict[str, int] = {}
+    try:
+        async with engine.begin() as conn:
+            raw = (await conn.get_raw_connection()).driver_connection
+            if job.shard is None:
+                for name, generate in TENANT_GENERATORS.items():
+                    counts[name] = await _copy(raw, name, generate(job), plan)
+            else:
+                data = ShardData(job)
+                for name, attr in SHARD_TABLES.items():
+                    counts[name] = await _copy(raw, name, getattr(data, attr), plan)
+    finally:
+        await engine.dispose()
+    return counts
+
+
+def run_job(job: Job) -> dict[str, int]:
+    """Worker entry point: one tenant (phase 1) or one user shard (phase 2)."""
+    return asyncio.run(_load(job))
+
+
+def plan_jobs(
+    profile: ScaleProfile, run: int, seed: int, password_hash: str, now: datetime
+) -> tuple[list[Job], list[Job]]:
+    sizes = skewed_sizes(
+        profile.tenants * profile.users_per_tenant, profile.tenants, s=0.5
+    )
+    tenants = [
+        Job(profile, run, seed, t, users, password_hash, now)
+        for t, users in enumerate(sizes)
+    ]
+    shards = [
+        replace(job, shard=(start, min(start + profile.shard_users, job.users)))
+        for job in tenants
+        for start in range(0, job.users, profile.shard_users)
+    ]
+    return tenants, shards
+
+
+def _run_phase(pool: ProcessPoolExecutor, jobs: list[Job], totals: dict[str, int]):
+    for counts in pool.map(run_job, jobs):
+        for name, count in counts.items():
+            totals[name] = totals.get(name, 0) + count
+
+
+async def drop_synthetic() -> None:
+    """Delete every synthetic tenant and its rows, children first."""
+    from app.db.session import engine
+
+    async with engine.begin() as conn:
+        res = await conn.execute(
+            text("SELECT id FROM tenants WHERE domain LIKE :d"),
+            {"d": f"%{DOMAIN_SUFFIX}"},
+        )
+        tenant_ids = list(res.scalars())
+        if tenant_ids:
+            for name in ("search_documents", *reversed(TABLES[1:])):
+                res = await conn.execute(
+                    text(f'DELETE FROM {name} WHERE "tenantId" = ANY(:t)'),
+                    {"t": tenant_ids},
+                )
+                print(f"  {name:<28} {res.rowcount:>12,} deleted")
+            await conn.execute(
+                text("DELETE FROM tenants WHERE id = ANY(:t)"), {"t": tenant_ids}
+            )
+    await engine.dispose()
+    print(f"Dropped {len(tenant_ids)} synthetic tenants")
+
+
+async def analyze() -> None:
+    from app.db.session import engine
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name in TABLES:
+            await conn.execute(text(f"ANALYZE {name}"))
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="smoke")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 4, help="COPY processes"
+    )
+    parser.add_argument(
+        "--tenants", type=int, help="Override the profile's tenant count"
+    )
+    parser.add_argument("--users-per-tenant", type=int, help="Override the profile")
+    parser.add_argument(
+        "--password", default=DEFAULT_PASSWORD, help="Password of every user"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Print the plan and exit"
+    )
+    parser.add_argument(
+        "--drop", action="store_true", help="Delete all synthetic tenants"
+    )
+    args = parser.parse_args()
+
+    if args.drop:
+        asyncio.run(drop_synthetic())
+        return
+
+    profile = PROFILES[args.profile]
+    if args.tenants:
+        profile = replace(profile, tenants=args.tenants)
+    if args.users_per_tenant:
+        profile = replace(profile, users_per_tenant=args.users_per_tenant)
+
+    check_columns()
+    estimate = profile.estimate()
+    print(
+        f"Profile {args.profile} (seed {args.seed}), about {sum(estimate.values()):,} rows:"
+    )
+    for name, count in estimate.items():
+        print(f"  {name:<28} ~{count:,}")
+    if args.dry_run:
+        return
+
+    from app.auth.password import hash_password
+
+    # Distinct per run, so repeated loads never collide on ids or domains
+    run = int(time.time()) & 0xFFFFFFFF
+    now = datetime.utcnow()
+    tenants, shards = plan_jobs(
+        profile, run, args.seed, hash_password(args.password), now
+    )
+
+    totals: dict[str, int] = {}
+    started = time.perf_counter()
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx) as pool:
+        _run_phase(pool, tenants, totals)
+        _run_phase(pool, shards, totals)
+    loaded = time.perf_counter() - started
+    asyncio.run(analyze())
+
+    rows = sum(totals.values())
+    print(f"\nLoaded {rows:,} rows in {loaded:.1f}s ({rows / loaded:,.0f} rows/s):")
+    for name in TABLES:
+        print(f"  {name:<28} {totals.get(name, 0):>12,}")
+    print(
+        f"\nTenant domains: t<n>-{run:08x}{DOMAIN_SUFFIX}; every user's password is --password"
+    )
+    print(
+        "Search documents are not built by COPY: run scripts/reindex_search.py if needed"
+    )
+
+
+if __name__ == "__main__":
+    main()
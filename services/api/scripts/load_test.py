@@ -0,0 +1,536 @@
+"""
+Load-test harness: weighted user journeys with open-loop arrivals.
+
+Unlike scripts/smoke_runner.py (each endpoint once, in sequence), this
+drives a running API with concurrent virtual users:
+
+- learner:    session check -> my enrollments -> course -> unit -> complete unit
+- admin:      dashboard -> reports dashboard -> training matrix export
+- instructor: grading hub -> submissions list
+
+Journeys arrive as a Poisson process at --rate per second, whether or not
+earlier ones have finished (open loop). A slow server therefore builds up
+in-flight journeys instead of slowing the load down and hiding its own
+latency. --max-in-flight caps the backlog; arrivals beyond it are counted
+as dropped.
+
+Virtual users are real users of the target database, picked per role.
+Their access tokens are minted with create_access_token, so bcrypt is not
+part of the measurement. With --password (e.g. the password given to
+scripts/generate_synthetic_data.py), learner journeys start with a real
+POST /api/auth/login instead.
+
+Results (throughput, error counts and p50/p95/p99 latency per step and per
+journey) are written as JSON with sorted keys, one file per commit by
+default, so runs can be diffed between commits. --compare prints each
+step's p95 change against an earlier result.
+
+Usage:
+    python scripts/load_test.py --rate 50 --duration 60
+    python scripts/load_test.py --rate 200 --users 2000 --tenant-domain %.synthetic.local
+    python scripts/load_test.py --rate 200 --compare reports/load/<commit>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import func, select
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.auth.jwt import create_access_token
+from app.db.models import (
+    CourseUnit,
+    Enrollment,
+    EnrollmentStatus,
+    RoleKey,
+    Tenant,
+    User,
+    UserStatus,
+)
+from app.db.session import async_session_factory, engine
+
+BASE_URL = "http://127.0.0.1:8001"
+
+
+@dataclass
+class VirtualUser:
+    user_id: str
+    email: str
+    token: str
+    course_id: Optional[str] = None
+    unit_ids: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    method: str
+    path: Callable[[VirtualUser, random.Random], str]
+    body: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class Journey:
+    name: str
+    role: RoleKey
+    weight: float
+    steps: List[Step]
+    needs_enrollment: bool = False
+
+
+JOURNEYS: List[Journey] = [
+    Journey(
+        "learner",
+        RoleKey.LEARNER,
+        weight=80,
+        needs_enrollment=True,
+        steps=[
+            Step("session", "GET", lambda vu, rng: "/api/auth/me"),
+            Step(
+                "enrollments",
+                "GET",
+                lambda vu, rng: "/api/learner/enrollments?limit=20",
+            ),
+            Step("course", "GET", lambda vu, rng: f"/api/courses/{vu.course_id}"),
+            Step(
+                "unit",
+                "GET",
+                lambda vu, rng: f"/api/courses/{vu.course_id}/units/{rng.choice(vu.unit_ids)}",
+            ),
+            Step(
+                "complete_unit",
+                "POST",
+                lambda vu, rng: f"/api/learner/progress/units/{rng.choice(vu.unit_ids)}/complete",
+            ),
+        ],
+    ),
+    Journey(
+        "admin",
+        RoleKey.ADMIN,
+        weight=5,
+        steps=[
+            Step("dashboard", "GET", lambda vu, rng: "/api/dashboard"),
+            Step("reports_dashboard", "GET", lambda vu, rng: "/api/reports/dashboard"),
+            Step(
+                "export_training_matrix",
+                "POST",
+                lambda vu, rng: "/api/reports/export/training-matrix",
+                body={},
+            ),
+        ],
+    ),
+    Journey(
+        "instructor",
+        RoleKey.INSTRUCTOR,
+        weight=15,
+        steps=[
+            Step("grading_hub", "GET", lambda vu, rng: "/api/instructor/grading-hub"),
+            Step("submissions", "GET", lambda vu, rng: "/api/submissions?limit=20"),
+        ],
+    ),
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=API_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# ============= Virtual Users =============
+
+
+async def load_virtual_users(
+    role: RoleKey, limit: int, tenant_domain: Optional[str], needs_enrollment: bool
+) -> List[VirtualUser]:
+    async with async_session_factory() as session:
+        query = (
+            select(
+                User.id,
+                User.email,
+                User.node_id,
+                User.tenant_id,
+                User.token_version,
+            )
+            .where(
+                User.role == role,
+                User.status == UserStatus.ACTIVE,
+                User.deleted_at.is_(None),
+            )
+            .order_by(func.random())
+            .limit(limit)
+        )
+        if tenant_domain:
+            query = query.join(Tenant, Tenant.id == User.tenant_id).where(
+                Tenant.domain.like(tenant_domain)
+            )
+        if needs_enrollment:
+            query = query.where(
+                select(Enrollment.id)
+                .where(
+                    Enrollment.user_id == User.id,
+                    Enrollment.status != EnrollmentStatus.COMPLETED,
+                )
+                .exists()
+            )
+        rows = (await session.execute(query)).all()
+
+        users = {
+            row.id: VirtualUser(
+                user_id=row.id,
+                email=row.email,
+                token=create_access_token(
+                    user_id=row.id,
+                    email=row.email,
+                    role=role.value,
+                    tenant_id=row.tenant_id,
+                    node_id=row.node_id,
+                    token_version=row.token_version or 0,
+                ),
+            )
+            for row in rows
+        }
+        if not needs_enrollment or not users:
+            return list(users.values())
+
+        # One open enrollment per learner, and the units of its course
+        res = await session.execute(
+            select(Enrollment.user_id, Enrollment.course_id)
+            .where(
+                Enrollment.user_id.in_(users),
+                Enrollment.status != EnrollmentStatus.COMPLETED,
+            )
+            .distinct(Enrollment.user_id)
+            .order_by(Enrollment.user_id)
+        )
+        for user_id, course_id in res.all():
+            users[user_id].course_id = course_id
+        units: Dict[str, List[str]] = {}
+        res = await session.execute(
+            select(CourseUnit.course_id, CourseUnit.id).where(
+                CourseUnit.course_id.in_({vu.course_id for vu in users.values()})
+            )
+        )
+        for course_id, unit_id in res.all():
+            units.setdefault(course_id, []).append(unit_id)
+        for vu in users.values():
+            vu.unit_ids = units.get(vu.course_id, [])
+        return [vu for vu in users.values() if vu.course_id and vu.unit_ids]
+
+
+# ============= Runner =============
+
+
+class Recorder:
+    """Per-step and per-journey samples of one run."""
+
+    def __init__(self) -> None:
+        self.step_ms: Dict[str, List[float]] = {}
+        self.step_statuses: Dict[str, Counter] = {}
+        self.journey_ms: Dict[str, List[float]] = {}
+        self.journeys: Dict[str, Counter] = {}
+        self.arrival_lag_ms: List[float] = []
+        self.dropped = 0
+
+    def step(self, name: str, elapsed: float, status: str) -> None:
+        self.step_ms.setdefault(name, []).append(elapsed * 1000)
+        self.step_statuses.setdefault(name, Counter())[status] += 1
+
+    def journey(self, name: str, outcome: str, elapsed: float | None = None) -> None:
+        self.journeys.setdefault(name, Counter())[outcome] += 1
+        if elapsed is not None:
+            self.journey_ms.setdefault(name, []).append(elapsed * 1000)
+
+
+async def login(
+    client: httpx.AsyncClient, vu: VirtualUser, password: str, rec: Recorder
+):
+    started = time.perf_counter()
+    try:
+        resp = await client.post(
+            "/api/auth/login", json={"email": vu.email, "password": password}
+        )
+        status = str(resp.status_code)
+    except httpx.HTTPError as exc:
+        resp, status = None, f"error:{type(exc).__name__}"
+    rec.step("learner.login", time.perf_counter() - started, status)
+    if resp is None or resp.status_code >= 400:
+        return None
+    return resp.cookies.get("session")
+
+
+async def run_journey(
+    client: httpx.AsyncClient,
+    journey: Journey,
+    vu: VirtualUser,
+    rec: Recorder,
+    rng: random.Random,
+    think_ms: float,
+    password: Optional[str],
+) -> None:
+    started = time.perf_counter()
+    token = vu.token
+    if password and journey.role == RoleKey.LEARNER:
+        token = await login(client, vu, password, rec)
+        if token is None:
+            rec.journey(journey.name, "failed")
+            return
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for step in journey.steps:
+        if think_ms:
+            await asyncio.sleep(rng.expovariate(1 / think_ms) / 1000)
+        step_started = time.perf_counter()
+        try:
+            resp = await client.request(
+                step.method, step.path(vu, rng), headers=headers, json=step.body
+            )
+            await resp.aread()
+            status = str(resp.status_code)
+            failed = resp.status_code >= 400
+        except httpx.HTTPError as exc:
+            status, failed = f"error:{type(exc).__name__}", True
+        rec.step(
+            f"{journey.name}.{step.name}", time.perf_counter() - step_started, status
+        )
+        if failed:
+            rec.journey(journey.name, "failed")
+            return
+    rec.journey(journey.name, "completed", time.perf_counter() - started)
+
+
+async def drive(
+    args: argparse.Namespace, pools: Dict[str, List[VirtualUser]], rec: Recorder
+) -> float:
+    """Open-loop arrivals for args.duration seconds; returns the elapsed time."""
+    rng = random.Random(args.seed)
+    journeys = [j for j in JOURNEYS if pools.get(j.name)]
+    weights = [j.weight for j in journeys]
+    limits = httpx.Limits(
+        max_connections=args.connections, max_keepalive_connections=args.connections
+    )
+    # Tokens are sent as Bearer headers; a shared cookie jar would mix up sessions
+    cookies = httpx.Cookies(CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])))
+    tasks: set[asyncio.Task] = set()
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits, cookies=cookies
+    ) as client:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        next_at = started
+        while next_at - started < args.duration:
+            delay = next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            rec.arrival_lag_ms.append(max(loop.time() - next_at, 0.0) * 1000)
+            journey = rng.choices(journeys, weights=weights)[0]
+            if len(tasks) >= args.max_in_flight:
+                rec.dropped += 1
+                rec.journey(journey.name, "dropped")
+            else:
+                rec.journey(journey.name, "started")
+                task = asyncio.create_task(
+                    run_journey(
+                        client,
+                        journey,
+                        rng.choice(pools[journey.name]),
+                        rec,
+                        random.Random(rng.random()),
+                        args.think_ms,
+                        args.password,
+                    )
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            next_at += rng.expovariate(args.rate)
+        if tasks:
+            await asyncio.wait(tasks, timeout=args.timeout * 2)
+        return loop.time() - started
+
+
+def _latency(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(percentile(values, 0.50), 1),
+        "p95_ms": round(percentile(values, 0.95), 1),
+        "p99_ms": round(percentile(values, 0.99), 1),
+        "max_ms": round(max(values), 1) if values else 0.0,
+    }
+
+
+def summarize(
+    args: argparse.Namespace,
+    pools: Dict[str, List[VirtualUser]],
+    rec: Recorder,
+    elapsed: float,
+) -> Dict[str, Any]:
+    steps = {}
+    for name, values in rec.step_ms.items():
+        statuses = rec.step_statuses[name]
+        errors = sum(
+            count
+            for status, count in statuses.items()
+            if not status.isdigit() or int(status) >= 400
+        )
+        steps[name] = {
+            "requests": len(values),
+            "errors": errors,
+            "throughput_rps": round(len(values) / elapsed, 2),
+            "statuses": dict(statuses),
+            **_latency(values),
+        }
+    journeys = {
+        name: {**dict(counts), **_latency(rec.journey_ms.get(name, []))}
+        for name, counts in rec.journeys.items()
+    }
+    requests = sum(s["requests"] for s in steps.values())
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "base_url": args.base_url,
+            "rate_per_s": args.rate,
+            "duration_s": args.duration,
+            "think_ms": args.think_ms,
+            "max_in_flight": args.max_in_flight,
+            "connections": args.connections,
+            "real_login": bool(args.password),
+            "seed": args.seed,
+            "virtual_users": {name: len(pool) for name, pool in pools.items()},
+        },
+        "summary": {
+            "elapsed_s": round(elapsed, 1),
+            "requests": requests,
+            "errors": sum(s["errors"] for s in steps.values()),
+            "throughput_rps": round(requests / elapsed, 2),
+            "dropped": rec.dropped,
+            "arrival_lag_p99_ms": round(percentile(rec.arrival_lag_ms, 0.99), 1),
+        },
+        "journeys": journeys,
+        "steps": steps,
+    }
+
+
+def print_result(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    base_steps = baseline["steps"] if baseline else {}
+    header = f"{'step':<36} {'req/s':>8} {'err':>6} {'p50':>8} {'p95':>8} {'p99':>8}"
+    if baseline:
+        header += f" {'p95 vs ' + baseline['meta']['commit']:>18}"
+    print(header)
+    for name, s in sorted(result["steps"].items()):
+        line = (
+            f"{name:<36} {s['throughput_rps']:>8.1f} {s['errors']:>6} "
+            f"{s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f}"
+        )
+        before = base_steps.get(name)
+        if before and before["p95_ms"]:
+            change = (s["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+            line += f" {change:>+17.1f}%"
+        print(line)
+    summary = result["summary"]
+    print(
+        f"\n{summary['requests']:,} requests in {summary['elapsed_s']}s "
+        f"({summary['throughput_rps']} req/s), {summary['errors']} errors, "
+        f"{summary['dropped']} dropped arrivals, "
+        f"arrival lag p99 {summary['arrival_lag_p99_ms']} ms"
+    )
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    pools: Dict[str, List[VirtualUser]] = {}
+    for journey in JOURNEYS:
+        pools[journey.name] = await load_virtual_users(
+            journey.role, args.users, args.tenant_domain, journey.needs_enrollment
+        )
+        print(f"{journey.name:<11} {len(pools[journey.name]):>6} virtual users")
+    await engine.dispose()
+    if not any(pools.values()):
+        raise SystemExit(
+            "No virtual users found (see scripts/generate_synthetic_data.py)"
+        )
+
+    rec = Recorder()
+    elapsed = await drive(args, pools, rec)
+    return summarize(args, pools, rec, elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument(
+        "--rate", type=float, default=20.0, help="Journey arrivals per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60.0, help="Seconds of arrivals"
+    )
+    parser.add_argument(
+        "--users", type=int, default=1000, help="Virtual users per role"
+    )
+    parser.add_argument(
+        "--tenant-domain", help="SQL LIKE pattern for the tenants to use"
+    )
+    parser.add_argument(
+        "--think-ms", type=float, default=500.0, help="Mean think time per step"
+    )
+    parser.add_argument("--max-in-flight", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--password", help="Log learners in with this password")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--out", help="Result JSON (default reports/load/<commit>.json)"
+    )
+    parser.add_argument("--compare", help="Earlier result JSON to compare p95 against")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_result(result, baseline)
+
+    out_path = args.out or os.path.join(
+        API_ROOT, "reports", "load", f"{result['meta']['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Load test result written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
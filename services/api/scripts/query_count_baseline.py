@@ -0,0 +1,49 @@
+"""
+Endpoint query-count baseline.
+
+Seeds a throwaway tenant with N and 10N rows, calls each list/detail
+endpoint through the ASGI app and records SQL statements and latency per
+request (see tests/query_counts.py). Writes reports/QUERY_COUNT_BASELINE.md
+and tests/query_count_baseline.json, which tests/test_query_counts.py
+checks against. Needs a migrated database (DATABASE_URL).
+
+Usage:
+    python scripts/query_count_baseline.py [--rows 5] [--runs 3]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from tests.query_counts import (
+    DEFAULT_ROWS,
+    REPORT_PATH,
+    render_report,
+    run,
+    write_baseline,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    measurements = asyncio.run(run(args.rows, args.runs))
+    report = render_report(measurements)
+    with open(REPORT_PATH, "w") as f:
+        f.write(report)
+    write_baseline(measurements)
+    print(report)
+    print(f"Wrote {REPORT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
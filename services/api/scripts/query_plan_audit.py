@@ -1,112 +1,78 @@
+"""
+Endpoint query-plan audit and index advisor.
+
+Seeds a throwaway tenant, calls the list/detail/report endpoints through
+the ASGI app, captures the SQL each one runs and re-runs it under
+EXPLAIN (ANALYZE, BUFFERS) (see tests/query_plans.py). Writes
+reports/QUERY_PLAN_REPORT.md with per-statement cost, time and buffers,
+regressions against tests/query_plan_baseline.json (new Seq Scans or
+Sorts on large tables, cost growth) and composite index suggestions.
+
+Run against a database loaded with scripts/generate_synthetic_data.py;
+plans on a near-empty database are not representative.
+
+Usage:
+    python scripts/query_plan_audit.py [--rows 20]
+    python scripts/query_plan_audit.py --update-baseline
+    python scripts/query_plan_audit.py --emit-migration   # Alembic stub of the suggestions
+    python scripts/query_plan_audit.py --check            # exit 1 on regressions
+"""
+
+import argparse
 import asyncio
 import os
 import sys
-from typing import Any, List, Tuple
-
-from sqlalchemy import text
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 API_ROOT = os.path.dirname(CURRENT_DIR)
 if API_ROOT not in sys.path:
     sys.path.insert(0, API_ROOT)
 
-from app.db.models import Course, Group, Tenant
-from app.db.session import async_session_factory, engine
-
-QUERIES: List[Tuple[str, str]] = [
-    (
-        "Users list",
-        """EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM users WHERE "tenantId" = :t AND "deletedAt" IS NULL ORDER BY "createdAt" DESC LIMIT 20""",
-    ),
-    (
-        "Courses list",
-        """EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM courses WHERE "tenantId" = :t AND "deletedAt" IS NULL ORDER BY "createdAt" DESC LIMIT 20""",
-    ),
-    (
-        "Groups list",
-        """EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM groups WHERE "tenantId" = :t AND "deletedAt" IS NULL ORDER BY "createdAt" DESC LIMIT 20""",
-    ),
-    (
-        "Group detail",
-        """EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM groups WHERE id = :gid AND "tenantId" = :t AND "deletedAt" IS NULL""",
-    ),
-    (
-        "Course enrollments",
-        """EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM enrollments WHERE "courseId" = :cid AND "tenantId" = :t ORDER BY "updatedAt" DESC LIMIT 20""",
-    ),
-    (
-        "Learning paths list",
-        """EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM learning_paths WHERE "tenantId" = :t ORDER BY "createdAt" DESC LIMIT 50""",
-    ),
-]
-
-
-async def pick_ids() -> Tuple[Any, Any, Any]:
-    async with async_session_factory() as session:
-        t_res = await session.execute(text("SELECT id FROM tenants LIMIT 1"))
-        t_id = t_res.scalar()
-        c_res = await session.execute(
-            text('SELECT id FROM courses WHERE "tenantId" = :t LIMIT 1'), {"t": t_id}
-        )
-        c_id = c_res.scalar()
-        g_res = await session.execute(
-            text('SELECT id FROM groups WHERE "tenantId" = :t LIMIT 1'), {"t": t_id}
-        )
-        g_id = g_res.scalar()
-        return (t_id, c_id, g_id)
+from tests.query_plans import (
+    DEFAULT_ROWS,
+    PLAN_BASELINE_PATH,
+    PLAN_REPORT_PATH,
+    diff,
+    load_baseline,
+    render_report,
+    run,
+    suggestions,
+    write_baseline,
+    write_migration,
+)
 
 
-async def has_tenant_index(table: str) -> bool:
-    async with engine.begin() as conn:
-        res = await conn.execute(
-            text("""
-            SELECT indexname, indexdef
-            FROM pg_indexes
-            WHERE schemaname='public' AND tablename=:t
-        """),
-            {"t": table},
-        )
-        idx = res.fetchall()
-        for name, defn in idx:
-            if '"tenantId"' in defn:
-                return True
-        return False
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--emit-migration", action="store_true")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regressions")
+    args = parser.parse_args()
 
+    plans = asyncio.run(run(args.rows))
+    regressions = diff(plans, load_baseline())
+    os.makedirs(os.path.dirname(PLAN_REPORT_PATH), exist_ok=True)
+    with open(PLAN_REPORT_PATH, "w", encoding="utf-8") as f:
+        f.write(render_report(plans, regressions))
+    print(f"{len(plans)} statement plans; report written to {PLAN_REPORT_PATH}")
 
-async def run_audit() -> None:
-    t_id, c_id, g_id = await pick_ids()
-    out_dir = os.path.join(API_ROOT, "reports")
-    os.makedirs(out_dir, exist_ok=True)
-    out_path = os.path.join(out_dir, "QUERY_PLAN_REPORT.md")
-    lines: List[str] = []
-    lines.append("# Query Plan Audit")
-    lines.append("")
-    async with engine.begin() as conn:
-        for name, q in QUERIES:
-            params = {"t": t_id, "cid": c_id, "gid": g_id}
-            res = await conn.execute(text(q), params)
-            plan_lines = [row[0] for row in res.fetchall()]
-            lines.append(f"## {name}")
-            lines.append("```")
-            lines.extend(plan_lines[:40])  # cap to 40 lines
-            lines.append("```")
-            lines.append("")
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    indexes = suggestions(plans)
+    for index in indexes:
+        print(f"SUGGEST    {index.name} on {index}")
 
-    # Index presence summary
-    checks = [
-        ("users", await has_tenant_index("users")),
-        ("courses", await has_tenant_index("courses")),
-        ("groups", await has_tenant_index("groups")),
-        ("enrollments", await has_tenant_index("enrollments")),
-        ("learning_paths", await has_tenant_index("learning_paths")),
-    ]
-    lines.append("## Index Summary (tenantId presence)")
-    for tbl, present in checks:
-        lines.append(f"- {tbl}: {'YES' if present else 'NO'}")
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    print(f"Query plan report written to {out_path}")
+    if args.update_baseline:
+        write_baseline(plans)
+        print(f"Wrote {PLAN_BASELINE_PATH}")
+    if args.emit_migration and indexes:
+        print(f"Wrote migration stub {write_migration(indexes)}")
+    if args.check and regressions:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_audit())
+    main()
@@ -0,0 +1,54 @@
+"""
+Rebuild search_documents from the source tables.
+
+Use after raw SQL imports or manual data fixes that bypass the ORM flush
+hooks. Reindexes one tenant, or every tenant when --tenant is omitted.
+
+Usage:
+    python scripts/reindex_search.py [--tenant TENANT_ID]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from sqlalchemy import text
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.db.session import engine
+from app.search import reindex_tenant
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenant", help="Tenant id (default: all tenants)")
+    args = parser.parse_args()
+
+    if args.tenant:
+        tenant_ids = [args.tenant]
+    else:
+        async with engine.connect() as conn:
+            res = await conn.execute(text('SELECT id FROM tenants WHERE "deletedAt" IS NULL'))
+            tenant_ids = list(res.scalars())
+
+    for tenant_id in tenant_ids:
+        async with engine.begin() as conn:
+            await reindex_tenant(conn, tenant_id)
+            count = (
+                await conn.execute(
+                    text('SELECT count(*) FROM search_documents WHERE "tenantId" = :t'),
+                    {"t": tenant_id},
+                )
+            ).scalar()
+        print(f"Reindexed tenant {tenant_id}: {count} documents")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
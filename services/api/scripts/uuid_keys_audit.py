@@ -0,0 +1,322 @@
+"""
+Readiness check and before/after measurement for native uuid keys.
+
+Key columns are the ones alembic/versions/c4e8b1d37f52_convert_keys_to_uuid.py
+converts (primary key "id" columns, the foreign keys that point at them and
+its REFERENCE_COLUMNS). For the current database the script
+
+- checks readiness: values that are not UUIDs (the migration refuses to
+  run with any) and key columns whose ORM type disagrees with the schema
+  (UUIDKey in app.db.models on one side, a converted column on the other);
+- measures the size of every index over a key column;
+- times representative key joins (median EXPLAIN ANALYZE execution time of
+  --repeat runs after a warm-up) for the tenant with the most enrollments.
+
+Each run saves reports/uuid_keys/<text|uuid>.json, labelled by the current
+key column type, and rewrites reports/UUID_KEYS_REPORT.md, which compares
+both runs once the migration has been measured on each side:
+
+    python scripts/generate_synthetic_data.py --profile bench
+    python scripts/uuid_keys_audit.py             # text keys
+    alembic upgrade head                          # then DB_UUID_KEYS=true
+    python scripts/uuid_keys_audit.py             # uuid keys
+
+Usage:
+    python scripts/uuid_keys_audit.py [--repeat 5] [--check]
+"""
+
+import argparse
+import asyncio
+import glob
+import importlib.util
+import json
+import os
+import statistics
+import sys
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+API_ROOT = os.path.dirname(CURRENT_DIR)
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
+
+from app.db.models import Base
+from app.db.session import engine
+from app.db.types import UUIDKey
+
+RESULTS_DIR = os.path.join(API_ROOT, "reports", "uuid_keys")
+REPORT_PATH = os.path.join(API_ROOT, "reports", "UUID_KEYS_REPORT.md")
+
+# Key joins the conversion should speed up; :tenant is bound untyped, so the
+# same SQL runs against either schema
+JOINS = {
+    "enrollments x users x courses": """
+        SELECT count(*) FROM enrollments e
+        JOIN users u ON u.id = e."userId"
+        JOIN courses c ON c.id = e."courseId"
+        WHERE e."tenantId" = :tenant
+    """,
+    "timeline_events x users": """
+        SELECT count(*) FROM timeline_events t
+        JOIN users u ON u.id = t."userId"
+        WHERE t."tenantId" = :tenant
+    """,
+    "learning_path_enrollments x learning_paths x users": """
+        SELECT count(*) FROM learning_path_enrollments pe
+        JOIN learning_paths p ON p.id = pe."pathId"
+        JOIN users u ON u.id = pe."userId"
+        WHERE p."tenantId" = :tenant
+    """,
+    "assignment_submissions x courses x users": """
+        SELECT count(*) FROM assignment_submissions s
+        JOIN courses c ON c.id = s."courseId"
+        JOIN users u ON u.id = s."userId"
+        WHERE s."tenantId" = :tenant
+    """,
+    "enrollments x users (all tenants)": """
+        SELECT count(*) FROM enrollments e
+        JOIN users u ON u.id = e."userId"
+    """,
+}
+
+INDEXES_SQL = """
+    SELECT
+        ic.relname AS index_name,
+        t.relname AS table_name,
+        pg_relation_size(i.indexrelid) AS bytes,
+        ARRAY(
+            SELECT a.attname::text FROM pg_attribute a
+            WHERE a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+        ) AS columns
+    FROM pg_index i
+    JOIN pg_class ic ON ic.oid = i.indexrelid
+    JOIN pg_class t ON t.oid = i.indrelid
+    WHERE t.relnamespace = current_schema()::regnamespace
+      AND NOT t.relispartition
+"""
+
+
+def load_migration() -> Any:
+    pattern = os.path.join(API_ROOT, "alembic", "versions", "*_convert_keys_to_uuid.py")
+    path = glob.glob(pattern)[0]
+    spec = importlib.util.spec_from_file_location("convert_keys_to_uuid", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def orm_keys() -> Dict[tuple, bool]:
+    """(table, column) -> typed UUIDKey, for every mapped column."""
+    return {
+        (table.name, column.name): isinstance(column.type, UUIDKey)
+        for table in Base.metadata.tables.values()
+        for column in table.columns
+    }
+
+
+def mismatches(orm: Dict[tuple, bool], keys: set) -> List[str]:
+    """Columns the ORM and the migration disagree on, for mapped tables."""
+    tables = {table for table, _ in orm}
+    problems = [
+        f"{table}.{column}: UUIDKey in the ORM but not a key column"
+        for (table, column), is_key in sorted(orm.items())
+        if is_key and (table, column) not in keys
+    ]
+    problems += [
+        f"{table}.{column}: key column but not UUIDKey in the ORM"
+        for table, column in sorted(keys)
+        if table in tables and not orm.get((table, column), False)
+    ]
+    return problems
+
+
+async def invalid_values(conn, migration: Any, keys: set) -> Dict[str, int]:
+    counts = {}
+    for table, column in sorted(keys):
+        res = await conn.execute(
+            text(f'SELECT count(*) FROM "{table}" WHERE "{column}"::text !~ :pattern'),
+            {"pattern": migration.UUID_PATTERN},
+        )
+        count = res.scalar() or 0
+        if count:
+            counts[f"{table}.{column}"] = count
+    return counts
+
+
+async def key_indexes(conn, keys: set) -> List[Dict[str, Any]]:
+    res = await conn.execute(text(INDEXES_SQL))
+    return sorted(
+        (
+            {
+                "index": row.index_name,
+                "table": row.table_name,
+                "bytes": row.bytes,
+                "columns": list(row.columns),
+            }
+            for row in res
+            if any((row.table_name, c) in keys for c in row.columns)
+        ),
+        key=lambda i: i["index"],
+    )
+
+
+async def time_joins(conn, tenant: str, repeat: int) -> Dict[str, float]:
+    timings = {}
+    for name, sql in JOINS.items():
+        explain = text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")
+        runs = []
+        for _ in range(repeat + 1):  # the first run warms the cache
+            res = await conn.execute(
+                explain, {"tenant": tenant} if ":tenant" in sql else {}
+            )
+            runs.append(res.scalar()[0]["Execution Time"])
+        timings[name] = round(statistics.median(runs[1:]), 3)
+    return timings
+
+
+async def measure(repeat: int) -> Dict[str, Any]:
+    migration = load_migration()
+    async with engine.connect() as conn:
+        keys, _, _ = await conn.run_sync(
+            lambda c: migration.key_columns(c, migration.TEXT_TYPES + ("uuid",))
+        )
+        text_keys, _, _ = await conn.run_sync(
+            lambda c: migration.key_columns(c, migration.TEXT_TYPES)
+        )
+        res = await conn.execute(
+            text(
+                'SELECT "tenantId" FROM enrollments GROUP BY 1 '
+                "ORDER BY count(*) DESC LIMIT 1"
+            )
+        )
+        tenant = res.scalar()
+        result = {
+            "label": "text" if text_keys else "uuid",
+            "key_columns": len(keys),
+            "text_key_columns": len(text_keys),
+            "invalid_values": await invalid_values(conn, migration, text_keys),
+            "orm_mismatches": mismatches(orm_keys(), keys),
+            "indexes": await key_indexes(conn, keys),
+            "joins": await time_joins(conn, str(tenant), repeat) if tenant else {},
+        }
+    await engine.dispose()
+    return result
+
+
+def _mb(n: float) -> str:
+    return f"{n / 1024 / 1024:.1f} MB"
+
+
+def _change(before: float, after: float) -> str:
+    return f"{(after - before) / before * 100:+.0f}%" if before else "-"
+
+
+def render_report(runs: Dict[str, Dict[str, Any]]) -> str:
+    before, after = runs.get("text"), runs.get("uuid")
+    latest = after or before
+    lines: List[str] = [
+        "# Native UUID Keys",
+        "",
+        f"- Key columns: {latest['key_columns']} "
+        f"({latest['text_key_columns']} still text)",
+        "- Runs: " + ", ".join(sorted(runs)),
+        "",
+        "## Readiness",
+        "",
+    ]
+    if latest["invalid_values"]:
+        lines += ["Values that are not UUIDs (the migration refuses to run):", ""]
+        lines += [f"- `{c}`: {n:,} rows" for c, n in latest["invalid_values"].items()]
+    else:
+        lines.append("- Every key value is a UUID.")
+    if latest["orm_mismatches"]:
+        lines += ["", "ORM types that disagree with the migration:", ""]
+        lines += [f"- {problem}" for problem in latest["orm_mismatches"]]
+    else:
+        lines.append("- ORM key types match the key columns.")
+
+    sizes = {
+        label: {i["index"]: i for i in run["indexes"]} for label, run in runs.items()
+    }
+    names = sorted(
+        set().union(*sizes.values()),
+        key=lambda n: -max(s.get(n, {}).get("bytes", 0) for s in sizes.values()),
+    )
+    total = {
+        label: sum(i["bytes"] for i in run["indexes"]) for label, run in runs.items()
+    }
+    lines += [
+        "",
+        "## Index sizes",
+        "",
+        "| Index | Table | text | uuid | Change |",
+        "|---|---|---|---|---|",
+        f"| **All {len(names)} key indexes** | | "
+        f"{_mb(total.get('text', 0))} | {_mb(total.get('uuid', 0))} "
+        f"| {_change(total.get('text', 0), total.get('uuid', 0))} |",
+    ]
+    for name in names[:30]:
+        x = sizes.get("text", {}).get(name, {})
+        y = sizes.get("uuid", {}).get(name, {})
+        table = (x or y)["table"]
+        a, b = x.get("bytes", 0), y.get("bytes", 0)
+        lines.append(f"| `{name}` | {table} | {_mb(a)} | {_mb(b)} | {_change(a, b)} |")
+
+    joins = sorted(set().union(*(run["joins"] for run in runs.values())))
+    lines += [
+        "",
+        "## Join timings",
+        "",
+        "Median EXPLAIN ANALYZE execution time, tenant with the most enrollments.",
+        "",
+        "| Join | text ms | uuid ms | Change |",
+        "|---|---|---|---|",
+    ]
+    for name in joins:
+        x = (before or {}).get("joins", {}).get(name, 0.0)
+        y = (after or {}).get("joins", {}).get(name, 0.0)
+        lines.append(f"| {name} | {x:.2f} | {y:.2f} | {_change(x, y)} |")
+    return "\n".join(lines) + "\n"
+
+
+def load_runs() -> Dict[str, Dict[str, Any]]:
+    runs = {}
+    for label in ("text", "uuid"):
+        path = os.path.join(RESULTS_DIR, f"{label}.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                runs[label] = json.load(f)
+    return runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 when the migration would fail"
+    )
+    args = parser.parse_args()
+
+    result = asyncio.run(measure(args.repeat))
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{result['label']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, sort_keys=True)
+    with open(REPORT_PATH, "w", encoding="utf-8") as f:
+        f.write(render_report(load_runs()))
+    print(f"Wrote {path} and {REPORT_PATH}")
+
+    for column, count in result["invalid_values"].items():
+        print(f"INVALID   {column}: {count:,} values are not UUIDs")
+    for problem in result["orm_mismatches"]:
+        print(f"MISMATCH  {problem}")
+    if args.check and (result["invalid_values"] or result["orm_mismatches"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
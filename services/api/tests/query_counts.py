@@ -0,0 +1,409 @@
+"""
+Endpoint Query-count Harness
+
+Seeds a throwaway tenant at two sizes (n and 10n rows of everything the
+endpoints list), calls each endpoint through httpx against the ASGI app
+and reads the SQL statement count from the Server-Timing header that
+MetricsMiddleware adds outside production. An endpoint whose statement
+count grows with the data has an N+1 query.
+
+Needs a migrated PostgreSQL database (DATABASE_URL). Used by
+tests/test_query_counts.py and scripts/query_count_baseline.py.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import httpx
+from sqlalchemy import text
+
+API_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(API_ROOT, "tests", "query_count_baseline.json")
+REPORT_PATH = os.path.join(API_ROOT, "reports", "QUERY_COUNT_BASELINE.md")
+
+DEFAULT_ROWS = 5
+SCALE = 10
+TABLES = (
+    "learning_path_enrollments",
+    "learning_path_courses",
+    "learning_paths",
+    "group_courses",
+    "group_members",
+    "groups",
+    "enrollments",
+    "search_documents",
+    "outbox_events",
+    "courses",
+    "user_roles",
+    "users",
+)
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+_DB_MS = re.compile(r"db;dur=([\d.]+)")
+
+
+@dataclass
+class Seeded:
+    rows: int
+    tenant_id: str
+    admin_id: str
+    admin_email: str
+    course_id: str  # Has every learner enrolled
+    path_id: str  # Has every learner enrolled
+    post_course_id: str  # Target of the bulk course enrollment
+    post_path_id: str  # Target of the bulk learning path enrollment
+    new_user_ids: list[str] = field(default_factory=list)  # Not enrolled anywhere
+
+
+@dataclass
+class Endpoint:
+    name: str
+    method: str
+    path: Callable[[Seeded], str]
+    body: Callable[[Seeded], dict[str, Any]] | None = None
+
+    @property
+    def repeatable(self) -> bool:
+        return self.method == "GET"
+
+
+@dataclass
+class Measurement:
+    endpoint: str
+    rows: int
+    status: int
+    queries: int
+    db_ms: float
+    latency_ms: float
+
+
+ENDPOINTS = [
+    Endpoint("GET /api/users", "GET", lambda s: "/api/users?limit=100"),
+    Endpoint("GET /api/courses", "GET", lambda s: "/api/courses?limit=100"),
+    Endpoint(
+        "GET /api/courses/{course_id}", "GET", lambda s: f"/api/courses/{s.course_id}"
+    ),
+    Endpoint(
+        "GET /api/courses/{course_id}/enrollments",
+        "GET",
+        lambda s: f"/api/courses/{s.course_id}/enrollments",
+    ),
+    Endpoint("GET /api/enrollments", "GET", lambda s: "/api/enrollments?limit=100"),
+    Endpoint("GET /api/groups", "GET", lambda s: "/api/groups?limit=100"),
+    Endpoint(
+        "GET /api/learning-paths", "GET", lambda s: "/api/learning-paths?limit=100"
+    ),
+    Endpoint(
+        "GET /api/learning-paths/{path_id}/enrollments",
+        "GET",
+        lambda s: f"/api/learning-paths/{s.path_id}/enrollments",
+    ),
+    Endpoint(
+        "GET /api/reports/training-matrix",
+        "GET",
+        lambda s: "/api/reports/training-matrix",
+    ),
+    Endpoint(
+        "POST /api/courses/{course_id}/enrollments",
+        "POST",
+        lambda s: f"/api/courses/{s.post_course_id}/enrollments",
+        lambda s: {"userIds": s.new_user_ids},
+    ),
+    Endpoint(
+        "POST /api/learning-paths/{path_id}/enrollments",
+        "POST",
+        lambda s: f"/api/learning-paths/{s.post_path_id}/enrollments",
+        lambda s: {"userIds": s.new_user_ids},
+    ),
+]
+
+
+# ============= Seeding =============
+
+
+async def seed(rows: int) -> Seeded:
+    """A new tenant with an admin and `rows` learners, courses, groups and paths."""
+    from app.db.models import (
+        Course,
+        Enrollment,
+        Group,
+        GroupCourse,
+        GroupMember,
+        LearningPath,
+        LearningPathCourse,
+        LearningPathEnrollment,
+        RoleKey,
+        Tenant,
+        User,
+        UserRole,
+    )
+    from app.db.session import async_session_factory
+
+    tenant_id = str(uuid4())
+    tag = tenant_id[:8]
+    admin = User(
+        tenant_id=tenant_id,
+        username=f"qc-admin-{tag}",
+        email=f"qc-admin-{tag}@query-counts.local",
+        first_name="Query",
+        last_name="Admin",
+        role=RoleKey.ADMIN,
+        active_role=RoleKey.ADMIN,
+    )
+
+    def learner(i: int, kind: str) -> User:
+        return User(
+            tenant_id=tenant_id,
+            username=f"qc-{kind}-{tag}-{i}",
+            email=f"qc-{kind}-{tag}-{i}@query-counts.local",
+            first_name=f"{kind.title()}{i}",
+            last_name="Learner",
+        )
+
+    learners = [learner(i, "learner") for i in range(rows)]
+    new_users = [learner(i, "new") for i in range(rows)]
+    courses = [
+        Course(tenant_id=tenant_id, code=f"QC-{tag}-{i}", title=f"Course {i}")
+        for i in range(rows)
+    ]
+    post_course = Course(tenant_id=tenant_id, code=f"QC-{tag}-post", title="Post")
+    paths = [LearningPath(tenant_id=tenant_id, name=f"Path {i}") for i in range(rows)]
+    post_path = LearningPath(tenant_id=tenant_id, name="Post path")
+    groups = [Group(tenant_id=tenant_id, name=f"Group {i}") for i in range(rows)]
+
+    async with async_session_factory() as db:
+        db.add(Tenant(id=tenant_id, domain=f"{tag}.query-counts.local", name="QC"))
+        await db.flush()
+        db.add_all([admin, *learners, *new_users, *courses, post_course])
+        db.add_all([*paths, post_path, *groups])
+        await db.flush()
+
+        # ADMIN's built-in permissions lack enrollments:read, which
+        # GET /api/enrollments checks; the learner role grants it
+        db.add(
+            UserRole(tenant_id=tenant_id, user_id=admin.id, role_key=RoleKey.LEARNER)
+        )
+        # GET /api/enrollments lists the caller's own enrollments
+        for c in courses:
+            db.add(Enrollment(tenant_id=tenant_id, user_id=admin.id, course_id=c.id))
+
+        course, path = courses[0], paths[0]
+        for i, user in enumerate(learners):
+            # Two enrollments per learner for the list and matrix endpoints
+            for c in {courses[0], courses[i]}:
+                db.add(Enrollment(tenant_id=tenant_id, user_id=user.id, course_id=c.id))
+            db.add(
+                LearningPathEnrollment(
+                    tenant_id=tenant_id, user_id=user.id, path_id=path.id
+                )
+            )
+        for i, group in enumerate(groups):
+            db.add(
+                GroupMember(tenant_id=tenant_id, group_id=group.id, user_id=admin.id)
+            )
+            db.add(
+                GroupMember(
+                    tenant_id=tenant_id, group_id=group.id, user_id=learners[i].id
+                )
+            )
+            db.add(
+                GroupCourse(
+                    tenant_id=tenant_id, group_id=group.id, course_id=courses[i].id
+                )
+            )
+        for p in (path, post_path):
+            for order, c in enumerate(courses[:2]):
+                db.add(
+                    LearningPathCourse(
+                        tenant_id=tenant_id, path_id=p.id, course_id=c.id, order=order
+                    )
+                )
+        await db.commit()
+
+    return Seeded(
+        rows=rows,
+        tenant_id=tenant_id,
+        admin_id=admin.id,
+        admin_email=admin.email,
+        course_id=course.id,
+        path_id=path.id,
+        post_course_id=post_course.id,
+        post_path_id=post_path.id,
+        new_user_ids=[u.id for u in new_users],
+    )
+
+
+async def cleanup(seeded: Seeded) -> None:
+    from app.db.session import engine
+
+    params = {"t": seeded.tenant_id}
+    async with engine.begin() as conn:
+        for table in TABLES:
+            await conn.execute(
+                text(f'DELETE FROM {table} WHERE "tenantId" = :t'), params
+            )
+        await conn.execute(text("DELETE FROM tenants WHERE id = :t"), params)
+
+
+# ============= Measuring =============
+
+
+def _token(seeded: Seeded) -> str:
+    from app.auth.jwt import create_access_token
+
+    return create_access_token(
+        user_id=seeded.admin_id,
+        email=seeded.admin_email,
+        role="ADMIN",
+        tenant_id=seeded.tenant_id,
+    )
+
+
+async def _call(
+    client: httpx.AsyncClient, endpoint: Endpoint, seeded: Seeded
+) -> tuple[httpx.Response, float]:
+    body = endpoint.body(seeded) if endpoint.body else None
+    start = time.perf_counter()
+    response = await client.request(endpoint.method, endpoint.path(seeded), json=body)
+    return response, (time.perf_counter() - start) * 1000
+
+
+async def measure(seeded: Seeded, runs: int = 3) -> list[Measurement]:
+    """Statement count and latency of every endpoint for one seeded tenant.
+
+    Each GET is called once to warm per-process caches (RBAC permissions),
+    then `runs` times; latency is the median. POSTs change the data, so
+    they are measured on their first call, after the GETs warmed the caches.
+    """
+    from app.main import app
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {_token(seeded)}"}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://query-counts", headers=headers
+    ) as client:
+        for endpoint in sorted(ENDPOINTS, key=lambda e: not e.repeatable):
+            if endpoint.repeatable:
+                await _call(client, endpoint, seeded)
+            latencies = []
+            for _ in range(runs if endpoint.repeatable else 1):
+                response, latency_ms = await _call(client, endpoint, seeded)
+                latencies.append(latency_ms)
+            timing = response.headers.get("server-timing", "")
+            queries = _QUERIES.search(timing)
+            db_ms = _DB_MS.search(timing)
+            if queries is None or db_ms is None:
+                raise RuntimeError(
+                    "No Server-Timing header; run with METRICS_ENABLED=true outside "
+                    "production"
+                )
+            results.append(
+                Measurement(
+                    endpoint=endpoint.name,
+                    rows=seeded.rows,
+                    status=response.status_code,
+                    queries=int(queries.group(1)),
+                    db_ms=float(db_ms.group(1)),
+                    latency_ms=statistics.median(latencies),
+                )
+            )
+    return results
+
+
+async def run(rows: int = DEFAULT_ROWS, runs: int = 3) -> list[Measurement]:
+    """Measurements at `rows` and SCALE * `rows`; seeded data is always removed."""
+    from app.db.session import engine
+
+    measurements: list[Measurement] = []
+    try:
+        for size in (rows, rows * SCALE):
+            seeded = await seed(size)
+            try:
+                measurements += await measure(seeded, runs)
+            finally:
+                await cleanup(seeded)
+    finally:
+        await engine.dispose()
+    return measurements
+
+
+# ============= Baseline =============
+
+
+def load_baseline() -> dict[str, int]:
+    """Endpoint -> statement count at the larger size, from the checked-in baseline."""
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as f:
+        return json.load(f)["queries"]
+
+
+def write_baseline(measurements: list[Measurement]) -> None:
+    largest = max(m.rows for m in measurements)
+    with open(BASELINE_PATH, "w") as f:
+        json.dump(
+            {
+                "rows": largest,
+                "queries": {
+                    m.endpoint: m.queries for m in measurements if m.rows == largest
+                },
+            },
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+        f.write("\n")
+
+
+def render_report(measurements: list[Measurement]) -> str:
+    small, large = sorted({m.rows for m in measurements})
+    by_key = {(m.endpoint, m.rows): m for m in measurements}
+    lines = [
+        "# Endpoint Query-count Baseline",
+        "",
+        "Generated by `scripts/query_count_baseline.py`. SQL statements per request",
+        f"with {small} and {large} seeded rows (learners, courses, groups, paths);",
+        "latency is the median of warm calls through the ASGI app (no network).",
+        "An endpoint whose statement count grows with the rows has an N+1 query;",
+        "`tests/test_query_counts.py` fails on growth or on counts above",
+        "`tests/query_count_baseline.json`.",
+        "",
+        f"| Endpoint | Status | Queries ({small}) | Queries ({large}) "
+        f"| DB ms ({large}) | Latency ms ({small}) | Latency ms ({large}) |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for endpoint in ENDPOINTS:
+        a = by_key[(endpoint.name, small)]
+        b = by_key[(endpoint.name, large)]
+        lines.append(
+            f"| `{endpoint.name}` | {b.status} | {a.queries} | {b.queries} "
+            f"| {b.db_ms:.1f} | {a.latency_ms:.1f} | {b.latency_ms:.1f} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "DEFAULT_ROWS",
+    "ENDPOINTS",
+    "Endpoint",
+    "Measurement",
+    "SCALE",
+    "Seeded",
+    "cleanup",
+    "load_baseline",
+    "measure",
+    "render_report",
+    "run",
+    "seed",
+    "write_baseline",
+]
@@ -0,0 +1,536 @@
+"""
+Endpoint Query-plan Tracker
+
+Calls each endpoint of the query-count harness (plus the report and
+dashboard endpoints) through the ASGI app, captures the SQL it actually
+runs (app.metrics.capture_statements) and re-runs every statement under
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) in a transaction that is rolled
+back. Each plan is stored by endpoint and SQL fingerprint as its node
+shape plus cost, time and buffer metrics, and diffed against
+tests/query_plan_baseline.json: a new Seq Scan or Sort on a large table,
+or a large cost increase, is a regression.
+
+The index advisor turns Seq Scans with equality filters (and Sorts above
+them) into composite index suggestions, skips those an existing index
+already covers, and renders them as an Alembic migration stub.
+
+Plans depend on table statistics, so run against a database loaded with
+scripts/generate_synthetic_data.py (on a near-empty database every plan
+is a Seq Scan). The measured tenant is seeded by tests/query_counts.py.
+Used by tests/test_query_plans.py and scripts/query_plan_audit.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+import httpx
+
+from tests.query_counts import ENDPOINTS, Endpoint, Seeded, _token, cleanup, seed
+
+API_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLAN_BASELINE_PATH = os.path.join(API_ROOT, "tests", "query_plan_baseline.json")
+PLAN_REPORT_PATH = os.path.join(API_ROOT, "reports", "QUERY_PLAN_REPORT.md")
+
+DEFAULT_ROWS = 20
+# Seq Scans and Sorts on smaller tables are cheap and planner-dependent
+LARGE_TABLE_ROWS = 10_000
+# Total cost growth over the baseline that counts as a regression
+COST_GROWTH = 2.0
+MAX_INDEX_COLUMNS = 3
+_EXPLAINABLE = ("select", "with", "update", "delete", "insert")
+
+PLAN_ENDPOINTS = ENDPOINTS + [
+    Endpoint("GET /api/dashboard", "GET", lambda s: "/api/dashboard"),
+    Endpoint("GET /api/reports/overview", "GET", lambda s: "/api/reports/overview"),
+    Endpoint("GET /api/reports/dashboard", "GET", lambda s: "/api/reports/dashboard"),
+    Endpoint(
+        "GET /api/reports/course-progress",
+        "GET",
+        lambda s: "/api/reports/course-progress",
+    ),
+    Endpoint(
+        "GET /api/reports/user-activity", "GET", lambda s: "/api/reports/user-activity"
+    ),
+    Endpoint("GET /api/reports/timeline", "GET", lambda s: "/api/reports/timeline"),
+]
+
+
+@dataclass(frozen=True)
+class IndexSuggestion:
+    table: str
+    columns: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        snake = [re.sub(r"(?<!^)(?=[A-Z])", "_", c).lower() for c in self.columns]
+        return f"ix_{self.table}_{'_'.join(snake)}"[:63]
+
+    def __str__(self) -> str:
+        return f"{self.table} ({', '.join(self.columns)})"
+
+
+@dataclass
+class StatementPlan:
+    endpoint: str
+    fingerprint: str
+    sql: str
+    shape: list[str]
+    total_cost: float
+    actual_ms: float
+    shared_hit: int
+    shared_read: int
+    seq_scans: list[str] = field(default_factory=list)  # Large tables only
+    sorts: list[str] = field(default_factory=list)  # Sort keys over large tables
+    suggestions: list[IndexSuggestion] = field(default_factory=list)
+    error: str | None = None
+
+
+# ============= Normalizing =============
+
+_PARAM = re.compile(r"\$\d+(?:::[A-Z_]+(?:\[\])?)?")
+_PARAM_LIST = re.compile(r"\(\?(?:, \?)*\)")
+_EQ_COLUMN = re.compile(r'(?:\w+\.)?"?([A-Za-z_]\w*)"?\)?(?:::[a-z ]+)?\s*=\s')
+_SORT_COLUMN = re.compile(r'^(?:\w+\.)?"?([A-Za-z_]\w*)"?')
+
+
+def normalize_sql(statement: str) -> str:
+    """Whitespace collapsed, parameters as ?, IN lists of any length alike."""
+    sql = " ".join(statement.split())
+    sql = _PARAM.sub("?", sql)
+    return _PARAM_LIST.sub("(?...)", sql)
+
+
+def fingerprint(sql: str) -> str:
+    return hashlib.sha1(normalize_sql(sql).encode()).hexdigest()[:12]
+
+
+def walk(node: dict[str, Any], depth: int = 0) -> Iterator[tuple[int, dict]]:
+    yield depth, node
+    for child in node.get("Plans", []):
+        yield from walk(child, depth + 1)
+
+
+def _label(node: dict[str, Any]) -> str:
+    label = node["Node Type"]
+    if "Relation Name" in node:
+        label += f" on {node['Relation Name']}"
+    if "Index Name" in node:
+        label += f" using {node['Index Name']}"
+    return label
+
+
+def equality_columns(condition: str | None) -> list[str]:
+    """Columns compared with = in a plan Filter / Index Cond, in order."""
+    columns: list[str] = []
+    for column in _EQ_COLUMN.findall(condition or ""):
+        if column not in columns:
+            columns.append(column)
+    return columns
+
+
+def _scans(node: dict[str, Any]) -> list[dict[str, Any]]:
+    return [n for _, n in walk(node) if "Relation Name" in n]
+
+
+def advise(
+    plan: dict[str, Any],
+    table_rows: dict[str, float],
+    existing: dict[str, list[tuple[str, ...]]],
+) -> list[IndexSuggestion]:
+    """Composite indexes for Seq Scans (and Sorts over them) on large tables.
+
+    Equality-filtered columns come first, then the sort keys of a Sort whose
+    input is a single scan of the same table. Suggestions already covered
+    by the leading columns of an existing index are skipped.
+    """
+    found: dict[str, tuple[str, ...]] = {}
+    sorted_tables: dict[str, list[str]] = {}
+    for _, node in walk(plan):
+        if node["Node Type"] not in ("Sort", "Incremental Sort"):
+            continue
+        scans = _scans(node)
+        if len(scans) != 1:
+            continue
+        keys = [_SORT_COLUMN.match(k) for k in node.get("Sort Key", [])]
+        sorted_tables[scans[0]["Relation Name"]] = [k.group(1) for k in keys if k]
+
+    for _, node in walk(plan):
+        table = node.get("Relation Name")
+        if node["Node Type"] != "Seq Scan" or not table:
+            continue
+        if table_rows.get(table, 0) < LARGE_TABLE_ROWS:
+            continue
+        columns = equality_columns(node.get("Filter"))
+        for key in sorted_tables.get(table, []):
+            if key not in columns:
+                columns.append(key)
+        if not columns:
+            continue
+        found.setdefault(table, tuple(columns[:MAX_INDEX_COLUMNS]))
+
+    return [
+        IndexSuggestion(table, columns)
+        for table, columns in found.items()
+        if not covered(columns, existing.get(table, []))
+    ]
+
+
+def covered(columns: tuple[str, ...], indexes: list[tuple[str, ...]]) -> bool:
+    """Whether an existing index already starts with columns."""
+    return any(index[: len(columns)] == columns for index in indexes)
+
+
+def summarize_plan(
+    endpoint: str,
+    statement: str,
+    explain: list[dict[str, Any]],
+    table_rows: dict[str, float],
+    existing: dict[str, list[tuple[str, ...]]],
+) -> StatementPlan:
+    plan = explain[0]["Plan"]
+    seq_scans: list[str] = []
+    sorts: list[str] = []
+    for _, node in walk(plan):
+        table = node.get("Relation Name")
+        if (
+            node["Node Type"] == "Seq Scan"
+            and table_rows.get(table, 0) >= LARGE_TABLE_ROWS
+        ):
+            seq_scans.append(table)
+        if node["Node Type"] in ("Sort", "Incremental Sort"):
+            tables = {n["Relation Name"] for n in _scans(node)}
+            if any(table_rows.get(t, 0) >= LARGE_TABLE_ROWS for t in tables):
+                sorts.append(", ".join(node.get("Sort Key", [])))
+    return StatementPlan(
+        endpoint=endpoint,
+        fingerprint=fingerprint(statement),
+        sql=normalize_sql(statement)[:2000],
+        shape=["  " * depth + _label(node) for depth, node in walk(plan)],
+        total_cost=plan.get("Total Cost", 0.0),
+        actual_ms=explain[0].get("Execution Time", 0.0),
+        shared_hit=plan.get("Shared Hit Blocks", 0),
+        shared_read=plan.get("Shared Read Blocks", 0),
+        seq_scans=sorted(set(seq_scans)),
+        sorts=sorted(set(sorts)),
+        suggestions=advise(plan, table_rows, existing),
+    )
+
+
+# ============= Capturing =============
+
+
+async def _capture(seeded: Seeded) -> dict[str, list[tuple[str, Any]]]:
+    """Endpoint -> distinct (statement, parameters) it executed."""
+    from app.main import app
+    from app.metrics import capture_statements
+
+    captured: dict[str, list[tuple[str, Any]]] = {}
+    # An endpoint that raises still yields the statements it ran before failing
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    headers = {"Authorization": f"Bearer {_token(seeded)}"}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://query-plans", headers=headers
+    ) as client:
+        # POSTs change the data the GETs read, so they go last
+        for endpoint in sorted(PLAN_ENDPOINTS, key=lambda e: not e.repeatable):
+            body = endpoint.body(seeded) if endpoint.body else None
+            with capture_statements() as statements:
+                await client.request(endpoint.method, endpoint.path(seeded), json=body)
+            seen: dict[str, tuple[str, Any]] = {}
+            for s in statements:
+                if s.executemany or not s.statement.lstrip().lower().startswith(
+                    _EXPLAINABLE
+                ):
+                    continue
+                seen.setdefault(fingerprint(s.statement), (s.statement, s.parameters))
+            captured[endpoint.name] = list(seen.values())
+    return captured
+
+
+async def _catalog(conn) -> tuple[dict[str, float], dict[str, list[tuple[str, ...]]]]:
+    """Row estimates per table and the key columns of every btree index."""
+    rows = await conn.fetch(
+        "SELECT relname, reltuples FROM pg_class "
+        "WHERE relkind IN ('r', 'p') AND relnamespace = 'public'::regnamespace"
+    )
+    table_rows = {r["relname"]: float(r["reltuples"]) for r in rows}
+    rows = await conn.fetch("""
+        SELECT t.relname AS table_name,
+               array_agg(a.attname ORDER BY k.ord) AS columns
+        FROM pg_index x
+        JOIN pg_class t ON t.oid = x.indrelid
+        JOIN pg_class i ON i.oid = x.indexrelid
+        JOIN pg_am am ON am.oid = i.relam AND am.amname = 'btree'
+        CROSS JOIN LATERAL unnest(x.indkey) WITH ORDINALITY AS k(attnum, ord)
+        JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+        WHERE t.relnamespace = 'public'::regnamespace
+        GROUP BY t.relname, x.indexrelid
+        """)
+    existing: dict[str, list[tuple[str, ...]]] = {}
+    for r in rows:
+        existing.setdefault(r["table_name"], []).append(tuple(r["columns"]))
+    return table_rows, existing
+
+
+async def explain_all(
+    captured: dict[str, list[tuple[str, Any]]],
+) -> list[StatementPlan]:
+    from app.db.session import engine
+
+    plans: list[StatementPlan] = []
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        table_rows, existing = await _catalog(raw)
+        for endpoint, statements in captured.items():
+            for statement, parameters in statements:
+                # ANALYZE executes the statement; the rollback undoes any write
+                tx = raw.transaction()
+                await tx.start()
+                try:
+                    result = await raw.fetchval(
+                        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                        *(parameters or ()),
+                    )
+                    explain = json.loads(result) if isinstance(result, str) else result
+                    plans.append(
+                        summarize_plan(
+                            endpoint, statement, explain, table_rows, existing
+                        )
+                    )
+                except Exception as exc:
+                    plans.append(
+                        StatementPlan(
+                            endpoint=endpoint,
+                            fingerprint=fingerprint(statement),
+                            sql=normalize_sql(statement)[:2000],
+                            shape=[],
+                            total_cost=0.0,
+                            actual_ms=0.0,
+                            shared_hit=0,
+                            shared_read=0,
+                            error=f"{type(exc).__name__}: {exc}",
+                        )
+                    )
+                finally:
+                    await tx.rollback()
+    return plans
+
+
+async def run(rows: int = DEFAULT_ROWS) -> list[StatementPlan]:
+    """Plans of every endpoint statement for one seeded tenant (always removed)."""
+    from app.db.session import engine
+
+    try:
+        seeded = await seed(rows)
+        try:
+            return await explain_all(await _capture(seeded))
+        finally:
+            await cleanup(seeded)
+    finally:
+        await engine.dispose()
+
+
+# ============= Baseline and Diff =============
+
+
+def _key(plan: StatementPlan) -> str:
+    return f"{plan.endpoint} {plan.fingerprint}"
+
+
+def load_baseline() -> dict[str, dict[str, Any]]:
+    """ "<endpoint> <fingerprint>" -> stored plan, from the checked-in baseline."""
+    if not os.path.exists(PLAN_BASELINE_PATH):
+        return {}
+    with open(PLAN_BASELINE_PATH) as f:
+        return json.load(f)["plans"]
+
+
+def write_baseline(plans: list[StatementPlan]) -> None:
+    stored = {}
+    for plan in plans:
+        if plan.error:
+            continue
+        record = asdict(plan)
+        record.pop("suggestions")
+        # Timings and buffers vary run to run; the diff uses cost and shape
+        record.pop("actual_ms")
+        record.pop("shared_hit")
+        record.pop("shared_read")
+        stored[_key(plan)] = record
+    with open(PLAN_BASELINE_PATH, "w") as f:
+        json.dump({"plans": stored}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def diff(plans: list[StatementPlan], baseline: dict[str, dict[str, Any]]) -> list[str]:
+    """Regressions against the baseline: new Seq Scans/Sorts and cost growth."""
+    regressions = []
+    for plan in plans:
+        if plan.error:
+            continue
+        before = baseline.get(_key(plan))
+        old_scans = set(before["seq_scans"]) if before else set()
+        old_sorts = set(before["sorts"]) if before else set()
+        for table in sorted(set(plan.seq_scans) - old_scans):
+            regressions.append(
+                f"{plan.endpoint}: new Seq Scan on {table} [{plan.fingerprint}]"
+            )
+        for keys in sorted(set(plan.sorts) - old_sorts):
+            regressions.append(
+                f"{plan.endpoint}: new Sort on {keys} [{plan.fingerprint}]"
+            )
+        if (
+            before
+            and before["total_cost"]
+            and (plan.total_cost > before["total_cost"] * COST_GROWTH)
+        ):
+            regressions.append(
+                f"{plan.endpoint}: cost {before['total_cost']:.0f} -> "
+                f"{plan.total_cost:.0f} [{plan.fingerprint}]"
+            )
+    return regressions
+
+
+def suggestions(plans: list[StatementPlan]) -> list[IndexSuggestion]:
+    unique: dict[IndexSuggestion, None] = {}
+    for plan in plans:
+        for suggestion in plan.suggestions:
+            unique[suggestion] = None
+    return sorted(unique, key=lambda s: (s.table, s.columns))
+
+
+def render_report(plans: list[StatementPlan], regressions: list[str]) -> str:
+    lines = [
+        "# Query Plan Report",
+        "",
+        "Generated by `scripts/query_plan_audit.py`. Every SQL statement the",
+        "endpoints ran, re-run under `EXPLAIN (ANALYZE, BUFFERS)`. Seq Scans and",
+        f"Sorts are listed for tables above {LARGE_TABLE_ROWS:,} estimated rows.",
+        "",
+        "## Regressions against the baseline",
+        "",
+    ]
+    lines += [f"- {r}" for r in regressions] or ["None."]
+    lines += ["", "## Index suggestions", ""]
+    lines += [f"- `{s.name}` on {s}" for s in suggestions(plans)] or ["None."]
+    lines += [
+        "",
+        "## Statements",
+        "",
+        "| Endpoint | Statement | Cost | ms | Buffers hit/read | Seq Scans | Sorts |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for p in sorted(plans, key=lambda p: (p.endpoint, -p.total_cost)):
+        if p.error:
+            lines.append(
+                f"| `{p.endpoint}` | `{p.fingerprint}` "
+                f"| error: {p.error[:80]} | | | | |"
+            )
+            continue
+        lines.append(
+            f"| `{p.endpoint}` | `{p.fingerprint}` "
+            f"| {p.total_cost:.1f} | {p.actual_ms:.2f} "
+            f"| {p.shared_hit}/{p.shared_read} | {', '.join(p.seq_scans) or '-'} "
+            f"| {'; '.join(p.sorts) or '-'} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# ============= Migration Stub =============
+
+
+def render_migration(
+    indexes: list[IndexSuggestion], revision: str, down_revision: str
+) -> str:
+    entries = "\n".join(
+        f'    ("{s.name}", "{s.table}", {json.dumps(list(s.columns))}),'
+        for s in indexes
+    )
+    return f'''"""index_advisor_suggestions
+
+Revision ID: {revision}
+Revises: {down_revision}
+Create Date: {datetime.now()}
+
+Composite indexes suggested by scripts/query_plan_audit.py for Seq Scans
+and Sorts in endpoint query plans. Review each one (column order,
+existing indexes it makes redundant) before applying. Indexes are built
+CONCURRENTLY so the tables stay writable during the migration.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "{revision}"
+down_revision: Union[str, Sequence[str], None] = "{down_revision}"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+{entries}
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            column_list = ", ".join(f'"{{c}}"' for c in columns)
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{{name}}" '
+                f'ON "{{table}}" ({{column_list}})'
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in reversed(INDEXES):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{{name}}"')
+'''
+
+
+def write_migration(indexes: list[IndexSuggestion]) -> str:
+    """Write the stub into alembic/versions on top of the current head."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(Config(os.path.join(API_ROOT, "alembic.ini")))
+    revision = uuid4().hex[:12]
+    path = os.path.join(
+        API_ROOT, "alembic", "versions", f"{revision}_index_advisor_suggestions.py"
+    )
+    with open(path, "w") as f:
+        f.write(render_migration(indexes, revision, script.get_current_head()))
+    return path
+
+
+__all__ = [
+    "DEFAULT_ROWS",
+    "IndexSuggestion",
+    "PLAN_ENDPOINTS",
+    "StatementPlan",
+    "advise",
+    "diff",
+    "equality_columns",
+    "fingerprint",
+    "load_baseline",
+    "normalize_sql",
+    "render_migration",
+    "render_report",
+    "run",
+    "suggestions",
+    "summarize_plan",
+    "write_baseline",
+    "write_migration",
+]